@@ -237,11 +237,10 @@ namespace UniMcp.Tools
                     else if (!string.IsNullOrEmpty(asset.note) && regex.IsMatch(asset.note))
                         matched = true;
 
-                    // 额外检查：通过GUID获取资源对象名称并匹配
+                    // 额外检查：主资源名称（即文件名，无需加载资源）
                     if (!matched && !string.IsNullOrEmpty(assetPath))
                     {
-                        var obj = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(assetPath);
-                        if (obj != null && regex.IsMatch(obj.name))
+                        if (regex.IsMatch(System.IO.Path.GetFileNameWithoutExtension(assetPath)))
                         {
                             matched = true;
                         }
@@ -498,16 +497,12 @@ namespace UniMcp.Tools
                 resultData.Add("note", new JsonData(asset.note ?? ""));
                 resultData.Add("addTime", new JsonData(asset.addTime ?? ""));
 
-                // 尝试获取当前资源对象名称
+                // 当前资源对象名称（主资源名称即文件名，无需加载资源）
                 string currentName = "";
                 string assetPath = asset.GetAssetPath();
-                if (!string.IsNullOrEmpty(assetPath))
+                if (!string.IsNullOrEmpty(assetPath) && AssetDatabase.GetMainAssetTypeAtPath(assetPath) != null)
                 {
-                    var obj = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(assetPath);
-                    if (obj != null)
-                    {
-                        currentName = obj.name;
-                    }
+                    currentName = System.IO.Path.GetFileNameWithoutExtension(assetPath);
                 }
                 resultData.Add("current_object_name", new JsonData(currentName));
 
@@ -607,9 +602,8 @@ namespace UniMcp.Tools
                     }
                     else
                     {
-                        // 检查文件是否实际存在
-                        var obj = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(assetPath);
-                        if (obj == null)
+                        // 检查资源是否实际存在（只查询主资源类型，不加载资源）
+                        if (AssetDatabase.GetMainAssetTypeAtPath(assetPath) == null)
                         {
                             lostAssets.Add(asset);
                         }
@@ -95,6 +95,22 @@ namespace UniMcp.Tools
         private void OnEnable()
         {
             ValidateAndFixIds();
+            PublishSearchAnnotations();
+        }
+
+        /// <summary>
+        /// 将索引的名称、分类和备注提供给资源搜索索引（project_search text）
+        /// </summary>
+        private void PublishSearchAnnotations()
+        {
+            var annotations = new Dictionary<string, string>();
+            foreach (var asset in assetIndices)
+            {
+                if (string.IsNullOrEmpty(asset.guid))
+                    continue;
+                annotations[asset.guid] = $"{asset.name} {asset.category} {asset.note}";
+            }
+            AssetSearchIndex.SetAnnotations("asset_index", annotations);
         }
 
         /// <summary>
@@ -297,6 +313,7 @@ namespace UniMcp.Tools
         {
             EditorUtility.SetDirty(instance);
             instance.Save(true);
+            instance.PublishSearchAnnotations();
         }
 
         /// <summary>
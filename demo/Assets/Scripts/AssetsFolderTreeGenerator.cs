@@ -2,17 +2,17 @@ using System.IO;
 using System.Text;
 using UnityEngine;
 using UnityEditor;
+using UniMcp;
 
 public class AssetsFolderTreeGenerator
 {
     [MenuItem("Tools/Generate Assets YAML Tree")]
     public static void GenerateYamlTree()
     {
-        string assetsPath = Application.dataPath;
         StringBuilder yaml = new StringBuilder();
 
         yaml.AppendLine("Assets:");
-        GenerateFolderTree(assetsPath, yaml, 1);
+        GenerateFolderTree(ProjectTreeCache.RootPath, yaml, 1);
 
         string outputPath = Path.Combine(Application.dataPath, "../AssetsTree.yaml");
         File.WriteAllText(outputPath, yaml.ToString());
@@ -27,48 +27,26 @@ public class AssetsFolderTreeGenerator
 
     private static void GenerateFolderTree(string path, StringBuilder yaml, int depth)
     {
-        try
+        // 读取缓存的文件夹树快照，不再逐级遍历磁盘
+        var folder = ProjectTreeCache.GetFolder(path);
+        if (folder == null)
         {
-            string[] directories = Directory.GetDirectories(path);
+            Debug.LogError($"处理目录时出错: 未找到文件夹 {path}");
+            return;
+        }
 
-            foreach (string dir in directories)
+        string indent = new string(' ', depth * 2);
+        foreach (var subFolder in folder.SubFolders)
+        {
+            if (subFolder.SubFolders.Count > 0)
             {
-                string folderName = Path.GetFileName(dir);
-
-                // 跳过隐藏文件夹和.meta文件夹
-                if (folderName.StartsWith(".") || folderName.EndsWith(".meta"))
-                    continue;
-
-                string indent = new string(' ', depth * 2);
-
-                // 检查是否有子文件夹
-                string[] subDirs = Directory.GetDirectories(dir);
-                bool hasSubFolders = false;
-
-                foreach (string subDir in subDirs)
-                {
-                    string subFolderName = Path.GetFileName(subDir);
-                    if (!subFolderName.StartsWith(".") && !subFolderName.EndsWith(".meta"))
-                    {
-                        hasSubFolders = true;
-                        break;
-                    }
-                }
-
-                if (hasSubFolders)
-                {
-                    yaml.AppendLine($"{indent}- {folderName}:");
-                    GenerateFolderTree(dir, yaml, depth + 1);
-                }
-                else
-                {
-                    yaml.AppendLine($"{indent}- {folderName}");
-                }
+                yaml.AppendLine($"{indent}- {subFolder.Name}:");
+                GenerateFolderTree(subFolder.Path, yaml, depth + 1);
+            }
+            else
+            {
+                yaml.AppendLine($"{indent}- {subFolder.Name}");
             }
-        }
-        catch (System.Exception e)
-        {
-            Debug.LogError($"处理目录时出错: {e.Message}");
         }
     }
 }
\ No newline at end of file
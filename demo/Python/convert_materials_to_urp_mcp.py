@@ -2,12 +2,41 @@
 # -*- coding: utf-8 -*-
 """
 Unity材质球批量转换为URP材质脚本（MCP版本）
-将Assets/Materials目录下的所有Standard材质转换为URP/Lit材质，保持贴图映射
+将Assets/Materials目录下使用内置着色器的材质转换为对应的URP材质，保持贴图映射
 """
 
 import os
 import json
 
+# 内置着色器 -> URP 着色器
+BUILTIN_TO_URP_SHADERS = {
+    "Standard": "Universal Render Pipeline/Lit",
+    "Standard (Specular setup)": "Universal Render Pipeline/Lit",
+    "Autodesk Interactive": "Universal Render Pipeline/Lit",
+    "Legacy Shaders/Diffuse": "Universal Render Pipeline/Simple Lit",
+    "Legacy Shaders/Bumped Diffuse": "Universal Render Pipeline/Simple Lit",
+    "Legacy Shaders/Specular": "Universal Render Pipeline/Simple Lit",
+    "Legacy Shaders/Bumped Specular": "Universal Render Pipeline/Simple Lit",
+    "Legacy Shaders/VertexLit": "Universal Render Pipeline/Simple Lit",
+    "Legacy Shaders/Transparent/Diffuse": "Universal Render Pipeline/Simple Lit",
+    "Legacy Shaders/Transparent/Cutout/Diffuse": "Universal Render Pipeline/Simple Lit",
+    "Mobile/Diffuse": "Universal Render Pipeline/Simple Lit",
+    "Mobile/Bumped Diffuse": "Universal Render Pipeline/Simple Lit",
+    "Mobile/Bumped Specular": "Universal Render Pipeline/Simple Lit",
+    "Mobile/VertexLit": "Universal Render Pipeline/Simple Lit",
+    "Unlit/Texture": "Universal Render Pipeline/Unlit",
+    "Unlit/Color": "Universal Render Pipeline/Unlit",
+    "Unlit/Transparent": "Universal Render Pipeline/Unlit",
+    "Unlit/Transparent Cutout": "Universal Render Pipeline/Unlit",
+    "Mobile/Unlit (Supports Lightmap)": "Universal Render Pipeline/Unlit",
+    "Particles/Standard Surface": "Universal Render Pipeline/Particles/Lit",
+    "Particles/Standard Unlit": "Universal Render Pipeline/Particles/Unlit",
+    "Legacy Shaders/Particles/Alpha Blended": "Universal Render Pipeline/Particles/Unlit",
+    "Legacy Shaders/Particles/Additive": "Universal Render Pipeline/Particles/Unlit",
+    "Mobile/Particles/Alpha Blended": "Universal Render Pipeline/Particles/Unlit",
+    "Mobile/Particles/Additive": "Universal Render Pipeline/Particles/Unlit",
+}
+
 def get_all_material_files():
     """获取Assets/Materials目录下的所有.mat文件"""
     material_files = []
@@ -28,19 +57,20 @@ def convert_material_to_urp_batch(material_files):
         print("未找到任何材质文件")
         return
     
-    # 构建批量函数调用列表
-    batch_calls = []
-    
-    for material_path in material_files:
-        # 为每个材质添加转换调用
-        batch_calls.append({
-            "func": "edit_material",
-            "args": {
-                "action": "change_shader",
-                "path": material_path,
-                "shader": "Universal Render Pipeline/Lit"
+    # 一次 migrate_shader 调用完成整个目录：编辑器内批量切换着色器并搬运贴图/颜色，已转换的材质自动跳过
+    batch_calls = [{
+        "func": "edit_material",
+        "args": {
+            "action": "migrate_shader",
+            "path": "Assets/Materials",
+            "shader_map": BUILTIN_TO_URP_SHADERS,
+            "property_remap": {
+                "_MainTex": "_BaseMap",
+                "_Color": "_BaseColor",
+                "_Glossiness": "_Smoothness"
             }
-        })
+        }
+    }]
     
     print(f"\n开始批量转换 {len(material_files)} 个材质文件...")
     print("=" * 50)
@@ -0,0 +1,668 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unity MCP 服务压测工具（asyncio + 连接池，仅依赖标准库）
+
+功能:
+- 回放 McpExecuteRecordObject / McpDebugWindow 记录的调用（func + args）
+  支持 Library/McpExecuteRecordObject.asset、JSON 数组或 JSONL 文件
+- 合成负载: tools/list、hierarchy_search、N 项 batch_call、async_call 轮询，可按权重混合
+- 并发阶梯递增，每级统计 p50/p95/p99、吞吐量和错误率
+- 结果输出为 JSON 和/或 CSV
+
+用法:
+    # 合成负载，并发 1/4/16，每级 10 秒
+    python mcp_benchmark.py --mix tools_list:1,hierarchy_search:4,batch_call:1,async_call:1 --concurrency 1,4,16 --duration 10
+
+    # 回放记录文件
+    python mcp_benchmark.py --replay ../../Library/McpExecuteRecordObject.asset --concurrency 1,8 --requests 500
+
+    # 不依赖 Unity，对本地替身服务器自测
+    python mcp_benchmark.py --self-test --json report.json --csv report.csv
+"""
+
+import argparse
+import asyncio
+import csv
+import itertools
+import json
+import math
+import os
+import random
+import re
+import sys
+import time
+import uuid
+
+DEFAULT_MIX = "tools_list:1,hierarchy_search:4,batch_call:1,async_call:1"
+
+
+class RequestError(Exception):
+    """请求失败（连接、HTTP 或 JSON-RPC 层面的错误）"""
+
+
+# ----------------------------------------------------------------------
+# HTTP 连接池
+# ----------------------------------------------------------------------
+
+class HttpConnectionPool:
+    """基于 asyncio streams 的 HTTP/1.1 keep-alive 连接池"""
+
+    def __init__(self, host, port, max_size=64, timeout=30.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.idle = []
+        self.slots = asyncio.Semaphore(max_size)
+        self.opened = 0
+
+    async def _acquire(self):
+        await self.slots.acquire()
+        while self.idle:
+            reader, writer = self.idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        try:
+            connection = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+        except BaseException:
+            self.slots.release()
+            raise
+        self.opened += 1
+        return connection
+
+    def _release(self, connection, reusable):
+        if reusable:
+            self.idle.append(connection)
+        else:
+            connection[1].close()
+        self.slots.release()
+
+    async def request(self, method, path, body=b"", headers=None):
+        """发送请求，返回 (状态码, 响应头, 响应体)；连接失效时重试一次"""
+        for attempt in range(2):
+            connection = await self._acquire()
+            reusable = False
+            try:
+                status, response_headers, payload = await asyncio.wait_for(
+                    self._roundtrip(connection, method, path, body, headers), self.timeout)
+                reusable = response_headers.get("connection", "").lower() != "close"
+                return status, response_headers, payload
+            except (ConnectionError, asyncio.IncompleteReadError) as ex:
+                if attempt == 1:
+                    raise RequestError(f"connection failed: {ex}") from ex
+            except asyncio.TimeoutError as ex:
+                raise RequestError(f"timeout after {self.timeout}s") from ex
+            finally:
+                self._release(connection, reusable)
+
+    async def _roundtrip(self, connection, method, path, body, headers):
+        reader, writer = connection
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}",
+                 "Connection: keep-alive", f"Content-Length: {len(body)}"]
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by server")
+        status = int(status_line.split()[1])
+
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n"):
+                break
+            if not line:
+                raise ConnectionError("connection closed while reading headers")
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            payload = b"".join(chunks)
+        elif "content-length" in response_headers:
+            payload = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            payload = await reader.read()
+            response_headers["connection"] = "close"
+        return status, response_headers, payload
+
+    async def close(self):
+        for _, writer in self.idle:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+        self.idle.clear()
+
+
+# ----------------------------------------------------------------------
+# MCP 客户端
+# ----------------------------------------------------------------------
+
+class McpClient:
+    """JSON-RPC 2.0 客户端，对应 McpService 的 POST / 接口"""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.ids = itertools.count(1)
+
+    async def rpc(self, method, params=None):
+        """发送 JSON-RPC 请求，返回 result；JSON-RPC 错误抛出 RequestError"""
+        message = {"jsonrpc": "2.0", "id": next(self.ids), "method": method}
+        if params is not None:
+            message["params"] = params
+        return await self.send_raw(message)
+
+    async def send_raw(self, message):
+        body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+        status, _, payload = await self.pool.request(
+            "POST", "/", body, {"Content-Type": "application/json"})
+        if status >= 400:
+            raise RequestError(f"HTTP {status}")
+        if not payload:
+            return None
+        response = json.loads(payload.decode("utf-8"))
+        if "error" in response:
+            error = response["error"] or {}
+            raise RequestError(f"JSON-RPC {error.get('code')}: {error.get('message')}")
+        return response.get("result")
+
+    async def call_tool(self, name, arguments):
+        """调用工具并解析文本内容中的 Response 对象；工具返回 success=false 时抛出 RequestError"""
+        result = await self.rpc("tools/call", {"name": name, "arguments": arguments})
+        tool_result = parse_tool_result(result)
+        if isinstance(tool_result, dict) and tool_result.get("success") is False:
+            raise RequestError(f"{name}: {tool_result.get('error') or tool_result.get('message')}")
+        return tool_result
+
+
+def parse_tool_result(result):
+    """从 tools/call 的 content 数组中取出第一段文本并尝试解析为 JSON"""
+    if not isinstance(result, dict):
+        return result
+    if result.get("isError"):
+        raise RequestError("tool reported isError")
+    for item in result.get("content") or []:
+        if item.get("type") == "text":
+            text = item.get("text") or ""
+            try:
+                return json.loads(text)
+            except json.JSONDecodeError:
+                return text
+    return result
+
+
+# ----------------------------------------------------------------------
+# 负载场景
+# ----------------------------------------------------------------------
+
+async def op_tools_list(client, options):
+    await client.rpc("tools/list", {})
+
+
+async def op_hierarchy_search(client, options):
+    await client.call_tool("hierarchy_search", {"search_type": "by_name", "query": options.query})
+
+
+async def op_batch_call(client, options):
+    funcs = [{"func": "hierarchy_search", "args": {"search_type": "by_name", "query": options.query}}
+             for _ in range(options.batch_size)]
+    await client.call_tool("batch_call", {"args": funcs})
+
+
+async def op_async_call(client, options):
+    await run_async_call(client, "hierarchy_search", {"search_type": "by_name", "query": options.query},
+                         options.poll_interval, options.poll_timeout)
+
+
+async def run_async_call(client, func, args, poll_interval, poll_timeout):
+    """以新的任务 id 提交 async_call，并轮询直到拿到结果"""
+    task_id = uuid.uuid4().hex
+    await client.call_tool("async_call", {"id": task_id, "type": "in", "func": func, "args": args})
+    deadline = time.perf_counter() + poll_timeout
+    while True:
+        result = await client.call_tool("async_call", {"id": task_id, "type": "out"})
+        if not (isinstance(result, dict) and result.get("message") == "Task is still in progress."):
+            return
+        if time.perf_counter() > deadline:
+            raise RequestError(f"async_call '{task_id}' still running after {poll_timeout}s")
+        await asyncio.sleep(poll_interval)
+
+
+SYNTHETIC_OPS = {
+    "tools_list": op_tools_list,
+    "hierarchy_search": op_hierarchy_search,
+    "batch_call": op_batch_call,
+    "async_call": op_async_call,
+}
+
+
+def parse_mix(spec):
+    """解析 'name:weight,...' 形式的负载配比"""
+    mix = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, weight = part.partition(":")
+        name = name.strip()
+        if name not in SYNTHETIC_OPS:
+            raise ValueError(f"Unknown operation '{name}'. Available: {', '.join(SYNTHETIC_OPS)}")
+        mix.append((name, float(weight) if weight else 1.0))
+    if not mix:
+        raise ValueError("Operation mix is empty")
+    return mix
+
+
+class SyntheticWorkload:
+    """按权重随机选择合成操作"""
+
+    def __init__(self, mix, options, seed=None):
+        self.names = [name for name, _ in mix]
+        self.weights = [weight for _, weight in mix]
+        self.options = options
+        self.rng = random.Random(seed)
+
+    def next(self):
+        name = self.rng.choices(self.names, self.weights)[0]
+        op = SYNTHETIC_OPS[name]
+        return name, lambda client: op(client, self.options)
+
+
+class ReplayWorkload:
+    """按顺序循环回放记录的调用"""
+
+    def __init__(self, calls, options):
+        if not calls:
+            raise ValueError("No replayable calls found")
+        self.calls = calls
+        self.options = options
+        self.cursor = itertools.cycle(calls)
+
+    def next(self):
+        call = next(self.cursor)
+        if call["kind"] == "async":
+            return call["label"], lambda client: run_async_call(
+                client, call["func"], call["args"], self.options.poll_interval, self.options.poll_timeout)
+        if call["kind"] == "rpc":
+            message = dict(call["message"])
+            return call["label"], lambda client: self._send_rpc(client, message)
+        return call["label"], lambda client: client.call_tool(call["name"], call["arguments"])
+
+    @staticmethod
+    async def _send_rpc(client, message):
+        if "id" in message:
+            message["id"] = next(client.ids)
+        result = await client.send_raw(message)
+        if message.get("method") == "tools/call":
+            tool_result = parse_tool_result(result)
+            if isinstance(tool_result, dict) and tool_result.get("success") is False:
+                raise RequestError(tool_result.get("error") or "tool failed")
+
+
+# ----------------------------------------------------------------------
+# 记录文件读取
+# ----------------------------------------------------------------------
+
+def record_to_call(name, cmd):
+    """把一条执行记录（name + cmd JSON）转换为回放调用，无法识别时返回 None"""
+    try:
+        payload = json.loads(cmd) if isinstance(cmd, str) else cmd
+    except json.JSONDecodeError:
+        return None
+
+    if isinstance(payload, list):
+        # batch_call 记录的 cmd 是函数数组
+        return {"kind": "tool", "label": "batch_call", "name": "batch_call", "arguments": {"args": payload}}
+    if not isinstance(payload, dict):
+        return None
+    if "jsonrpc" in payload and "method" in payload:
+        label = payload["method"]
+        if label == "tools/call":
+            label = (payload.get("params") or {}).get("name") or label
+        return {"kind": "rpc", "label": label, "message": payload}
+    if "func" in payload and "type" not in payload:
+        func = payload["func"]
+        return {"kind": "tool", "label": func, "name": func, "arguments": payload.get("args") or {}}
+    if payload.get("type") == "in" and payload.get("func"):
+        # async_call 提交记录：回放时使用新的任务 id 并轮询结果
+        return {"kind": "async", "label": "async_call", "func": payload["func"], "args": payload.get("args") or {}}
+    if payload.get("type") == "out":
+        # 轮询记录依赖原会话的任务 id，无法单独回放
+        return None
+    if name:
+        # 其他工具记录的是原始参数
+        tool = name.split(".")[0]
+        return {"kind": "tool", "label": tool, "name": tool, "arguments": payload}
+    return None
+
+
+def load_replay(path):
+    """读取 .asset（Unity YAML）、JSON 数组或 JSONL 格式的记录文件"""
+    with open(path, "r", encoding="utf-8-sig") as f:
+        text = f.read()
+
+    if path.endswith(".asset") or text.startswith("%YAML"):
+        entries = parse_unity_records(text)
+    else:
+        stripped = text.lstrip()
+        if stripped.startswith("["):
+            entries = json.loads(stripped)
+        elif stripped.startswith("{") and "\n{" not in stripped.strip():
+            data = json.loads(stripped)
+            entries = data.get("records") or data.get("calls") or [data]
+        else:
+            entries = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    calls = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        if "cmd" in entry or "requestContent" in entry:
+            call = record_to_call(entry.get("name"), entry.get("cmd") or entry.get("requestContent"))
+        else:
+            call = record_to_call(None, entry)
+        if call is not None:
+            calls.append(call)
+    return calls
+
+
+def parse_unity_records(text):
+    """
+    从 McpExecuteRecordObject.asset 中提取记录（name/cmd 与 requestContent）
+    只解析所需的标量字段，支持 Unity 输出的单引号、双引号和折行格式
+    """
+    entries = []
+    current = None
+    lines = text.splitlines()
+    index = 0
+    field_pattern = re.compile(r"^(\s*)(- )?(name|cmd|requestContent|records|recordGroups|httpRequestRecords):\s?(.*)$")
+    while index < len(lines):
+        match = field_pattern.match(lines[index])
+        index += 1
+        if not match:
+            continue
+        key, raw = match.group(3), match.group(4)
+        if key in ("records", "recordGroups", "httpRequestRecords"):
+            continue
+        value, index = read_yaml_scalar(raw, lines, index)
+        if key == "name" and match.group(2):
+            current = {"name": value}
+            entries.append(current)
+        elif key == "cmd" and current is not None:
+            current["cmd"] = value
+        elif key == "requestContent":
+            entries.append({"requestContent": value})
+    return [entry for entry in entries if entry.get("cmd") or entry.get("requestContent")]
+
+
+def read_yaml_scalar(raw, lines, index):
+    """读取一个 YAML 标量，返回 (值, 下一行索引)"""
+    raw = raw.strip()
+    if not raw or raw[0] not in "'\"":
+        return raw, index
+
+    quote = raw[0]
+    parts = [raw[1:]]
+    while not _closes(parts[-1], quote) and index < len(lines):
+        parts.append(lines[index].strip())
+        index += 1
+
+    # 折行规则：换行折叠为空格，空行表示换行
+    folded = ""
+    for i, part in enumerate(parts):
+        if i == 0:
+            folded = part
+        elif part == "":
+            folded += "\n"
+        elif quote == '"' and folded.endswith("\\") and not folded.endswith("\\\\"):
+            folded = folded[:-1] + part
+        elif folded.endswith("\n"):
+            folded += part
+        else:
+            folded += " " + part
+    body = folded.rstrip()[:-1]
+
+    if quote == "'":
+        return body.replace("''", "'"), index
+    return json.loads('"' + body.replace("\n", "\\n") + '"'), index
+
+
+def _closes(segment, quote):
+    segment = segment.rstrip()
+    if not segment.endswith(quote):
+        return False
+    if quote == "'":
+        # 末尾连续单引号为奇数个时才是结束引号
+        count = len(segment) - len(segment.rstrip("'"))
+        return count % 2 == 1
+    count = len(segment[:-1]) - len(segment[:-1].rstrip("\\"))
+    return count % 2 == 0
+
+
+# ----------------------------------------------------------------------
+# 统计
+# ----------------------------------------------------------------------
+
+def percentile(sorted_values, p):
+    """最近秩法百分位数"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class StepStats:
+    """单个并发级别的统计"""
+
+    def __init__(self, concurrency):
+        self.concurrency = concurrency
+        self.latencies = {}
+        self.errors = {}
+        self.error_samples = {}
+        self.elapsed = 0.0
+
+    def add(self, label, latency_ms, error=None):
+        self.latencies.setdefault(label, []).append(latency_ms)
+        if error is not None:
+            self.errors[label] = self.errors.get(label, 0) + 1
+            samples = self.error_samples.setdefault(label, [])
+            if len(samples) < 5:
+                samples.append(str(error))
+
+    def rows(self):
+        labels = sorted(self.latencies)
+        everything = [v for label in labels for v in self.latencies[label]]
+        rows = [self._row(label, self.latencies[label], self.errors.get(label, 0)) for label in labels]
+        rows.append(self._row("ALL", everything, sum(self.errors.values())))
+        return rows
+
+    def _row(self, label, values, errors):
+        values = sorted(values)
+        count = len(values)
+        return {
+            "concurrency": self.concurrency,
+            "operation": label,
+            "requests": count,
+            "errors": errors,
+            "error_rate": round(errors / count, 4) if count else 0.0,
+            "throughput_rps": round(count / self.elapsed, 2) if self.elapsed > 0 else 0.0,
+            "mean_ms": round(sum(values) / count, 3) if count else 0.0,
+            "p50_ms": round(percentile(values, 50), 3),
+            "p95_ms": round(percentile(values, 95), 3),
+            "p99_ms": round(percentile(values, 99), 3),
+            "max_ms": round(values[-1], 3) if values else 0.0,
+        }
+
+
+async def run_step(client, workload, concurrency, duration=None, requests=None):
+    """以固定并发运行一级负载，按时长或请求数结束"""
+    stats = StepStats(concurrency)
+    issued = itertools.count()
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+
+    async def worker():
+        while True:
+            if requests is not None and next(issued) >= requests:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            label, op = workload.next()
+            began = time.perf_counter()
+            error = None
+            try:
+                await op(client)
+            except (RequestError, json.JSONDecodeError, OSError, ValueError) as ex:
+                error = ex
+            stats.add(label, (time.perf_counter() - began) * 1000.0, error)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+async def run_benchmark(options):
+    if options.replay:
+        workload = ReplayWorkload(load_replay(options.replay), options)
+        print(f"回放 {len(workload.calls)} 条记录: {options.replay}")
+    else:
+        workload = SyntheticWorkload(parse_mix(options.mix), options, options.seed)
+
+    levels = parse_levels(options.concurrency)
+    pool = HttpConnectionPool(options.host, options.port, max_size=max(levels), timeout=options.timeout)
+    client = McpClient(pool)
+    try:
+        server_info = await client.rpc("initialize", {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "mcp_benchmark", "version": "1.0"},
+        })
+        print(f"已连接: {(server_info or {}).get('serverInfo', {}).get('name', 'unknown')} "
+              f"({options.host}:{options.port})")
+
+        if options.warmup > 0:
+            await run_step(client, workload, min(levels), requests=options.warmup)
+
+        steps = []
+        for level in levels:
+            stats = await run_step(client, workload, level, options.duration, options.requests)
+            steps.append(stats)
+            print_step(stats)
+        return steps
+    finally:
+        await pool.close()
+
+
+def parse_levels(spec):
+    """解析并发级别：'1,4,16' 或 'start:stop:factor' 形式的几何递增"""
+    if ":" in spec:
+        start, stop, factor = (spec.split(":") + ["2"])[:3]
+        level, stop, factor = int(start), int(stop), float(factor)
+        levels = []
+        while level <= stop:
+            levels.append(level)
+            level = max(level + 1, int(level * factor))
+        return levels
+    return [int(x) for x in spec.split(",") if x.strip()]
+
+
+def print_step(stats):
+    print(f"\n并发 {stats.concurrency}  用时 {stats.elapsed:.2f}s")
+    print(f"{'operation':<20}{'reqs':>8}{'err%':>8}{'rps':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for row in stats.rows():
+        print(f"{row['operation']:<20}{row['requests']:>8}{row['error_rate'] * 100:>7.1f}%"
+              f"{row['throughput_rps']:>10.1f}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}"
+              f"{row['p99_ms']:>10.2f}{row['max_ms']:>10.2f}")
+    for label, samples in stats.error_samples.items():
+        print(f"  {label} 错误示例: {samples[0]}")
+
+
+def write_reports(steps, options):
+    rows = [row for step in steps for row in step.rows()]
+    if options.json:
+        report = {
+            "target": f"{options.host}:{options.port}",
+            "workload": options.replay or options.mix,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "steps": [{"concurrency": step.concurrency, "elapsed_s": round(step.elapsed, 3),
+                       "results": step.rows(), "error_samples": step.error_samples} for step in steps],
+        }
+        with open(options.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\nJSON 报告: {options.json}")
+    if options.csv:
+        with open(options.csv, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"CSV 报告: {options.csv}")
+
+
+async def run_self_test(options):
+    """启动本地替身服务器并对其运行压测"""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from mcp_standin_server import StandinConfig, StandinMcpServer
+
+    server = await StandinMcpServer(StandinConfig(delay_ms=1.0, jitter_ms=0.5, error_rate=0.01, seed=1),
+                                    port=0).start()
+    options.port = server.port
+    try:
+        return await run_benchmark(options)
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unity MCP 服务压测工具")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"合成负载配比，默认 {DEFAULT_MIX}")
+    parser.add_argument("--replay", help="回放记录文件（.asset / JSON / JSONL）")
+    parser.add_argument("--concurrency", default="1,4,16", help="并发级别，如 1,4,16 或 1:64:2")
+    parser.add_argument("--duration", type=float, default=None, help="每级持续时间（秒）")
+    parser.add_argument("--requests", type=int, default=None, help="每级请求数")
+    parser.add_argument("--warmup", type=int, default=20, help="预热请求数")
+    parser.add_argument("--batch-size", type=int, default=10, help="batch_call 每批函数数量")
+    parser.add_argument("--query", default="*", help="hierarchy_search 的查询条件")
+    parser.add_argument("--poll-interval", type=float, default=0.05, help="async_call 轮询间隔（秒）")
+    parser.add_argument("--poll-timeout", type=float, default=30.0, help="async_call 轮询超时（秒）")
+    parser.add_argument("--timeout", type=float, default=30.0, help="单次请求超时（秒）")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", help="JSON 报告输出路径")
+    parser.add_argument("--csv", help="CSV 报告输出路径")
+    parser.add_argument("--self-test", action="store_true", help="对内置替身服务器运行")
+    options = parser.parse_args()
+
+    if options.duration is None and options.requests is None:
+        if options.self_test:
+            options.requests = 200
+        else:
+            options.duration = 10.0
+
+    try:
+        runner = run_self_test(options) if options.self_test else run_benchmark(options)
+        steps = asyncio.run(runner)
+    except (RequestError, OSError, ValueError) as ex:
+        print(f"压测失败: {ex}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+    write_reports(steps, options)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unity MCP 服务的本地替身服务器（仅依赖标准库）
+
+模拟 McpService 的 JSON-RPC 接口（POST /），用于在没有 Unity 的情况下测试 mcp_benchmark.py：
+- initialize / notifications/initialized / tools/list / tools/call
+- tools/call 支持 hierarchy_search、batch_call、async_call（in/out 轮询）以及任意其他工具名
+- 默认串行执行工具调用，模拟 Unity 主线程队列；可配置每个工具的延迟、抖动和错误率
+
+用法:
+    python mcp_standin_server.py --port 8000 --delay 2 --tool-delay hierarchy_search=5 --jitter 1
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+PROTOCOL_VERSION = "2024-11-05"
+
+STANDIN_TOOLS = [
+    ("hierarchy_search", "Search GameObjects in the scene hierarchy"),
+    ("batch_call", "Execute multiple function calls sequentially"),
+    ("async_call", "Execute a function asynchronously and poll for the result"),
+    ("sync_call", "Execute a function synchronously"),
+    ("edit_scene", "Scene management"),
+    ("edit_gameobject", "GameObject management"),
+    ("edit_component", "Component management"),
+    ("project_search", "Search assets in the project"),
+]
+
+
+class StandinConfig:
+    """替身服务器的延迟与错误配置"""
+
+    def __init__(self, delay_ms=1.0, tool_delays=None, jitter_ms=0.0, error_rate=0.0,
+                 async_steps=3, serial=True, seed=None):
+        self.delay_ms = delay_ms
+        self.tool_delays = dict(tool_delays or {})
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.async_steps = max(0, async_steps)
+        self.serial = serial
+        self.rng = random.Random(seed)
+
+    def delay_for(self, tool_name):
+        """计算某个工具一次调用的模拟执行耗时（秒）"""
+        base = self.tool_delays.get(tool_name, self.delay_ms)
+        if self.jitter_ms > 0:
+            base += self.rng.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, base) / 1000.0
+
+    def should_fail(self):
+        return self.error_rate > 0 and self.rng.random() < self.error_rate
+
+
+def success(message, data=None):
+    response = {"success": True, "message": message}
+    if data is not None:
+        response["data"] = data
+    return response
+
+
+def error(message):
+    return {"success": False, "error": message}
+
+
+class StandinMcpServer:
+    """模拟 McpService JSON-RPC 接口的 asyncio HTTP/1.1 服务器（支持 keep-alive）"""
+
+    def __init__(self, config=None, host="127.0.0.1", port=8000):
+        self.config = config or StandinConfig()
+        self.host = host
+        self.port = port
+        self.server = None
+        self.main_thread = asyncio.Lock()
+        self.async_tasks = {}
+        self.request_count = 0
+        self.connections = {}
+        self.started_at = time.time()
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        # 端口为0时回填实际监听端口
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            # 关闭空闲的 keep-alive 连接，使连接处理协程正常退出
+            handlers = list(self.connections.values())
+            for writer in list(self.connections):
+                writer.close()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self.server.wait_closed()
+            self.server = None
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    # ------------------------------------------------------------------
+    # HTTP 层
+    # ------------------------------------------------------------------
+
+    async def handle_connection(self, reader, writer):
+        self.connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                parts = request_line.decode("latin-1").split()
+                if len(parts) < 2:
+                    break
+                method, path = parts[0].upper(), parts[1]
+                version = parts[2] if len(parts) > 2 else "HTTP/1.0"
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", "0") or 0)
+                body = await reader.readexactly(length) if length > 0 else b""
+
+                status, content_type, payload = await self.dispatch(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+                head = (
+                    f"HTTP/1.1 {status}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    "\r\n"
+                )
+                writer.write(head.encode("latin-1") + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.connections.pop(writer, None)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def dispatch(self, method, path, body):
+        if method == "GET":
+            info = {
+                "name": "Unity MCP Stand-in",
+                "version": "0.0.0",
+                "status": "running",
+                "port": self.port,
+                "toolCount": len(STANDIN_TOOLS),
+                "protocol": "MCP",
+                "protocolVersion": PROTOCOL_VERSION,
+                "requests": self.request_count,
+            }
+            return "200 OK", "application/json", json.dumps(info).encode("utf-8")
+
+        if method != "POST":
+            return "405 Method Not Allowed", "text/plain", b"Method Not Allowed"
+
+        self.request_count += 1
+        try:
+            request = json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as ex:
+            return "200 OK", "application/json", self.rpc_error(None, -32700, f"Parse error: {ex}")
+
+        response = await self.handle_rpc(request)
+        if response is None:
+            return "202 Accepted", "application/json", b""
+        return "200 OK", "application/json", response
+
+    # ------------------------------------------------------------------
+    # JSON-RPC 层
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def rpc_result(request_id, result):
+        return json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result},
+                          ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def rpc_error(request_id, code, message):
+        return json.dumps({"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}},
+                          ensure_ascii=False).encode("utf-8")
+
+    async def handle_rpc(self, request):
+        request_id = request.get("id")
+        method = request.get("method")
+        params = request.get("params") or {}
+
+        if method == "initialize":
+            return self.rpc_result(request_id, {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {"tools": {"listChanged": False}},
+                "serverInfo": {"name": "Unity MCP Stand-in", "version": "0.0.0"},
+            })
+        if method == "notifications/initialized":
+            return None
+        if method == "tools/list":
+            tools = [{"name": name, "description": desc, "inputSchema": {"type": "object", "properties": {}}}
+                     for name, desc in STANDIN_TOOLS]
+            return self.rpc_result(request_id, {"tools": tools})
+        if method == "tools/call":
+            name = params.get("name")
+            if not name:
+                return self.rpc_error(request_id, -32602, "Missing tool name")
+            result = await self.call_tool(name, params.get("arguments") or {})
+            content = [{"type": "text", "text": json.dumps(result, ensure_ascii=False)}]
+            return self.rpc_result(request_id, {"content": content})
+        return self.rpc_error(request_id, -32601, f"Method not found: {method}")
+
+    async def run_on_main_thread(self, tool_name, func):
+        """模拟 EnqueueTask：串行模式下所有工具调用排队执行"""
+        delay = self.config.delay_for(tool_name)
+        if self.config.serial:
+            async with self.main_thread:
+                await asyncio.sleep(delay)
+                return func()
+        await asyncio.sleep(delay)
+        return func()
+
+    async def call_tool(self, name, arguments):
+        if name == "batch_call":
+            funcs = arguments.get("args") if isinstance(arguments, dict) else arguments
+            if not isinstance(funcs, list):
+                return error("Required parameter 'funcs' is missing or not an array.")
+            results = []
+            errors = []
+            for item in funcs:
+                func = item.get("func") if isinstance(item, dict) else None
+                result = await self.call_tool(func or "", (item or {}).get("args") or {})
+                results.append(result)
+                errors.append(None if result.get("success") else result.get("error"))
+            return success("Batch call completed.", {"results": results, "errors": errors})
+
+        if name == "async_call":
+            return self.handle_async_call(arguments)
+
+        if not name:
+            return error("Required parameter 'func' is missing or empty.")
+
+        def execute():
+            if self.config.should_fail():
+                return error(f"Simulated failure in '{name}'")
+            if name == "hierarchy_search":
+                query = arguments.get("query") or "*"
+                return success(f"Found 1 GameObject(s) matching '{query}'",
+                               [{"name": "Main Camera", "instanceID": 1000, "path": "Main Camera"}])
+            return success(f"Stand-in executed '{name}'", {"args": arguments})
+
+        return await self.run_on_main_thread(name, execute)
+
+    def handle_async_call(self, arguments):
+        task_id = arguments.get("id")
+        call_type = arguments.get("type")
+        if not task_id:
+            return error("Required parameter 'id' is missing or empty.")
+
+        if call_type == "in":
+            func = arguments.get("func")
+            if not func:
+                return error("Required parameter 'func' is missing or empty for type 'in'.")
+            if task_id in self.async_tasks:
+                return error(f"Task with id '{task_id}' is already running.")
+            state = {"remaining": self.config.async_steps, "result": None}
+            self.async_tasks[task_id] = state
+
+            async def run():
+                state["result"] = await self.call_tool(func, arguments.get("args") or {})
+
+            state["task"] = asyncio.ensure_future(run())
+            return success(f"Task '{task_id}' started.")
+
+        if call_type == "out":
+            state = self.async_tasks.get(task_id)
+            if state is None:
+                return error(f"No task found with id '{task_id}'. "
+                             "It might have been completed and retrieved, or never started.")
+            if state["remaining"] > 0 or not state["task"].done():
+                state["remaining"] -= 1
+                return success("Task is still in progress.")
+            del self.async_tasks[task_id]
+            return state["result"] or success("Task completed with no return value.")
+
+        return error(f"Invalid 'type' parameter: {call_type}. Must be 'in' or 'out'.")
+
+
+def parse_tool_delays(values):
+    delays = {}
+    for value in values or []:
+        name, sep, ms = value.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"Invalid --tool-delay '{value}', expected name=ms")
+        delays[name.strip()] = float(ms)
+    return delays
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unity MCP 本地替身服务器")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--delay", type=float, default=1.0, help="默认工具执行耗时（毫秒）")
+    parser.add_argument("--tool-delay", action="append", metavar="NAME=MS", help="指定工具的执行耗时，可重复")
+    parser.add_argument("--jitter", type=float, default=0.0, help="执行耗时的随机抖动（毫秒）")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="模拟工具失败的概率（0~1）")
+    parser.add_argument("--async-steps", type=int, default=3, help="async_call 完成前返回“进行中”的轮询次数")
+    parser.add_argument("--parallel", action="store_true", help="并行执行工具调用（默认串行，模拟主线程）")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        delay_ms=args.delay,
+        tool_delays=parse_tool_delays(args.tool_delay),
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        async_steps=args.async_steps,
+        serial=not args.parallel,
+        seed=args.seed,
+    )
+
+    async def run():
+        server = await StandinMcpServer(config, args.host, args.port).start()
+        print(f"MCP 替身服务器已启动: http://{server.host}:{server.port}/")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("已停止")
+
+
+if __name__ == "__main__":
+    main()
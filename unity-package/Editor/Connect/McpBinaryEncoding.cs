@@ -0,0 +1,813 @@
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.IO;
+using System.Text;
+using System.Threading;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// JSON-RPC 消息的传输编码
+    /// </summary>
+    public enum McpWireFormat
+    {
+        Json,
+        MessagePack,
+        Cbor
+    }
+
+    /// <summary>
+    /// MessagePack/CBOR 紧凑编码与协商。
+    /// 客户端在 initialize 的 capabilities.experimental.binary 中声明支持的编码和附件能力：
+    /// {"encodings": ["msgpack", "cbor"], "attachments": true}
+    /// 服务器在响应的同一位置返回接受的子集。协商后，客户端通过 Accept 头选择响应编码，
+    /// 请求体可按 Content-Type 以相同编码发送。未协商或未声明时始终使用纯 JSON。
+    /// 协商结果按会话（McpSession）保存，不同客户端互不影响；未携带会话的请求始终使用纯 JSON。
+    /// 以二进制编码响应时，工具结果放在 structuredContent 中，响应节点直接编码，不经过 JSON 文本。
+    /// </summary>
+    public static class McpBinaryEncoding
+    {
+        public const string CapabilityName = "binary";
+
+        /// <summary>
+        /// 保留协商结果的会话数上限，超出时淘汰最早协商的会话
+        /// </summary>
+        public const int MaxSessions = 256;
+
+        private sealed class Negotiation
+        {
+            public McpWireFormat[] Formats;
+            public bool Attachments;
+        }
+
+        private static readonly object _lock = new object();
+        private static readonly Dictionary<string, Negotiation> _sessions = new Dictionary<string, Negotiation>(StringComparer.Ordinal);
+        private static readonly Queue<string> _sessionOrder = new Queue<string>();
+
+        private sealed class ResponseScope
+        {
+            public JsonNode Response;
+        }
+
+        private static readonly AsyncLocal<ResponseScope> _response = new AsyncLocal<ResponseScope>();
+
+        /// <summary>
+        /// 会话是否已协商附件模式（大块结果以 /blob/{id} 句柄返回）
+        /// </summary>
+        public static bool IsAttachmentsEnabled(string sessionId)
+        {
+            lock (_lock)
+                return sessionId != null && _sessions.TryGetValue(sessionId, out var negotiation) && negotiation.Attachments;
+        }
+
+        /// <summary>
+        /// 会话已协商的二进制编码
+        /// </summary>
+        public static McpWireFormat[] GetNegotiatedFormats(string sessionId)
+        {
+            lock (_lock)
+                return sessionId != null && _sessions.TryGetValue(sessionId, out var negotiation) ? negotiation.Formats : Array.Empty<McpWireFormat>();
+        }
+
+        /// <summary>
+        /// 会话结束时移除其协商结果
+        /// </summary>
+        internal static void Forget(string sessionId)
+        {
+            if (sessionId == null)
+                return;
+            lock (_lock)
+                _sessions.Remove(sessionId);
+        }
+
+        #region 协商
+
+        /// <summary>
+        /// 根据 initialize 请求中的客户端能力为会话完成协商，返回应写入 capabilities.experimental 的服务器能力；
+        /// 客户端未声明时该会话重置为纯 JSON 并返回 null
+        /// </summary>
+        internal static JsonClass Negotiate(string sessionId, JsonNode clientCapabilities)
+        {
+            // 没有会话时无法保存协商结果，不声明二进制能力
+            if (sessionId == null)
+                return null;
+
+            var requested = clientCapabilities?["experimental"]?[CapabilityName] as JsonClass;
+
+            var formats = new List<McpWireFormat>();
+            bool attachments = false;
+            if (requested != null)
+            {
+                if (requested["encodings"] is JsonArray encodings)
+                {
+                    foreach (JsonNode encoding in encodings)
+                    {
+                        var format = ParseFormatName(encoding?.Value);
+                        if (format != McpWireFormat.Json && !formats.Contains(format))
+                            formats.Add(format);
+                    }
+                }
+                attachments = requested["attachments"]?.AsBool ?? false;
+            }
+
+            Store(sessionId, requested == null ? null : new Negotiation { Formats = formats.ToArray(), Attachments = attachments });
+
+            if (requested == null)
+                return null;
+
+            var accepted = new JsonArray();
+            foreach (var format in formats)
+                accepted.Add(new JsonData(GetFormatName(format)));
+
+            var capability = new JsonClass();
+            capability.Add("encodings", accepted);
+            if (attachments)
+            {
+                var attachmentInfo = new JsonClass();
+                attachmentInfo.Add("route", new JsonData("/blob/{id}"));
+                attachmentInfo.Add("ttlSeconds", new JsonData((int)McpBlobStore.DefaultTtl.TotalSeconds));
+                attachmentInfo.Add("maxBytes", new JsonData(McpBlobStore.MaxTotalBytes));
+                capability.Add("attachments", attachmentInfo);
+            }
+            else
+            {
+                capability.Add("attachments", new JsonData(false));
+            }
+            return capability;
+        }
+
+        private static void Store(string sessionId, Negotiation negotiation)
+        {
+            if (sessionId == null)
+                return;
+            lock (_lock)
+            {
+                if (negotiation == null)
+                {
+                    _sessions.Remove(sessionId);
+                    return;
+                }
+                if (!_sessions.ContainsKey(sessionId))
+                    _sessionOrder.Enqueue(sessionId);
+                _sessions[sessionId] = negotiation;
+
+                // 队列中可能残留已移除的会话，只按仍存在的会话计数淘汰
+                while (_sessions.Count > MaxSessions && _sessionOrder.Count > 0)
+                    _sessions.Remove(_sessionOrder.Dequeue());
+                if (_sessionOrder.Count > MaxSessions * 2)
+                {
+                    var live = new List<string>(_sessionOrder);
+                    _sessionOrder.Clear();
+                    foreach (string id in live)
+                    {
+                        if (_sessions.ContainsKey(id))
+                            _sessionOrder.Enqueue(id);
+                    }
+                }
+            }
+        }
+
+        /// <summary>
+        /// 根据 Accept 头选择响应编码，只会选择该会话已协商的编码
+        /// </summary>
+        public static McpWireFormat SelectResponseFormat(string acceptHeader, string sessionId)
+        {
+            if (string.IsNullOrEmpty(acceptHeader))
+                return McpWireFormat.Json;
+
+            var negotiated = GetNegotiatedFormats(sessionId);
+            if (negotiated.Length == 0)
+                return McpWireFormat.Json;
+
+            foreach (var part in acceptHeader.Split(','))
+            {
+                var format = FromMediaType(part);
+                if (format != McpWireFormat.Json && Array.IndexOf(negotiated, format) >= 0)
+                    return format;
+            }
+            return McpWireFormat.Json;
+        }
+
+        /// <summary>
+        /// 根据 Content-Type/Accept 中的媒体类型识别编码
+        /// </summary>
+        public static McpWireFormat FromMediaType(string mediaType)
+        {
+            if (string.IsNullOrEmpty(mediaType))
+                return McpWireFormat.Json;
+
+            int separator = mediaType.IndexOf(';');
+            string type = (separator >= 0 ? mediaType.Substring(0, separator) : mediaType).Trim().ToLowerInvariant();
+            switch (type)
+            {
+                case "application/msgpack":
+                case "application/x-msgpack":
+                case "application/vnd.msgpack":
+                    return McpWireFormat.MessagePack;
+                case "application/cbor":
+                    return McpWireFormat.Cbor;
+                default:
+                    return McpWireFormat.Json;
+            }
+        }
+
+        public static string GetMediaType(McpWireFormat format)
+        {
+            switch (format)
+            {
+                case McpWireFormat.MessagePack: return "application/msgpack";
+                case McpWireFormat.Cbor: return "application/cbor";
+                default: return "application/json";
+            }
+        }
+
+        private static string GetFormatName(McpWireFormat format)
+        {
+            return format == McpWireFormat.MessagePack ? "msgpack" : format == McpWireFormat.Cbor ? "cbor" : "json";
+        }
+
+        private static McpWireFormat ParseFormatName(string name)
+        {
+            switch (name?.Trim().ToLowerInvariant())
+            {
+                case "msgpack":
+                case "messagepack":
+                    return McpWireFormat.MessagePack;
+                case "cbor":
+                    return McpWireFormat.Cbor;
+                default:
+                    return McpWireFormat.Json;
+            }
+        }
+
+        #endregion
+
+        #region 编码
+
+        /// <summary>
+        /// 将 JSON 节点编码为指定格式
+        /// </summary>
+        public static byte[] Encode(JsonNode node, McpWireFormat format)
+        {
+            if (format == McpWireFormat.Json)
+                return Encoding.UTF8.GetBytes(node?.ToString() ?? "null");
+
+            using (var stream = new MemoryStream())
+            {
+                var writer = new Writer(stream, format);
+                writer.WriteNode(node, 0);
+                return stream.ToArray();
+            }
+        }
+
+        /// <summary>
+        /// 将 JSON-RPC 响应文本编码为指定格式
+        /// </summary>
+        public static byte[] EncodeJson(string json, McpWireFormat format)
+        {
+            if (format == McpWireFormat.Json)
+                return Encoding.UTF8.GetBytes(json);
+            return Encode(Json.Parse(json), format);
+        }
+
+        /// <summary>
+        /// 开始处理一个请求，记录本次响应的编码；在处理请求的 async 方法内调用，随 await 流向各处理函数
+        /// </summary>
+        internal static void BeginResponse(McpWireFormat format)
+        {
+            _response.Value = format == McpWireFormat.Json ? null : new ResponseScope();
+        }
+
+        /// <summary>
+        /// 当前请求的响应是否以二进制编码输出
+        /// </summary>
+        public static bool IsBinaryResponse => _response.Value != null;
+
+        /// <summary>
+        /// 二进制响应时保存构建好的响应节点并返回 true，调用方不必再序列化为文本
+        /// </summary>
+        internal static bool CaptureResponse(JsonNode response)
+        {
+            var scope = _response.Value;
+            if (scope == null)
+                return false;
+            scope.Response = response;
+            return true;
+        }
+
+        /// <summary>
+        /// 编码当前请求的响应：已保存响应节点时直接编码，否则编码响应文本
+        /// </summary>
+        internal static byte[] EncodeResponse(string json, McpWireFormat format)
+        {
+            var captured = _response.Value?.Response;
+            if (captured != null && format != McpWireFormat.Json)
+                return Encode(captured, format);
+            return EncodeJson(json, format);
+        }
+
+        private sealed class Writer
+        {
+            private readonly Stream _stream;
+            private readonly bool _cbor;
+            private readonly byte[] _scratch = new byte[9];
+
+            public Writer(Stream stream, McpWireFormat format)
+            {
+                _stream = stream;
+                _cbor = format == McpWireFormat.Cbor;
+            }
+
+            public void WriteNode(JsonNode node, int depth)
+            {
+                if (node is JsonClass obj)
+                {
+                    WriteMapHeader(obj.Count);
+                    foreach (KeyValuePair<string, JsonNode> pair in obj)
+                    {
+                        WriteString(pair.Key);
+                        // JSON-RPC 版本号必须是字符串，与 CreateMcpSuccessResponse 中的修正保持一致
+                        if (depth == 0 && pair.Key == "jsonrpc" && pair.Value is JsonData version)
+                            WriteString(version.Value);
+                        else
+                            WriteNode(pair.Value, depth + 1);
+                    }
+                }
+                else if (node is JsonArray array)
+                {
+                    WriteArrayHeader(array.Count);
+                    for (int i = 0; i < array.Count; i++)
+                        WriteNode(array[i], depth + 1);
+                }
+                else if (node is JsonData data)
+                {
+                    WriteData(data);
+                }
+                else
+                {
+                    WriteNull();
+                }
+            }
+
+            /// <summary>
+            /// 与 JsonData.ToString 的输出保持一致：能推断为数字/布尔的文本按对应类型编码
+            /// </summary>
+            private void WriteData(JsonData data)
+            {
+                if (data.IsNumber)
+                {
+                    WriteNumber(data.AsDouble, data.type == JsonNodeType.Integer, data.Value);
+                    return;
+                }
+
+                string text = data.Value;
+                switch (data.type)
+                {
+                    case JsonNodeType.Boolean:
+                        WriteBool(data.AsBool);
+                        return;
+                    case JsonNodeType.Null:
+                        if (text == null || text == "null")
+                            WriteNull();
+                        else
+                            WriteString(text);
+                        return;
+                    case JsonNodeType.Integer:
+                    case JsonNodeType.Float:
+                        if (double.TryParse(text, NumberStyles.Float, CultureInfo.InvariantCulture, out double value))
+                            WriteNumber(value, data.type == JsonNodeType.Integer, text);
+                        else
+                            WriteString(text);
+                        return;
+                    default:
+                        WriteString(text);
+                        return;
+                }
+            }
+
+            private void WriteNumber(double value, bool isInteger, string text)
+            {
+                if (long.TryParse(text, NumberStyles.AllowLeadingSign, CultureInfo.InvariantCulture, out long integer))
+                {
+                    WriteInteger(integer);
+                    return;
+                }
+                if (isInteger && Math.Abs(value) < 9.2e18 && Math.Floor(value) == value)
+                {
+                    WriteInteger((long)value);
+                    return;
+                }
+                if (!double.IsNaN(value) && (double)(float)value == value)
+                    WriteSingle((float)value);
+                else
+                    WriteDouble(value);
+            }
+
+            private void WriteNull()
+            {
+                _stream.WriteByte(_cbor ? (byte)0xf6 : (byte)0xc0);
+            }
+
+            private void WriteBool(bool value)
+            {
+                if (_cbor)
+                    _stream.WriteByte(value ? (byte)0xf5 : (byte)0xf4);
+                else
+                    _stream.WriteByte(value ? (byte)0xc3 : (byte)0xc2);
+            }
+
+            private void WriteInteger(long value)
+            {
+                if (_cbor)
+                {
+                    if (value >= 0)
+                        WriteCborHead(0, (ulong)value);
+                    else
+                        WriteCborHead(1, (ulong)(-1 - value));
+                    return;
+                }
+
+                if (value >= 0)
+                {
+                    if (value <= 0x7f) _stream.WriteByte((byte)value);
+                    else if (value <= byte.MaxValue) WriteBigEndian(0xcc, (ulong)value, 1);
+                    else if (value <= ushort.MaxValue) WriteBigEndian(0xcd, (ulong)value, 2);
+                    else if (value <= uint.MaxValue) WriteBigEndian(0xce, (ulong)value, 4);
+                    else WriteBigEndian(0xcf, (ulong)value, 8);
+                }
+                else
+                {
+                    if (value >= -32) _stream.WriteByte((byte)(sbyte)value);
+                    else if (value >= sbyte.MinValue) WriteBigEndian(0xd0, (ulong)value, 1);
+                    else if (value >= short.MinValue) WriteBigEndian(0xd1, (ulong)value, 2);
+                    else if (value >= int.MinValue) WriteBigEndian(0xd2, (ulong)value, 4);
+                    else WriteBigEndian(0xd3, (ulong)value, 8);
+                }
+            }
+
+            private void WriteSingle(float value)
+            {
+                uint bits = (uint)BitConverter.ToInt32(BitConverter.GetBytes(value), 0);
+                WriteBigEndian(_cbor ? (byte)0xfa : (byte)0xca, bits, 4);
+            }
+
+            private void WriteDouble(double value)
+            {
+                ulong bits = (ulong)BitConverter.DoubleToInt64Bits(value);
+                WriteBigEndian(_cbor ? (byte)0xfb : (byte)0xcb, bits, 8);
+            }
+
+            private void WriteString(string value)
+            {
+                byte[] bytes = Encoding.UTF8.GetBytes(value ?? string.Empty);
+                if (_cbor)
+                {
+                    WriteCborHead(3, (ulong)bytes.Length);
+                }
+                else
+                {
+                    int length = bytes.Length;
+                    if (length < 32) _stream.WriteByte((byte)(0xa0 | length));
+                    else if (length <= byte.MaxValue) WriteBigEndian(0xd9, (ulong)length, 1);
+                    else if (length <= ushort.MaxValue) WriteBigEndian(0xda, (ulong)length, 2);
+                    else WriteBigEndian(0xdb, (ulong)length, 4);
+                }
+                _stream.Write(bytes, 0, bytes.Length);
+            }
+
+            private void WriteArrayHeader(int count)
+            {
+                if (_cbor) WriteCborHead(4, (ulong)count);
+                else if (count < 16) _stream.WriteByte((byte)(0x90 | count));
+                else if (count <= ushort.MaxValue) WriteBigEndian(0xdc, (ulong)count, 2);
+                else WriteBigEndian(0xdd, (ulong)count, 4);
+            }
+
+            private void WriteMapHeader(int count)
+            {
+                if (_cbor) WriteCborHead(5, (ulong)count);
+                else if (count < 16) _stream.WriteByte((byte)(0x80 | count));
+                else if (count <= ushort.MaxValue) WriteBigEndian(0xde, (ulong)count, 2);
+                else WriteBigEndian(0xdf, (ulong)count, 4);
+            }
+
+            private void WriteCborHead(int majorType, ulong value)
+            {
+                byte major = (byte)(majorType << 5);
+                if (value < 24) _stream.WriteByte((byte)(major | (byte)value));
+                else if (value <= byte.MaxValue) WriteBigEndian((byte)(major | 24), value, 1);
+                else if (value <= ushort.MaxValue) WriteBigEndian((byte)(major | 25), value, 2);
+                else if (value <= uint.MaxValue) WriteBigEndian((byte)(major | 26), value, 4);
+                else WriteBigEndian((byte)(major | 27), value, 8);
+            }
+
+            private void WriteBigEndian(byte prefix, ulong value, int size)
+            {
+                _scratch[0] = prefix;
+                for (int i = size; i >= 1; i--)
+                {
+                    _scratch[i] = (byte)value;
+                    value >>= 8;
+                }
+                _stream.Write(_scratch, 0, size + 1);
+            }
+        }
+
+        #endregion
+
+        #region 解码
+
+        /// <summary>
+        /// 将 MessagePack/CBOR 数据解码为 JSON 节点；二进制串以 base64 字符串表示
+        /// </summary>
+        public static JsonNode Decode(byte[] data, McpWireFormat format)
+        {
+            if (data == null)
+                throw new ArgumentNullException(nameof(data));
+            if (format == McpWireFormat.Json)
+                return Json.Parse(Encoding.UTF8.GetString(data));
+
+            var reader = new Reader(data, format);
+            var node = reader.ReadNode(0);
+            if (!reader.AtEnd)
+                throw new FormatException("Unexpected trailing data after the encoded value.");
+            return node;
+        }
+
+        private sealed class Reader
+        {
+            private const int MaxDepth = 256;
+
+            private readonly byte[] _data;
+            private readonly bool _cbor;
+            private int _position;
+
+            public Reader(byte[] data, McpWireFormat format)
+            {
+                _data = data;
+                _cbor = format == McpWireFormat.Cbor;
+            }
+
+            public bool AtEnd => _position >= _data.Length;
+
+            public JsonNode ReadNode(int depth)
+            {
+                if (depth > MaxDepth)
+                    throw new FormatException("Encoded value is nested too deeply.");
+                return _cbor ? ReadCbor(depth) : ReadMessagePack(depth);
+            }
+
+            private JsonNode ReadMessagePack(int depth)
+            {
+                byte b = ReadByte();
+                if (b <= 0x7f) return new JsonData((int)b);
+                if (b >= 0xe0) return new JsonData((int)(sbyte)b);
+                if ((b & 0xf0) == 0x80) return ReadMap(b & 0x0f, depth);
+                if ((b & 0xf0) == 0x90) return ReadArray(b & 0x0f, depth);
+                if ((b & 0xe0) == 0xa0) return new JsonData(ReadUtf8(b & 0x1f));
+
+                switch (b)
+                {
+                    case 0xc0: return new JsonData((string)null);
+                    case 0xc2: return new JsonData(false);
+                    case 0xc3: return new JsonData(true);
+                    case 0xc4: return new JsonData(ReadBase64((int)ReadBigEndian(1)));
+                    case 0xc5: return new JsonData(ReadBase64((int)ReadBigEndian(2)));
+                    case 0xc6: return new JsonData(ReadBase64(ReadLength(ReadBigEndian(4))));
+                    case 0xca: return new JsonData(ReadSingle());
+                    case 0xcb: return new JsonData(BitConverter.Int64BitsToDouble((long)ReadBigEndian(8)));
+                    case 0xcc: return new JsonData((long)ReadBigEndian(1));
+                    case 0xcd: return new JsonData((long)ReadBigEndian(2));
+                    case 0xce: return new JsonData((long)ReadBigEndian(4));
+                    case 0xcf: return CreateUnsigned(ReadBigEndian(8));
+                    case 0xd0: return new JsonData((long)(sbyte)ReadBigEndian(1));
+                    case 0xd1: return new JsonData((long)(short)ReadBigEndian(2));
+                    case 0xd2: return new JsonData((long)(int)ReadBigEndian(4));
+                    case 0xd3: return new JsonData((long)ReadBigEndian(8));
+                    case 0xd9: return new JsonData(ReadUtf8((int)ReadBigEndian(1)));
+                    case 0xda: return new JsonData(ReadUtf8((int)ReadBigEndian(2)));
+                    case 0xdb: return new JsonData(ReadUtf8(ReadLength(ReadBigEndian(4))));
+                    case 0xdc: return ReadArray((int)ReadBigEndian(2), depth);
+                    case 0xdd: return ReadArray(ReadLength(ReadBigEndian(4)), depth);
+                    case 0xde: return ReadMap((int)ReadBigEndian(2), depth);
+                    case 0xdf: return ReadMap(ReadLength(ReadBigEndian(4)), depth);
+                    default:
+                        throw new FormatException($"Unsupported MessagePack type 0x{b:x2} at offset {_position - 1}.");
+                }
+            }
+
+            private JsonNode ReadCbor(int depth)
+            {
+                byte initial = ReadByte();
+                int major = initial >> 5;
+                int info = initial & 0x1f;
+
+                if (major == 7)
+                {
+                    switch (info)
+                    {
+                        case 20: return new JsonData(false);
+                        case 21: return new JsonData(true);
+                        case 22:
+                        case 23: return new JsonData((string)null);
+                        case 25: return new JsonData((float)HalfToSingle((ushort)ReadBigEndian(2)));
+                        case 26: return new JsonData(ReadSingle());
+                        case 27: return new JsonData(BitConverter.Int64BitsToDouble((long)ReadBigEndian(8)));
+                        default:
+                            throw new FormatException($"Unsupported CBOR simple value {info} at offset {_position - 1}.");
+                    }
+                }
+
+                bool indefinite = info == 31;
+                ulong argument = indefinite ? 0 : ReadCborArgument(info);
+                switch (major)
+                {
+                    case 0:
+                        return CreateUnsigned(argument);
+                    case 1:
+                        if (argument > long.MaxValue)
+                            return new JsonData(-1.0 - argument);
+                        return new JsonData(-1 - (long)argument);
+                    case 2:
+                        return new JsonData(Convert.ToBase64String(indefinite ? ReadCborChunks(2) : ReadBytes(ReadLength(argument))));
+                    case 3:
+                        return new JsonData(indefinite ? Encoding.UTF8.GetString(ReadCborChunks(3)) : ReadUtf8(ReadLength(argument)));
+                    case 4:
+                        return indefinite ? ReadIndefinite(false, depth) : ReadArray(ReadLength(argument), depth);
+                    case 5:
+                        return indefinite ? ReadIndefinite(true, depth) : ReadMap(ReadLength(argument), depth);
+                    case 6:
+                        // 标签只携带语义提示，直接解码被标记的值
+                        return ReadNode(depth + 1);
+                    default:
+                        throw new FormatException($"Unsupported CBOR major type {major} at offset {_position - 1}.");
+                }
+            }
+
+            private ulong ReadCborArgument(int info)
+            {
+                if (info < 24) return (ulong)info;
+                switch (info)
+                {
+                    case 24: return ReadBigEndian(1);
+                    case 25: return ReadBigEndian(2);
+                    case 26: return ReadBigEndian(4);
+                    case 27: return ReadBigEndian(8);
+                    default:
+                        throw new FormatException($"Invalid CBOR additional information {info} at offset {_position - 1}.");
+                }
+            }
+
+            private byte[] ReadCborChunks(int major)
+            {
+                using (var buffer = new MemoryStream())
+                {
+                    while (PeekByte() != 0xff)
+                    {
+                        byte initial = ReadByte();
+                        if (initial >> 5 != major)
+                            throw new FormatException("Invalid chunk in indefinite-length CBOR string.");
+                        var chunk = ReadBytes(ReadLength(ReadCborArgument(initial & 0x1f)));
+                        buffer.Write(chunk, 0, chunk.Length);
+                    }
+                    _position++;
+                    return buffer.ToArray();
+                }
+            }
+
+            private JsonNode ReadIndefinite(bool isMap, int depth)
+            {
+                if (isMap)
+                {
+                    var obj = new JsonClass();
+                    while (PeekByte() != 0xff)
+                    {
+                        string key = ReadKey(depth);
+                        obj.Add(key, ReadNode(depth + 1));
+                    }
+                    _position++;
+                    return obj;
+                }
+
+                var array = new JsonArray();
+                while (PeekByte() != 0xff)
+                    array.Add(ReadNode(depth + 1));
+                _position++;
+                return array;
+            }
+
+            private JsonNode ReadArray(int count, int depth)
+            {
+                var array = new JsonArray(Math.Min(count, _data.Length - _position));
+                for (int i = 0; i < count; i++)
+                    array.Add(ReadNode(depth + 1));
+                return array;
+            }
+
+            private JsonNode ReadMap(int count, int depth)
+            {
+                var obj = new JsonClass(Math.Min(count, (_data.Length - _position) / 2));
+                for (int i = 0; i < count; i++)
+                {
+                    string key = ReadKey(depth);
+                    obj.Add(key, ReadNode(depth + 1));
+                }
+                return obj;
+            }
+
+            private string ReadKey(int depth)
+            {
+                var key = ReadNode(depth + 1);
+                if (key is JsonData)
+                    return key.Value ?? "null";
+                throw new FormatException("Map keys must be strings or scalar values.");
+            }
+
+            private static JsonNode CreateUnsigned(ulong value)
+            {
+                if (value > long.MaxValue)
+                    return new JsonData((double)value);
+                return new JsonData((long)value);
+            }
+
+            private float ReadSingle()
+            {
+                int bits = (int)ReadBigEndian(4);
+                return BitConverter.ToSingle(BitConverter.GetBytes(bits), 0);
+            }
+
+            private static double HalfToSingle(ushort half)
+            {
+                int exponent = (half >> 10) & 0x1f;
+                int mantissa = half & 0x3ff;
+                double value;
+                if (exponent == 0) value = mantissa * Math.Pow(2, -24);
+                else if (exponent != 31) value = (mantissa + 1024) * Math.Pow(2, exponent - 25);
+                else value = mantissa == 0 ? double.PositiveInfinity : double.NaN;
+                return (half & 0x8000) != 0 ? -value : value;
+            }
+
+            private string ReadUtf8(int length)
+            {
+                EnsureAvailable(length);
+                string value = Encoding.UTF8.GetString(_data, _position, length);
+                _position += length;
+                return value;
+            }
+
+            private string ReadBase64(int length)
+            {
+                EnsureAvailable(length);
+                string value = Convert.ToBase64String(_data, _position, length);
+                _position += length;
+                return value;
+            }
+
+            private byte[] ReadBytes(int length)
+            {
+                EnsureAvailable(length);
+                var bytes = new byte[length];
+                Buffer.BlockCopy(_data, _position, bytes, 0, length);
+                _position += length;
+                return bytes;
+            }
+
+            private ulong ReadBigEndian(int size)
+            {
+                EnsureAvailable(size);
+                ulong value = 0;
+                for (int i = 0; i < size; i++)
+                    value = (value << 8) | _data[_position++];
+                return value;
+            }
+
+            private byte ReadByte()
+            {
+                EnsureAvailable(1);
+                return _data[_position++];
+            }
+
+            private byte PeekByte()
+            {
+                EnsureAvailable(1);
+                return _data[_position];
+            }
+
+            private int ReadLength(ulong length)
+            {
+                if (length > int.MaxValue)
+                    throw new FormatException("Encoded length is too large.");
+                return (int)length;
+            }
+
+            private void EnsureAvailable(int count)
+            {
+                if (count < 0 || _position + count > _data.Length)
+                    throw new FormatException("Unexpected end of encoded data.");
+            }
+        }
+
+        #endregion
+    }
+}
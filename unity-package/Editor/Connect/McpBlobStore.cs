@@ -0,0 +1,297 @@
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Linq;
+using System.Threading.Tasks;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 大块二进制结果（截图、网格/高度图数据等）的内存附件存储，通过 /blob/{id} 路由提供下载。
+    /// 工具只需把缓冲区放入存储并在结果中返回附件句柄，避免 base64 或巨大数字数组带来的体积与字符串开销。
+    /// 访问示例：
+    /// - GET /blob/{id}     下载附件（HEAD 仅返回头）
+    /// - DELETE /blob/{id}  提前释放附件
+    /// 附件按 TTL 过期，总容量超过上限时优先淘汰最早过期的附件。
+    /// </summary>
+    public static class McpBlobStore
+    {
+        private const string BlobRoutePrefix = "/blob";
+
+        /// <summary>
+        /// 默认保留时长
+        /// </summary>
+        public static readonly TimeSpan DefaultTtl = TimeSpan.FromMinutes(5);
+
+        /// <summary>
+        /// 所有附件的总字节上限
+        /// </summary>
+        public const long MaxTotalBytes = 256L * 1024 * 1024;
+
+        private sealed class BlobEntry
+        {
+            public byte[] Data;
+            public int Offset;
+            public int Count;
+            public string ContentType;
+            public DateTime ExpiresAt;
+        }
+
+        private static readonly Dictionary<string, BlobEntry> _blobs = new Dictionary<string, BlobEntry>();
+        private static readonly object _lock = new object();
+        private static long _totalBytes;
+
+        /// <summary>
+        /// 当前附件数量
+        /// </summary>
+        public static int Count
+        {
+            get
+            {
+                lock (_lock)
+                {
+                    EvictExpired(DateTime.UtcNow);
+                    return _blobs.Count;
+                }
+            }
+        }
+
+        /// <summary>
+        /// 当前附件占用的总字节数
+        /// </summary>
+        public static long TotalBytes
+        {
+            get
+            {
+                lock (_lock)
+                {
+                    EvictExpired(DateTime.UtcNow);
+                    return _totalBytes;
+                }
+            }
+        }
+
+        /// <summary>
+        /// 存入附件并返回 id。缓冲区不会被复制，存入后调用方不应再修改它。
+        /// </summary>
+        public static string Put(byte[] data, string contentType, TimeSpan? ttl = null)
+        {
+            if (data == null)
+                throw new ArgumentNullException(nameof(data));
+            return Put(data, 0, data.Length, contentType, ttl);
+        }
+
+        /// <summary>
+        /// 存入缓冲区的一段作为附件并返回 id。缓冲区不会被复制，存入后调用方不应再修改它。
+        /// </summary>
+        public static string Put(byte[] data, int offset, int count, string contentType, TimeSpan? ttl = null)
+        {
+            if (data == null)
+                throw new ArgumentNullException(nameof(data));
+            if (offset < 0 || count < 0 || offset + count > data.Length)
+                throw new ArgumentOutOfRangeException(nameof(count), "Blob range is outside of the buffer.");
+            if (count > MaxTotalBytes)
+                throw new ArgumentException($"Blob size {count} exceeds the store limit of {MaxTotalBytes} bytes.", nameof(data));
+
+            string id = Guid.NewGuid().ToString("N");
+            var entry = new BlobEntry
+            {
+                Data = data,
+                Offset = offset,
+                Count = count,
+                ContentType = string.IsNullOrEmpty(contentType) ? "application/octet-stream" : contentType,
+                ExpiresAt = DateTime.UtcNow + (ttl ?? DefaultTtl)
+            };
+
+            lock (_lock)
+            {
+                EvictExpired(DateTime.UtcNow);
+                EvictForCapacity(count);
+                _blobs[id] = entry;
+                _totalBytes += count;
+            }
+            return id;
+        }
+
+        /// <summary>
+        /// 释放附件
+        /// </summary>
+        public static bool Remove(string id)
+        {
+            if (string.IsNullOrEmpty(id))
+                return false;
+
+            lock (_lock)
+            {
+                if (!_blobs.TryGetValue(id, out var entry))
+                    return false;
+                _blobs.Remove(id);
+                _totalBytes -= entry.Count;
+                return true;
+            }
+        }
+
+        /// <summary>
+        /// 清空所有附件
+        /// </summary>
+        public static void Clear()
+        {
+            lock (_lock)
+            {
+                _blobs.Clear();
+                _totalBytes = 0;
+            }
+        }
+
+        /// <summary>
+        /// 存入附件并创建可放入工具结果的附件句柄
+        /// </summary>
+        /// <param name="data">附件内容</param>
+        /// <param name="contentType">MIME 类型</param>
+        /// <param name="name">可选的文件名</param>
+        /// <param name="ttl">保留时长，默认 DefaultTtl</param>
+        public static JsonClass CreateAttachment(byte[] data, string contentType, string name = null, TimeSpan? ttl = null)
+        {
+            var lifetime = ttl ?? DefaultTtl;
+            string id = Put(data, contentType, lifetime);
+
+            var attachment = new JsonClass();
+            attachment.Add("type", new JsonData("attachment"));
+            attachment.Add("id", new JsonData(id));
+            if (!string.IsNullOrEmpty(name))
+                attachment.Add("name", new JsonData(name));
+            attachment.Add("mimeType", new JsonData(string.IsNullOrEmpty(contentType) ? "application/octet-stream" : contentType));
+            attachment.Add("size", new JsonData(data.Length));
+            attachment.Add("url", new JsonData($"{BlobRoutePrefix}/{id}"));
+            attachment.Add("absoluteUrl", new JsonData($"http://127.0.0.1:{McpService.mcpPort}{BlobRoutePrefix}/{id}"));
+            attachment.Add("expiresIn", new JsonData((int)lifetime.TotalSeconds));
+            return attachment;
+        }
+
+        internal static async Task<bool> TryHandleRequestAsync(System.Net.HttpListenerRequest request, System.Net.HttpListenerResponse response, string requestPath)
+        {
+            if (string.IsNullOrEmpty(requestPath) ||
+                !requestPath.StartsWith(BlobRoutePrefix + "/", StringComparison.OrdinalIgnoreCase))
+            {
+                return false;
+            }
+
+            try
+            {
+                string id = requestPath.Substring(BlobRoutePrefix.Length + 1).Trim('/');
+
+                if (request.HttpMethod.Equals("DELETE", StringComparison.OrdinalIgnoreCase))
+                {
+                    bool removed = Remove(id);
+                    response.StatusCode = removed ? 200 : 404;
+                    response.ContentType = "application/json; charset=utf-8";
+                    await WriteJsonAsync(response, removed
+                        ? Response.Success($"Blob '{id}' released.")
+                        : Response.Error($"Blob not found or expired: {id}"));
+                    return true;
+                }
+
+                // 仅支持 GET/HEAD/DELETE
+                if (!request.HttpMethod.Equals("GET", StringComparison.OrdinalIgnoreCase) &&
+                    !request.HttpMethod.Equals("HEAD", StringComparison.OrdinalIgnoreCase))
+                {
+                    response.StatusCode = 405;
+                    response.ContentType = "application/json; charset=utf-8";
+                    await WriteJsonAsync(response, Response.Error("Method Not Allowed. /blob only supports GET/HEAD/DELETE."));
+                    return true;
+                }
+
+                BlobEntry entry;
+                lock (_lock)
+                {
+                    EvictExpired(DateTime.UtcNow);
+                    _blobs.TryGetValue(id, out entry);
+                }
+
+                if (entry == null)
+                {
+                    response.StatusCode = 404;
+                    response.ContentType = "application/json; charset=utf-8";
+                    await WriteJsonAsync(response, Response.Error($"Blob not found or expired: {id}"));
+                    return true;
+                }
+
+                response.StatusCode = 200;
+                response.ContentType = entry.ContentType;
+                response.ContentLength64 = entry.Count;
+                response.Headers.Add("Cache-Control", "private, max-age=" +
+                    Math.Max(0, (int)(entry.ExpiresAt - DateTime.UtcNow).TotalSeconds).ToString(CultureInfo.InvariantCulture));
+
+                // HEAD 仅返回头
+                if (request.HttpMethod.Equals("HEAD", StringComparison.OrdinalIgnoreCase))
+                {
+                    response.Close();
+                    return true;
+                }
+
+                // 直接写出存储的缓冲区，不做任何复制或编码
+                await response.OutputStream.WriteAsync(entry.Data, entry.Offset, entry.Count);
+                response.Close();
+                return true;
+            }
+            catch (Exception ex)
+            {
+                try
+                {
+                    response.StatusCode = 500;
+                    response.ContentType = "application/json; charset=utf-8";
+                    await WriteJsonAsync(response, Response.Error($"Blob route error: {ex.Message}"));
+                }
+                catch
+                {
+                    // ignore
+                }
+                return true;
+            }
+        }
+
+        private static void EvictExpired(DateTime now)
+        {
+            if (_blobs.Count == 0)
+                return;
+
+            List<string> expired = null;
+            foreach (var pair in _blobs)
+            {
+                if (pair.Value.ExpiresAt <= now)
+                    (expired ??= new List<string>()).Add(pair.Key);
+            }
+
+            if (expired == null)
+                return;
+            foreach (var id in expired)
+            {
+                _totalBytes -= _blobs[id].Count;
+                _blobs.Remove(id);
+            }
+        }
+
+        private static void EvictForCapacity(long incoming)
+        {
+            if (_totalBytes + incoming <= MaxTotalBytes)
+                return;
+
+            foreach (var pair in _blobs.OrderBy(p => p.Value.ExpiresAt).ToList())
+            {
+                _blobs.Remove(pair.Key);
+                _totalBytes -= pair.Value.Count;
+                if (_totalBytes + incoming <= MaxTotalBytes)
+                    break;
+            }
+        }
+
+        private static async Task WriteJsonAsync(System.Net.HttpListenerResponse response, JsonNode json)
+        {
+            string content = json?.ToString() ?? "{}";
+            byte[] bytes = System.Text.Encoding.UTF8.GetBytes(content);
+            await response.OutputStream.WriteAsync(bytes, 0, bytes.Length);
+            response.Close();
+        }
+    }
+}
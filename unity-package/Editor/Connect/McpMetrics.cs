@@ -0,0 +1,515 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Globalization;
+using System.Linq;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using UniMcp.Executer;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 请求处理阶段
+    /// </summary>
+    public enum McpStage
+    {
+        Read,       // 读取请求体
+        Parse,      // Json.Parse
+        QueueWait,  // EnqueueTask 等待主线程
+        Execute,    // tool.HandleCommand 到回调
+        Record,     // 执行记录持久化
+        Serialize,  // 构建响应 JSON
+        Write,      // 写入响应流
+        Total       // 从接收请求到响应写完
+    }
+
+    /// <summary>
+    /// HDR 风格的对数线性直方图：小于16的值精确计数，之后每个2的幂区间划分8个子桶（相对误差约12.5%）。
+    /// 记录为无锁操作，可在任意线程调用。
+    /// </summary>
+    public sealed class LogLinearHistogram
+    {
+        private const int LinearBuckets = 16;
+        private const int SubBucketBits = 3;
+        private const int SubBuckets = 1 << SubBucketBits;
+        private const int MaxExponent = 40;
+        private const int BucketCount = LinearBuckets + (MaxExponent - 3) * SubBuckets;
+
+        private readonly long[] _buckets = new long[BucketCount];
+        private long _count;
+        private long _sum;
+        private long _max;
+
+        public long Count => Interlocked.Read(ref _count);
+        public long Sum => Interlocked.Read(ref _sum);
+        public long Max => Interlocked.Read(ref _max);
+        public double Mean => Count == 0 ? 0 : (double)Sum / Count;
+
+        /// <summary>
+        /// 记录一个非负整数值
+        /// </summary>
+        public void Record(long value)
+        {
+            if (value < 0) value = 0;
+            Interlocked.Increment(ref _buckets[IndexOf(value)]);
+            Interlocked.Increment(ref _count);
+            Interlocked.Add(ref _sum, value);
+
+            long current = Interlocked.Read(ref _max);
+            while (value > current)
+            {
+                long observed = Interlocked.CompareExchange(ref _max, value, current);
+                if (observed == current) break;
+                current = observed;
+            }
+        }
+
+        /// <summary>
+        /// 获取指定百分位（0-100）的近似值
+        /// </summary>
+        public long ValueAtPercentile(double percentile)
+        {
+            long total = Count;
+            if (total == 0) return 0;
+
+            long target = Math.Max(1, (long)Math.Ceiling(total * Math.Min(100, Math.Max(0, percentile)) / 100.0));
+            long seen = 0;
+            for (int i = 0; i < BucketCount; i++)
+            {
+                seen += Interlocked.Read(ref _buckets[i]);
+                if (seen >= target)
+                    return Math.Min(MidpointOf(i), Max);
+            }
+            return Max;
+        }
+
+        public void Reset()
+        {
+            for (int i = 0; i < BucketCount; i++)
+                Interlocked.Exchange(ref _buckets[i], 0);
+            Interlocked.Exchange(ref _count, 0);
+            Interlocked.Exchange(ref _sum, 0);
+            Interlocked.Exchange(ref _max, 0);
+        }
+
+        private static int IndexOf(long value)
+        {
+            if (value < LinearBuckets)
+                return (int)value;
+
+            int exponent = 0;
+            for (long v = value; (v >>= 1) != 0;)
+                exponent++;
+            if (exponent > MaxExponent)
+                return BucketCount - 1;
+
+            int sub = (int)((value >> (exponent - SubBucketBits)) & (SubBuckets - 1));
+            return LinearBuckets + (exponent - 4) * SubBuckets + sub;
+        }
+
+        private static long MidpointOf(int index)
+        {
+            if (index < LinearBuckets)
+                return index;
+
+            int k = index - LinearBuckets;
+            int exponent = k / SubBuckets + 4;
+            int sub = k % SubBuckets;
+            long width = 1L << (exponent - SubBucketBits);
+            return ((long)(SubBuckets + sub) << (exponent - SubBucketBits)) + width / 2;
+        }
+    }
+
+    /// <summary>
+    /// 单个 (方法, 工具, 操作) 的统计数据
+    /// </summary>
+    public sealed class McpToolMetrics
+    {
+        public string Method { get; }
+        public string Tool { get; }
+        public string Action { get; }
+
+        private long _calls;
+        private long _errors;
+
+        public long Calls => Interlocked.Read(ref _calls);
+        public long Errors => Interlocked.Read(ref _errors);
+
+        /// <summary>
+        /// 各阶段耗时（微秒），按 McpStage 索引
+        /// </summary>
+        public LogLinearHistogram[] Stages { get; } = Enumerable.Range(0, McpMetrics.StageCount).Select(_ => new LogLinearHistogram()).ToArray();
+        public LogLinearHistogram RequestBytes { get; } = new LogLinearHistogram();
+        public LogLinearHistogram ResponseBytes { get; } = new LogLinearHistogram();
+
+        internal McpToolMetrics(string method, string tool, string action)
+        {
+            Method = method;
+            Tool = tool;
+            Action = action;
+        }
+
+        internal void Add(McpRequestSample sample)
+        {
+            Interlocked.Increment(ref _calls);
+            if (!sample.Success)
+                Interlocked.Increment(ref _errors);
+
+            for (int i = 0; i < McpMetrics.StageCount; i++)
+            {
+                double ms = sample.GetStage((McpStage)i);
+                if (!double.IsNaN(ms))
+                    Stages[i].Record((long)(ms * 1000.0));
+            }
+            if (sample.RequestBytes >= 0)
+                RequestBytes.Record(sample.RequestBytes);
+            if (sample.ResponseBytes >= 0)
+                ResponseBytes.Record(sample.ResponseBytes);
+        }
+
+        public LogLinearHistogram GetStage(McpStage stage) => Stages[(int)stage];
+    }
+
+    /// <summary>
+    /// 单次请求的计时样本，在请求结束时由 McpMetrics.EndRequest 提交
+    /// </summary>
+    public sealed class McpRequestSample
+    {
+        private readonly double[] _stages;
+        private int _committed;
+
+        internal readonly long StartTimestamp;
+
+        public string Method { get; set; }
+        public string Tool { get; set; } = "";
+        public string Action { get; set; } = "";
+        public bool Success { get; set; } = true;
+        public long RequestBytes { get; set; } = -1;
+        public long ResponseBytes { get; set; } = -1;
+        public bool IsCommitted => _committed != 0;
+
+        internal McpRequestSample()
+        {
+            StartTimestamp = Stopwatch.GetTimestamp();
+            _stages = new double[McpMetrics.StageCount];
+            for (int i = 0; i < _stages.Length; i++)
+                _stages[i] = double.NaN;
+        }
+
+        /// <summary>
+        /// 累加某阶段的耗时（毫秒）
+        /// </summary>
+        public void AddStage(McpStage stage, double milliseconds)
+        {
+            int index = (int)stage;
+            _stages[index] = double.IsNaN(_stages[index]) ? milliseconds : _stages[index] + milliseconds;
+        }
+
+        public double GetStage(McpStage stage) => _stages[(int)stage];
+
+        internal bool TryCommit() => Interlocked.Exchange(ref _committed, 1) == 0;
+    }
+
+    /// <summary>
+    /// MCP 请求指标：按方法/工具/操作统计调用数、错误数、各阶段耗时与负载大小的直方图。
+    /// 通过 /metrics（Prometheus 文本格式，?format=json 返回 JSON 快照）和状态窗口展示。
+    /// </summary>
+    public static class McpMetrics
+    {
+        public static readonly int StageCount = Enum.GetValues(typeof(McpStage)).Length;
+
+        /// <summary>
+        /// 最多跟踪的序列数，超出后归入 "other"，防止标签基数失控
+        /// </summary>
+        public const int MaxSeries = 512;
+
+        private static readonly Dictionary<string, McpToolMetrics> _series = new Dictionary<string, McpToolMetrics>();
+        private static readonly object _seriesLock = new object();
+        private static readonly AsyncLocal<McpRequestSample> _current = new AsyncLocal<McpRequestSample>();
+        private static DateTime _since = DateTime.UtcNow;
+
+        /// <summary>
+        /// 当前异步流中的请求样本（可能为 null）
+        /// </summary>
+        public static McpRequestSample Current => _current.Value;
+
+        /// <summary>
+        /// 开始统计一次请求，并设置为当前异步流的样本
+        /// </summary>
+        public static McpRequestSample BeginRequest()
+        {
+            var sample = new McpRequestSample();
+            _current.Value = sample;
+            return sample;
+        }
+
+        /// <summary>
+        /// 结束并提交请求样本；未经过 JSON-RPC 处理的请求（路由、GET 等）不计入
+        /// </summary>
+        public static void EndRequest(McpRequestSample sample)
+        {
+            if (sample == null || string.IsNullOrEmpty(sample.Method) || !sample.TryCommit())
+                return;
+
+            sample.AddStage(McpStage.Total, ElapsedMilliseconds(sample.StartTimestamp));
+            GetOrCreateSeries(sample.Method, sample.Tool ?? "", sample.Action ?? "").Add(sample);
+        }
+
+        /// <summary>
+        /// 计算从指定 Stopwatch 时间戳到现在的毫秒数
+        /// </summary>
+        public static double ElapsedMilliseconds(long startTimestamp)
+        {
+            return (Stopwatch.GetTimestamp() - startTimestamp) * 1000.0 / Stopwatch.Frequency;
+        }
+
+        /// <summary>
+        /// 从工具参数中提取操作标签（action / search_type / search_target / func）
+        /// </summary>
+        public static string ResolveAction(JsonNode arguments)
+        {
+            if (!(arguments is JsonClass args))
+                return "";
+            foreach (var key in new[] { "action", "search_type", "search_target", "func" })
+            {
+                string value = args[key]?.Value;
+                if (!string.IsNullOrEmpty(value))
+                    return value;
+            }
+            return "";
+        }
+
+        /// <summary>
+        /// 清空全部统计
+        /// </summary>
+        public static void Reset()
+        {
+            lock (_seriesLock)
+            {
+                _series.Clear();
+                _since = DateTime.UtcNow;
+            }
+        }
+
+        /// <summary>
+        /// 获取当前所有序列
+        /// </summary>
+        public static List<McpToolMetrics> GetSeries()
+        {
+            lock (_seriesLock)
+            {
+                return _series.Values.ToList();
+            }
+        }
+
+        private static McpToolMetrics GetOrCreateSeries(string method, string tool, string action)
+        {
+            string key = method + "|" + tool + "|" + action;
+            lock (_seriesLock)
+            {
+                if (_series.TryGetValue(key, out var metrics))
+                    return metrics;
+
+                if (_series.Count >= MaxSeries)
+                {
+                    key = method + "|other|";
+                    if (_series.TryGetValue(key, out metrics))
+                        return metrics;
+                    tool = "other";
+                    action = "";
+                }
+
+                metrics = new McpToolMetrics(method, tool, action);
+                _series[key] = metrics;
+                return metrics;
+            }
+        }
+
+        /// <summary>
+        /// 注册 /metrics 路由
+        /// </summary>
+        internal static void RegisterRoutes(McpService service)
+        {
+            service.RegistHttpRequest("/metrics", "GET", HandleMetricsRequest);
+        }
+
+        private static Task<string> HandleMetricsRequest(HttpRequestContext context)
+        {
+            if (context.QueryParams.TryGetValue("format", out string format) &&
+                string.Equals(format, "json", StringComparison.OrdinalIgnoreCase))
+            {
+                context.Response.ContentType = "application/json; charset=utf-8";
+                return Task.FromResult(GetSnapshot().ToString());
+            }
+
+            context.Response.ContentType = "text/plain; version=0.0.4; charset=utf-8";
+            return Task.FromResult(ExportPrometheus());
+        }
+
+        #region 导出
+
+        private static readonly double[] Quantiles = { 0.5, 0.95, 0.99 };
+
+        /// <summary>
+        /// 导出 Prometheus 文本格式
+        /// </summary>
+        public static string ExportPrometheus()
+        {
+            var series = GetSeries();
+            var sb = new StringBuilder();
+
+            sb.Append("# HELP unimcp_requests_total Total MCP JSON-RPC requests.\n");
+            sb.Append("# TYPE unimcp_requests_total counter\n");
+            foreach (var s in series)
+                sb.Append("unimcp_requests_total").Append(Labels(s, null, null)).Append(' ').Append(s.Calls).Append('\n');
+
+            sb.Append("# HELP unimcp_errors_total Failed MCP JSON-RPC requests.\n");
+            sb.Append("# TYPE unimcp_errors_total counter\n");
+            foreach (var s in series)
+                sb.Append("unimcp_errors_total").Append(Labels(s, null, null)).Append(' ').Append(s.Errors).Append('\n');
+
+            sb.Append("# HELP unimcp_stage_duration_seconds Request latency per processing stage.\n");
+            sb.Append("# TYPE unimcp_stage_duration_seconds summary\n");
+            foreach (var s in series)
+            {
+                for (int i = 0; i < StageCount; i++)
+                {
+                    var histogram = s.Stages[i];
+                    if (histogram.Count == 0) continue;
+                    AppendSummary(sb, "unimcp_stage_duration_seconds", s, StageName((McpStage)i), histogram, 1e-6);
+                }
+            }
+
+            sb.Append("# HELP unimcp_request_bytes Request body size.\n");
+            sb.Append("# TYPE unimcp_request_bytes summary\n");
+            foreach (var s in series)
+            {
+                if (s.RequestBytes.Count > 0)
+                    AppendSummary(sb, "unimcp_request_bytes", s, null, s.RequestBytes, 1);
+            }
+
+            sb.Append("# HELP unimcp_response_bytes Response body size.\n");
+            sb.Append("# TYPE unimcp_response_bytes summary\n");
+            foreach (var s in series)
+            {
+                if (s.ResponseBytes.Count > 0)
+                    AppendSummary(sb, "unimcp_response_bytes", s, null, s.ResponseBytes, 1);
+            }
+
+            sb.Append("# HELP unimcp_tool_cache_hits_total Read-only tool result cache hits.\n");
+            sb.Append("# TYPE unimcp_tool_cache_hits_total counter\n");
+            sb.Append("unimcp_tool_cache_hits_total ").Append(ToolResultCache.Hits).Append('\n');
+            sb.Append("# HELP unimcp_tool_cache_misses_total Read-only tool result cache misses.\n");
+            sb.Append("# TYPE unimcp_tool_cache_misses_total counter\n");
+            sb.Append("unimcp_tool_cache_misses_total ").Append(ToolResultCache.Misses).Append('\n');
+            sb.Append("# HELP unimcp_tool_cache_entries Cached read-only tool results.\n");
+            sb.Append("# TYPE unimcp_tool_cache_entries gauge\n");
+            sb.Append("unimcp_tool_cache_entries ").Append(ToolResultCache.Count).Append('\n');
+
+            return sb.ToString();
+        }
+
+        private static void AppendSummary(StringBuilder sb, string name, McpToolMetrics s, string stage, LogLinearHistogram histogram, double scale)
+        {
+            foreach (var q in Quantiles)
+            {
+                sb.Append(name).Append(Labels(s, stage, q)).Append(' ')
+                  .Append(FormatDouble(histogram.ValueAtPercentile(q * 100) * scale)).Append('\n');
+            }
+            sb.Append(name).Append("_sum").Append(Labels(s, stage, null)).Append(' ').Append(FormatDouble(histogram.Sum * scale)).Append('\n');
+            sb.Append(name).Append("_count").Append(Labels(s, stage, null)).Append(' ').Append(histogram.Count).Append('\n');
+        }
+
+        private static string Labels(McpToolMetrics s, string stage, double? quantile)
+        {
+            var sb = new StringBuilder("{");
+            sb.Append("method=\"").Append(EscapeLabel(s.Method)).Append('"');
+            sb.Append(",tool=\"").Append(EscapeLabel(s.Tool)).Append('"');
+            sb.Append(",action=\"").Append(EscapeLabel(s.Action)).Append('"');
+            if (stage != null)
+                sb.Append(",stage=\"").Append(stage).Append('"');
+            if (quantile.HasValue)
+                sb.Append(",quantile=\"").Append(FormatDouble(quantile.Value)).Append('"');
+            return sb.Append('}').ToString();
+        }
+
+        private static string EscapeLabel(string value)
+        {
+            return (value ?? "").Replace("\\", "\\\\").Replace("\"", "\\\"").Replace("\n", "\\n");
+        }
+
+        private static string FormatDouble(double value)
+        {
+            return value.ToString("0.######", CultureInfo.InvariantCulture);
+        }
+
+        /// <summary>
+        /// 阶段名称（snake_case）
+        /// </summary>
+        public static string StageName(McpStage stage)
+        {
+            switch (stage)
+            {
+                case McpStage.Read: return "read";
+                case McpStage.Parse: return "parse";
+                case McpStage.QueueWait: return "queue_wait";
+                case McpStage.Execute: return "execute";
+                case McpStage.Record: return "record";
+                case McpStage.Serialize: return "serialize";
+                case McpStage.Write: return "write";
+                default: return "total";
+            }
+        }
+
+        /// <summary>
+        /// 获取 JSON 格式的指标快照
+        /// </summary>
+        public static JsonClass GetSnapshot()
+        {
+            var snapshot = new JsonClass();
+            snapshot.Add("since", new JsonData(_since.ToString("o", CultureInfo.InvariantCulture)));
+
+            var seriesArray = new JsonArray();
+            foreach (var s in GetSeries())
+            {
+                var item = new JsonClass();
+                item.Add("method", new JsonData(s.Method));
+                item.Add("tool", new JsonData(s.Tool));
+                item.Add("action", new JsonData(s.Action));
+                item.Add("calls", new JsonData(s.Calls));
+                item.Add("errors", new JsonData(s.Errors));
+
+                var stages = new JsonClass();
+                for (int i = 0; i < StageCount; i++)
+                {
+                    var histogram = s.Stages[i];
+                    if (histogram.Count == 0) continue;
+                    stages.Add(StageName((McpStage)i), HistogramToJson(histogram, 0.001));
+                }
+                item.Add("stages_ms", stages);
+                item.Add("request_bytes", HistogramToJson(s.RequestBytes, 1));
+                item.Add("response_bytes", HistogramToJson(s.ResponseBytes, 1));
+                seriesArray.Add(item);
+            }
+            snapshot.Add("series", seriesArray);
+            snapshot.Add("tool_cache", ToolResultCache.GetStatistics());
+            return snapshot;
+        }
+
+        private static JsonClass HistogramToJson(LogLinearHistogram histogram, double scale)
+        {
+            var json = new JsonClass();
+            json.Add("count", new JsonData(histogram.Count));
+            json.Add("mean", new JsonData(Math.Round(histogram.Mean * scale, 3)));
+            json.Add("p50", new JsonData(Math.Round(histogram.ValueAtPercentile(50) * scale, 3)));
+            json.Add("p95", new JsonData(Math.Round(histogram.ValueAtPercentile(95) * scale, 3)));
+            json.Add("p99", new JsonData(Math.Round(histogram.ValueAtPercentile(99) * scale, 3)));
+            json.Add("max", new JsonData(Math.Round(histogram.Max * scale, 3)));
+            return json;
+        }
+
+        #endregion
+    }
+}
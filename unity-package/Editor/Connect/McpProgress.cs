@@ -0,0 +1,171 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 工具执行期间的进度通知（MCP notifications/progress）。
+    /// tools/call 请求携带 params._meta.progressToken 时，工具在主线程执行期间该令牌与请求所属的会话为当前进度上下文，
+    /// 工具通过 Report 发送的通知只经该会话的 SSE 连接推送，不会发给其他客户端；同一连接上的通知按发送顺序写出。
+    /// 没有进度令牌或该会话没有 SSE 连接时 IsAvailable 为 false，Report 直接返回。
+    /// </summary>
+    public static class McpProgress
+    {
+        private sealed class Sink
+        {
+            public Func<string, Task> Send;
+            public Task Tail = Task.CompletedTask;
+        }
+
+        private sealed class Context
+        {
+            public JsonNode Token;
+            public string SessionId;
+        }
+
+        private static readonly AsyncLocal<Context> _current = new AsyncLocal<Context>();
+        private static readonly Dictionary<string, Sink> _sinks = new Dictionary<string, Sink>(StringComparer.Ordinal);
+        private static readonly object _sinksLock = new object();
+
+        /// <summary>
+        /// 当前调用的进度令牌（未提供时为 null）
+        /// </summary>
+        public static JsonNode CurrentToken => _current.Value?.Token;
+
+        /// <summary>
+        /// 当前调用是否能发送进度通知
+        /// </summary>
+        public static bool IsAvailable
+        {
+            get
+            {
+                return FindSink(_current.Value) != null;
+            }
+        }
+
+        /// <summary>
+        /// 发送一条进度通知；无法发送时返回 false
+        /// </summary>
+        /// <param name="progress">当前进度，需单调递增</param>
+        /// <param name="total">总量，未知时为 null</param>
+        /// <param name="message">可选的进度描述</param>
+        /// <param name="data">可选的附加数据（如分页结果）</param>
+        public static bool Report(double progress, double? total = null, string message = null, JsonNode data = null)
+        {
+            Context context = _current.Value;
+            Sink sink = FindSink(context);
+            if (sink == null)
+                return false;
+
+            var parameters = new JsonClass
+            {
+                ["progressToken"] = context.Token,
+                ["progress"] = progress
+            };
+            if (total.HasValue)
+                parameters["total"] = total.Value;
+            if (!string.IsNullOrEmpty(message))
+                parameters["message"] = message;
+            if (data != null)
+                parameters["data"] = data;
+
+            var notification = new JsonClass
+            {
+                ["jsonrpc"] = "2.0",
+                ["method"] = "notifications/progress",
+                ["params"] = parameters
+            };
+
+            // 在调用线程上序列化，发送在后台按连接串行进行
+            string json = notification.ToString();
+            lock (sink)
+                sink.Tail = sink.Tail.ContinueWith(_ => SendAsync(sink, json), TaskScheduler.Default).Unwrap();
+            return true;
+        }
+
+        /// <summary>
+        /// 在一段同步代码中设置当前进度令牌及其所属会话；token 或 sessionId 为空时返回 null
+        /// </summary>
+        public static IDisposable Activate(JsonNode progressToken, string sessionId)
+        {
+            if (progressToken == null || string.IsNullOrEmpty(sessionId))
+                return null;
+            return new ActivationScope(new Context { Token = progressToken, SessionId = sessionId });
+        }
+
+        /// <summary>
+        /// 注册会话的 SSE 发送函数（同一会话重新连接时替换旧连接），释放返回值时注销
+        /// </summary>
+        internal static IDisposable AddSink(string sessionId, Func<string, Task> send)
+        {
+            var sink = new Sink { Send = send };
+            lock (_sinksLock)
+                _sinks[sessionId] = sink;
+            return new SinkRegistration(sessionId, sink);
+        }
+
+        private static Sink FindSink(Context context)
+        {
+            if (context == null)
+                return null;
+            lock (_sinksLock)
+                return _sinks.TryGetValue(context.SessionId, out var sink) ? sink : null;
+        }
+
+        private static async Task SendAsync(Sink sink, string json)
+        {
+            try
+            {
+                await sink.Send(json);
+            }
+            catch (Exception ex)
+            {
+                McpLogger.LogWarning($"[McpProgress] Failed to send progress notification: {ex.Message}");
+            }
+        }
+
+        private sealed class ActivationScope : IDisposable
+        {
+            private readonly Context _previous;
+            private bool _disposed;
+
+            public ActivationScope(Context context)
+            {
+                _previous = _current.Value;
+                _current.Value = context;
+            }
+
+            public void Dispose()
+            {
+                if (_disposed) return;
+                _disposed = true;
+                _current.Value = _previous;
+            }
+        }
+
+        private sealed class SinkRegistration : IDisposable
+        {
+            private readonly string _sessionId;
+            private readonly Sink _sink;
+
+            public SinkRegistration(string sessionId, Sink sink)
+            {
+                _sessionId = sessionId;
+                _sink = sink;
+            }
+
+            public void Dispose()
+            {
+                lock (_sinksLock)
+                {
+                    // 会话已由新连接替换时保留新连接
+                    if (_sinks.TryGetValue(_sessionId, out var current) && current == _sink)
+                        _sinks.Remove(_sessionId);
+                }
+            }
+        }
+    }
+}
@@ -618,6 +618,10 @@ namespace UniMcp
             {
                 McpLogger.Log("[UniMcp] MCP服务状态为关闭，不自动启动");
             }
+            // 注册内置 HTTP 路由
+            McpMetrics.RegisterRoutes(this);
+            McpTracer.RegisterRoutes(this);
+
             //监听程序集刷新事件
             AssemblyReloadEvents.beforeAssemblyReload += ForceStop;
             AssemblyReloadEvents.afterAssemblyReload += OnAfterAssemblyReload;
@@ -1304,10 +1308,22 @@ namespace UniMcp
                         foreach (var prop in methodObj.Properties)
                         {
                             var propDef = new JsonClass();
-                            propDef.Add("type", new JsonData(prop.Value));
+                            string[] multiTypes;
+                            if (methodObj.MultiTypes.TryGetValue(prop.Key, out multiTypes))
+                            {
+                                // 多类型属性使用 JSON Schema 的类型数组
+                                var typeArray = new JsonArray();
+                                foreach (string multiType in multiTypes)
+                                    typeArray.Add(new JsonData(multiType));
+                                propDef.Add("type", typeArray);
+                            }
+                            else
+                            {
+                                propDef.Add("type", new JsonData(prop.Value));
+                            }
 
                             // 为数组类型添加items定义
-                            if (prop.Value == "array")
+                            if (prop.Value == "array" || (multiTypes != null && multiTypes.Contains("array")))
                             {
                                 var items = new JsonClass();
                                 string itemType = "string"; // 默认类型
@@ -1952,7 +1968,7 @@ namespace UniMcp
 
                     // Fire and forget each HTTP request with cancellation token
                     // 传递端口参数，避免在后台线程访问EditorPrefs
-                    _ = HandleMcpRequestAsync(context, cancellationToken, port);
+                    _ = HandleTracedRequestAsync(context, cancellationToken, port);
                 }
                 catch (HttpListenerException ex)
                 {
@@ -1998,15 +2014,18 @@ namespace UniMcp
             HttpListenerRequest request = context.Request;
             HttpListenerResponse response = context.Response;
             string clientEndpoint = request.RemoteEndPoint?.ToString() ?? "Unknown";
+            IDisposable progressSink = null;
+            string sessionId = McpSession.FromRequest(request) ?? McpSession.NewId();
             
             try
             {
                 McpLogger.Log($"[UniMcp] 建立SSE连接: {clientEndpoint}");
                 
                 // 获取客户端连接的实际地址（不要硬编码 127.0.0.1）
+                // 消息端点携带会话标识，/message 请求据此关联到本连接的会话
                 string host = request.Headers["Host"] ?? request.Url.Authority;
                 string scheme = request.Url.Scheme; // http 或 https
-                string messageEndpoint = $"{scheme}://{host}/message";
+                string messageEndpoint = $"{scheme}://{host}/message?{McpSession.QueryName}={sessionId}";
                 
                 McpLogger.Log($"[UniMcp] 消息端点: {messageEndpoint}");
                 
@@ -2018,7 +2037,11 @@ namespace UniMcp
                 });
                 
                 McpLogger.Log($"[UniMcp] SSE初始化完成，进入保持连接循环");
-                
+
+                // 注册为本会话的进度通知推送通道，心跳与通知共用写锁，避免写入交错
+                var writeLock = new SemaphoreSlim(1, 1);
+                progressSink = McpProgress.AddSink(sessionId, json => SendSSEText(response, writeLock, "message", json));
+
                 // 保持连接直到取消或连接断开
                 int heartbeatCount = 0;
                 while (!cancellationToken.IsCancellationRequested)
@@ -2030,7 +2053,15 @@ namespace UniMcp
                         
                         // 发送心跳
                         heartbeatCount++;
-                        await SendSSEComment(response, $"heartbeat {heartbeatCount}");
+                        await writeLock.WaitAsync(cancellationToken);
+                        try
+                        {
+                            await SendSSEComment(response, $"heartbeat {heartbeatCount}");
+                        }
+                        finally
+                        {
+                            writeLock.Release();
+                        }
                         McpLogger.Log($"[UniMcp] 发送心跳 #{heartbeatCount} to {clientEndpoint}");
                     }
                     catch (HttpListenerException)
@@ -2066,6 +2097,8 @@ namespace UniMcp
             }
             finally
             {
+                progressSink?.Dispose();
+                McpBinaryEncoding.Forget(sessionId);
                 try { response.Close(); } catch { }
                 McpLogger.Log($"[UniMcp] SSE连接已关闭: {clientEndpoint}");
             }
@@ -2101,6 +2134,24 @@ namespace UniMcp
             }
         }
         
+        /// <summary>
+        /// 在写锁内发送已序列化的 SSE 消息（用于进度通知，内容可能较大，不记录正文）
+        /// </summary>
+        private static async Task SendSSEText(HttpListenerResponse response, SemaphoreSlim writeLock, string eventType, string json)
+        {
+            byte[] buffer = Encoding.UTF8.GetBytes($"event: {eventType}\ndata: {json}\n\n");
+            await writeLock.WaitAsync();
+            try
+            {
+                await response.OutputStream.WriteAsync(buffer, 0, buffer.Length);
+                await response.OutputStream.FlushAsync();
+            }
+            finally
+            {
+                writeLock.Release();
+            }
+        }
+
         /// <summary>
         /// 发送 SSE 注释（用于心跳）
         /// </summary>
@@ -2120,12 +2171,39 @@ namespace UniMcp
         /// <param name="context">HTTP监听上下文</param>
         /// <param name="cancellationToken">取消令牌</param>
         /// <param name="port">监听端口（在主线程中预先缓存的值）</param>
+        private async Task HandleTracedRequestAsync(HttpListenerContext context, CancellationToken cancellationToken, int port)
+        {
+            // 只追踪 POST（JSON-RPC）请求，GET 状态查询、SSE 长连接与 /metrics、/traces 不进入追踪缓冲区
+            if (context.Request.HttpMethod != "POST")
+            {
+                await HandleMcpRequestAsync(context, cancellationToken, port);
+                return;
+            }
+
+            var rootSpan = McpTracer.BeginTrace($"POST {context.Request.Url.AbsolutePath}", context.Request.Headers["traceparent"]);
+            try
+            {
+                if (rootSpan != null)
+                    context.Response.Headers["traceparent"] = McpTracer.FormatTraceparent(rootSpan.Context);
+                await HandleMcpRequestAsync(context, cancellationToken, port);
+            }
+            finally
+            {
+                rootSpan?.End();
+            }
+        }
+
+        /// <summary>
+        /// 处理单个 HTTP 请求
+        /// </summary>
         private async Task HandleMcpRequestAsync(HttpListenerContext context, CancellationToken cancellationToken, int port)
         {
             string clientEndpoint = context.Request.RemoteEndPoint?.ToString() ?? "Unknown";
             string clientId = Guid.NewGuid().ToString();
             HttpListenerRequest request = context.Request;
             HttpListenerResponse response = context.Response;
+            McpRequestSample metricsSample = McpMetrics.BeginRequest();
+            McpSpan acceptSpan = McpTracer.StartSpan("accept", "http", activate: false);
 
             // 增强请求日志 - 记录更多详细信息
             McpLogger.Log($"[UniMcp] <color=cyan>收到MCP请求:</color> {request.HttpMethod} {request.Url} from {clientEndpoint} (ID: {clientId})");
@@ -2140,7 +2218,8 @@ namespace UniMcp
                 // 设置响应头，允许跨域
                 response.Headers.Add("Access-Control-Allow-Origin", "*");
                 response.Headers.Add("Access-Control-Allow-Methods", "GET, POST, OPTIONS");
-                response.Headers.Add("Access-Control-Allow-Headers", "Content-Type");
+                response.Headers.Add("Access-Control-Allow-Headers", "Content-Type, traceparent, " + McpSession.HeaderName);
+                response.Headers.Add("Access-Control-Expose-Headers", "traceparent, " + McpSession.HeaderName);
 
                 // 检查是否是SSE请求 - 只有GET请求才可能是SSE
                 bool isSSERequest = false;
@@ -2227,22 +2306,52 @@ namespace UniMcp
                     return;
                 }
 
+                // 内置 /blob 路由：提供工具结果中的二进制附件
+                if (await McpBlobStore.TryHandleRequestAsync(request, response, requestPath))
+                {
+                    Log($"[UniMcp] /blob 路由处理完成 from {clientEndpoint}");
+                    return;
+                }
+
+                // 会话：使用请求携带的标识；未携带时不分配会话（只使用纯 JSON），由 initialize 分配并通过响应头返回
+                string sessionId = McpSession.FromRequest(request);
+                McpSession.Enter(sessionId);
+
                 string requestBody = "";
+                acceptSpan?.End();
 
                 // 先读取请求体（如果有）
                 if (request.HasEntityBody)
                 {
+                    long readStart = Stopwatch.GetTimestamp();
+                    McpSpan readSpan = McpTracer.StartSpan("read_body", "http", activate: false);
                     try
                     {
-                        using (StreamReader reader = new StreamReader(request.InputStream, request.ContentEncoding))
+                        var requestFormat = McpBinaryEncoding.FromMediaType(request.ContentType);
+                        if (requestFormat != McpWireFormat.Json)
                         {
-                            requestBody = await reader.ReadToEndAsync();
+                            // 已协商的二进制请求体先解码为 JSON 文本，后续处理与记录保持不变
+                            using (var buffer = new MemoryStream())
+                            {
+                                await request.InputStream.CopyToAsync(buffer);
+                                requestBody = McpBinaryEncoding.Decode(buffer.ToArray(), requestFormat)?.ToString() ?? "";
+                            }
+                        }
+                        else
+                        {
+                            using (StreamReader reader = new StreamReader(request.InputStream, request.ContentEncoding))
+                            {
+                                requestBody = await reader.ReadToEndAsync();
+                            }
                         }
                     }
                     catch (Exception ex)
                     {
                         LogError($"[UniMcp] 读取请求体时出错: {ex.Message}");
                     }
+                    readSpan?.End();
+                    metricsSample.AddStage(McpStage.Read, McpMetrics.ElapsedMilliseconds(readStart));
+                    metricsSample.RequestBytes = request.ContentLength64 >= 0 ? request.ContentLength64 : Encoding.UTF8.GetByteCount(requestBody);
                 }
 
                 // 解析查询参数
@@ -2354,19 +2463,29 @@ namespace UniMcp
                     try
                     {
                         // 处理 JSON-RPC 请求
+                        var messageFormat = McpBinaryEncoding.SelectResponseFormat(acceptHeader, sessionId);
+                        McpBinaryEncoding.BeginResponse(messageFormat);
                         string messageResponseJson = await ProcessMcpRequest(requestBody);
-                        byte[] messageResponseBytes = Encoding.UTF8.GetBytes(messageResponseJson);
+                        byte[] messageResponseBytes = McpBinaryEncoding.EncodeResponse(messageResponseJson, messageFormat);
                         
+                        long messageWriteStart = Stopwatch.GetTimestamp();
+                        McpSpan messageWriteSpan = McpTracer.StartSpan("write_response", "http", activate: false);
                         response.StatusCode = 200;
-                        response.ContentType = "application/json";
+                        response.ContentType = McpBinaryEncoding.GetMediaType(messageFormat);
                         await response.OutputStream.WriteAsync(messageResponseBytes, 0, messageResponseBytes.Length);
                         response.Close();
+                        messageWriteSpan?.End();
+                        metricsSample.ResponseBytes = messageResponseBytes.Length;
+                        metricsSample.AddStage(McpStage.Write, McpMetrics.ElapsedMilliseconds(messageWriteStart));
+                        McpMetrics.EndRequest(metricsSample);
                         
                         McpLogger.Log($"[UniMcp] /message 请求处理完成 from {clientEndpoint}");
                     }
                     catch (Exception ex)
                     {
                         McpLogger.LogError($"[UniMcp] /message 请求处理失败: {ex.Message}");
+                        metricsSample.Success = false;
+                        McpMetrics.EndRequest(metricsSample);
                         
                         string messageErrorResponse = CreateMcpErrorResponse(null, -32603, $"Internal error: {ex.Message}");
                         byte[] messageErrorBytes = Encoding.UTF8.GetBytes(messageErrorResponse);
@@ -2431,10 +2550,19 @@ namespace UniMcp
 
                 // 处理MCP请求
                 McpLogger.Log($"[UniMcp] 开始处理MCP请求 from {clientEndpoint}");
+                // 客户端协商了二进制编码且 Accept 头选择了它时，按该编码输出
+                var responseFormat = McpBinaryEncoding.SelectResponseFormat(acceptHeader, sessionId);
+                McpBinaryEncoding.BeginResponse(responseFormat);
                 string responseJson = await ProcessMcpRequest(requestBody);
                 McpLogger.Log($"[UniMcp] MCP请求处理完成，准备发送响应 to {clientEndpoint}");
 
-                byte[] responseBytes = Encoding.UTF8.GetBytes(responseJson);
+                byte[] responseBytes = McpBinaryEncoding.EncodeResponse(responseJson, responseFormat);
+                if (responseFormat != McpWireFormat.Json)
+                    response.ContentType = McpBinaryEncoding.GetMediaType(responseFormat);
+                // initialize 为未携带会话的客户端分配了会话，通过响应头返回，客户端在后续请求中回传
+                string assignedSessionId = McpSession.AssignedId;
+                if (assignedSessionId != null)
+                    response.Headers[McpSession.HeaderName] = assignedSessionId;
 
                 // 尝试设置状态码
                 try
@@ -2451,12 +2579,18 @@ namespace UniMcp
                 try
                 {
                     McpLogger.Log($"[UniMcp] 开始写入响应数据，长度: {responseBytes.Length} bytes");
+                    long writeStart = Stopwatch.GetTimestamp();
+                    McpSpan writeSpan = McpTracer.StartSpan("write_response", "http", activate: false);
                     await response.OutputStream.WriteAsync(responseBytes, 0, responseBytes.Length);
                     await response.OutputStream.FlushAsync();
                     McpLogger.Log($"[UniMcp] 响应数据写入完成");
 
                     response.Close();
+                    writeSpan?.End();
                     McpLogger.Log($"[UniMcp] 响应连接已关闭");
+                    metricsSample.ResponseBytes = responseBytes.Length;
+                    metricsSample.AddStage(McpStage.Write, McpMetrics.ElapsedMilliseconds(writeStart));
+                    McpMetrics.EndRequest(metricsSample);
                 }
                 catch (Exception ex)
                 {
@@ -2479,6 +2613,8 @@ namespace UniMcp
             {
                 LogError($"[UniMcp] MCP请求处理异常 {clientEndpoint}: {ex.Message}");
                 LogError($"[UniMcp] 异常堆栈: {ex.StackTrace}");
+                metricsSample.Success = false;
+                McpMetrics.EndRequest(metricsSample);
 
                 try
                 {
@@ -2574,9 +2710,13 @@ namespace UniMcp
                 McpLogger.Log($"[UniMcp] 请求体内容: {requestBody}");
 
                 JsonNode requestJson;
+                long parseStart = Stopwatch.GetTimestamp();
+                McpSpan parseSpan = McpTracer.StartSpan("json.parse", "rpc", activate: false);
                 try
                 {
                     requestJson = Json.Parse(requestBody);
+                    parseSpan?.End();
+                    McpMetrics.Current?.AddStage(McpStage.Parse, McpMetrics.ElapsedMilliseconds(parseStart));
                 }
                 catch (Exception parseEx)
                 {
@@ -2597,8 +2737,13 @@ namespace UniMcp
 
                 McpLogger.Log($"[UniMcp] 解析成功 - 方法: {method}, ID: {id}");
 
+                var metricsSample = McpMetrics.Current;
+                if (metricsSample != null)
+                    metricsSample.Method = method ?? "";
+
                 // 设置超时保护
                 CancellationTokenSource timeoutCts = new CancellationTokenSource(TimeSpan.FromSeconds(10));
+                McpSpan rpcSpan = McpTracer.StartSpan($"rpc {method}", "rpc");
 
                 try
                 {
@@ -2688,6 +2833,7 @@ namespace UniMcp
                 }
                 finally
                 {
+                    rpcSpan?.End();
                     timeoutCts.Dispose();
                 }
             }
@@ -2778,6 +2924,16 @@ namespace UniMcp
 
             var capabilities = new JsonClass();
 
+            // 二进制传输（MessagePack/CBOR 编码与 /blob 附件），仅在客户端声明时启用
+            var binaryCapability = McpBinaryEncoding.Negotiate(McpSession.EnsureCurrent(), paramsNode?["capabilities"]);
+            if (binaryCapability != null)
+            {
+                var experimental = new JsonClass();
+                experimental.Add(McpBinaryEncoding.CapabilityName, binaryCapability);
+                capabilities.Add("experimental", experimental);
+                Log($"[UniMcp] 初始化响应 - 二进制传输: {binaryCapability}");
+            }
+
             // Tools capability
             var toolsCapability = new JsonClass();
             // 动态检查工具数量是否发生变化（会自动更新 LastToolCount）
@@ -4433,6 +4589,7 @@ namespace UniMcp
             try
             {
                 McpLogger.Log($"[UniMcp] HandleToolsCall开始，ID: {id}");
+                string sessionId = McpSession.CurrentId;
 
                 if (paramsNode == null)
                 {
@@ -4443,6 +4600,9 @@ namespace UniMcp
                 var paramsObj = paramsNode.ToObject();
                 string toolName = paramsObj["name"]?.Value;
                 JsonNode argumentsNode = paramsObj["arguments"];
+                JsonNode progressToken = paramsObj["_meta"]["progressToken"];
+                if (progressToken == null || progressToken.IsNull())
+                    progressToken = null;
 
                 McpLogger.Log($"[UniMcp] 工具调用 - 工具名: {toolName}, ID: {id}");
 
@@ -4459,6 +4619,13 @@ namespace UniMcp
                     return CreateMcpErrorResponse(id, -32602, $"Tool '{toolName}' is disabled");
                 }
 
+                var metricsSample = McpMetrics.Current;
+                if (metricsSample != null)
+                {
+                    metricsSample.Tool = toolName;
+                    metricsSample.Action = McpMetrics.ResolveAction(argumentsNode);
+                }
+
                 // 统一通过GetMcpTool获取工具实例
                 Log($"[UniMcp] 获取McpTool实例: {toolName}");
                 var tool = GetMcpTool(toolName);
@@ -4478,20 +4645,36 @@ namespace UniMcp
                 JsonNode adaptedArguments = AdaptToolArguments(toolName, argumentsNode);
 
                 // 统一通过HandleCommand处理所有工具调用，使用消息队列确保在主线程中执行
+                long enqueuedAt = Stopwatch.GetTimestamp();
+                McpTraceContext traceContext = McpTracer.CurrentContext;
+                McpSpan queueSpan = McpTracer.StartSpan(traceContext, "enqueue_wait", "queue", activate: false);
                 EnqueueTask(() =>
                 {
+                    McpSpan toolSpan = null;
+                    IDisposable traceActivation = null;
+                    IDisposable progressActivation = null;
                     try
                     {
+                        queueSpan?.End();
+                        metricsSample?.AddStage(McpStage.QueueWait, McpMetrics.ElapsedMilliseconds(enqueuedAt));
+                        long executeStart = Stopwatch.GetTimestamp();
+                        toolSpan = McpTracer.StartSpan(traceContext, $"tool {toolName}", "tool", activate: false);
+                        traceActivation = McpTracer.Activate(toolSpan?.Context);
+                        progressActivation = McpProgress.Activate(progressToken, sessionId);
                         tool.HandleCommand(adaptedArguments, (result) =>
                         {
                             var endTime = DateTime.Now;
                             var duration = (endTime - startTime).TotalMilliseconds;
+                            toolSpan?.End();
+                            metricsSample?.AddStage(McpStage.Execute, McpMetrics.ElapsedMilliseconds(executeStart));
 
                             try
                             {
                                 Log($"[UniMcp] 工具执行完成，结果: {result}");
 
                                 // 记录执行结果到McpExecuteRecordObject
+                                long recordStart = Stopwatch.GetTimestamp();
+                                McpSpan recordSpan = McpTracer.StartSpan(traceContext, "record", "persist", activate: false);
                                 try
                                 {
                                     var recordObject = McpExecuteRecordObject.instance;
@@ -4556,6 +4739,8 @@ namespace UniMcp
                                         if (successNode != null && successNode.Value == "false")
                                         {
                                             error = jsonResult["error"]?.Value ?? "Unknown error";
+                                            if (metricsSample != null)
+                                                metricsSample.Success = false;
                                         }
                                     }
 
@@ -4579,6 +4764,8 @@ namespace UniMcp
                                 {
                                     LogError($"[UniMcp] 记录执行结果时发生错误: {recordEx.Message}");
                                 }
+                                recordSpan?.End();
+                                metricsSample?.AddStage(McpStage.Record, McpMetrics.ElapsedMilliseconds(recordStart));
 
                                 tcs.SetResult(result);
                             }
@@ -4592,12 +4779,20 @@ namespace UniMcp
                     catch (Exception ex)
                     {
                         LogError($"[UniMcp] 主线程执行工具调用失败: {ex.Message}");
+                        toolSpan?.End();
                         tcs.SetException(ex);
                     }
+                    finally
+                    {
+                        traceActivation?.Dispose();
+                        progressActivation?.Dispose();
+                    }
                 });
 
                 // 等待执行完成
                 var toolResult = await tcs.Task;
+                long serializeStart = Stopwatch.GetTimestamp();
+                McpSpan serializeSpan = McpTracer.StartSpan("serialize", "rpc", activate: false);
 
                 // 构建MCP响应
                 var responseContent = new JsonArray();
@@ -4634,9 +4829,7 @@ namespace UniMcp
                     {
                         try
                         {
-                            // 读取图片文件并转换为Base64
                             byte[] imageBytes = System.IO.File.ReadAllBytes(resourcePath);
-                            string base64Data = System.Convert.ToBase64String(imageBytes);
 
                             // 根据格式确定MIME类型
                             string mimeType = "image/jpeg"; // 默认
@@ -4663,14 +4856,28 @@ namespace UniMcp
                                 }
                             }
 
-                            // 创建图片内容
-                            var imageContent = new JsonClass();
-                            imageContent.Add("type", new JsonData("image"));
-                            imageContent.Add("data", new JsonData(base64Data));
-                            imageContent.Add("mimeType", new JsonData(mimeType));
-                            responseContent.Add(imageContent);
-
-                            Log($"[UniMcp] 添加图片资源到响应: {resourcePath}, MIME: {mimeType}, 大小: {imageBytes.Length} bytes");
+                            if (McpBinaryEncoding.IsAttachmentsEnabled(sessionId))
+                            {
+                                // 已协商附件模式：图片放入附件存储，结果中只返回 /blob 句柄
+                                var attachments = new JsonArray();
+                                attachments.Add(McpBlobStore.CreateAttachment(imageBytes, mimeType, System.IO.Path.GetFileName(resourcePath)));
+                                if (!(cleanedResult is JsonClass))
+                                    cleanedResult = new JsonClass();
+                                cleanedResult.AsObject.Add("attachments", attachments);
+
+                                Log($"[UniMcp] 添加图片附件到响应: {resourcePath}, MIME: {mimeType}, 大小: {imageBytes.Length} bytes");
+                            }
+                            else
+                            {
+                                // 创建图片内容（Base64）
+                                var imageContent = new JsonClass();
+                                imageContent.Add("type", new JsonData("image"));
+                                imageContent.Add("data", new JsonData(System.Convert.ToBase64String(imageBytes)));
+                                imageContent.Add("mimeType", new JsonData(mimeType));
+                                responseContent.Add(imageContent);
+
+                                Log($"[UniMcp] 添加图片资源到响应: {resourcePath}, MIME: {mimeType}, 大小: {imageBytes.Length} bytes");
+                            }
                         }
                         catch (Exception ex)
                         {
@@ -4679,16 +4886,27 @@ namespace UniMcp
                     }
                 }
 
-                // 添加文本内容（去除resources的结果）
-                var responseTextContent = new JsonClass();
-                responseTextContent.Add("type", new JsonData("text"));
-                responseTextContent.Add("text", new JsonData(cleanedResult?.ToString() ?? "Tool executed successfully"));
-                responseContent.Add(responseTextContent);
-
                 var responseResult = new JsonClass();
-                responseResult.Add("content", responseContent);
+                if (McpBinaryEncoding.IsBinaryResponse && cleanedResult is JsonClass structuredResult)
+                {
+                    // 二进制编码响应：结果节点作为 structuredContent 直接编码，不再序列化为文本
+                    responseResult.Add("content", responseContent);
+                    responseResult.Add("structuredContent", structuredResult);
+                }
+                else
+                {
+                    // 添加文本内容（去除resources的结果）
+                    var responseTextContent = new JsonClass();
+                    responseTextContent.Add("type", new JsonData("text"));
+                    responseTextContent.Add("text", new JsonData(cleanedResult?.ToString() ?? "Tool executed successfully"));
+                    responseContent.Add(responseTextContent);
+                    responseResult.Add("content", responseContent);
+                }
 
-                return CreateMcpSuccessResponse(id, responseResult);
+                string toolResponse = CreateMcpSuccessResponse(id, responseResult);
+                serializeSpan?.End();
+                metricsSample?.AddStage(McpStage.Serialize, McpMetrics.ElapsedMilliseconds(serializeStart));
+                return toolResponse;
             }
             catch (Exception ex)
             {
@@ -4769,6 +4987,10 @@ namespace UniMcp
                 response.Add("id", new JsonData(null));
             }
 
+            // 二进制编码响应直接编码响应节点，不再序列化为文本（请求记录中只保留摘要）
+            if (McpBinaryEncoding.CaptureResponse(response))
+                return $"{{\"jsonrpc\":\"2.0\",\"id\":{response["id"]},\"result\":\"(binary response)\"}}";
+
             // 使用System.Text.Json序列化以确保格式正确
             try
             {
@@ -4803,6 +5025,10 @@ namespace UniMcp
         /// </summary>
         private string CreateMcpErrorResponse(string id, int code, string message)
         {
+            var metricsSample = McpMetrics.Current;
+            if (metricsSample != null)
+                metricsSample.Success = false;
+
             var error = new JsonClass();
             error.Add("code", new JsonData(code));
             error.Add("message", new JsonData(message));
@@ -4829,6 +5055,9 @@ namespace UniMcp
                 response.Add("id", new JsonData(null));
             }
 
+            // 二进制编码响应以该节点为准，避免沿用之前保存的成功响应
+            McpBinaryEncoding.CaptureResponse(response);
+
             // 使用System.Text.Json序列化以确保格式正确
             try
             {
@@ -0,0 +1,88 @@
+using System;
+using System.Net;
+using System.Threading;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// MCP 会话标识。Streamable HTTP 客户端通过 Mcp-Session-Id 请求头携带会话，
+    /// SSE 客户端通过 endpoint 消息中返回的 /message?sessionId={id} 携带会话。
+    /// 请求处理期间当前会话保存在 AsyncLocal 中，随 await 流转；
+    /// 按会话保存的状态（编码协商、进度通知通道）都以该标识为键。
+    /// 未携带会话的请求不分配会话（按纯 JSON 处理），只有 initialize 会分配新会话并通过响应头返回。
+    /// </summary>
+    public static class McpSession
+    {
+        public const string HeaderName = "Mcp-Session-Id";
+        public const string QueryName = "sessionId";
+
+        private sealed class Scope
+        {
+            public string Id;
+            public bool Assigned;
+        }
+
+        private static readonly AsyncLocal<Scope> _current = new AsyncLocal<Scope>();
+
+        /// <summary>
+        /// 当前请求所属的会话（未进入请求上下文或请求未携带会话时为 null）
+        /// </summary>
+        public static string CurrentId => _current.Value?.Id;
+
+        /// <summary>
+        /// 本次请求处理中新分配的会话（需通过响应头返回给客户端），未分配时为 null
+        /// </summary>
+        public static string AssignedId
+        {
+            get
+            {
+                var scope = _current.Value;
+                return scope != null && scope.Assigned ? scope.Id : null;
+            }
+        }
+
+        /// <summary>
+        /// 生成新的会话标识
+        /// </summary>
+        public static string NewId()
+        {
+            return Guid.NewGuid().ToString("N");
+        }
+
+        /// <summary>
+        /// 读取请求携带的会话标识（请求头优先，其次为查询参数），未携带时返回 null
+        /// </summary>
+        public static string FromRequest(HttpListenerRequest request)
+        {
+            string sessionId = request.Headers[HeaderName];
+            if (string.IsNullOrEmpty(sessionId))
+                sessionId = request.QueryString[QueryName];
+            return string.IsNullOrEmpty(sessionId) ? null : sessionId;
+        }
+
+        /// <summary>
+        /// 设置当前异步流程的会话；在 async 方法内设置时，方法返回后自动恢复调用方的值
+        /// </summary>
+        internal static void Enter(string sessionId)
+        {
+            _current.Value = new Scope { Id = sessionId };
+        }
+
+        /// <summary>
+        /// 当前请求未携带会话时分配新会话（用于 initialize），返回当前会话；不在请求上下文中时返回 null。
+        /// 分配结果记录在调用方 Enter 创建的上下文中，HTTP 层通过 AssignedId 读取
+        /// </summary>
+        internal static string EnsureCurrent()
+        {
+            var scope = _current.Value;
+            if (scope == null)
+                return null;
+            if (scope.Id == null)
+            {
+                scope.Id = NewId();
+                scope.Assigned = true;
+            }
+            return scope.Id;
+        }
+    }
+}
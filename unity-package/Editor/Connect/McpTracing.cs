@@ -0,0 +1,414 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Globalization;
+using System.Linq;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using UnityEditor;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 一条请求链路的追踪记录
+    /// </summary>
+    public sealed class McpTrace
+    {
+        public string TraceId { get; }
+        public string RemoteParentId { get; }
+        public string Name { get; }
+        public DateTime StartedAt { get; } = DateTime.UtcNow;
+        public int DroppedSpans { get; private set; }
+
+        private readonly List<McpSpanRecord> _spans = new List<McpSpanRecord>();
+
+        internal McpTrace(string traceId, string remoteParentId, string name)
+        {
+            TraceId = traceId;
+            RemoteParentId = remoteParentId;
+            Name = name;
+        }
+
+        internal void Add(McpSpanRecord record)
+        {
+            lock (_spans)
+            {
+                if (_spans.Count >= McpTracer.MaxSpansPerTrace)
+                {
+                    DroppedSpans++;
+                    return;
+                }
+                _spans.Add(record);
+            }
+        }
+
+        public List<McpSpanRecord> GetSpans()
+        {
+            lock (_spans)
+            {
+                return new List<McpSpanRecord>(_spans);
+            }
+        }
+    }
+
+    /// <summary>
+    /// 已结束的 span
+    /// </summary>
+    public struct McpSpanRecord
+    {
+        public string Name;
+        public string Category;
+        public string SpanId;
+        public string ParentId;
+        public long StartTimestamp;
+        public long EndTimestamp;
+        public int ThreadId;
+        public string Detail;
+    }
+
+    /// <summary>
+    /// 追踪上下文：所属 trace 及当前 span，用于跨线程、跨回调传递父子关系
+    /// </summary>
+    public sealed class McpTraceContext
+    {
+        public McpTrace Trace { get; }
+        public string SpanId { get; }
+
+        internal McpTraceContext(McpTrace trace, string spanId)
+        {
+            Trace = trace;
+            SpanId = spanId;
+        }
+    }
+
+    /// <summary>
+    /// 进行中的 span，End/Dispose 时写入所属 trace。
+    /// activate 为 true 时在创建期间成为当前异步流的父 span，结束时恢复之前的上下文，
+    /// 因此激活的 span 必须在创建它的同一异步流中结束；跨线程的 span 应使用 activate: false。
+    /// </summary>
+    public sealed class McpSpan : IDisposable
+    {
+        private readonly string _name;
+        private readonly string _category;
+        private readonly string _parentId;
+        private readonly long _start;
+        private readonly bool _activated;
+        private readonly McpTraceContext _previous;
+        private int _ended;
+
+        public McpTraceContext Context { get; }
+        public string Detail { get; set; }
+
+        internal McpSpan(McpTraceContext parent, McpTrace trace, string name, string category, bool activate)
+        {
+            _name = name;
+            _category = category;
+            _parentId = parent?.SpanId ?? trace.RemoteParentId;
+            _start = Stopwatch.GetTimestamp();
+            Context = new McpTraceContext(trace, McpTracer.NewSpanId());
+
+            if (activate)
+            {
+                _activated = true;
+                _previous = McpTracer.CurrentContext;
+                McpTracer.SetCurrent(Context);
+            }
+        }
+
+        public void End()
+        {
+            if (Interlocked.Exchange(ref _ended, 1) != 0)
+                return;
+
+            Context.Trace.Add(new McpSpanRecord
+            {
+                Name = _name,
+                Category = _category,
+                SpanId = Context.SpanId,
+                ParentId = _parentId,
+                StartTimestamp = _start,
+                EndTimestamp = Stopwatch.GetTimestamp(),
+                ThreadId = Thread.CurrentThread.ManagedThreadId,
+                Detail = Detail
+            });
+
+            if (_activated)
+                McpTracer.SetCurrent(_previous);
+        }
+
+        public void Dispose() => End();
+    }
+
+    /// <summary>
+    /// 请求链路追踪：每个 MCP 请求生成一个 trace，各处理阶段记录为 span，
+    /// 保存在有界内存缓冲区中，通过 /traces 导出为 Chrome trace_event JSON（可在 chrome://tracing 或 Perfetto 打开）。
+    /// 支持 W3C traceparent 请求头透传。
+    /// </summary>
+    [InitializeOnLoad]
+    public static class McpTracer
+    {
+        /// <summary>
+        /// 缓冲区保留的最大 trace 数
+        /// </summary>
+        public const int MaxTraces = 200;
+
+        /// <summary>
+        /// 单个 trace 的最大 span 数，超出部分丢弃并计数
+        /// </summary>
+        public const int MaxSpansPerTrace = 4096;
+
+        private static readonly AsyncLocal<McpTraceContext> _current = new AsyncLocal<McpTraceContext>();
+        private static readonly LinkedList<McpTrace> _traces = new LinkedList<McpTrace>();
+        private static readonly object _tracesLock = new object();
+        private static readonly long _epoch = Stopwatch.GetTimestamp();
+        private static readonly int _mainThreadId = Thread.CurrentThread.ManagedThreadId;
+
+        [ThreadStatic]
+        private static Random _random;
+
+        /// <summary>
+        /// 是否启用追踪
+        /// </summary>
+        public static bool Enabled { get; set; } = true;
+
+        /// <summary>
+        /// 当前异步流的追踪上下文（未处于追踪中时为 null）
+        /// </summary>
+        public static McpTraceContext CurrentContext => _current.Value;
+
+        internal static void SetCurrent(McpTraceContext context)
+        {
+            _current.Value = context;
+        }
+
+        /// <summary>
+        /// 开始一个新的 trace 并返回已激活的根 span
+        /// </summary>
+        /// <param name="name">根 span 名称</param>
+        /// <param name="traceparent">可选的 W3C traceparent 请求头</param>
+        public static McpSpan BeginTrace(string name, string traceparent = null)
+        {
+            if (!Enabled)
+                return null;
+
+            string traceId = null;
+            string remoteParentId = null;
+            TryParseTraceparent(traceparent, out traceId, out remoteParentId);
+
+            var trace = new McpTrace(traceId ?? NewId(16), remoteParentId, name);
+            lock (_tracesLock)
+            {
+                _traces.AddLast(trace);
+                while (_traces.Count > MaxTraces)
+                    _traces.RemoveFirst();
+            }
+            return new McpSpan(null, trace, name, "request", true);
+        }
+
+        /// <summary>
+        /// 在当前上下文下开始子 span；不在追踪中时返回 null
+        /// </summary>
+        public static McpSpan StartSpan(string name, string category = "mcp", bool activate = true)
+        {
+            return StartSpan(CurrentContext, name, category, activate);
+        }
+
+        /// <summary>
+        /// 在指定父上下文下开始子 span；parent 为 null 时返回 null
+        /// </summary>
+        public static McpSpan StartSpan(McpTraceContext parent, string name, string category = "mcp", bool activate = true)
+        {
+            if (parent == null || !Enabled)
+                return null;
+            return new McpSpan(parent, parent.Trace, name, category, activate);
+        }
+
+        /// <summary>
+        /// 在一段同步代码中恢复指定追踪上下文，用于回调、协程等异步边界；context 为 null 时返回 null
+        /// </summary>
+        public static IDisposable Activate(McpTraceContext context)
+        {
+            return context == null ? null : new ActivationScope(context);
+        }
+
+        private sealed class ActivationScope : IDisposable
+        {
+            private readonly McpTraceContext _previous;
+            private bool _disposed;
+
+            public ActivationScope(McpTraceContext context)
+            {
+                _previous = CurrentContext;
+                SetCurrent(context);
+            }
+
+            public void Dispose()
+            {
+                if (_disposed) return;
+                _disposed = true;
+                SetCurrent(_previous);
+            }
+        }
+
+        /// <summary>
+        /// 生成响应用的 traceparent 头
+        /// </summary>
+        public static string FormatTraceparent(McpTraceContext context)
+        {
+            return context == null ? null : $"00-{context.Trace.TraceId}-{context.SpanId}-01";
+        }
+
+        /// <summary>
+        /// 解析 W3C traceparent：version-traceid(32)-parentid(16)-flags
+        /// </summary>
+        public static bool TryParseTraceparent(string traceparent, out string traceId, out string parentId)
+        {
+            traceId = null;
+            parentId = null;
+            if (string.IsNullOrEmpty(traceparent))
+                return false;
+
+            var parts = traceparent.Trim().Split('-');
+            if (parts.Length < 4 || parts[0].Length != 2 || parts[1].Length != 32 || parts[2].Length != 16)
+                return false;
+            if (!IsHex(parts[1]) || !IsHex(parts[2]) || parts[1].All(c => c == '0') || parts[2].All(c => c == '0'))
+                return false;
+
+            traceId = parts[1].ToLowerInvariant();
+            parentId = parts[2].ToLowerInvariant();
+            return true;
+        }
+
+        internal static string NewSpanId() => NewId(8);
+
+        private static string NewId(int bytes)
+        {
+            if (_random == null)
+                _random = new Random(Guid.NewGuid().GetHashCode());
+            var buffer = new byte[bytes];
+            _random.NextBytes(buffer);
+            var sb = new StringBuilder(bytes * 2);
+            foreach (var b in buffer)
+                sb.Append(b.ToString("x2"));
+            return sb.ToString();
+        }
+
+        private static bool IsHex(string value)
+        {
+            foreach (char c in value)
+            {
+                if (!Uri.IsHexDigit(c))
+                    return false;
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// 清空追踪缓冲区
+        /// </summary>
+        public static void Clear()
+        {
+            lock (_tracesLock)
+            {
+                _traces.Clear();
+            }
+        }
+
+        /// <summary>
+        /// 获取缓冲区中的 trace（按时间顺序）
+        /// </summary>
+        public static List<McpTrace> GetTraces()
+        {
+            lock (_tracesLock)
+            {
+                return _traces.ToList();
+            }
+        }
+
+        /// <summary>
+        /// 注册 /traces 路由
+        /// </summary>
+        internal static void RegisterRoutes(McpService service)
+        {
+            service.RegistHttpRequest("/traces", "GET", HandleTracesRequest);
+        }
+
+        private static Task<string> HandleTracesRequest(HttpRequestContext context)
+        {
+            context.QueryParams.TryGetValue("trace_id", out string traceId);
+            int limit = 0;
+            if (context.QueryParams.TryGetValue("limit", out string limitValue))
+                int.TryParse(limitValue, out limit);
+
+            context.Response.ContentType = "application/json; charset=utf-8";
+            return Task.FromResult(ExportChromeTrace(traceId, limit));
+        }
+
+        /// <summary>
+        /// 导出 Chrome trace_event 格式（ph="X" 完整事件，时间单位微秒）
+        /// </summary>
+        /// <param name="traceId">只导出指定 trace，为空导出全部</param>
+        /// <param name="limit">只导出最近 N 个 trace，0 表示不限制</param>
+        public static string ExportChromeTrace(string traceId = null, int limit = 0)
+        {
+            IEnumerable<McpTrace> traces = GetTraces();
+            if (!string.IsNullOrEmpty(traceId))
+                traces = traces.Where(t => t.TraceId.Equals(traceId, StringComparison.OrdinalIgnoreCase));
+            if (limit > 0)
+                traces = traces.Reverse().Take(limit).Reverse();
+
+            var events = new JsonArray();
+            events.Add(MetadataEvent("process_name", 0, "Unity MCP"));
+            events.Add(MetadataEvent("thread_name", _mainThreadId, "Unity Main Thread"));
+
+            foreach (var trace in traces)
+            {
+                foreach (var span in trace.GetSpans())
+                {
+                    var evt = new JsonClass();
+                    evt.Add("name", new JsonData(span.Name));
+                    evt.Add("cat", new JsonData(span.Category));
+                    evt.Add("ph", new JsonData("X"));
+                    evt.Add("ts", new JsonData(ToMicros(span.StartTimestamp - _epoch)));
+                    evt.Add("dur", new JsonData(ToMicros(span.EndTimestamp - span.StartTimestamp)));
+                    evt.Add("pid", new JsonData(1));
+                    evt.Add("tid", new JsonData(span.ThreadId));
+
+                    var args = new JsonClass();
+                    args.Add("trace_id", new JsonData(trace.TraceId));
+                    args.Add("span_id", new JsonData(span.SpanId));
+                    if (!string.IsNullOrEmpty(span.ParentId))
+                        args.Add("parent_id", new JsonData(span.ParentId));
+                    if (!string.IsNullOrEmpty(span.Detail))
+                        args.Add("detail", new JsonData(span.Detail));
+                    evt.Add("args", args);
+                    events.Add(evt);
+                }
+            }
+
+            var root = new JsonClass();
+            root.Add("traceEvents", events);
+            root.Add("displayTimeUnit", new JsonData("ms"));
+            return root.ToString();
+        }
+
+        private static JsonClass MetadataEvent(string name, int tid, string value)
+        {
+            var evt = new JsonClass();
+            evt.Add("name", new JsonData(name));
+            evt.Add("ph", new JsonData("M"));
+            evt.Add("pid", new JsonData(1));
+            evt.Add("tid", new JsonData(tid));
+            var args = new JsonClass();
+            args.Add("name", new JsonData(value));
+            evt.Add("args", args);
+            return evt;
+        }
+
+        private static long ToMicros(long ticks)
+        {
+            return (long)(ticks * 1000000.0 / Stopwatch.Frequency);
+        }
+    }
+}
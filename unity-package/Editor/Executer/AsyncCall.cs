@@ -81,10 +81,12 @@ namespace UniMcp.Executer
                 var state = new StateTreeContext(args, new Dictionary<string, object>());
                 pendingTasks[id] = state;
 
+                var ticket = ToolResultCache.BeginCall(functionName, method, args);
                 method.ExecuteMethod(state);
 
                 state.RegistComplete(result =>
                 {
+                    ToolResultCache.EndCall(ticket, result);
                     // The task is complete, and the result is stored in the state.
                     // The client will poll for it using type='out'.
                     state.Result = result; // Make sure the result is stored.
@@ -72,7 +72,7 @@ namespace UniMcp.Executer
                 }
 
                 // 开始异步顺序执行
-                ExecuteFunctionAtIndex(funcsArray, 0, results, totalCalls, callback);
+                ExecuteFunctionAtIndex(funcsArray, 0, results, totalCalls, callback, McpTracer.CurrentContext);
             }
             catch (Exception e)
             {
@@ -87,7 +87,7 @@ namespace UniMcp.Executer
         /// 如果遇到执行错误，将中断执行并返回错误信息
         /// </summary>
         private void ExecuteFunctionAtIndex(JsonArray funcsArray, int currentIndex, List<object> results,
-            int totalCalls, Action<JsonClass> finalCallback)
+            int totalCalls, Action<JsonClass> finalCallback, McpTraceContext traceContext)
         {
             // 如果所有函数都执行完毕，返回最终结果
             if (currentIndex >= totalCalls)
@@ -182,37 +182,43 @@ namespace UniMcp.Executer
                     return;
                 }
 
-                // 异步执行单个函数调用
-                ExecuteSingleFunctionAsync(funcName, args, (singleResult) =>
+                // 异步执行单个函数调用（每个子调用记录为一个 span）
+                var subCallSpan = McpTracer.StartSpan(traceContext, $"batch[{currentIndex}] {funcName}", "batch", activate: false);
+                using (McpTracer.Activate(subCallSpan?.Context))
                 {
-                    // 保存当前函数的执行结果
-                    results[currentIndex] = singleResult;
+                    ExecuteSingleFunctionAsync(funcName, args, (singleResult) =>
+                    {
+                        subCallSpan?.End();
 
-                    McpLogger.Log($"[FunctionsCall] Function {currentIndex + 1}/{totalCalls} ({funcName}) executed");
+                        // 保存当前函数的执行结果
+                        results[currentIndex] = singleResult;
 
-                    // 检查执行结果是否成功
-                    bool isSuccess = false;
-                    if (singleResult != null && singleResult is JsonClass jsonResult)
-                    {
-                        var successNode = jsonResult["success"];
-                        isSuccess = successNode != null && successNode.Value == "true";
-                    }
+                        McpLogger.Log($"[FunctionsCall] Function {currentIndex + 1}/{totalCalls} ({funcName}) executed");
 
-                    // 如果执行失败，中断后续执行
-                    if (!isSuccess)
-                    {
-                        McpLogger.LogError($"[FunctionsCall] Function {currentIndex + 1}/{totalCalls} ({funcName}) failed, aborting batch execution");
+                        // 检查执行结果是否成功
+                        bool isSuccess = false;
+                        if (singleResult != null && singleResult is JsonClass jsonResult)
+                        {
+                            var successNode = jsonResult["success"];
+                            isSuccess = successNode != null && successNode.Value == "true";
+                        }
 
-                        // 创建中断执行的响应
-                        string errorMsg = $"批量执行中断：执行到第{currentIndex + 1}个函数时遇到错误，中断执行";
-                        var abortResponse = CreateBatchResponse(false, results, totalCalls, currentIndex, 1, errorMsg);
-                        finalCallback(abortResponse);
-                        return;
-                    }
+                        // 如果执行失败，中断后续执行
+                        if (!isSuccess)
+                        {
+                            McpLogger.LogError($"[FunctionsCall] Function {currentIndex + 1}/{totalCalls} ({funcName}) failed, aborting batch execution");
 
-                    // 继续执行下一个函数
-                    ExecuteFunctionAtIndex(funcsArray, currentIndex + 1, results, totalCalls, finalCallback);
-                });
+                            // 创建中断执行的响应
+                            string errorMsg = $"批量执行中断：执行到第{currentIndex + 1}个函数时遇到错误，中断执行";
+                            var abortResponse = CreateBatchResponse(false, results, totalCalls, currentIndex, 1, errorMsg);
+                            finalCallback(abortResponse);
+                            return;
+                        }
+
+                        // 继续执行下一个函数
+                        ExecuteFunctionAtIndex(funcsArray, currentIndex + 1, results, totalCalls, finalCallback, traceContext);
+                    });
+                }
             }
             catch (Exception e)
             {
@@ -244,6 +250,14 @@ namespace UniMcp.Executer
                     return;
                 }
 
+                // 只读操作优先使用缓存结果
+                var ticket = ToolResultCache.BeginCall(functionName, method, args);
+                if (ToolResultCache.TryGetCached(ticket, out JsonNode cached))
+                {
+                    callback(cached);
+                    return;
+                }
+
                 // 创建执行上下文
                 var state = new StateTreeContext(args, new Dictionary<string, object>());
 
@@ -251,6 +265,7 @@ namespace UniMcp.Executer
                 method.ExecuteMethod(state);
                 state.RegistComplete((result) =>
                 {
+                    ToolResultCache.EndCall(ticket, result);
                     try
                     {
                         // 成功执行，调用回调并传递结果
@@ -29,11 +29,29 @@ namespace UniMcp
         /// </summary>
         private MethodKey[] _keys;
 
+        /// <summary>
+        /// 由 Keys 编译得到的参数绑定器，首次执行时创建
+        /// </summary>
+        private MethodKeyBinder _binder;
+
         /// <summary>
         /// 工具方法的描述，用于在状态树中引用
         /// </summary>
         public abstract string Description {get;}
 
+        /// <summary>
+        /// 本次调用是否会创建、删除、重命名或移动场景对象（按调用参数判断，只读和普通属性修改应返回 false）；
+        /// 为 true 时执行后调用 HierarchyIndex.Invalidate
+        /// </summary>
+        /// <param name="args">调用参数</param>
+        protected virtual bool ModifiesHierarchy(JsonClass args) => false;
+
+        /// <summary>
+        /// 是否严格校验参数：为 true 时类型、枚举或范围不合法的调用在进入处理函数前直接返回错误；
+        /// 默认宽松，无法转换的值交由处理函数按原始参数解析
+        /// </summary>
+        protected virtual bool StrictArguments => false;
+
         /// <summary>
         /// 当前方法支持的参数键列表，用于API文档生成和参数验证。
         /// 子类必须实现此属性，定义该方法接受的所有可能参数键。
@@ -99,11 +117,20 @@ namespace UniMcp
         /// <param name="args">方法调用的参数对象</param>
         public virtual void ExecuteMethod(StateTreeContext args)
         {
+            // 处理函数可能改写参数，执行前判断
+            bool modifiesHierarchy = ModifiesHierarchy(args.JsonData);
             try
             {
                 // 确保状态树已初始化
                 _targetTree = _targetTree ?? CreateTargetTree();
                 _actionTree = _actionTree ?? CreateActionTree();
+                _binder = _binder ?? MethodKeyBinder.Compile(Keys, StrictArguments, _targetTree, _actionTree);
+                // 参数一次性绑定并校验，非法调用在目标定位前直接返回
+                if (!_binder.TryBind(args, out string bindError))
+                {
+                    args.Complete(Response.Error(bindError));
+                    return;
+                }
                 ExecuteTargetTree(args);
             }
             catch (Exception e)
@@ -111,6 +138,11 @@ namespace UniMcp
                 Debug.LogException(new Exception("[DualStateMethodBase] Unexpected error during dual-tree execution:", e));
                 args.Complete(Response.Error($"Unexpected error during execution: {e.Message}"));
             }
+            finally
+            {
+                if (modifiesHierarchy)
+                    HierarchyIndex.Invalidate();
+            }
         }
         /// <summary>
         /// 执行目标树
@@ -118,24 +150,40 @@ namespace UniMcp
         /// <param name="args"></param>
         protected virtual void ExecuteTargetTree(StateTreeContext args)
         {
-            var copyContext = new StateTreeContext(args.JsonData, args.ObjectReferences);
+            var copyContext = new StateTreeContext(args.JsonData, args.ObjectReferences) { Arguments = args.Arguments };
             // 第一阶段：使用目标定位树找到目标
             McpLogger.Log("[DualStateMethodBase] Phase 1: Target Location");
-            var targetResult = _targetTree.Run(copyContext);
+            var traceContext = McpTracer.CurrentContext;
+            var targetSpan = McpTracer.StartSpan(traceContext, "dual.target", "tool", activate: false);
+            object targetResult;
+            using (McpTracer.Activate(targetSpan?.Context))
+            {
+                targetResult = _targetTree.Run(copyContext);
+            }
 
             // 检查目标定位阶段的错误
             if (targetResult == null && !string.IsNullOrEmpty(_targetTree.ErrorMessage))
             {
+                targetSpan?.End();
                 Debug.LogError($"[DualStateMethodBase] Target location failed: {_targetTree.ErrorMessage}");
                 args.Complete(Response.Error($"Target location failed: {_targetTree.ErrorMessage}"));
             }
             else if (targetResult != null && targetResult != copyContext)
             {
+                targetSpan?.End();
                 ExecuteActiontTree(targetResult, args);
             }
             else
             {
-                copyContext.RegistComplete((x) => ExecuteActiontTree(x, args));
+                // 异步定位完成后在原追踪上下文中继续执行操作阶段
+                copyContext.RegistComplete((x) =>
+                {
+                    targetSpan?.End();
+                    using (McpTracer.Activate(traceContext))
+                    {
+                        ExecuteActiontTree(x, args);
+                    }
+                });
             }
         }
         /// <summary>
@@ -159,7 +207,11 @@ namespace UniMcp
             McpLogger.Log("[DualStateMethodBase] Phase 2: Action Execution");
             args.SetObjectReference("_resolved_targets", processedTarget);
 
-            var actionResult = _actionTree.Run(args);
+            object actionResult;
+            using (McpTracer.StartSpan("dual.action", "tool"))
+            {
+                actionResult = _actionTree.Run(args);
+            }
 
             // 检查执行操作阶段的错误
             if (actionResult == null && !string.IsNullOrEmpty(_actionTree.ErrorMessage))
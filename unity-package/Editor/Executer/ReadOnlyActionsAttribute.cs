@@ -0,0 +1,50 @@
+using System;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 标记工具中不会修改编辑器状态的只读操作，用于结果缓存（见 ToolResultCache）
+    /// 未指定操作列表时，表示该工具的所有调用均为只读
+    /// </summary>
+    [AttributeUsage(AttributeTargets.Class, AllowMultiple = true, Inherited = false)]
+    public class ReadOnlyActionsAttribute : Attribute
+    {
+        /// <summary>
+        /// 用于区分操作的参数名，如 "action"
+        /// </summary>
+        public string ActionKey { get; }
+
+        /// <summary>
+        /// 只读的操作值列表，为空表示全部只读
+        /// </summary>
+        public string[] Actions { get; }
+
+        /// <summary>
+        /// 结果的最大缓存时间（秒），小于等于0表示只在失效事件发生时过期
+        /// 适用于帧率、编辑器时间等随时间变化的数据
+        /// </summary>
+        public double MaxAgeSeconds { get; set; }
+
+        /// <summary>
+        /// 标记工具的所有调用为只读
+        /// </summary>
+        public ReadOnlyActionsAttribute()
+        {
+            Actions = new string[0];
+        }
+
+        /// <summary>
+        /// 标记指定操作为只读
+        /// </summary>
+        /// <param name="actionKey">用于区分操作的参数名</param>
+        /// <param name="actions">只读的操作值</param>
+        public ReadOnlyActionsAttribute(string actionKey, params string[] actions)
+        {
+            if (string.IsNullOrWhiteSpace(actionKey))
+                throw new ArgumentException("Action key cannot be null or empty", nameof(actionKey));
+
+            ActionKey = actionKey;
+            Actions = actions ?? new string[0];
+        }
+    }
+}
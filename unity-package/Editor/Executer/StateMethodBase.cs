@@ -28,11 +28,29 @@ namespace UniMcp
         /// </summary>
         private MethodKey[] _keys;
 
+        /// <summary>
+        /// 由 Keys 编译得到的参数绑定器，首次执行时创建
+        /// </summary>
+        private MethodKeyBinder _binder;
+
         /// <summary>
         /// 工具方法的描述，用于在状态树中引用
         /// </summary>
         public abstract string Description {get;}
 
+        /// <summary>
+        /// 本次调用是否会创建、删除、重命名或移动场景对象（按调用参数判断，只读和普通属性修改应返回 false）；
+        /// 为 true 时执行后调用 HierarchyIndex.Invalidate
+        /// </summary>
+        /// <param name="args">调用参数</param>
+        protected virtual bool ModifiesHierarchy(JsonClass args) => false;
+
+        /// <summary>
+        /// 是否严格校验参数：为 true 时类型、枚举或范围不合法的调用在进入处理函数前直接返回错误；
+        /// 默认宽松，无法转换的值交由处理函数按原始参数解析
+        /// </summary>
+        protected virtual bool StrictArguments => false;
+
         /// <summary>
         /// 当前方法支持的参数键列表，用于API文档生成和参数验证。
         /// 子类必须实现此属性，定义该方法接受的所有可能参数键。
@@ -84,7 +102,25 @@ namespace UniMcp
         {
             // 确保状态树已初始化
             _stateTree = _stateTree ?? CreateStateTree();
-            var result = _stateTree.Run(ctx);
+            _binder = _binder ?? MethodKeyBinder.Compile(Keys, StrictArguments, _stateTree);
+            // 参数一次性绑定并校验，非法调用在进入处理函数前直接返回
+            if (!_binder.TryBind(ctx, out string bindError))
+            {
+                ctx.Complete(Response.Error(bindError));
+                return;
+            }
+            // 处理函数可能改写参数，执行前判断
+            bool modifiesHierarchy = ModifiesHierarchy(ctx.JsonData);
+            object result;
+            try
+            {
+                result = _stateTree.Run(ctx);
+            }
+            finally
+            {
+                if (modifiesHierarchy)
+                    HierarchyIndex.Invalidate();
+            }
             // 如果结果为空且有错误信息，返回错误响应
             if (result == null && !string.IsNullOrEmpty(_stateTree.ErrorMessage))
             {
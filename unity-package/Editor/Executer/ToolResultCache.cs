@@ -0,0 +1,328 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Reflection;
+using System.Text;
+using UnityEditor;
+using UnityEngine;
+using UniMcp.Models;
+
+namespace UniMcp.Executer
+{
+    /// <summary>
+    /// 只读工具操作的结果缓存。
+    /// 标记了 ReadOnlyActionsAttribute 的操作按 (工具名, 规范化参数) 缓存结果，
+    /// 场景、资源、选择、Undo 或播放模式发生变化时整体失效；非只读调用执行前后同样会使缓存失效。
+    /// 播放模式下对象随时被脚本和物理修改且不产生上述事件，因此不缓存；增量请求（since_version）也不缓存。
+    /// 结果以序列化文本保存，每次命中都解析出新的 JsonNode，调用方之间互不影响。
+    /// 仅在主线程访问。
+    /// </summary>
+    [InitializeOnLoad]
+    public static class ToolResultCache
+    {
+        /// <summary>
+        /// 最大缓存条目数，超出时淘汰最早写入的条目
+        /// </summary>
+        public const int MaxEntries = 256;
+
+        private class Entry
+        {
+            public string Result;
+            public double StoredAt;
+            public double MaxAge;
+        }
+
+        /// <summary>
+        /// 一次工具调用的缓存凭据，由 BeginCall 创建，EndCall 消费
+        /// </summary>
+        public sealed class CallTicket
+        {
+            internal string ToolName;
+            internal string Key;
+            internal bool ReadOnly;
+            internal double MaxAge;
+            internal long Generation;
+
+            /// <summary>
+            /// 本次调用是否为可缓存的只读操作
+            /// </summary>
+            public bool IsReadOnly => ReadOnly;
+        }
+
+        private static readonly Dictionary<string, Entry> _entries = new Dictionary<string, Entry>();
+        private static readonly Dictionary<Type, ReadOnlyActionsAttribute[]> _policies = new Dictionary<Type, ReadOnlyActionsAttribute[]>();
+        private static long _generation;
+
+        /// <summary>
+        /// 是否启用缓存
+        /// </summary>
+        public static bool Enabled { get; set; } = true;
+
+        /// <summary>
+        /// 命中次数
+        /// </summary>
+        public static long Hits { get; private set; }
+
+        /// <summary>
+        /// 未命中次数（只读调用实际执行的次数）
+        /// </summary>
+        public static long Misses { get; private set; }
+
+        /// <summary>
+        /// 失效次数
+        /// </summary>
+        public static long Invalidations { get; private set; }
+
+        /// <summary>
+        /// 最近一次失效原因
+        /// </summary>
+        public static string LastInvalidationReason { get; private set; }
+
+        /// <summary>
+        /// 当前缓存条目数
+        /// </summary>
+        public static int Count => _entries.Count;
+
+        static ToolResultCache()
+        {
+            EditorApplication.hierarchyChanged += () => Invalidate("hierarchyChanged");
+            EditorApplication.projectChanged += () => Invalidate("projectChanged");
+            EditorApplication.playModeStateChanged += state => Invalidate("playModeStateChanged");
+            ObjectChangeEvents.changesPublished += OnChangesPublished;
+            Undo.postprocessModifications += OnPostprocessModifications;
+            Undo.undoRedoPerformed += () => Invalidate("undoRedoPerformed");
+            Selection.selectionChanged += () => Invalidate("selectionChanged");
+        }
+
+        private static void OnChangesPublished(ref ObjectChangeEventStream stream)
+        {
+            if (stream.length > 0)
+                Invalidate("objectChangeEvents");
+        }
+
+        private static UndoPropertyModification[] OnPostprocessModifications(UndoPropertyModification[] modifications)
+        {
+            if (modifications != null && modifications.Length > 0)
+                Invalidate("undoModifications");
+            return modifications;
+        }
+
+        /// <summary>
+        /// 清空全部缓存结果
+        /// </summary>
+        /// <param name="reason">失效原因，用于诊断</param>
+        public static void Invalidate(string reason)
+        {
+            _generation++;
+            LastInvalidationReason = reason;
+            if (_entries.Count == 0)
+                return;
+            _entries.Clear();
+            Invalidations++;
+        }
+
+        /// <summary>
+        /// 重置命中统计
+        /// </summary>
+        public static void ResetStatistics()
+        {
+            Hits = 0;
+            Misses = 0;
+            Invalidations = 0;
+        }
+
+        /// <summary>
+        /// 获取缓存统计信息
+        /// </summary>
+        public static JsonClass GetStatistics()
+        {
+            long total = Hits + Misses;
+            var stats = new JsonClass();
+            stats.Add("enabled", new JsonData(Enabled));
+            stats.Add("entries", new JsonData(_entries.Count));
+            stats.Add("hits", new JsonData(Hits));
+            stats.Add("misses", new JsonData(Misses));
+            stats.Add("hit_rate", new JsonData(total == 0 ? 0.0 : (double)Hits / total));
+            stats.Add("invalidations", new JsonData(Invalidations));
+            stats.Add("last_invalidation", new JsonData(LastInvalidationReason ?? ""));
+            return stats;
+        }
+
+        /// <summary>
+        /// 调用开始：判断是否只读并计算缓存键；非只读调用会立即使缓存失效
+        /// </summary>
+        public static CallTicket BeginCall(string toolName, IToolMethod method, JsonClass args)
+        {
+            var ticket = new CallTicket { ToolName = toolName, Generation = _generation };
+            if (method != null && TryGetReadOnlyRule(method.GetType(), args, out double maxAge))
+            {
+                ticket.ReadOnly = true;
+                ticket.MaxAge = maxAge;
+                ticket.Key = IsCacheable(args) ? BuildKey(toolName, args) : null;
+            }
+            else
+            {
+                Invalidate("call:" + toolName);
+                ticket.Generation = _generation;
+            }
+            return ticket;
+        }
+
+        /// <summary>
+        /// 查找只读调用的缓存结果
+        /// </summary>
+        public static bool TryGetCached(CallTicket ticket, out JsonNode result)
+        {
+            result = null;
+            if (!Enabled || ticket == null || !ticket.ReadOnly || ticket.Key == null)
+                return false;
+
+            if (_entries.TryGetValue(ticket.Key, out Entry entry))
+            {
+                if (entry.MaxAge <= 0 || EditorApplication.timeSinceStartup - entry.StoredAt <= entry.MaxAge)
+                {
+                    Hits++;
+                    result = Json.Parse(entry.Result);
+                    return true;
+                }
+                _entries.Remove(ticket.Key);
+            }
+            Misses++;
+            return false;
+        }
+
+        /// <summary>
+        /// 调用结束：缓存成功的只读结果；非只读调用再次使缓存失效（覆盖异步修改）
+        /// 执行期间若发生失效事件，则丢弃本次结果
+        /// </summary>
+        public static void EndCall(CallTicket ticket, JsonNode result)
+        {
+            if (ticket == null)
+                return;
+
+            if (!ticket.ReadOnly)
+            {
+                Invalidate("call:" + ticket.ToolName);
+                return;
+            }
+
+            if (!Enabled || ticket.Key == null || result == null || ticket.Generation != _generation || !IsSuccess(result))
+                return;
+
+            if (_entries.Count >= MaxEntries && !_entries.ContainsKey(ticket.Key))
+            {
+                string oldest = _entries.OrderBy(kvp => kvp.Value.StoredAt).First().Key;
+                _entries.Remove(oldest);
+            }
+
+            _entries[ticket.Key] = new Entry
+            {
+                Result = result.ToString(),
+                StoredAt = EditorApplication.timeSinceStartup,
+                MaxAge = ticket.MaxAge
+            };
+        }
+
+        /// <summary>
+        /// 只读但不缓存的调用：播放模式下的任何调用、流式调用（结果通过进度通知输出，汇总结果无法重放）
+        /// 和基于版本号的增量请求（结果取决于调用方已持有的版本）
+        /// </summary>
+        private static bool IsCacheable(JsonClass args)
+        {
+            if (EditorApplication.isPlaying)
+                return false;
+            if (args == null)
+                return true;
+            return !args["stream"].AsBoolDefault(false) && args["since_version"].IsNull();
+        }
+
+        private static bool IsSuccess(JsonNode result)
+        {
+            if (result is JsonClass obj)
+            {
+                var success = obj["success"];
+                return success == null || success.Value != "false";
+            }
+            return true;
+        }
+
+        private static bool TryGetReadOnlyRule(Type methodType, JsonClass args, out double maxAge)
+        {
+            maxAge = 0;
+            if (!_policies.TryGetValue(methodType, out var rules))
+            {
+                rules = methodType.GetCustomAttributes<ReadOnlyActionsAttribute>(false).ToArray();
+                _policies[methodType] = rules;
+            }
+
+            foreach (var rule in rules)
+            {
+                if (string.IsNullOrEmpty(rule.ActionKey))
+                {
+                    maxAge = rule.MaxAgeSeconds;
+                    return true;
+                }
+
+                string action = args?[rule.ActionKey]?.Value;
+                if (!string.IsNullOrEmpty(action) && Array.IndexOf(rule.Actions, action) >= 0)
+                {
+                    maxAge = rule.MaxAgeSeconds;
+                    return true;
+                }
+            }
+            return false;
+        }
+
+        /// <summary>
+        /// 生成缓存键：工具名 + 按键名排序后的参数
+        /// </summary>
+        private static string BuildKey(string toolName, JsonClass args)
+        {
+            var sb = new StringBuilder(toolName).Append('|');
+            AppendNormalized(sb, args);
+            return sb.ToString();
+        }
+
+        private static void AppendNormalized(StringBuilder sb, JsonNode node)
+        {
+            if (node is JsonClass obj)
+            {
+                sb.Append('{');
+                bool first = true;
+                foreach (var key in obj.GetKeys().OrderBy(k => k, StringComparer.Ordinal))
+                {
+                    if (!first) sb.Append(',');
+                    first = false;
+                    sb.Append(key).Append(':');
+                    AppendNormalized(sb, obj[key]);
+                }
+                sb.Append('}');
+            }
+            else if (node is JsonArray arr)
+            {
+                sb.Append('[');
+                for (int i = 0; i < arr.Count; i++)
+                {
+                    if (i > 0) sb.Append(',');
+                    AppendNormalized(sb, arr[i]);
+                }
+                sb.Append(']');
+            }
+            else if (node != null)
+            {
+                sb.Append('"').Append(node.Value?.Replace("\\", "\\\\").Replace("\"", "\\\"")).Append('"');
+            }
+        }
+    }
+
+    /// <summary>
+    /// 资源导入、删除、移动后使工具结果缓存失效
+    /// </summary>
+    internal class ToolResultCachePostprocessor : AssetPostprocessor
+    {
+        private static void OnPostprocessAllAssets(string[] importedAssets, string[] deletedAssets, string[] movedAssets, string[] movedFromAssetPaths)
+        {
+            ToolResultCache.Invalidate("assetPostprocess");
+        }
+    }
+}
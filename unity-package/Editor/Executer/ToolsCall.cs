@@ -98,9 +98,22 @@ namespace UniMcp.Executer
                     return;
                 }
 
-                var state = new StateTreeContext(args ?? new JsonClass(), new Dictionary<string, object>());
+                args = args ?? new JsonClass();
+                var ticket = ToolResultCache.BeginCall(methodName, method, args);
+                if (ToolResultCache.TryGetCached(ticket, out JsonNode cached))
+                {
+                    McpLogger.Log($"[ToolsCall] Cache hit: {methodName}");
+                    callback(cached);
+                    return;
+                }
+
+                var state = new StateTreeContext(args, new Dictionary<string, object>());
                 method.ExecuteMethod(state);
-                state.RegistComplete(callback);
+                state.RegistComplete(result =>
+                {
+                    ToolResultCache.EndCall(ticket, result);
+                    callback(result);
+                });
             }
             catch (Exception e)
             {
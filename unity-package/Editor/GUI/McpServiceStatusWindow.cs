@@ -1,6 +1,7 @@
 using System;
 using System.Collections.Generic;
 using System.Collections;
+using System.Linq;
 using System.Net;
 using System.Net.NetworkInformation;
 using System.Threading.Tasks;
@@ -483,9 +484,10 @@ namespace UniMcp.Gui
             EditorGUILayout.Space(8);
             EditorGUILayout.EndVertical();
 
-            // 客户端连接状态部分
+            // 工具指标与客户端连接状态部分
             if (isServiceRunning)
             {
+                DrawToolMetrics();
                 DrawClientConnectionStatus();
             }
 
@@ -576,6 +578,82 @@ namespace UniMcp.Gui
         // HTTP请求记录列表的滚动位置
         private Vector2 httpRequestRecordsScrollPosition;
 
+        // 工具指标面板
+        private static bool toolMetricsFoldout = false;
+        private Vector2 toolMetricsScrollPosition;
+
+        /// <summary>
+        /// 绘制工具调用指标（按总耗时 p95 降序）
+        /// </summary>
+        private void DrawToolMetrics()
+        {
+            EditorGUILayout.Space(10);
+            EditorGUILayout.BeginVertical(EditorStyles.helpBox);
+
+            EditorGUILayout.BeginHorizontal();
+            toolMetricsFoldout = EditorGUILayout.Foldout(toolMetricsFoldout, L.T("Tool Metrics", "工具指标"), true);
+            var cache = ToolResultCache.GetStatistics();
+            EditorGUILayout.LabelField(
+                $"{L.T("Cache", "缓存")}: {cache["hits"].Value}/{cache["hits"].AsInt + cache["misses"].AsInt} ({cache["entries"].Value})",
+                EditorStyles.miniLabel, GUILayout.Width(160));
+            if (GUILayout.Button(L.T("Reset", "重置"), EditorStyles.miniButton, GUILayout.Width(50)))
+            {
+                McpMetrics.Reset();
+                ToolResultCache.ResetStatistics();
+            }
+            EditorGUILayout.EndHorizontal();
+
+            if (toolMetricsFoldout)
+            {
+                var series = McpMetrics.GetSeries()
+                    .OrderByDescending(s => s.GetStage(McpStage.Total).ValueAtPercentile(95))
+                    .ToList();
+
+                if (series.Count == 0)
+                {
+                    EditorGUILayout.LabelField(L.T("No requests yet", "暂无请求"), EditorStyles.centeredGreyMiniLabel);
+                }
+                else
+                {
+                    EditorGUILayout.BeginHorizontal();
+                    EditorGUILayout.LabelField(L.T("Tool / Action", "工具 / 操作"), EditorStyles.miniBoldLabel, GUILayout.MinWidth(120));
+                    EditorGUILayout.LabelField(L.T("Calls", "次数"), EditorStyles.miniBoldLabel, GUILayout.Width(45));
+                    EditorGUILayout.LabelField(L.T("Errors", "错误"), EditorStyles.miniBoldLabel, GUILayout.Width(45));
+                    EditorGUILayout.LabelField("p50", EditorStyles.miniBoldLabel, GUILayout.Width(55));
+                    EditorGUILayout.LabelField("p95", EditorStyles.miniBoldLabel, GUILayout.Width(55));
+                    EditorGUILayout.LabelField("p99", EditorStyles.miniBoldLabel, GUILayout.Width(55));
+                    EditorGUILayout.LabelField(L.T("Exec p95", "执行 p95"), EditorStyles.miniBoldLabel, GUILayout.Width(60));
+                    EditorGUILayout.EndHorizontal();
+
+                    toolMetricsScrollPosition = EditorGUILayout.BeginScrollView(toolMetricsScrollPosition, GUILayout.MaxHeight(160));
+                    foreach (var s in series)
+                    {
+                        var total = s.GetStage(McpStage.Total);
+                        string name = string.IsNullOrEmpty(s.Tool) ? s.Method : (string.IsNullOrEmpty(s.Action) ? s.Tool : $"{s.Tool}.{s.Action}");
+                        EditorGUILayout.BeginHorizontal();
+                        EditorGUILayout.LabelField(name, EditorStyles.miniLabel, GUILayout.MinWidth(120));
+                        EditorGUILayout.LabelField(s.Calls.ToString(), EditorStyles.miniLabel, GUILayout.Width(45));
+                        EditorGUILayout.LabelField(s.Errors.ToString(), EditorStyles.miniLabel, GUILayout.Width(45));
+                        EditorGUILayout.LabelField(FormatMicros(total.ValueAtPercentile(50)), EditorStyles.miniLabel, GUILayout.Width(55));
+                        EditorGUILayout.LabelField(FormatMicros(total.ValueAtPercentile(95)), EditorStyles.miniLabel, GUILayout.Width(55));
+                        EditorGUILayout.LabelField(FormatMicros(total.ValueAtPercentile(99)), EditorStyles.miniLabel, GUILayout.Width(55));
+                        EditorGUILayout.LabelField(FormatMicros(s.GetStage(McpStage.Execute).ValueAtPercentile(95)), EditorStyles.miniLabel, GUILayout.Width(60));
+                        EditorGUILayout.EndHorizontal();
+                    }
+                    EditorGUILayout.EndScrollView();
+                }
+
+                EditorGUILayout.LabelField($"GET http://localhost:{mcpPort}/metrics", EditorStyles.miniLabel);
+            }
+
+            EditorGUILayout.EndVertical();
+        }
+
+        private static string FormatMicros(long micros)
+        {
+            return micros >= 1000 ? $"{micros / 1000.0:0.#}ms" : $"{micros}µs";
+        }
+
         /// <summary>
         /// 绘制客户端请求记录
         /// </summary>
@@ -49,6 +49,9 @@ namespace UniMcp
         [SerializeField]
         private bool _enableDescriptions = true;
 
+        [SerializeField]
+        private bool _indexScriptSymbols = true;
+
         /// <summary>
         /// MCP服务器端口
         /// </summary>
@@ -149,6 +152,23 @@ namespace UniMcp
             }
         }
 
+        /// <summary>
+        /// 资源搜索索引是否收录脚本中的类型名（class/struct/interface/enum），修改后重建索引
+        /// </summary>
+        public bool IndexScriptSymbols
+        {
+            get => _indexScriptSymbols;
+            set
+            {
+                if (_indexScriptSymbols != value)
+                {
+                    _indexScriptSymbols = value;
+                    SaveSettings();
+                    AssetSearchIndex.Rebuild();
+                }
+            }
+        }
+
         /// <summary>
         /// 获取MCP本地设置实例
         /// </summary>
@@ -319,12 +319,14 @@ namespace UniMcp
     {
         public Dictionary<string, string> Properties { get; set; }
         public Dictionary<string, string> ArrayItemTypes { get; set; }
+        public Dictionary<string, string[]> MultiTypes { get; set; }
 
         public MethodObj(string key, string desc, bool optional = true)
             : base(key, desc, optional, "object")
         {
             Properties = new Dictionary<string, string>();
             ArrayItemTypes = new Dictionary<string, string>();
+            MultiTypes = new Dictionary<string, string[]>();
         }
 
         /// <summary>
@@ -365,6 +367,20 @@ namespace UniMcp
             return this;
         }
 
+        /// <summary>
+        /// Add property accepting several types (e.g. number or array)
+        /// </summary>
+        public MethodObj AddMultiTypeProperty(string propName, string[] propTypes, string itemType = "string")
+        {
+            foreach (string propType in propTypes)
+                ValidateType(propType);
+            Properties[propName] = propTypes[0];
+            MultiTypes[propName] = propTypes;
+            if (propTypes.Contains("array"))
+                ArrayItemTypes[propName] = ValidateType(itemType);
+            return this;
+        }
+
         /// <summary>
         /// Add boolean type property
         /// </summary>
@@ -0,0 +1,549 @@
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using UnityEngine;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 参数绑定器：由工具的 MethodKey[] 一次性编译而成。
+    /// 每次调用只遍历一遍参数，完成类型转换、默认值、枚举/范围校验和向量解析，
+    /// 结果以 BoundArguments 的形式挂到 StateTreeContext 上，处理函数无需再反复解析字符串。
+    /// 默认为宽松模式：无法转换的值不绑定，处理函数回退到原始参数自行解析，与未使用绑定器时的行为一致；
+    /// 严格模式（工具通过 StrictArguments 开启）在进入处理函数前拒绝类型错误、枚举和范围不合法的参数。
+    /// </summary>
+    public sealed class MethodKeyBinder
+    {
+        private enum SlotKind
+        {
+            String,
+            Integer,
+            Number,
+            Boolean,
+            Vector,
+            Color,
+            Array,
+            Object
+        }
+
+        private sealed class Slot
+        {
+            public string Key;
+            public SlotKind Kind;
+            public HashSet<string> EnumValues;
+            public double? Minimum;
+            public double? Maximum;
+            public object DefaultValue;
+        }
+
+        private readonly Dictionary<string, Slot> _slots;
+        private readonly Dictionary<string, object> _defaults;
+        private readonly bool _strict;
+
+        private MethodKeyBinder(Dictionary<string, Slot> slots, Dictionary<string, object> defaults, bool strict)
+        {
+            _slots = slots;
+            _defaults = defaults;
+            _strict = strict;
+        }
+
+        /// <summary>
+        /// 已编译的参数数量
+        /// </summary>
+        public int Count => _slots.Count;
+
+        /// <summary>
+        /// 编译参数绑定器。
+        /// 状态树用于路由的键（如 action）不做枚举校验，由状态树自身给出带可选值的错误信息。
+        /// </summary>
+        /// <param name="keys">工具声明的参数键</param>
+        /// <param name="strict">是否拒绝无法转换或不合法的参数</param>
+        /// <param name="trees">工具的状态树，用于收集路由键</param>
+        public static MethodKeyBinder Compile(MethodKey[] keys, bool strict, params StateTree[] trees)
+        {
+            var routingKeys = new HashSet<string>();
+            if (trees != null)
+            {
+                foreach (var tree in trees)
+                {
+                    tree?.CollectRoutingKeys(routingKeys);
+                }
+            }
+
+            var slots = new Dictionary<string, Slot>();
+            var defaults = new Dictionary<string, object>();
+            if (keys == null)
+                return new MethodKeyBinder(slots, defaults, strict);
+
+            foreach (var key in keys)
+            {
+                if (key == null || string.IsNullOrEmpty(key.Key))
+                    continue;
+
+                var slot = new Slot
+                {
+                    Key = key.Key,
+                    Kind = GetSlotKind(key)
+                };
+
+                // 枚举和范围只在严格模式下校验，宽松模式保持原有的容错行为
+                if (strict)
+                {
+                    slot.Minimum = ToNullableDouble(key.Minimum);
+                    slot.Maximum = ToNullableDouble(key.Maximum);
+                    if (key.EnumValues != null && key.EnumValues.Count > 0 && !routingKeys.Contains(key.Key))
+                        slot.EnumValues = new HashSet<string>(key.EnumValues, StringComparer.OrdinalIgnoreCase);
+                }
+
+                if (key.DefaultValue != null)
+                {
+                    slot.DefaultValue = ConvertDefault(slot, key.DefaultValue);
+                    if (slot.DefaultValue != null)
+                        defaults[key.Key] = slot.DefaultValue;
+                }
+
+                slots[key.Key] = slot;
+            }
+
+            return new MethodKeyBinder(slots, defaults, strict);
+        }
+
+        /// <summary>
+        /// 绑定上下文中的参数，成功时设置 ctx.Arguments。
+        /// </summary>
+        /// <param name="ctx">状态树上下文</param>
+        /// <param name="error">失败时的错误信息</param>
+        /// <returns>是否绑定成功</returns>
+        public bool TryBind(StateTreeContext ctx, out string error)
+        {
+            var bound = Bind(ctx?.JsonData, out error);
+            if (bound == null)
+                return false;
+
+            ctx.Arguments = bound;
+            return true;
+        }
+
+        /// <summary>
+        /// 单次遍历参数并生成类型化结果。
+        /// 未声明的键以及宽松模式下无法转换的值保持原样，由处理函数自行读取。
+        /// </summary>
+        /// <param name="args">原始参数</param>
+        /// <param name="error">失败时的错误信息</param>
+        /// <returns>绑定结果，失败返回 null</returns>
+        public BoundArguments Bind(JsonClass args, out string error)
+        {
+            error = null;
+            var values = new Dictionary<string, object>(_slots.Count);
+
+            if (args != null)
+            {
+                foreach (var kvp in args.AsEnumerable())
+                {
+                    if (!_slots.TryGetValue(kvp.Key, out Slot slot))
+                        continue;
+
+                    var node = kvp.Value;
+                    if (node == null || node.IsNull())
+                        continue;
+
+                    if (!TryConvert(slot, node, out object value, out error))
+                    {
+                        if (_strict)
+                            return null;
+                        error = null;
+                        continue;
+                    }
+
+                    values[slot.Key] = value;
+                }
+            }
+
+            return new BoundArguments(values, _defaults);
+        }
+
+        private static SlotKind GetSlotKind(MethodKey key)
+        {
+            if (key is MethodVector)
+                return SlotKind.Vector;
+            if (key is MethodColor)
+                return SlotKind.Color;
+
+            switch (key.Type)
+            {
+                case "integer": return SlotKind.Integer;
+                case "number": return SlotKind.Number;
+                case "boolean": return SlotKind.Boolean;
+                case "array": return SlotKind.Array;
+                case "object": return SlotKind.Object;
+                default: return SlotKind.String;
+            }
+        }
+
+        private static bool TryConvert(Slot slot, JsonNode node, out object value, out string error)
+        {
+            value = null;
+            error = null;
+
+            switch (slot.Kind)
+            {
+                case SlotKind.Integer:
+                    {
+                        if (!TryParseLong(node.Value, out long l))
+                        {
+                            error = $"Parameter '{slot.Key}' expects an integer but got '{node.Value}'";
+                            return false;
+                        }
+                        if (!CheckRange(slot, l, out error))
+                            return false;
+                        value = l;
+                        return true;
+                    }
+                case SlotKind.Number:
+                    {
+                        if (!TryParseDouble(node.Value, out double d))
+                        {
+                            error = $"Parameter '{slot.Key}' expects a number but got '{node.Value}'";
+                            return false;
+                        }
+                        if (!CheckRange(slot, d, out error))
+                            return false;
+                        value = d;
+                        return true;
+                    }
+                case SlotKind.Boolean:
+                    {
+                        if (!TryParseBool(node.Value, out bool b))
+                        {
+                            error = $"Parameter '{slot.Key}' expects a boolean but got '{node.Value}'";
+                            return false;
+                        }
+                        value = b;
+                        return true;
+                    }
+                case SlotKind.Vector:
+                    {
+                        if (!TryParseFloats(node, out float[] components) || components.Length < 2)
+                        {
+                            error = $"Parameter '{slot.Key}' expects a numeric array like [x, y, z] but got '{node}'";
+                            return false;
+                        }
+                        value = components;
+                        return true;
+                    }
+                case SlotKind.Color:
+                    {
+                        if (TryParseColor(node, out Color color))
+                            value = color;
+                        else
+                            value = node.Value; // 颜色名等由处理函数自行解析
+                        return true;
+                    }
+                case SlotKind.Array:
+                case SlotKind.Object:
+                    value = node;
+                    return true;
+                default:
+                    {
+                        string s = node.Value;
+                        if (slot.EnumValues != null && !slot.EnumValues.Contains(s))
+                        {
+                            error = $"Invalid value '{s}' for parameter '{slot.Key}'. Supported values: [{string.Join(", ", slot.EnumValues)}]";
+                            return false;
+                        }
+                        value = s;
+                        return true;
+                    }
+            }
+        }
+
+        private static bool CheckRange(Slot slot, double v, out string error)
+        {
+            error = null;
+            if ((slot.Minimum.HasValue && v < slot.Minimum.Value) || (slot.Maximum.HasValue && v > slot.Maximum.Value))
+            {
+                error = $"Parameter '{slot.Key}' value {v.ToString(CultureInfo.InvariantCulture)} is out of range [{slot.Minimum}, {slot.Maximum}]";
+                return false;
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// 声明的默认值按传入值相同的规则转换，转换失败时视为没有默认值
+        /// </summary>
+        private static object ConvertDefault(Slot slot, object defaultValue)
+        {
+            JsonNode node = ToNode(defaultValue);
+            return node != null && TryConvert(slot, node, out object value, out _) ? value : null;
+        }
+
+        private static JsonNode ToNode(object value)
+        {
+            switch (value)
+            {
+                case JsonNode node:
+                    return node;
+                case bool b:
+                    return new JsonData(b);
+                case string s:
+                    return s.StartsWith("[") || s.StartsWith("{") ? Json.Parse(s) : new JsonData(s);
+                case float[] floats:
+                    {
+                        var array = new JsonArray();
+                        foreach (float f in floats)
+                            array.Add(new JsonData(f));
+                        return array;
+                    }
+                case IConvertible convertible:
+                    return new JsonData(convertible.ToString(CultureInfo.InvariantCulture));
+                default:
+                    return null;
+            }
+        }
+
+        private static double? ToNullableDouble(object v)
+        {
+            if (v == null)
+                return null;
+            try
+            {
+                return Convert.ToDouble(v, CultureInfo.InvariantCulture);
+            }
+            catch (Exception)
+            {
+                return null;
+            }
+        }
+
+        internal static bool TryParseLong(string s, out long value)
+        {
+            if (long.TryParse(s, NumberStyles.Integer, CultureInfo.InvariantCulture, out value))
+                return true;
+
+            // 允许 5.0 这类整数值的浮点写法
+            if (double.TryParse(s, NumberStyles.Float, CultureInfo.InvariantCulture, out double d)
+                && Math.Abs(d % 1) < double.Epsilon && d >= long.MinValue && d <= long.MaxValue)
+            {
+                value = (long)d;
+                return true;
+            }
+            return false;
+        }
+
+        internal static bool TryParseDouble(string s, out double value)
+        {
+            return double.TryParse(s, NumberStyles.Float, CultureInfo.InvariantCulture, out value);
+        }
+
+        internal static bool TryParseBool(string s, out bool value)
+        {
+            if (bool.TryParse(s, out value))
+                return true;
+            if (s == "1") { value = true; return true; }
+            if (s == "0") { value = false; return true; }
+            return false;
+        }
+
+        private static bool TryParseFloats(JsonNode node, out float[] components)
+        {
+            components = null;
+            if (node is JsonArray array)
+            {
+                components = new float[array.Count];
+                for (int i = 0; i < array.Count; i++)
+                {
+                    if (!TryParseDouble(array[i].Value, out double d))
+                        return false;
+                    components[i] = (float)d;
+                }
+                return true;
+            }
+
+            if (node is JsonClass obj && obj.ContainsKey("x") && obj.ContainsKey("y"))
+            {
+                var list = new List<float>(4);
+                foreach (var axis in new[] { "x", "y", "z", "w" })
+                {
+                    if (!obj.ContainsKey(axis))
+                        break;
+                    if (!TryParseDouble(obj[axis].Value, out double d))
+                        return false;
+                    list.Add((float)d);
+                }
+                components = list.ToArray();
+                return true;
+            }
+
+            // 字符串形式: "[1, 2, 3]"、"(1, 2, 3)"、"1, 2, 3"
+            if (node is JsonData)
+            {
+                var parts = node.Value.Trim().Trim('[', ']', '(', ')').Split(',');
+                components = new float[parts.Length];
+                for (int i = 0; i < parts.Length; i++)
+                {
+                    if (!TryParseDouble(parts[i].Trim().Trim('"'), out double d))
+                        return false;
+                    components[i] = (float)d;
+                }
+                return true;
+            }
+
+            return false;
+        }
+
+        private static bool TryParseColor(JsonNode node, out Color color)
+        {
+            color = default;
+            if (node is JsonClass obj && obj.ContainsKey("r"))
+            {
+                if (!TryParseDouble(obj["r"].Value, out double r) ||
+                    !TryParseDouble(obj["g"].Value, out double g) ||
+                    !TryParseDouble(obj["b"].Value, out double b))
+                    return false;
+                double a = 1.0;
+                if (obj.ContainsKey("a") && !TryParseDouble(obj["a"].Value, out a))
+                    return false;
+                color = new Color((float)r, (float)g, (float)b, (float)a);
+                return true;
+            }
+
+            if (node is JsonArray)
+            {
+                if (!TryParseFloats(node, out float[] c) || c.Length < 3)
+                    return false;
+                color = new Color(c[0], c[1], c[2], c.Length > 3 ? c[3] : 1f);
+                return true;
+            }
+
+            return node is JsonData && ColorUtility.TryParseHtmlString(node.Value, out color);
+        }
+    }
+
+    /// <summary>
+    /// 绑定后的类型化参数。显式传入的值优先，其次为 MethodKey 声明的默认值。
+    /// </summary>
+    public sealed class BoundArguments
+    {
+        private readonly Dictionary<string, object> _values;
+        private readonly Dictionary<string, object> _defaults;
+
+        internal BoundArguments(Dictionary<string, object> values, Dictionary<string, object> defaults)
+        {
+            _values = values;
+            _defaults = defaults;
+        }
+
+        /// <summary>
+        /// 显式传入且非空的参数数量
+        /// </summary>
+        public int Count => _values.Count;
+
+        /// <summary>
+        /// 参数是否由调用方显式传入
+        /// </summary>
+        public bool IsProvided(string key)
+        {
+            return _values.ContainsKey(key);
+        }
+
+        /// <summary>
+        /// 获取显式传入的参数值
+        /// </summary>
+        public bool TryGetProvided<T>(string key, out T value)
+        {
+            if (_values.TryGetValue(key, out object raw) && TryCast(raw, out value))
+                return true;
+            value = default;
+            return false;
+        }
+
+        /// <summary>
+        /// 获取参数值，未传入时回退到 MethodKey 的默认值
+        /// </summary>
+        public bool TryGet<T>(string key, out T value)
+        {
+            if (TryGetProvided(key, out value))
+                return true;
+            if (_defaults.TryGetValue(key, out object raw) && TryCast(raw, out value))
+                return true;
+            value = default;
+            return false;
+        }
+
+        /// <summary>
+        /// 获取参数值，均不存在时返回 fallback
+        /// </summary>
+        public T Get<T>(string key, T fallback = default)
+        {
+            return TryGet(key, out T value) ? value : fallback;
+        }
+
+        /// <summary>
+        /// 参数被改写后移除已绑定的值，避免读到旧值
+        /// </summary>
+        internal void Invalidate(string key)
+        {
+            _values.Remove(key);
+        }
+
+        private static bool TryCast<T>(object raw, out T value)
+        {
+            if (raw is T typed)
+            {
+                value = typed;
+                return true;
+            }
+
+            object converted = null;
+            var target = typeof(T);
+            var underlying = Nullable.GetUnderlyingType(target) ?? target;
+
+            if (raw is float[] v)
+            {
+                if (underlying == typeof(Vector2) && v.Length >= 2)
+                    converted = new Vector2(v[0], v[1]);
+                else if (underlying == typeof(Vector3) && v.Length >= 3)
+                    converted = new Vector3(v[0], v[1], v[2]);
+                else if (underlying == typeof(Vector4) && v.Length >= 4)
+                    converted = new Vector4(v[0], v[1], v[2], v[3]);
+                else if (underlying == typeof(Color) && v.Length >= 3)
+                    converted = new Color(v[0], v[1], v[2], v.Length > 3 ? v[3] : 1f);
+            }
+            else if (raw is IConvertible && underlying != typeof(string) && (underlying.IsPrimitive || underlying == typeof(decimal)))
+            {
+                try
+                {
+                    converted = Convert.ChangeType(raw, underlying, CultureInfo.InvariantCulture);
+                }
+                catch (Exception)
+                {
+                    converted = null;
+                }
+            }
+            else if (underlying == typeof(string))
+            {
+                converted = raw is JsonNode node ? node.Value : Convert.ToString(raw, CultureInfo.InvariantCulture);
+            }
+            else if (underlying.IsEnum && raw is string s)
+            {
+                try
+                {
+                    converted = Enum.Parse(underlying, s, true);
+                }
+                catch (Exception)
+                {
+                    converted = null;
+                }
+            }
+
+            if (converted != null)
+            {
+                value = (T)converted;
+                return true;
+            }
+
+            value = default;
+            return false;
+        }
+    }
+}
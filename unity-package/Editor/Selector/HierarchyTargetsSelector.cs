@@ -0,0 +1,173 @@
+using System;
+using System.Collections.Generic;
+using System.Text.RegularExpressions;
+using UnityEngine;
+using UnityEngine.SceneManagement;
+using UniMcp.Models;
+
+namespace UniMcp.Tools
+{
+    /// <summary>
+    /// 多目标场景对象选择器
+    /// 提供 targets 参数时返回全部匹配的 GameObject（GameObject[]，按层级顺序去重），否则交给内部的单目标选择器。
+    /// targets 数组的元素可以是：实例ID；层级路径（可含 * 和 ? 通配符，匹配完整路径）；
+    /// hierarchy_search 查询对象 {"query": "...", "include_inactive": false, "use_regex": false}，query 语法与 by_query 相同（含 t:Type）。
+    /// 没有匹配到任何对象的元素以 List&lt;string&gt; 放入对象引用 UnmatchedTargetsKey，供操作阶段报告。
+    /// </summary>
+    public class HierarchyTargetsSelector : IObjectSelector
+    {
+        /// <summary>
+        /// 未匹配元素列表在对象引用中的键
+        /// </summary>
+        public const string UnmatchedTargetsKey = "_unmatched_targets";
+
+        private readonly IObjectSelector fallbackSelector;
+
+        public HierarchyTargetsSelector(IObjectSelector fallbackSelector)
+        {
+            this.fallbackSelector = fallbackSelector;
+        }
+
+        public MethodKey[] CreateKeys()
+        {
+            var keys = new List<MethodKey>(fallbackSelector.CreateKeys())
+            {
+                new MethodArr("targets", "多个目标：实例ID、层级路径（支持*和?通配符）或 hierarchy_search 查询对象", true)
+                    .AddExample("12345", "\"Enemies/*\"", "{\"query\": \"t:Light\"}")
+            };
+            return keys.ToArray();
+        }
+
+        public StateTree BuildStateTree()
+        {
+            StateTree fallbackTree = fallbackSelector.BuildStateTree();
+            return StateTreeBuilder.Create()
+                .DefaultLeaf((Func<StateTreeContext, object>)(context =>
+                {
+                    if (context.TryGetJsonValue("targets", out JsonNode targets) && targets != null && !targets.IsNull())
+                    {
+                        return HandleTargetsSearch(context, targets);
+                    }
+
+                    object result = fallbackTree.Run(context);
+                    if (result == null && !string.IsNullOrEmpty(fallbackTree.ErrorMessage))
+                    {
+                        return Response.Error(fallbackTree.ErrorMessage);
+                    }
+                    return result;
+                }))
+                .Build();
+        }
+
+        private object HandleTargetsSearch(StateTreeContext context, JsonNode targets)
+        {
+            if (!TryResolve(targets, out GameObject[] gameObjects, out List<string> unmatched, out string error))
+            {
+                return Response.Error(error);
+            }
+
+            if (gameObjects.Length == 0)
+            {
+                return Response.Error($"No GameObjects matched 'targets': {string.Join(", ", unmatched)}");
+            }
+
+            context.SetObjectReference(UnmatchedTargetsKey, unmatched);
+            return gameObjects;
+        }
+
+        /// <summary>
+        /// 解析 targets 参数（数组，或单个查询对象），结果按层级顺序去重
+        /// </summary>
+        /// <param name="targets">targets 参数</param>
+        /// <param name="gameObjects">匹配的对象</param>
+        /// <param name="unmatched">没有匹配到任何对象的元素</param>
+        /// <param name="error">参数格式无效时的错误信息</param>
+        public static bool TryResolve(JsonNode targets, out GameObject[] gameObjects, out List<string> unmatched, out string error)
+        {
+            gameObjects = null;
+            unmatched = new List<string>();
+            error = null;
+
+            var items = new List<JsonNode>();
+            if (targets is JsonArray array)
+            {
+                foreach (JsonNode item in array.Childs)
+                    items.Add(item);
+            }
+            else
+            {
+                items.Add(targets);
+            }
+
+            var found = new List<GameObject>();
+            var seen = new HashSet<GameObject>();
+            foreach (JsonNode item in items)
+            {
+                if (!TryResolveItem(item, out List<GameObject> matches, out error))
+                    return false;
+
+                if (matches.Count == 0)
+                {
+                    unmatched.Add(item.ToString());
+                    continue;
+                }
+                foreach (GameObject go in matches)
+                {
+                    if (seen.Add(go))
+                        found.Add(go);
+                }
+            }
+
+            if (items.Count > 1)
+                HierarchyIndex.SortByHierarchyOrder(found);
+            gameObjects = found.ToArray();
+            return true;
+        }
+
+        private static bool TryResolveItem(JsonNode item, out List<GameObject> matches, out string error)
+        {
+            matches = new List<GameObject>();
+            error = null;
+
+            if (item is JsonClass query)
+            {
+                string searchTerm = query["query"]?.Value;
+                if (string.IsNullOrEmpty(searchTerm))
+                {
+                    error = "Query objects in 'targets' require a non-empty 'query'.";
+                    return false;
+                }
+                return HierarchySearch.TryFindByQuery(searchTerm, query["include_inactive"].AsBoolDefault(false),
+                    query["use_regex"].AsBoolDefault(false), out matches, out error);
+            }
+
+            string text = item?.Value;
+            if (string.IsNullOrEmpty(text))
+            {
+                error = "'targets' entries must be instance IDs, hierarchy paths or query objects.";
+                return false;
+            }
+
+            if (int.TryParse(text, out int instanceId))
+            {
+                var found = UnityEditor.EditorUtility.InstanceIDToObject(instanceId);
+                GameObject go = found is Component component ? component.gameObject : found as GameObject;
+                if (go != null && go.scene.IsValid() && go.scene == SceneManager.GetActiveScene())
+                    matches.Add(go);
+                return true;
+            }
+
+            if (text.IndexOf('*') >= 0 || text.IndexOf('?') >= 0)
+            {
+                // 通配符匹配完整层级路径：* 匹配任意字符（含 /），? 匹配单个字符
+                string pattern = "^" + Regex.Escape(text.Trim('/')).Replace("\\*", ".*").Replace("\\?", ".") + "$";
+                var regex = new Regex(pattern, RegexOptions.CultureInvariant);
+                matches = HierarchyIndex.FindByPathMatch(regex.IsMatch, true);
+                return true;
+            }
+
+            matches = HierarchyIndex.FindByPath(text, true);
+            return true;
+        }
+    }
+}
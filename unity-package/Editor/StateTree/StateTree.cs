@@ -152,6 +152,20 @@ namespace UniMcp
             return token.Value;
         }
 
+        /// <summary>
+        /// 收集状态树中用于路由的参数键（节点 key 与可选参数名）
+        /// </summary>
+        /// <param name="keys">输出集合</param>
+        public void CollectRoutingKeys(HashSet<string> keys)
+        {
+            if (!string.IsNullOrEmpty(key))
+                keys.Add(key);
+            foreach (var param in optionalParams)
+                keys.Add(param);
+            foreach (var child in select.Values)
+                child?.CollectRoutingKeys(keys);
+        }
+
         /* 美化打印（Unicode 框线） */
         public void Print(StringBuilder sb, string indent = "", bool last = true, string parentEdgeLabel = null)
         {
@@ -29,6 +29,11 @@ namespace UniMcp
         public JsonNode Result { get; set; }
         public bool IsComplete { get; private set; }
 
+        /// <summary>
+        /// 由 MethodKeyBinder 预先绑定的类型化参数，未绑定时为 null
+        /// </summary>
+        public BoundArguments Arguments { get; set; }
+
         /// <summary>
         /// 构造函数，基于现有 JsonClass 创建上下文
         /// </summary>
@@ -112,6 +117,7 @@ namespace UniMcp
         public void SetJsonValue(string key, JsonNode value)
         {
             JsonData[key] = value;
+            Arguments?.Invalidate(key);
         }
 
         /// <summary>
@@ -132,7 +138,7 @@ namespace UniMcp
         {
             var newJsonData = JsonData.Clone();
             var newObjectReferences = new Dictionary<string, object>(ObjectReferences);
-            return new StateTreeContext(newJsonData, newObjectReferences);
+            return new StateTreeContext(newJsonData, newObjectReferences) { Arguments = Arguments };
         }
 
         /// <summary>
@@ -178,6 +184,7 @@ namespace UniMcp
             }
             set
             {
+                Arguments?.Invalidate(key);
                 if (value == null)
                 {
                     // null值优先存储到JsonData中
@@ -260,6 +267,10 @@ namespace UniMcp
         /// <returns>是否找到该键且类型匹配</returns>
         public bool TryGetValue<T>(string key, out T value)
         {
+            // 优先使用预绑定的类型化参数，避免重复解析；按 object 读取的调用方期望原始 JsonNode，不使用绑定值
+            if (typeof(T) != typeof(object) && Arguments != null && Arguments.TryGetProvided(key, out value))
+                return true;
+
             if (TryGetValue(key, out object obj))
             {
                 if (obj is T typedValue)
@@ -284,6 +295,28 @@ namespace UniMcp
             return false;
         }
 
+        /// <summary>
+        /// 获取类型化参数：显式传入的值 -> MethodKey 默认值 -> fallback。
+        /// 未经绑定的上下文回退到逐次解析 JsonData。
+        /// </summary>
+        /// <typeparam name="T">期望的值类型</typeparam>
+        /// <param name="key">参数键</param>
+        /// <param name="fallback">参数不存在时的返回值</param>
+        /// <returns>参数值</returns>
+        public T GetArg<T>(string key, T fallback = default(T))
+        {
+            if (Arguments != null)
+            {
+                if (Arguments.TryGet(key, out T bound))
+                    return bound;
+                // 已绑定的键解析失败说明类型不匹配，不再重复解析
+                if (Arguments.IsProvided(key))
+                    return fallback;
+            }
+
+            return TryGetValue(key, out T value) ? value : fallback;
+        }
+
         /// <summary>
         /// 移除指定键的值（从JsonData和ObjectReferences中都移除）
         /// </summary>
@@ -291,6 +324,7 @@ namespace UniMcp
         /// <returns>是否移除了任何值</returns>
         public bool Remove(string key)
         {
+            Arguments?.Invalidate(key);
             bool removedFromJson = JsonData.Remove(key) != null;
             bool removedFromObjects = ObjectReferences.Remove(key);
             return removedFromJson || removedFromObjects;
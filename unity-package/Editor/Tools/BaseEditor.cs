@@ -15,6 +15,8 @@ namespace UniMcp.Tools
     /// 对应方法名: base_editor
     /// </summary>
     [ToolName("base_editor", "System Management", "系统管理")]
+    [ReadOnlyActions("action", "get_windows", "get_selection")]
+    [ReadOnlyActions("action", "get_state", MaxAgeSeconds = 1)]
     public class BaseEditor : StateMethodBase
     {
         public override string Description => L.T("Manage Unity Editor state and controls", "管理Unity编辑器状态和控制");
@@ -123,11 +125,7 @@ namespace UniMcp.Tools
             try
             {
                 // Get all types deriving from EditorWindow
-                var windowTypes = AppDomain
-                    .CurrentDomain.GetAssemblies()
-                    .SelectMany(assembly => assembly.GetTypes())
-                    .Where(type => type.IsSubclassOf(typeof(EditorWindow)))
-                    .ToList();
+                var windowTypes = TypeIndex.GetTypesDerivedFrom(typeof(EditorWindow)).ToList();
 
                 var openWindows = new List<object>();
 
@@ -21,6 +21,11 @@ namespace UniMcp.Tools
     {
         public override string Description => L.T("Hierarchy apply tool, handles prefab apply and connection operations for game objects", "层级应用工具，处理游戏对象的预制体应用和连接操作");
 
+        /// <summary>
+        /// 断开预制体连接不改变对象和层级，其余操作会替换或传播预制体实例
+        /// </summary>
+        protected override bool ModifiesHierarchy(JsonClass args) => args["apply_type"]?.Value != "break_prefab_connection";
+
         /// <summary>
         /// Create the list of parameter keys supported by this method
         /// </summary>
@@ -45,7 +50,11 @@ namespace UniMcp.Tools
                     .SetEnumValues("connect_to_prefab", "apply_prefab_changes", "break_prefab_connection"),
                 
                 // Force apply
-                new MethodBool("force_apply", L.T("Whether to force create connection (override existing connection)", "是否强制创建连接（覆盖现有连接）"))
+                new MethodBool("force_apply", L.T("Whether to force create connection (override existing connection)", "是否强制创建连接（覆盖现有连接）")),
+                
+                // Multiple instances
+                new MethodArr("targets", L.T("apply_prefab_changes: apply several prefab instances in one asset-editing batch (instance IDs, hierarchy paths or hierarchy_search query objects)", "apply_prefab_changes：在一个资源编辑批次中应用多个预制体实例（实例ID、层级路径或 hierarchy_search 查询对象）"))
+                    .AddExample("12345", "\"Enemies/*\"", "{\"query\": \"t:Enemy\"}")
             };
         }
 
@@ -239,6 +248,16 @@ namespace UniMcp.Tools
         /// </summary>
         private object ApplyPrefabChanges(JsonClass args)
         {
+            // 多个实例：在同一个资源编辑范围内应用，导入和嵌套预制体传播只进行一次
+            if (args["targets"] is JsonNode targets && !targets.IsNull())
+            {
+                if (!HierarchyTargetsSelector.TryResolve(targets, out GameObject[] instances, out List<string> unmatched, out string error))
+                    return Response.Error(error);
+                if (instances.Length == 0)
+                    return Response.Error($"No GameObjects matched 'targets': {string.Join(", ", unmatched)}");
+                return PrefabBatchEditor.ApplyInstances(instances, "apply_prefab_changes");
+            }
+
             try
             {
                 // 获取目标GameObject
@@ -509,13 +528,8 @@ namespace UniMcp.Tools
                 return null;
 
             // 尝试按ID查找
-            if (int.TryParse(searchTerm, out int id))
-            {
-                var allObjects = GameObjectUtils.GetAllSceneObjects(true);
-                GameObject objById = allObjects.FirstOrDefault(go => go.GetInstanceID() == id);
-                if (objById != null)
-                    return objById;
-            }
+            if (int.TryParse(searchTerm, out int id) && HierarchyIndex.TryGetGameObject(id, out GameObject objById))
+                return objById;
 
             // 尝试按路径查找
             GameObject objByPath = GameObject.Find(searchTerm);
@@ -523,8 +537,7 @@ namespace UniMcp.Tools
                 return objByPath;
 
             // 尝试按名称查找
-            var allObjectsName = GameObjectUtils.GetAllSceneObjects(true);
-            return allObjectsName.FirstOrDefault(go => go.name == searchTerm);
+            return HierarchyIndex.FindByName(searchTerm, true).FirstOrDefault();
         }
 
 
@@ -1,5 +1,6 @@
 using System;
 using System.Collections;
+using System.Collections.Generic;
 using System.Linq;
 using System.Reflection;
 using System.Threading;
@@ -16,13 +17,15 @@ namespace UniMcp.Tools
     /// <summary>
     /// Handles GameObject creation operations in the scene hierarchy.
     /// Corresponding method name: hierarchy_create
-    /// Supports: menu, primitive, prefab, empty, copy
+    /// Supports: menu, primitive, prefab, empty, copy, bulk
     /// </summary>
     [ToolName("hierarchy_create", "Hierarchy Management", "层级管理")]
     public class HierarchyCreate : StateMethodBase
     {
         public override string Description => L.T("Hierarchy creation tool, supports creating various types of game objects in scene hierarchy", "层级创建工具，支持在场景层级中创建各种类型的游戏对象");
 
+        protected override bool ModifiesHierarchy(JsonClass args) => true;
+
         /// <summary>
         /// Create the list of parameter keys supported by this method
         /// </summary>
@@ -36,7 +39,7 @@ namespace UniMcp.Tools
                 
                 // Creation source type - enumeration
                 new MethodStr("source", L.T("Template source", "模板来源"), false)
-                    .SetEnumValues("primitive","menu", "prefab", "empty", "copy"),
+                    .SetEnumValues("primitive","menu", "prefab", "empty", "copy", "bulk"),
                 
                 // GameObject tag
                 new MethodStr("tag", L.T("GameObject tag", "游戏对象标签"))
@@ -83,7 +86,37 @@ namespace UniMcp.Tools
                 new MethodBool("save_as_prefab", L.T("Whether to save as prefab", "是否保存为预制体")),
                 
                 // Set active state
-                new MethodBool("set_active", L.T("Set active state", "设置激活状态"))
+                new MethodBool("set_active", L.T("Set active state", "设置激活状态")),
+
+                // Components to add
+                new MethodArr("components", L.T("Components to add, type names or {type_name, properties}", "要添加的组件，类型名或 {type_name, properties}"), true, "object"),
+
+                // Component properties
+                new MethodObj("component_properties", L.T("Component properties, component type -> {property: value}", "组件属性，组件类型 -> {属性: 值}")),
+
+                // Bulk template
+                new MethodStr("template", L.T("bulk: template instantiated once per instance, a prefab path/name or an existing object (instance ID or hierarchy path)", "bulk：每个实例都从该模板实例化，预制体路径/名称或现有对象（实例ID或层级路径）"))
+                    .AddExample("Assets/Prefabs/Tree.prefab"),
+
+                // Bulk instances
+                new MethodArr("instances", L.T("bulk: per-instance transforms and overrides [{position, rotation, scale, name, component_properties}]; position/rotation/scale/name at the top level are defaults", "bulk：每个实例的变换与覆盖 [{position, rotation, scale, name, component_properties}]；顶层的 position/rotation/scale/name 作为默认值"), true, "object"),
+
+                // Bulk layout
+                new MethodObj("layout", L.T("bulk: procedural layout used instead of instances. type " + string.Join("/", InstanceLayout.Types) + "; count, origin, seed, random_yaw, scale_range [min, max]; grid: rows, columns, spacing (number or [x, y, z]); scatter: size [x, y, z] or radius; path: points, spacing, closed, align_to_path", "bulk：代替 instances 的程序化布局。type 为 " + string.Join("/", InstanceLayout.Types) + "；count、origin、seed、random_yaw、scale_range [min, max]；grid：rows、columns、spacing（数值或 [x, y, z]）；scatter：size [x, y, z] 或 radius；path：points、spacing、closed、align_to_path"))
+                    .AddStringProperty("type")
+                    .AddNumberProperty("count")
+                    .AddArrayProperty("origin", "number")
+                    .AddNumberProperty("seed")
+                    .AddBooleanProperty("random_yaw")
+                    .AddArrayProperty("scale_range", "number")
+                    .AddNumberProperty("rows")
+                    .AddNumberProperty("columns")
+                    .AddMultiTypeProperty("spacing", new[] { "number", "array" }, "number")
+                    .AddArrayProperty("size", "number")
+                    .AddNumberProperty("radius")
+                    .AddArrayProperty("points", "array")
+                    .AddBooleanProperty("closed")
+                    .AddBooleanProperty("align_to_path")
             };
         }
 
@@ -108,6 +141,7 @@ namespace UniMcp.Tools
                     .Leaf("prefab", HandleCreateFromPrefab)
                     .Leaf("empty", HandleCreateEmpty)
                     .Leaf("copy", HandleCreateFromCopy)
+                    .Leaf("bulk", HandleBulkInstantiate)
                 .Build();
         }
 
@@ -562,6 +596,338 @@ namespace UniMcp.Tools
             }
         }
 
+        // --- Bulk Instantiation ---
+
+        /// <summary>
+        /// 批量实例化：模板、父对象、标签、层和组件类型只解析一次，所有实例在同一个折叠的撤销组中创建，
+        /// 返回紧凑的实例ID数组
+        /// </summary>
+        private object HandleBulkInstantiate(JsonClass args)
+        {
+            string templateToken = args["template"]?.Value;
+            if (string.IsNullOrEmpty(templateToken))
+                templateToken = !string.IsNullOrEmpty(args["prefab_path"]?.Value) ? args["prefab_path"].Value : args["copy_source"]?.Value;
+            if (string.IsNullOrEmpty(templateToken))
+            {
+                return Response.Error("'template' (prefab path or existing object) is required for bulk instantiation.");
+            }
+
+            // 摆放列表：instances 或 layout 二选一
+            JsonArray instances = args["instances"] as JsonArray;
+            JsonClass layout = args["layout"] as JsonClass;
+            if ((instances == null) == (layout == null))
+            {
+                return Response.Error("Provide either 'instances' or 'layout' for bulk instantiation.");
+            }
+
+            List<InstanceLayout.Placement> placements;
+            var instanceArgs = new List<JsonClass>();
+            if (layout != null)
+            {
+                if (!InstanceLayout.TryGenerate(layout, out placements, out string layoutError))
+                    return Response.Error(layoutError);
+            }
+            else
+            {
+                placements = new List<InstanceLayout.Placement>();
+                foreach (JsonNode node in instances.Childs)
+                {
+                    JsonClass instance = node as JsonClass ?? new JsonClass();
+                    instanceArgs.Add(instance);
+                    placements.Add(new InstanceLayout.Placement
+                    {
+                        Position = GameObjectUtils.ParseVector3(instance["position"] as JsonArray),
+                        Rotation = GameObjectUtils.ParseVector3(instance["rotation"] as JsonArray),
+                        Scale = GameObjectUtils.ParseVector3(instance["scale"] as JsonArray)
+                    });
+                }
+            }
+            if (placements.Count == 0)
+            {
+                return Response.Error("Bulk instantiation produced no instances.");
+            }
+
+            // --- 一次性解析 ---
+            if (!TryResolveBulkTemplate(templateToken, out GameObject prefabAsset, out GameObject sourceObject, out string error))
+                return Response.Error(error);
+            GameObject template = prefabAsset != null ? prefabAsset : sourceObject;
+
+            Transform parent = null;
+            string parentToken = args["parent_id"]?.Value;
+            if (string.IsNullOrEmpty(parentToken))
+                parentToken = args["parent"]?.Value;
+            if (!string.IsNullOrEmpty(parentToken))
+            {
+                GameObject parentGo = GameObjectUtils.FindObjectByIdOrPath(parentToken);
+                if (parentGo == null)
+                    return Response.Error($"Parent '{parentToken}' not found.");
+                parent = parentGo.transform;
+            }
+
+            string tag = args["tag"]?.Value;
+            if (!string.IsNullOrEmpty(tag) && !InternalEditorUtility.tags.Contains(tag))
+            {
+                InternalEditorUtility.AddTag(tag);
+            }
+
+            int layer = -1;
+            string layerName = args["layer"]?.Value;
+            if (!string.IsNullOrEmpty(layerName))
+            {
+                layer = LayerMask.NameToLayer(layerName);
+                if (layer == -1)
+                    return Response.Error($"Layer '{layerName}' not found.");
+            }
+
+            var componentTypes = new Dictionary<string, Type>(StringComparer.Ordinal);
+            var componentsToAdd = new List<KeyValuePair<Type, JsonClass>>();
+            if (args["components"] is JsonArray componentsArray)
+            {
+                foreach (JsonNode node in componentsArray.Childs)
+                {
+                    string typeName = node is JsonClass compObj ? compObj["type_name"]?.Value : node.Value;
+                    if (!TryResolveComponentType(typeName, componentTypes, out Type type, out error))
+                        return Response.Error(error);
+                    componentsToAdd.Add(new KeyValuePair<Type, JsonClass>(type, (node as JsonClass)?["properties"] as JsonClass));
+                }
+            }
+            if (!TryResolveComponentProperties(args["component_properties"] as JsonClass, componentTypes, out var sharedProperties, out error))
+                return Response.Error(error);
+
+            Vector3? defaultPosition = GameObjectUtils.ParseVector3(args["position"] as JsonArray);
+            Vector3? defaultRotation = GameObjectUtils.ParseVector3(args["rotation"] as JsonArray);
+            Vector3? defaultScale = GameObjectUtils.ParseVector3(args["scale"] as JsonArray);
+            JsonNode activeNode = !args["set_active"].IsNull() ? args["set_active"] : args["active"];
+            bool? active = activeNode.IsNull() ? (bool?)null : activeNode.AsBool;
+            string baseName = !string.IsNullOrEmpty(args["name"]?.Value) ? args["name"].Value : template.name;
+            bool isPrefab = prefabAsset != null;
+
+            // --- 创建实例 ---
+            var instanceIds = new JsonArray();
+            var errors = new JsonArray();
+            var stopwatch = System.Diagnostics.Stopwatch.StartNew();
+            string undoName = $"Bulk Instantiate '{template.name}' x{placements.Count}";
+
+            using (new UndoGroupScope(undoName))
+            {
+                for (int i = 0; i < placements.Count; i++)
+                {
+                    if (i % 100 == 0)
+                        McpProgress.Report(i, placements.Count, $"hierarchy_create bulk: {i}/{placements.Count}");
+
+                    GameObject go = null;
+                    try
+                    {
+                        go = isPrefab
+                            ? (GameObject)PrefabUtility.InstantiatePrefab(prefabAsset, parent)
+                            : UnityEngine.Object.Instantiate(sourceObject, parent, false);
+                        JsonClass instance = i < instanceArgs.Count ? instanceArgs[i] : null;
+                        string instanceError = ApplyBulkInstance(go, i, placements[i], instance, baseName,
+                            defaultPosition, defaultRotation, defaultScale, tag, layer, active,
+                            componentsToAdd, sharedProperties, componentTypes, isPrefab);
+                        if (instanceError != null)
+                            throw new InvalidOperationException(instanceError);
+
+                        Undo.RegisterCreatedObjectUndo(go, undoName);
+                        instanceIds.Add(go.GetInstanceID());
+                    }
+                    catch (Exception e)
+                    {
+                        if (go != null)
+                            UnityEngine.Object.DestroyImmediate(go);
+                        errors.Add(new JsonClass { ["index"] = i, ["error"] = e.Message });
+                    }
+                }
+            }
+
+            McpLogger.Log($"[HierarchyCreate] Bulk instantiated {instanceIds.Count} of {placements.Count} '{template.name}' in {stopwatch.ElapsedMilliseconds}ms ({errors.Count} failed)");
+
+            var data = new JsonClass
+            {
+                ["template"] = isPrefab ? AssetDatabase.GetAssetPath(prefabAsset) : template.name,
+                ["template_type"] = isPrefab ? "prefab" : "object",
+                ["requested"] = placements.Count,
+                ["created"] = instanceIds.Count,
+                ["failed"] = errors.Count,
+                ["ms"] = stopwatch.ElapsedMilliseconds,
+                ["instance_ids"] = instanceIds
+            };
+            if (errors.Count > 0)
+                data["errors"] = errors;
+            return Response.Success($"Instantiated {instanceIds.Count} of {placements.Count} '{template.name}' instance(s) in one undo group.", data);
+        }
+
+        /// <summary>
+        /// 设置单个实例的名称、变换、标签、层、组件和属性，返回错误信息（成功时为 null）
+        /// </summary>
+        private static string ApplyBulkInstance(GameObject go, int index, InstanceLayout.Placement placement, JsonClass instance, string baseName,
+            Vector3? defaultPosition, Vector3? defaultRotation, Vector3? defaultScale, string tag, int layer, bool? active,
+            List<KeyValuePair<Type, JsonClass>> componentsToAdd, List<KeyValuePair<Type, JsonClass>> sharedProperties,
+            Dictionary<string, Type> componentTypes, bool isPrefab)
+        {
+            string name = instance?["name"]?.Value;
+            go.name = !string.IsNullOrEmpty(name) ? name : index == 0 ? baseName : $"{baseName} ({index})";
+
+            Transform transform = go.transform;
+            Vector3? position = placement.Position ?? defaultPosition;
+            Vector3? rotation = placement.Rotation ?? defaultRotation;
+            Vector3? scale = placement.Scale ?? defaultScale;
+            if (position.HasValue)
+                transform.localPosition = position.Value;
+            if (rotation.HasValue)
+                transform.localEulerAngles = rotation.Value;
+            if (scale.HasValue)
+                transform.localScale = scale.Value;
+
+            if (!string.IsNullOrEmpty(tag))
+                go.tag = tag;
+            if (layer != -1)
+                go.layer = layer;
+
+            foreach (var component in componentsToAdd)
+            {
+                Component added = go.GetComponent(component.Key);
+                if (added == null)
+                    added = go.AddComponent(component.Key);
+                string error = SetBulkProperties(added, component.Value, isPrefab);
+                if (error != null)
+                    return error;
+            }
+
+            foreach (var properties in sharedProperties)
+            {
+                string error = SetBulkProperties(go, properties.Key, properties.Value, isPrefab);
+                if (error != null)
+                    return error;
+            }
+
+            // 实例级覆盖（组件类型与共享属性共用解析缓存）
+            if (instance != null && instance["component_properties"] is JsonClass overrides)
+            {
+                if (!TryResolveComponentProperties(overrides, componentTypes, out var instanceProperties, out string error))
+                    return error;
+                foreach (var properties in instanceProperties)
+                {
+                    error = SetBulkProperties(go, properties.Key, properties.Value, isPrefab);
+                    if (error != null)
+                        return error;
+                }
+            }
+
+            if (active.HasValue)
+                go.SetActive(active.Value);
+
+            if (isPrefab)
+            {
+                PrefabUtility.RecordPrefabInstancePropertyModifications(go);
+                PrefabUtility.RecordPrefabInstancePropertyModifications(transform);
+            }
+            return null;
+        }
+
+        /// <summary>
+        /// 解析批量模板：资源路径优先按预制体处理，否则先查找场景对象，再按名称搜索预制体
+        /// </summary>
+        private bool TryResolveBulkTemplate(string token, out GameObject prefabAsset, out GameObject sourceObject, out string error)
+        {
+            prefabAsset = null;
+            sourceObject = null;
+            error = null;
+
+            bool isAssetPath = token.EndsWith(".prefab", StringComparison.OrdinalIgnoreCase) ||
+                token.StartsWith("Assets/", StringComparison.Ordinal) || token.StartsWith("Packages/", StringComparison.Ordinal);
+            if (!isAssetPath)
+            {
+                sourceObject = GameObjectUtils.FindObjectByIdOrPath(token);
+                if (sourceObject != null)
+                    return true;
+            }
+
+            string resolvedPath = ResolvePrefabPath(token);
+            prefabAsset = string.IsNullOrEmpty(resolvedPath) ? null : AssetDatabase.LoadAssetAtPath<GameObject>(resolvedPath);
+            if (prefabAsset == null)
+            {
+                error = $"Template '{token}' is neither an existing GameObject nor a prefab asset.";
+                return false;
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// 解析组件类型（带缓存）
+        /// </summary>
+        private static bool TryResolveComponentType(string typeName, Dictionary<string, Type> cache, out Type type, out string error)
+        {
+            error = null;
+            if (string.IsNullOrEmpty(typeName))
+            {
+                type = null;
+                error = "Component type name is empty.";
+                return false;
+            }
+            if (cache.TryGetValue(typeName, out type))
+                return true;
+            if (!TypeIndex.TryResolve(typeName, typeof(Component), out type, out error))
+                return false;
+            cache[typeName] = type;
+            return true;
+        }
+
+        /// <summary>
+        /// 将 组件类型 -> 属性字典 解析为类型与属性的列表
+        /// </summary>
+        private static bool TryResolveComponentProperties(JsonClass componentProperties, Dictionary<string, Type> cache,
+            out List<KeyValuePair<Type, JsonClass>> resolved, out string error)
+        {
+            resolved = new List<KeyValuePair<Type, JsonClass>>();
+            error = null;
+            if (componentProperties == null)
+                return true;
+
+            foreach (KeyValuePair<string, JsonNode> entry in componentProperties.Properties())
+            {
+                if (!(entry.Value is JsonClass properties))
+                    continue;
+                if (!TryResolveComponentType(entry.Key, cache, out Type type, out error))
+                    return false;
+                resolved.Add(new KeyValuePair<Type, JsonClass>(type, properties));
+            }
+            return true;
+        }
+
+        private static string SetBulkProperties(GameObject go, Type componentType, JsonClass properties, bool isPrefab)
+        {
+            Component component = go.GetComponent(componentType);
+            if (component == null)
+                return $"Component '{componentType.Name}' not found on '{go.name}'.";
+            return SetBulkProperties(component, properties, isPrefab);
+        }
+
+        /// <summary>
+        /// 通过缓存的成员访问器写入组件属性，无法访问时退回 SerializedProperty
+        /// </summary>
+        private static string SetBulkProperties(Component component, JsonClass properties, bool isPrefab)
+        {
+            if (properties == null || properties.Count == 0)
+                return null;
+
+            Type type = component.GetType();
+            foreach (KeyValuePair<string, JsonNode> property in properties.Properties())
+            {
+                MemberPath member = MemberAccessorCache.Get(type, property.Key);
+                string error;
+                bool set = member.IsValid
+                    ? member.TrySetValue(component, property.Value, out error)
+                    : MemberAccessorCache.TrySetSerialized(component, property.Key, property.Value, out error);
+                if (!set)
+                    return $"{type.Name}.{property.Key}: {error}";
+            }
+
+            if (isPrefab)
+                PrefabUtility.RecordPrefabInstancePropertyModifications(component);
+            return null;
+        }
+
         /// <summary>
         /// 解析预制体路径
         /// </summary>
@@ -1,7 +1,6 @@
 using System;
 using System.Collections.Generic;
 using System.Linq;
-using System.Reflection;
 using System.Text.RegularExpressions;
 // Migrated from Newtonsoft.Json to SimpleJson
 using UnityEditor;
@@ -17,8 +16,14 @@ namespace UniMcp.Tools
     /// 对应方法名: hierarchy_search
     /// </summary>
     [ToolName("hierarchy_search", "Hierarchy Management", "层级管理")]
+    [ReadOnlyActions]
     public class HierarchySearch : StateMethodBase
     {
+        /// <summary>
+        /// 流式模式未指定 limit 时每页的对象数
+        /// </summary>
+        private const int DefaultStreamPageSize = 100;
+
         public override string Description => L.T("Search and find GameObjects in the scene hierarchy", "在场景层级中搜索和查找游戏对象");
 
         /// <summary>
@@ -46,7 +51,18 @@ namespace UniMcp.Tools
                 new MethodBool("include_inactive", L.T("Whether to search inactive objects", "是否搜索非激活对象")),
                 
                 // Use regular expression
-                new MethodBool("use_regex", L.T("Whether to use regular expressions", "是否使用正则表达式"))
+                new MethodBool("use_regex", L.T("Whether to use regular expressions", "是否使用正则表达式")),
+
+                // Pagination
+                new MethodInt("limit", L.T("Maximum number of results per page, 0 returns all", "每页最多返回的结果数，0 表示返回全部")),
+                new MethodStr("cursor", L.T("Pagination cursor, use next_cursor from the previous page; rejected once the hierarchy has changed", "分页游标，使用上一页返回的 next_cursor；层级发生变化后游标失效")),
+
+                // Field projection
+                new MethodArr("fields", L.T("Only return these fields for each object: " + string.Join(", ", GameObjectUtils.ProjectableFields), "每个对象只返回这些字段：" + string.Join(", ", GameObjectUtils.ProjectableFields)))
+                    .AddExample("name", "instance_id", "path"),
+
+                // Streaming
+                new MethodBool("stream", L.T("Emit every page as a progress notification (needs a progressToken and an SSE connection)", "将每一页作为进度通知推送（需要 progressToken 和 SSE 连接）"))
             };
         }
 
@@ -109,9 +125,6 @@ namespace UniMcp.Tools
 
             if (findAll || foundObjects.Count == 0)
             {
-                // 从当前场景搜索所有GameObject
-                GameObject[] allObjects = GetAllGameObjectsInActiveScene(searchInInactive);
-
                 // 检查是否包含通配符
                 bool hasWildcards = query.Contains('*');
                 Regex regex = null;
@@ -131,29 +144,20 @@ namespace UniMcp.Tools
                     }
                 }
 
-                foreach (GameObject go in allObjects)
-                {
-                    bool nameMatches;
+                // 通过层级索引匹配名称，通配符模式只检查第一个*之前的字面前缀范围
+                List<GameObject> nameMatches = hasWildcards && regex != null
+                    ? HierarchyIndex.FindByNameMatch(regex.IsMatch, searchInInactive, query.Substring(0, query.IndexOf('*')))
+                    : HierarchyIndex.FindByNameMatch(name => name.Contains(query, StringComparison.OrdinalIgnoreCase), searchInInactive);
 
-                    if (hasWildcards && regex != null)
-                    {
-                        nameMatches = regex.IsMatch(go.name);
-                    }
-                    else
-                    {
-                        nameMatches = go.name.Contains(query, StringComparison.OrdinalIgnoreCase);
-                    }
-
-                    if (nameMatches)
-                    {
-                        if (foundObjects.Contains(go))
-                            continue;
-                        foundObjects.Add(go);
-                    }
+                foreach (GameObject go in nameMatches)
+                {
+                    if (foundObjects.Contains(go))
+                        continue;
+                    foundObjects.Add(go);
                 }
             }
 
-            return CreateHierarchySearchResult(foundObjects, "name", includeHierarchy);
+            return CreateSearchResult(args, foundObjects, "name", includeHierarchy);
         }
 
         /// <summary>
@@ -181,7 +185,7 @@ namespace UniMcp.Tools
                 }
             }
 
-            return CreateSearchResult(foundObjects, "ID");
+            return CreateSearchResult(args, foundObjects, "ID");
         }
 
         /// <summary>
@@ -198,26 +202,14 @@ namespace UniMcp.Tools
                 return Response.Error("Search term is required for by_tag search.");
             }
 
-            List<GameObject> foundObjects = new List<GameObject>();
-
-            // 使用Unity内置的FindGameObjectsWithTag方法
-            GameObject[] taggedObjects = GameObject.FindGameObjectsWithTag(searchTerm);
-            foundObjects.AddRange(taggedObjects);
-
-            if (searchInInactive)
+            if (!InternalEditorUtility.tags.Contains(searchTerm))
             {
-                // 搜索非激活对象 - 从当前场景获取
-                GameObject[] allObjects = GetAllGameObjectsInActiveScene(true);
-                foreach (GameObject go in allObjects)
-                {
-                    if (!go.activeInHierarchy && go.CompareTag(searchTerm))
-                    {
-                        foundObjects.Add(go);
-                    }
-                }
+                return Response.Error($"Tag '{searchTerm}' is not defined.");
             }
 
-            return CreateSearchResult(foundObjects, "tag");
+            List<GameObject> foundObjects = HierarchyIndex.FindByTag(searchTerm, searchInInactive);
+
+            return CreateSearchResult(args, foundObjects, "tag");
         }
 
         /// <summary>
@@ -234,8 +226,6 @@ namespace UniMcp.Tools
                 return Response.Error("Search term is required for by_layer search.");
             }
 
-            List<GameObject> foundObjects = new List<GameObject>();
-
             // 获取层级索引
             int layerIndex = LayerMask.NameToLayer(searchTerm);
             if (layerIndex == -1)
@@ -243,18 +233,9 @@ namespace UniMcp.Tools
                 return Response.Error($"Layer '{searchTerm}' not found.");
             }
 
-            // 从当前场景搜索GameObject
-            GameObject[] allObjects = GetAllGameObjectsInActiveScene(searchInInactive);
+            List<GameObject> foundObjects = HierarchyIndex.FindByLayer(layerIndex, searchInInactive);
 
-            foreach (GameObject go in allObjects)
-            {
-                if (go.layer == layerIndex)
-                {
-                    foundObjects.Add(go);
-                }
-            }
-
-            return CreateSearchResult(foundObjects, "layer");
+            return CreateSearchResult(args, foundObjects, "layer");
         }
 
         /// <summary>
@@ -271,27 +252,16 @@ namespace UniMcp.Tools
                 return Response.Error("Search term is required for by_component search.");
             }
 
-            List<GameObject> foundObjects = new List<GameObject>();
-
             // 尝试获取组件类型
-            Type componentType = GetComponentType(searchTerm);
-            if (componentType == null)
+            if (!TypeIndex.TryResolve(searchTerm, typeof(Component), out Type componentType, out string typeError))
             {
-                return Response.Error($"Component type '{searchTerm}' not found.");
+                return Response.Error($"Component type '{searchTerm}' not resolved: {typeError}");
             }
 
-            // 从当前场景搜索包含指定组件的GameObject
-            GameObject[] allObjects = GetAllGameObjectsInActiveScene(searchInInactive);
+            // 从层级索引查找包含指定组件的GameObject
+            List<GameObject> foundObjects = HierarchyIndex.FindByComponent(componentType, searchInInactive);
 
-            foreach (GameObject go in allObjects)
-            {
-                if (go.GetComponent(componentType) != null)
-                {
-                    foundObjects.Add(go);
-                }
-            }
-
-            return CreateSearchResult(foundObjects, "component");
+            return CreateSearchResult(args, foundObjects, "component");
         }
 
         /// <summary>
@@ -300,7 +270,6 @@ namespace UniMcp.Tools
         private object HandleSearchByquery(JsonClass args)
         {
             string searchTerm = args["query"]?.Value;
-            bool findAll = args["select_many"].AsBoolDefault(false);
             bool includeHierarchy = args["include_hierarchy"].AsBoolDefault(false);
             bool searchInInactive = args["include_inactive"].AsBoolDefault(false);
             bool useRegex = args["use_regex"].AsBoolDefault(false);
@@ -310,287 +279,234 @@ namespace UniMcp.Tools
                 return Response.Error("Search term is required for by_query search.");
             }
 
+            if (!TryFindByQuery(searchTerm, searchInInactive, useRegex, out List<GameObject> foundObjects, out string error))
+            {
+                return Response.Error(error);
+            }
+
+            // 类型搜索（t:TypeName）不附带层级数据
+            bool isTypeSearch = searchTerm.StartsWith("t:", StringComparison.OrdinalIgnoreCase);
+            return CreateSearchResult(args, foundObjects, isTypeSearch ? "type" : "term", !isTypeSearch && includeHierarchy);
+        }
+
+        /// <summary>
+        /// 执行 by_query 搜索：t:TypeName 按组件类型查找，否则按名称、标签、层和组件名匹配（支持通配符*或正则），
+        /// 激活的名称匹配对象使其祖先也匹配。结果按层级顺序排列
+        /// </summary>
+        /// <param name="searchTerm">搜索条件</param>
+        /// <param name="includeInactive">是否包含非激活对象</param>
+        /// <param name="useRegex">是否按正则表达式解释搜索条件</param>
+        /// <param name="foundObjects">匹配的对象</param>
+        /// <param name="error">搜索条件无效时的错误信息</param>
+        public static bool TryFindByQuery(string searchTerm, bool includeInactive, bool useRegex, out List<GameObject> foundObjects, out string error)
+        {
+            foundObjects = null;
+            error = null;
+
             // 检查是否是类型搜索（t:TypeName 格式）
-            bool isTypeSearch = false;
-            string typeName = null;
             if (searchTerm.StartsWith("t:", StringComparison.OrdinalIgnoreCase))
             {
-                isTypeSearch = true;
-                typeName = searchTerm.Substring(2).Trim();
+                string typeName = searchTerm.Substring(2).Trim();
                 if (string.IsNullOrEmpty(typeName))
                 {
-                    return Response.Error("Type name is required after 't:' prefix.");
+                    error = "Type name is required after 't:' prefix.";
+                    return false;
+                }
+
+                // 类型搜索直接从层级索引按组件查找
+                if (!TypeIndex.TryResolve(typeName, typeof(Component), out Type queryType, out string typeError))
+                {
+                    error = $"Component type '{typeName}' not resolved: {typeError}";
+                    return false;
                 }
+
+                foundObjects = HierarchyIndex.FindByComponent(queryType, includeInactive);
+                return true;
             }
 
             // 处理搜索模式：通配符、正则表达式或普通文本
             Regex regex = null;
             bool isPatternMatch = false;
 
-            if (!isTypeSearch)
-            {
-                // 检查是否包含通配符
-                bool hasWildcards = searchTerm.Contains('*');
+            // 检查是否包含通配符
+            bool hasWildcards = searchTerm.Contains('*');
 
-                if (useRegex)
+            if (useRegex)
+            {
+                // 直接使用正则表达式
+                try
                 {
-                    // 直接使用正则表达式
-                    try
-                    {
-                        regex = new Regex(searchTerm, RegexOptions.IgnoreCase);
-                        isPatternMatch = true;
-                    }
-                    catch (ArgumentException ex)
-                    {
-                        return Response.Error($"Invalid regular expression: {ex.Message}");
-                    }
+                    regex = new Regex(searchTerm, RegexOptions.IgnoreCase);
+                    isPatternMatch = true;
                 }
-                else if (hasWildcards)
+                catch (ArgumentException ex)
                 {
-                    // 将通配符转换为正则表达式
-                    string regexPattern = ConvertWildcardToRegex(searchTerm);
-                    try
-                    {
-                        regex = new Regex(regexPattern, RegexOptions.IgnoreCase);
-                        isPatternMatch = true;
-                    }
-                    catch (ArgumentException ex)
-                    {
-                        return Response.Error($"Invalid wildcard pattern: {ex.Message}");
-                    }
+                    error = $"Invalid regular expression: {ex.Message}";
+                    return false;
                 }
             }
-
-            List<GameObject> foundObjects = new List<GameObject>();
-            HashSet<GameObject> uniqueObjects = new HashSet<GameObject>(); // 避免重复
-
-            // 如果是类型搜索，直接使用FindObjectsOfType
-            if (isTypeSearch)
+            else if (hasWildcards)
             {
-                Type queryType = GetComponentType(typeName);
-                if (queryType == null)
+                // 将通配符转换为正则表达式
+                string regexPattern = ConvertWildcardToRegex(searchTerm);
+                try
                 {
-                    return Response.Error($"Component type '{typeName}' not found.");
+                    regex = new Regex(regexPattern, RegexOptions.IgnoreCase);
+                    isPatternMatch = true;
                 }
-
-                GameObject[] sceneObjects = GetAllGameObjectsInActiveScene(searchInInactive);
-
-                foreach (GameObject go in sceneObjects)
+                catch (ArgumentException ex)
                 {
-                    if (go.GetComponent(queryType) != null)
-                    {
-                        if (uniqueObjects.Add(go))
-                        {
-                            foundObjects.Add(go);
-                        }
-                    }
+                    error = $"Invalid wildcard pattern: {ex.Message}";
+                    return false;
                 }
-
-                return CreateSearchResult(foundObjects, "type");
             }
 
-            // 从当前场景搜索所有GameObject
-            GameObject[] allObjects = GetAllGameObjectsInActiveScene(searchInInactive);
+            Func<string, bool> textMatches = isPatternMatch && regex != null
+                ? (Func<string, bool>)regex.IsMatch
+                : text => text.Contains(searchTerm, StringComparison.OrdinalIgnoreCase);
+            // 通配符模式下名称只需检查第一个*之前的字面前缀范围
+            string namePrefix = isPatternMatch && !useRegex ? searchTerm.Substring(0, searchTerm.IndexOf('*')) : null;
 
-            foreach (GameObject go in allObjects)
-            {
-                bool matches = false;
+            HashSet<GameObject> uniqueObjects = new HashSet<GameObject>(); // 避免重复
 
-                // 1. 检查名称匹配
-                if (isPatternMatch && regex != null)
-                {
-                    if (regex.IsMatch(go.name))
-                    {
-                        matches = true;
-                    }
-                }
-                else
-                {
-                    if (go.name.Contains(searchTerm, StringComparison.OrdinalIgnoreCase))
-                    {
-                        matches = true;
-                    }
-                }
+            // 1. 检查名称匹配
+            List<GameObject> nameMatches = HierarchyIndex.FindByNameMatch(textMatches, true, namePrefix);
+            uniqueObjects.UnionWith(nameMatches);
 
-                // 2. 检查标签匹配
-                if (!matches)
-                {
-                    if (isPatternMatch && regex != null)
-                    {
-                        if (regex.IsMatch(go.tag))
-                        {
-                            matches = true;
-                        }
-                    }
-                    else
-                    {
-                        // 安全地检查标签，避免未定义标签的错误
-                        try
-                        {
-                            if (go.CompareTag(searchTerm) || go.tag.Contains(searchTerm, StringComparison.OrdinalIgnoreCase))
-                            {
-                                matches = true;
-                            }
-                        }
-                        catch (UnityException)
-                        {
-                            // 标签未定义，跳过标签匹配
-                        }
-                    }
-                }
-
-                // 3. 检查层级匹配
-                if (!matches)
-                {
-                    string layerName = LayerMask.LayerToName(go.layer);
-                    if (!string.IsNullOrEmpty(layerName))
-                    {
-                        if (isPatternMatch && regex != null)
-                        {
-                            if (regex.IsMatch(layerName))
-                            {
-                                matches = true;
-                            }
-                        }
-                        else
-                        {
-                            if (layerName.Contains(searchTerm, StringComparison.OrdinalIgnoreCase))
-                            {
-                                matches = true;
-                            }
-                        }
-                    }
-                }
+            // 2. 检查标签匹配
+            uniqueObjects.UnionWith(HierarchyIndex.FindByTagMatch(textMatches, true));
 
-                // 4. 检查组件匹配
-                if (!matches)
-                {
-                    Component[] components = go.GetComponents<Component>();
-                    foreach (Component component in components)
-                    {
-                        if (component != null)
-                        {
-                            string componentTypeName = component.GetType().Name;
-                            if (isPatternMatch && regex != null)
-                            {
-                                if (regex.IsMatch(componentTypeName))
-                                {
-                                    matches = true;
-                                    break;
-                                }
-                            }
-                            else
-                            {
-                                if (componentTypeName.Contains(searchTerm, StringComparison.OrdinalIgnoreCase))
-                                {
-                                    matches = true;
-                                    break;
-                                }
-                            }
-                        }
-                    }
-                }
+            // 3. 检查层级匹配
+            uniqueObjects.UnionWith(HierarchyIndex.FindByLayerMatch(layer =>
+            {
+                string layerName = LayerMask.LayerToName(layer);
+                return !string.IsNullOrEmpty(layerName) && textMatches(layerName);
+            }, true));
 
-                // 5. 检查子对象名称匹配（默认启用）
-                if (!matches)
-                {
-                    Transform[] children = go.GetComponentsInChildren<Transform>();
-                    foreach (Transform child in children)
-                    {
-                        if (child != go.transform)
-                        {
-                            if (isPatternMatch && regex != null)
-                            {
-                                if (regex.IsMatch(child.name))
-                                {
-                                    matches = true;
-                                    break;
-                                }
-                            }
-                            else
-                            {
-                                if (child.name.Contains(searchTerm, StringComparison.OrdinalIgnoreCase))
-                                {
-                                    matches = true;
-                                    break;
-                                }
-                            }
-                        }
-                    }
-                }
+            // 4. 检查组件匹配
+            uniqueObjects.UnionWith(HierarchyIndex.FindByComponentMatch(type => textMatches(type.Name), true));
 
-                if (matches && uniqueObjects.Add(go))
+            // 5. 检查子对象名称匹配（默认启用）：激活的匹配对象使其所有祖先匹配
+            foreach (GameObject match in nameMatches)
+            {
+                if (!match.activeInHierarchy)
+                    continue;
+                for (Transform parent = match.transform.parent; parent != null; parent = parent.parent)
                 {
-                    foundObjects.Add(go);
+                    uniqueObjects.Add(parent.gameObject);
                 }
             }
 
-            return CreateHierarchySearchResult(foundObjects, "term", includeHierarchy);
+            foundObjects = uniqueObjects.Where(go => includeInactive || go.activeInHierarchy).ToList();
+            HierarchyIndex.SortByHierarchyOrder(foundObjects);
+            return true;
         }
 
         // --- Helper Methods ---
 
         /// <summary>
-        /// 获取当前激活场景中的所有GameObject
+        /// 创建搜索结果。匹配对象按层级顺序排列，只序列化 cursor/limit 指定的一页；
+        /// fields 指定时只输出投影字段，stream 为 true 且可发送进度通知时逐页推送全部结果
         /// </summary>
-        private GameObject[] GetAllGameObjectsInActiveScene(bool includeInactive)
+        private object CreateSearchResult(JsonClass args, List<GameObject> foundObjects, string searchType, bool includeHierarchy = false)
         {
-            List<GameObject> allObjects = new List<GameObject>();
+            int limit = args["limit"].AsIntDefault(0);
+            if (limit < 0)
+            {
+                return Response.Error("'limit' must be zero or a positive integer.");
+            }
 
-            // 获取当前激活场景的根对象
-            Scene activeScene = SceneManager.GetActiveScene();
-            if (!activeScene.IsValid())
+            // 游标为 "{索引版本}:{偏移}"，层级在两页之间发生变化时偏移已不可靠，拒绝过期游标
+            int offset = 0;
+            long version = HierarchyIndex.Version;
+            string cursor = args["cursor"]?.Value;
+            if (!string.IsNullOrEmpty(cursor))
             {
-                return allObjects.ToArray();
+                int separator = cursor.IndexOf(':');
+                if (separator <= 0
+                    || !long.TryParse(cursor.Substring(0, separator), out long cursorVersion)
+                    || !int.TryParse(cursor.Substring(separator + 1), out offset) || offset < 0)
+                {
+                    return Response.Error($"Invalid cursor '{cursor}'. Use the next_cursor value returned by the previous page.");
+                }
+                if (cursorVersion != version)
+                {
+                    return Response.Error($"Cursor '{cursor}' is stale: the hierarchy changed since it was issued. Repeat the search without 'cursor'.");
+                }
             }
 
-            GameObject[] rootObjects = activeScene.GetRootGameObjects();
+            // fields 支持数组或逗号分隔的字符串
+            string[] fields = null;
+            JsonNode fieldsNode = args["fields"];
+            if (fieldsNode is JsonArray fieldArray && fieldArray.Count > 0)
+                fields = fieldArray.Childs.Select(f => f.Value.Trim()).ToArray();
+            else if (fieldsNode != null && fieldsNode.type == JsonNodeType.String && !string.IsNullOrWhiteSpace(fieldsNode.Value))
+                fields = fieldsNode.Value.Split(new[] { ',' }, StringSplitOptions.RemoveEmptyEntries).Select(f => f.Trim()).ToArray();
+            if (fields != null)
+            {
+                var unknown = fields.Where(f => Array.IndexOf(GameObjectUtils.ProjectableFields, f) < 0).ToArray();
+                if (unknown.Length > 0)
+                {
+                    return Response.Error($"Unknown field(s): {string.Join(", ", unknown)}. Supported fields: {string.Join(", ", GameObjectUtils.ProjectableFields)}");
+                }
+            }
+
+            int total = foundObjects.Count;
+            offset = Math.Min(offset, total);
+            string hierarchyInfo = includeHierarchy ? " with complete hierarchy" : "";
 
-            foreach (GameObject rootObj in rootObjects)
+            // 流式模式：每页作为一条进度通知推送，最终结果只包含汇总信息
+            bool stream = args["stream"].AsBoolDefault(false);
+            if (stream && McpProgress.IsAvailable)
             {
-                if (includeInactive)
+                int pageSize = limit > 0 ? limit : DefaultStreamPageSize;
+                int pages = 0;
+                for (int start = offset; start < total; start += pageSize)
                 {
-                    // 包含非激活对象，获取所有子对象（包括非激活的）
-                    Transform[] allTransforms = rootObj.GetComponentsInChildren<Transform>(true);
-                    foreach (Transform t in allTransforms)
+                    int pageEnd = Math.Min(total, start + pageSize);
+                    var page = new JsonClass
                     {
-                        allObjects.Add(t.gameObject);
-                    }
+                        ["offset"] = start,
+                        ["items"] = BuildPage(foundObjects, start, pageEnd, fields, includeHierarchy)
+                    };
+                    McpProgress.Report(pageEnd - offset, total - offset, $"hierarchy_search {pageEnd}/{total}", page);
+                    pages++;
                 }
-                else
+
+                return new JsonClass
                 {
-                    // 只包含激活对象
-                    if (rootObj.activeInHierarchy)
-                    {
-                        Transform[] activeTransforms = rootObj.GetComponentsInChildren<Transform>(false);
-                        foreach (Transform t in activeTransforms)
-                        {
-                            allObjects.Add(t.gameObject);
-                        }
-                    }
-                }
+                    ["success"] = true,
+                    ["message"] = $"Streamed {total - offset} GameObjects using {searchType}{hierarchyInfo} in {pages} progress notifications.",
+                    ["data"] = new JsonArray(),
+                    ["total"] = total,
+                    ["offset"] = offset,
+                    ["streamed"] = true,
+                    ["pages"] = pages,
+                    ["exec_time_ms"] = 1.00,
+                    ["mode"] = "Async mode"
+                };
             }
 
-            return allObjects.ToArray();
-        }
+            int end = limit > 0 ? Math.Min(total, offset + limit) : total;
+            JsonArray results = BuildPage(foundObjects, offset, end, fields, includeHierarchy);
 
-        /// <summary>
-        /// 创建搜索结果
-        /// </summary>
-        private object CreateSearchResult(List<GameObject> foundObjects, string searchType)
-        {
-            // 构建结果数据
-            var results = foundObjects.Select(go => Json.FromObject(GameObjectUtils.GetGameObjectData(go))).ToList();
-
-            // 构建中文消息
+            // 构建消息
             string message;
-            if (results.Count == 0)
+            if (total == 0)
             {
                 message = $"No GameObjects found using search method: {searchType}.";
             }
+            else if (results.Count < total)
+            {
+                message = $"Found {total} GameObjects using {searchType}{hierarchyInfo}, returning {offset}-{end - 1}.";
+            }
             else
             {
-                message = $"Found {results.Count} GameObjects using {searchType}.";
+                message = $"Found {total} GameObjects using {searchType}{hierarchyInfo}.";
+            }
+            if (stream)
+            {
+                message += " Streaming is unavailable (no progressToken or SSE connection), returned a regular page instead.";
             }
 
             // 构建响应对象，包含执行时间、成功标志、消息和数据
@@ -598,63 +514,59 @@ namespace UniMcp.Tools
             {
                 ["success"] = true,
                 ["message"] = message,
-                ["data"] = Json.FromObject(results),
+                ["data"] = results,
+                ["total"] = total,
+                ["offset"] = offset,
                 ["exec_time_ms"] = 1.00,
                 ["mode"] = "Async mode"
             };
+            if (end < total)
+            {
+                response["next_cursor"] = $"{version}:{end}";
+            }
 
             return response;
         }
 
         /// <summary>
-        /// 创建包含完整层级信息的搜索结果
+        /// 序列化 [start, end) 范围内的匹配对象
         /// </summary>
-        private object CreateHierarchySearchResult(List<GameObject> foundObjects, string searchType, bool includeHierarchy)
+        private JsonArray BuildPage(List<GameObject> foundObjects, int start, int end, string[] fields, bool includeHierarchy)
         {
-            // 构建结果数据 - 使用JObject确保正确序列化
-            var results = new List<JsonClass>();
-
-            if (includeHierarchy)
+            var page = new JsonArray();
+            for (int i = start; i < end; i++)
             {
-                // 获取完整的层级数据
-                foreach (var go in foundObjects)
-                {
-                    var hierarchyData = GetCompleteHierarchyData(go);
-                    results.Add(hierarchyData);
-                }
+                GameObject go = foundObjects[i];
+                if (go == null)
+                    continue;
+
+                if (fields != null)
+                    page.Add(GetProjectedData(go, fields, includeHierarchy));
+                else if (includeHierarchy)
+                    page.Add(GetCompleteHierarchyData(go));
+                else
+                    page.Add(GameObjectUtils.GetGameObjectData(go));
             }
-            else
+            return page;
+        }
+
+        /// <summary>
+        /// 获取投影字段数据，includeHierarchy 时递归包含子对象的同名字段
+        /// </summary>
+        private JsonClass GetProjectedData(GameObject go, string[] fields, bool includeHierarchy)
+        {
+            JsonClass result = GameObjectUtils.GetGameObjectFields(go, fields);
+            if (includeHierarchy && go.transform.childCount > 0)
             {
-                // 使用标准的GameObject数据
-                foreach (var go in foundObjects)
+                JsonArray childrenArray = new JsonArray();
+                foreach (Transform child in go.transform)
                 {
-                    results.Add(GameObjectUtils.GetGameObjectData(go));
+                    if (child != null)
+                        childrenArray.Add(GetProjectedData(child.gameObject, fields, true));
                 }
+                result["children"] = childrenArray;
             }
-
-            // 构建消息
-            string message;
-            if (results.Count == 0)
-            {
-                message = $"No GameObjects found using search method: {searchType}.";
-            }
-            else
-            {
-                string hierarchyInfo = includeHierarchy ? " with complete hierarchy" : "";
-                message = $"Found {results.Count} GameObjects using {searchType}{hierarchyInfo}.";
-            }
-
-            // 构建响应对象，确保正确序列化
-            var response = new JsonClass
-            {
-                ["success"] = true,
-                ["message"] = message,
-                ["data"] = Json.FromObject(results),
-                ["exec_time_ms"] = 1.00,
-                ["mode"] = "Async mode"
-            };
-
-            return response;
+            return result;
         }
 
         /// <summary>
@@ -697,65 +609,12 @@ namespace UniMcp.Tools
             return result;
         }
 
-        /// <summary>
-        /// 获取组件类型
-        /// </summary>
-        private Type GetComponentType(string typeName)
-        {
-            // 尝试从常见的Unity命名空间获取
-            string[] commonNamespaces = {
-                "UnityEngine",
-                "UnityEngine.UI",
-                "UnityEngine.EventSystems",
-                "UnityEditor"
-            };
-
-            foreach (string ns in commonNamespaces)
-            {
-                Type type = Type.GetType($"{ns}.{typeName}");
-                if (type != null && typeof(UnityEngine.Object).IsAssignableFrom(type))
-                    return type;
-            }
-
-            // 尝试直接获取类型
-            Type directType = Type.GetType(typeName);
-            if (directType != null && typeof(UnityEngine.Object).IsAssignableFrom(directType))
-                return directType;
-
-            // 尝试从所有已加载的程序集中查找
-            foreach (Assembly assembly in AppDomain.CurrentDomain.GetAssemblies())
-            {
-                try
-                {
-                    // 先尝试全名匹配
-                    Type type = assembly.GetType(typeName);
-                    if (type != null && typeof(UnityEngine.Object).IsAssignableFrom(type))
-                        return type;
-
-                    // 再遍历所有类型，尝试短名匹配
-                    foreach (var t in assembly.GetTypes())
-                    {
-                        if ((t.Name == typeName || t.FullName == typeName) &&
-                            typeof(UnityEngine.Object).IsAssignableFrom(t))
-                            return t;
-                    }
-                }
-                catch
-                {
-                    // 忽略无法访问的程序集
-                    continue;
-                }
-            }
-
-            return null;
-        }
-
         /// <summary>
         /// 将通配符模式转换为正则表达式
         /// </summary>
         /// <param name="wildcardPattern">包含通配符*的模式</param>
         /// <returns>正则表达式字符串</returns>
-        private string ConvertWildcardToRegex(string wildcardPattern)
+        private static string ConvertWildcardToRegex(string wildcardPattern)
         {
             if (string.IsNullOrEmpty(wildcardPattern))
                 return string.Empty;
@@ -23,6 +23,8 @@ namespace UniMcp.Tools
     public class ObjectDelete : DualStateMethodBase
     {
         public override string Description => L.T("Delete GameObjects or assets", "删除游戏对象或资源");
+
+        protected override bool ModifiesHierarchy(JsonClass args) => true;
         
         private IObjectSelector objectSelector;
 
@@ -61,6 +61,26 @@ namespace UniMcp.Tools
                 new MethodBool("include_indirect", L.T("Include indirect dependencies/references, default false", "包含间接依赖/引用，默认为false"))
                     .SetDefault(false),
                 
+                // Tree depth
+                new MethodInt("depth", L.T("Folder levels to expand below 'path' for tree, default 1 (0 returns only the folder's counts)", "tree展开的文件夹层数，默认1（0只返回该文件夹的统计）"))
+                    .SetRange(0, 10)
+                    .SetDefault(1),
+
+                // Tree paging
+                new MethodInt("offset", L.T("Index of the first child entry of 'path' to return for tree, default 0", "tree返回的第一个子项序号，默认0"))
+                    .SetDefault(0),
+                new MethodInt("limit", L.T("Maximum child entries per folder for tree, default 200", "tree每个文件夹最多返回的子项数，默认200"))
+                    .SetRange(1, 5000)
+                    .SetDefault(200),
+
+                // Tree files
+                new MethodBool("include_files", L.T("List files (name and size) as tree children, default false", "tree是否列出文件（名称和大小），默认为false")),
+
+                // Tree format
+                new MethodStr("format", L.T("Tree output format, default json", "tree输出格式，默认json"))
+                    .SetEnumValues("json", "yaml")
+                    .SetDefault("json"),
+
                 // Max results count
                 new MethodInt("max_results", L.T("Maximum results count, default 100", "最大结果数量，默认100"))
                     .SetRange(1, 1000)
@@ -576,7 +596,7 @@ namespace UniMcp.Tools
         }
 
         /// <summary>
-        /// 查询并选择引用指定资源的所有资源（优化版本）
+        /// 查询并选择引用指定资源的所有资源（使用持久化的反向依赖索引）
         /// </summary>
         private object SelectUsages(JsonClass args)
         {
@@ -600,18 +620,9 @@ namespace UniMcp.Tools
                 if (string.IsNullOrEmpty(targetGuid))
                     return Response.Error($"Could not get GUID for asset: {fullPath}");
 
-                List<string> referencingPaths = new List<string>();
-
-                // 方法1: 使用Unity内置的引用查找（更高效）
-                if (TryFindReferencesUsingBuiltinAPI(fullPath, targetGuid, referencingPaths, maxResults))
-                {
-                    McpLogger.Log($"[SelectUsages] Used builtin API to find references");
-                }
-                else
-                {
-                    // 方法2: 优化的手动查找（仅查找常见资源类型）
-                    FindReferencesOptimized(fullPath, targetGuid, referencingPaths, includeIndirect, maxResults);
-                }
+                // 多取一个用于判断结果是否被截断
+                List<string> referencingPaths = AssetDependencyIndex.FindReferencers(fullPath, includeIndirect, maxResults + 1, out bool complete);
+                bool truncated = referencingPaths.Count > maxResults;
 
                 List<UnityEngine.Object> referencingObjects = new List<UnityEngine.Object>();
                 List<object> referencingData = new List<object>();
@@ -630,17 +641,22 @@ namespace UniMcp.Tools
                 Selection.objects = referencingObjects.ToArray();
 
                 var duration = System.DateTime.Now - startTime;
-                string message = referencingPaths.Count >= maxResults
-                    ? $"Found {referencingPaths.Count}+ references (showing first {referencingObjects.Count}) for '{fullPath}' in {duration.TotalMilliseconds:F0}ms"
+                string message = truncated
+                    ? $"Found {maxResults}+ references (showing first {referencingObjects.Count}) for '{fullPath}' in {duration.TotalMilliseconds:F0}ms"
                     : $"Selected {referencingObjects.Count} assets that reference '{fullPath}' in {duration.TotalMilliseconds:F0}ms";
+                if (!complete)
+                    message += " (dependency index is still building, results may be incomplete)";
 
                 return Response.Success(message, new
                 {
                     targetAsset = GetAssetData(fullPath),
                     referencingCount = referencingObjects.Count,
-                    totalFound = referencingPaths.Count,
+                    totalFound = truncated ? maxResults : referencingPaths.Count,
+                    truncated = truncated,
                     maxResults = maxResults,
                     includeIndirect = includeIndirect,
+                    complete = complete,
+                    index = AssetDependencyIndex.GetStatus(),
                     searchDurationMs = duration.TotalMilliseconds,
                     referencingAssets = referencingData
                 });
@@ -651,81 +667,6 @@ namespace UniMcp.Tools
             }
         }
 
-        /// <summary>
-        /// 尝试使用Unity内置API查找引用（如果可用）
-        /// </summary>
-        private bool TryFindReferencesUsingBuiltinAPI(string targetPath, string targetGuid, List<string> referencingPaths, int maxResults)
-        {
-            try
-            {
-                // 尝试使用Unity 2020+的内置引用查找API
-                var searchFilter = $"ref:{targetGuid}";
-                string[] foundGuids = AssetDatabase.FindAssets(searchFilter);
-
-                if (foundGuids != null && foundGuids.Length > 0)
-                {
-                    foreach (string guid in foundGuids.Take(maxResults))
-                    {
-                        string assetPath = AssetDatabase.GUIDToAssetPath(guid);
-                        if (!string.IsNullOrEmpty(assetPath) && assetPath != targetPath)
-                        {
-                            referencingPaths.Add(assetPath);
-                        }
-                    }
-                    return true;
-                }
-            }
-            catch (Exception ex)
-            {
-                McpLogger.Log($"[SelectUsages] Builtin API not available or failed: {ex.Message}");
-            }
-            return false;
-        }
-
-        /// <summary>
-        /// 优化的手动引用查找（仅查找常见资源类型）
-        /// </summary>
-        private void FindReferencesOptimized(string targetPath, string targetGuid, List<string> referencingPaths, bool includeIndirect, int maxResults)
-        {
-            // 只查找常见的可能包含引用的资源类型，而不是所有资源
-            string[] searchFilters = {
-                "t:Scene",           // 场景文件
-                "t:Prefab",          // 预制体
-                "t:Material",        // 材质
-                "t:AnimationClip",   // 动画片段
-                "t:AnimatorController", // 动画控制器
-                "t:ScriptableObject", // ScriptableObject
-                "t:Shader"           // 着色器
-            };
-
-            var processedGuids = new HashSet<string>();
-
-            foreach (string filter in searchFilters)
-            {
-                if (referencingPaths.Count >= maxResults) break;
-
-                string[] guids = AssetDatabase.FindAssets(filter);
-
-                foreach (string guid in guids)
-                {
-                    if (referencingPaths.Count >= maxResults) break;
-                    if (processedGuids.Contains(guid)) continue;
-
-                    processedGuids.Add(guid);
-                    string assetPath = AssetDatabase.GUIDToAssetPath(guid);
-
-                    if (string.IsNullOrEmpty(assetPath) || assetPath == targetPath) continue;
-
-                    // 检查依赖关系
-                    string[] dependencies = AssetDatabase.GetDependencies(assetPath, includeIndirect);
-                    if (dependencies.Contains(targetPath))
-                    {
-                        referencingPaths.Add(assetPath);
-                    }
-                }
-            }
-        }
-
         private object GetAssetInfo(JsonClass args)
         {
             string path = args["path"]?.Value;
@@ -913,7 +854,8 @@ namespace UniMcp.Tools
         }
 
         /// <summary>
-        /// 获取文件夹结构（YAML格式）
+        /// 获取文件夹结构。读取缓存的文件夹树快照，只展开 path 以下 depth 层，
+        /// 每个文件夹附带直接和子树累计的文件数/大小；path 的子项按 offset/limit 分页，更深层每个文件夹最多 limit 项
         /// </summary>
         private object GetFolderStructure(JsonClass args)
         {
@@ -923,37 +865,50 @@ namespace UniMcp.Tools
                 if (string.IsNullOrEmpty(rootPath))
                     rootPath = "Assets";
 
-                const int maxDepth = 10; // 固定最大深度为10
+                int depth = Math.Max(0, args["depth"].AsIntDefault(1));
+                int offset = Math.Max(0, args["offset"].AsIntDefault(0));
+                int limit = Math.Max(1, args["limit"].AsIntDefault(200));
+                bool includeFiles = args["include_files"].AsBoolDefault(false);
+                bool yaml = string.Equals(args["format"]?.Value, "yaml", StringComparison.OrdinalIgnoreCase);
 
-                rootPath = SanitizeAssetPath(rootPath);
+                rootPath = SanitizeAssetPath(rootPath).TrimEnd('/');
 
                 if (!AssetDatabase.IsValidFolder(rootPath))
                 {
                     return Response.Error($"Path '{rootPath}' is not a valid folder.");
                 }
 
-                McpLogger.Log($"[ProjectOperate] Getting folder structure for: {rootPath}");
-
                 var startTime = System.DateTime.Now;
 
-                // 构建文件夹结构
-                var structure = BuildFolderStructure(rootPath, 0, maxDepth);
-
-                // 生成YAML格式字符串
-                var yamlBuilder = new System.Text.StringBuilder();
-                GenerateYamlStructure(structure, yamlBuilder, 0);
+                ProjectTreeCache.Folder folder = ProjectTreeCache.GetFolder(rootPath);
+                if (folder == null)
+                {
+                    return Response.Error($"Folder '{rootPath}' is not in the project tree snapshot yet.");
+                }
 
                 var duration = System.DateTime.Now - startTime;
 
+                if (yaml)
+                {
+                    var yamlBuilder = new System.Text.StringBuilder();
+                    GenerateYamlStructure(folder, yamlBuilder, 0, depth, limit);
+                    return Response.Success(
+                        $"Folder structure retrieved successfully in {duration.TotalMilliseconds:F0}ms.",
+                        new
+                        {
+                            rootPath = rootPath,
+                            yaml = yamlBuilder.ToString(),
+                            durationMs = duration.TotalMilliseconds,
+                            snapshotUpdated = ProjectTreeCache.UpdatedUtc.ToString("o")
+                        }
+                    );
+                }
+
+                JsonClass tree = BuildFolderNode(folder, depth, offset, limit, includeFiles);
+                tree["snapshot_updated"] = ProjectTreeCache.UpdatedUtc.ToString("o");
                 return Response.Success(
                     $"Folder structure retrieved successfully in {duration.TotalMilliseconds:F0}ms.",
-                    new
-                    {
-                        rootPath = rootPath,
-                        yaml = yamlBuilder.ToString(),
-                        durationMs = duration.TotalMilliseconds,
-                        timestamp = System.DateTime.Now.ToString("yyyy-MM-dd HH:mm:ss")
-                    }
+                    tree
                 );
             }
             catch (Exception e)
@@ -964,115 +919,97 @@ namespace UniMcp.Tools
         }
 
         /// <summary>
-        /// 递归构建文件夹结构
+        /// 构建文件夹节点：统计信息，以及 depth &gt; 0 时从 offset 起最多 limit 个子项（子文件夹在前，文件在后）
         /// </summary>
-        private FolderNode BuildFolderStructure(string folderPath, int currentDepth, int maxDepth)
+        private JsonClass BuildFolderNode(ProjectTreeCache.Folder folder, int depth, int offset, int limit, bool includeFiles)
         {
-            var node = new FolderNode
+            var node = new JsonClass
             {
-                Name = Path.GetFileName(folderPath),
-                Path = folderPath,
-                FileCount = 0,
-                SubFolders = new List<FolderNode>()
+                ["name"] = folder.Name,
+                ["path"] = folder.Path,
+                ["folders"] = folder.SubFolders.Count,
+                ["files"] = folder.FileNames.Count,
+                ["size"] = folder.Size,
+                ["total_folders"] = folder.TotalFolders,
+                ["total_files"] = folder.TotalFiles,
+                ["total_size"] = folder.TotalSize
             };
-
-            // 如果达到最大深度，不再递归
-            if (currentDepth >= maxDepth)
-            {
+            if (depth <= 0)
                 return node;
-            }
 
-            try
-            {
-                // 获取当前文件夹下的所有资产
-                string[] allGuids = AssetDatabase.FindAssets("", new[] { folderPath });
+            int folderCount = folder.SubFolders.Count;
+            int entryCount = folderCount + (includeFiles ? folder.FileNames.Count : 0);
+            int end = Math.Min(entryCount, offset + limit);
 
-                foreach (string guid in allGuids)
+            var children = new JsonArray();
+            for (int i = offset; i < end; i++)
+            {
+                if (i < folderCount)
                 {
-                    string assetPath = AssetDatabase.GUIDToAssetPath(guid);
-
-                    // 检查是否是当前文件夹的直接子项
-                    string parentDir = Path.GetDirectoryName(assetPath)?.Replace('\\', '/');
-                    if (parentDir != folderPath)
-                    {
-                        continue;
-                    }
-
-                    if (AssetDatabase.IsValidFolder(assetPath))
-                    {
-                        // 递归处理子文件夹
-                        var subFolder = BuildFolderStructure(assetPath, currentDepth + 1, maxDepth);
-                        node.SubFolders.Add(subFolder);
-                    }
-                    else
+                    children.Add(BuildFolderNode(folder.SubFolders[i], depth - 1, 0, limit, includeFiles));
+                }
+                else
+                {
+                    int fileIndex = i - folderCount;
+                    children.Add(new JsonClass
                     {
-                        // 统计文件数量（排除.meta文件）
-                        if (!assetPath.EndsWith(".meta"))
-                        {
-                            node.FileCount++;
-                        }
-                    }
+                        ["name"] = folder.FileNames[fileIndex],
+                        ["path"] = folder.Path + "/" + folder.FileNames[fileIndex],
+                        ["size"] = folder.FileSizes[fileIndex]
+                    });
                 }
-
-                // 按名称排序子文件夹
-                node.SubFolders = node.SubFolders.OrderBy(f => f.Name).ToList();
             }
-            catch (Exception ex)
+            node["children"] = children;
+            if (offset > 0)
+                node["offset"] = offset;
+            if (end < entryCount)
             {
-                Debug.LogWarning($"[BuildFolderStructure] Error processing folder '{folderPath}': {ex.Message}");
+                node["has_more"] = true;
+                node["next_offset"] = end;
             }
-
             return node;
         }
 
         /// <summary>
-        /// 生成YAML格式的文件夹结构字符串
+        /// 生成YAML格式的文件夹结构字符串（展开 depth 层，每个文件夹最多 limit 个子文件夹）
         /// </summary>
-        private void GenerateYamlStructure(FolderNode node, System.Text.StringBuilder builder, int indentLevel)
+        private void GenerateYamlStructure(ProjectTreeCache.Folder folder, System.Text.StringBuilder builder, int indentLevel, int depth, int limit)
         {
             string indent = new string(' ', indentLevel * 2);
+            int fileCount = folder.FileNames.Count;
 
             // 输出当前文件夹及其文件数量
             if (indentLevel == 0)
             {
                 // 根节点
-                builder.AppendLine($"{node.Name}:");
+                builder.AppendLine($"{folder.Name}:");
             }
-            else
+            else if (folder.SubFolders.Count > 0 && depth > 0)
             {
-                if (node.SubFolders.Count > 0)
+                // 有子文件夹，单独一行
+                builder.AppendLine($"{indent}{folder.Name}:");
+                if (fileCount > 0)
                 {
-                    // 有子文件夹，单独一行
-                    builder.AppendLine($"{indent}{node.Name}:");
-                    if (node.FileCount > 0)
-                    {
-                        builder.AppendLine($"{indent}  files: {node.FileCount}");
-                    }
-                }
-                else
-                {
-                    // 无子文件夹，直接输出文件数量
-                    builder.AppendLine($"{indent}{node.Name}: {node.FileCount}");
-                    return; // 无子文件夹，结束
+                    builder.AppendLine($"{indent}  files: {fileCount}");
                 }
             }
+            else
+            {
+                // 无子文件夹或不再展开，直接输出子树文件数量
+                builder.AppendLine($"{indent}{folder.Name}: {folder.TotalFiles}");
+                return;
+            }
 
             // 递归输出子文件夹
-            foreach (var subFolder in node.SubFolders)
+            int count = Math.Min(folder.SubFolders.Count, limit);
+            for (int i = 0; i < count; i++)
             {
-                GenerateYamlStructure(subFolder, builder, indentLevel + 1);
+                GenerateYamlStructure(folder.SubFolders[i], builder, indentLevel + 1, depth - 1, limit);
+            }
+            if (folder.SubFolders.Count > count)
+            {
+                builder.AppendLine($"{indent}  ...: {folder.SubFolders.Count - count} more folders");
             }
-        }
-
-        /// <summary>
-        /// 文件夹节点类，用于表示文件夹结构
-        /// </summary>
-        private class FolderNode
-        {
-            public string Name { get; set; }
-            public string Path { get; set; }
-            public int FileCount { get; set; }
-            public List<FolderNode> SubFolders { get; set; }
         }
 
         // --- Internal Helpers ---
@@ -1480,44 +1417,16 @@ namespace UniMcp.Tools
         }
 
         /// <summary>
-        /// Helper to find a Type by name, searching relevant assemblies.
+        /// Helper to find a Type by name through the shared type index.
         /// Needed for creating ScriptableObjects or finding component types by name.
         /// </summary>
         private Type FindType(string typeName)
         {
-            if (string.IsNullOrEmpty(typeName))
-                return null;
-
-            // Try direct lookup first (common Unity types often don't need assembly qualified name)
-            var type =
-                Type.GetType(typeName)
-                ?? Type.GetType($"UnityEngine.{typeName}, UnityEngine.CoreModule")
-                ?? Type.GetType($"UnityEngine.UI.{typeName}, UnityEngine.UI")
-                ?? Type.GetType($"UnityEditor.{typeName}, UnityEditor.CoreModule");
-
-            if (type != null)
+            if (TypeIndex.TryResolve(typeName, null, out Type type, out string error))
                 return type;
 
-            // If not found, search loaded assemblies (slower but more robust for user scripts)
-            foreach (var assembly in AppDomain.CurrentDomain.GetAssemblies())
-            {
-                // Look for non-namespaced first
-                type = assembly.GetType(typeName, false, true); // throwOnError=false, ignoreCase=true
-                if (type != null)
-                    return type;
-
-                // Check common namespaces if simple name given
-                type = assembly.GetType("UnityEngine." + typeName, false, true);
-                if (type != null)
-                    return type;
-                type = assembly.GetType("UnityEditor." + typeName, false, true);
-                if (type != null)
-                    return type;
-                // Add other likely namespaces if needed (e.g., specific plugins)
-            }
-
-            Debug.LogWarning($"[FindType] Type '{typeName}' not found in any loaded assembly.");
-            return null; // Not found
+            Debug.LogWarning($"[FindType] {error}");
+            return null;
         }
 
         // --- Data Serialization ---
@@ -13,6 +13,7 @@ namespace UniMcp.Tools
     /// 对应方法名: project_search
     /// </summary>
     [ToolName("project_search", "Project Management", "项目管理")]
+    [ReadOnlyActions]
     public class ProjectSearch : StateMethodBase
     {
         public override string Description => L.T("Search for assets and objects in the Project window", "在项目窗口中搜索资源和对象");
@@ -26,7 +27,7 @@ namespace UniMcp.Tools
             {
                 // Search type
                 new MethodStr("search_target", L.T("Search type", "搜索类型"))
-                    .SetEnumValues("asset", "folder", "script", "texture", "material", "prefab", "scene", "audio", "model"),
+                    .SetEnumValues("asset", "folder", "script", "texture", "material", "prefab", "scene", "audio", "model", "text", "suggest"),
                 
                 // Search keywords
                 new MethodStr("query", L.T("Search keywords", "搜索关键词"))
@@ -51,7 +52,18 @@ namespace UniMcp.Tools
                     .SetRange(1, 1000),
                 
                 // Include meta files
-                new MethodBool("include_meta", L.T("Include .meta files", "包含.meta文件"))
+                new MethodBool("include_meta", L.T("Include .meta files", "包含.meta文件")),
+
+                // Result detail
+                new MethodStr("detail", L.T("Result detail: metadata (default, built from path/GUID/type/file info/labels without loading assets) or full (loads each result to add instanceID and type-specific fields)", "结果详细程度：metadata（默认，仅由路径/GUID/类型/文件信息/标签构建，不加载资源）或 full（加载每个结果，附加instanceID和类型特定字段）"))
+                    .SetEnumValues("metadata", "full")
+                    .SetDefault("metadata"),
+
+                // Fuzzy matching
+                new MethodBool("fuzzy", L.T("Allow fuzzy (trigram) matches for text search, default true", "text搜索是否允许模糊（三元组）匹配，默认为true")),
+
+                // Indirect references
+                new MethodBool("include_indirect", L.T("Include indirect references (references search only), default false", "包含间接引用（仅references搜索），默认为false"))
             };
         }
 
@@ -74,6 +86,8 @@ namespace UniMcp.Tools
                      .Leaf("general", HandleGeneralSearch)
                      .Leaf("dependencies", HandleDependenciesSearch)
                      .Leaf("references", HandleReferencesSearch)
+                     .Leaf("text", HandleTextSearch)
+                     .Leaf("suggest", HandleSuggest)
                 .Build();
         }
 
@@ -173,6 +187,103 @@ namespace UniMcp.Tools
             return PerformSearch(args, null);
         }
 
+        /// <summary>
+        /// 基于资源搜索索引的全文/模糊搜索，结果按相关度排序。
+        /// query 可包含 t:Type、l:label 过滤，匹配名称、路径、类型、标签、asset_index 备注和脚本类型名
+        /// </summary>
+        private object HandleTextSearch(JsonClass args)
+        {
+            string searchTerm = args["query"]?.Value;
+            string searchPath = args["directory"]?.Value;
+            int maxResults = args["max_results"].AsIntDefault(100);
+            bool fuzzy = args["fuzzy"].AsBoolDefault(true);
+            bool loadAssets = IsFullDetail(args);
+
+            if (string.IsNullOrWhiteSpace(searchTerm))
+            {
+                return Response.Error("'query' parameter is required for text search");
+            }
+
+            string pathPrefix = null;
+            if (!string.IsNullOrEmpty(searchPath) && searchPath.TrimEnd('/') != "Assets")
+            {
+                searchPath = searchPath.Replace('\\', '/').Trim('/');
+                if (!searchPath.StartsWith("Assets/"))
+                    searchPath = "Assets/" + searchPath;
+                pathPrefix = searchPath + "/";
+            }
+
+            try
+            {
+                var hits = AssetSearchIndex.Search(searchTerm, maxResults, pathPrefix, fuzzy, out bool complete, out int totalMatches);
+
+                List<JsonClass> results = new List<JsonClass>();
+                foreach (var hit in hits)
+                {
+                    var assetInfo = GetAssetInfo(hit.Path, hit.Guid, loadAssets);
+                    if (assetInfo == null)
+                        continue;
+                    assetInfo["score"] = hit.Score;
+                    results.Add(assetInfo);
+                }
+
+                string message = $"Found {totalMatches} asset(s) matching '{searchTerm}' (showing {results.Count})";
+                if (!complete)
+                {
+                    message += " (search index is still building, results may be incomplete)";
+                }
+
+                var resultObj = new JsonClass
+                {
+                    ["query"] = searchTerm,
+                    ["directory"] = pathPrefix != null ? searchPath : "Assets",
+                    ["search_target"] = "text",
+                    ["total_results"] = totalMatches,
+                    ["max_results"] = maxResults,
+                    ["complete"] = complete,
+                    ["index"] = AssetSearchIndex.GetStatus(),
+                    ["results"] = Json.FromObject(results),
+                };
+                return Response.Success(message, resultObj);
+            }
+            catch (Exception ex)
+            {
+                return Response.Error($"Search failed: {ex.Message}");
+            }
+        }
+
+        /// <summary>
+        /// 词条前缀补全，返回以 query 开头的索引词条及其资源数
+        /// </summary>
+        private object HandleSuggest(JsonClass args)
+        {
+            string prefix = args["query"]?.Value;
+            int maxResults = args["max_results"].AsIntDefault(20);
+
+            if (string.IsNullOrWhiteSpace(prefix))
+            {
+                return Response.Error("'query' parameter is required for suggest");
+            }
+
+            var suggestions = new JsonArray();
+            foreach (var pair in AssetSearchIndex.Suggest(prefix, maxResults))
+            {
+                suggestions.Add(new JsonClass
+                {
+                    ["term"] = pair.Key,
+                    ["count"] = pair.Value
+                });
+            }
+
+            var resultObj = new JsonClass
+            {
+                ["query"] = prefix,
+                ["suggestions"] = suggestions,
+                ["index"] = AssetSearchIndex.GetStatus()
+            };
+            return Response.Success($"Found {suggestions.Count} completion(s) for '{prefix}'", resultObj);
+        }
+
         /// <summary>
         /// 执行搜索的主要实现
         /// </summary>
@@ -185,6 +296,7 @@ namespace UniMcp.Tools
             bool caseSensitive = args["case_sensitive"].AsBoolDefault(false);
             int maxResults = args["max_results"].AsIntDefault(100);
             bool includeMeta = args["include_meta"].AsBoolDefault(false);
+            bool loadAssets = IsFullDetail(args);
 
             // 验证搜索路径
             if (!searchPath.StartsWith("Assets/") && searchPath != "Assets")
@@ -244,12 +356,9 @@ namespace UniMcp.Tools
                     if (!includeMeta && assetPath.EndsWith(".meta"))
                         continue;
 
-                    // 获取资产对象
-                    UnityEngine.Object asset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(assetPath);
-                    if (asset != null)
+                    var assetInfo = GetAssetInfo(assetPath, guid, loadAssets);
+                    if (assetInfo != null)
                     {
-                        var assetInfo = GetAssetInfo(asset, assetPath, guid);
-                        // assetInfo本身是JObject，直接加入JArray
                         results.Add(assetInfo);
                     }
                 }
@@ -268,6 +377,7 @@ namespace UniMcp.Tools
                     ["search_target"] = searchType,
                     ["total_results"] = results.Count,
                     ["max_results"] = maxResults,
+                    ["detail"] = loadAssets ? "full" : "metadata",
                     ["results"] = Json.FromObject(results),
                 };
                 return Response.Success(message, resultObj);
@@ -296,19 +406,68 @@ namespace UniMcp.Tools
         }
 
         /// <summary>
-        /// 获取资产的详细信息
+        /// detail 参数是否要求加载资源
+        /// </summary>
+        private bool IsFullDetail(JsonClass args)
+        {
+            return string.Equals(args["detail"]?.Value, "full", StringComparison.OrdinalIgnoreCase);
+        }
+
+        /// <summary>
+        /// 获取资产信息。默认只使用元数据（路径、GUID、主资源类型、文件信息和 .meta 标签），不反序列化资源；
+        /// loadAsset 为 true 时加载资源并附加 instanceID 和类型特定字段。资源不存在时返回 null
         /// </summary>
-        private JsonClass GetAssetInfo(UnityEngine.Object asset, string assetPath, string guid)
+        private JsonClass GetAssetInfo(string assetPath, string guid, bool loadAsset)
         {
+            Type mainType = AssetDatabase.GetMainAssetTypeAtPath(assetPath);
+            if (mainType == null)
+                return null;
+
+            bool isFolder = AssetDatabase.IsValidFolder(assetPath);
             var info = new JsonClass
             {
-                ["name"] = asset.name,
+                ["name"] = isFolder ? System.IO.Path.GetFileName(assetPath) : System.IO.Path.GetFileNameWithoutExtension(assetPath),
                 ["path"] = assetPath,
                 ["guid"] = guid,
-                ["type"] = asset.GetType().Name,
-                ["instanceID"] = asset.GetInstanceID()
+                ["type"] = mainType.Name
             };
 
+            // 添加文件信息
+            try
+            {
+                if (isFolder)
+                {
+                    info["isFolder"] = true;
+                }
+                else
+                {
+                    var fileInfo = new System.IO.FileInfo(assetPath);
+                    info["fileSize"] = fileInfo.Length;
+                    info["lastModified"] = fileInfo.LastWriteTime.ToString("yyyy-MM-dd HH:mm:ss");
+                }
+            }
+            catch
+            {
+                // 忽略文件信息获取错误
+            }
+
+            string[] labels = AssetSearchIndex.ReadMetaLabels(assetPath);
+            if (labels.Length > 0)
+            {
+                info["labels"] = Json.FromObject(labels);
+            }
+
+            if (!loadAsset)
+                return info;
+
+            UnityEngine.Object asset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(assetPath);
+            if (asset == null)
+                return null;
+
+            info["name"] = asset.name;
+            info["type"] = asset.GetType().Name;
+            info["instanceID"] = asset.GetInstanceID();
+
             // 根据资产类型添加特定信息
             if (asset is Texture2D texture)
             {
@@ -344,25 +503,13 @@ namespace UniMcp.Tools
                 info["scriptableObjectType"] = scriptableObject.GetType().FullName;
             }
 
-            // 添加文件信息
-            try
-            {
-                var fileInfo = new System.IO.FileInfo(assetPath);
-                info["fileSize"] = fileInfo.Length;
-                info["lastModified"] = fileInfo.LastWriteTime.ToString("yyyy-MM-dd HH:mm:ss");
-            }
-            catch
-            {
-                // 忽略文件信息获取错误
-            }
-
             return info;
         }
 
         /// <summary>
-        /// 搜索特定类型的资产
+        /// 搜索特定类型的资产（先按 max_results 截断，再按需加载）
         /// </summary>
-        private object SearchByType<T>(string searchTerm, string searchPath, bool recursive, int maxResults) where T : UnityEngine.Object
+        private object SearchByType<T>(string searchTerm, string searchPath, bool recursive, int maxResults, bool loadAssets = false) where T : UnityEngine.Object
         {
             string[] guids = AssetDatabase.FindAssets($"t:{typeof(T).Name} {searchTerm}", new[] { searchPath });
             List<object> results = new List<object>();
@@ -376,10 +523,9 @@ namespace UniMcp.Tools
                 if (!IsInSearchPath(assetPath, searchPath, recursive))
                     continue;
 
-                T asset = AssetDatabase.LoadAssetAtPath<T>(assetPath);
-                if (asset != null)
+                var assetInfo = GetAssetInfo(assetPath, guid, loadAssets);
+                if (assetInfo != null)
                 {
-                    var assetInfo = GetAssetInfo(asset, assetPath, guid);
                     results.Add(assetInfo);
                 }
             }
@@ -395,6 +541,7 @@ namespace UniMcp.Tools
             string assetPath = args["query"]?.Value;
             bool recursive = args["recursive"].AsBoolDefault(true);
             int maxResults = args["max_results"].AsIntDefault(1000);
+            bool loadAssets = IsFullDetail(args);
 
             if (string.IsNullOrEmpty(assetPath))
             {
@@ -429,12 +576,9 @@ namespace UniMcp.Tools
                     if (depPath == assetPath)
                         continue;
 
-                    // 加载资产
-                    UnityEngine.Object asset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(depPath);
-                    if (asset != null)
+                    var depInfo = GetAssetInfo(depPath, AssetDatabase.AssetPathToGUID(depPath), loadAssets);
+                    if (depInfo != null)
                     {
-                        string guid = AssetDatabase.AssetPathToGUID(depPath);
-                        var depInfo = GetAssetInfo(asset, depPath, guid);
                         results.Add(depInfo);
                     }
                 }
@@ -460,7 +604,7 @@ namespace UniMcp.Tools
         }
 
         /// <summary>
-        /// 查找引用指定资源的所有资源
+        /// 查找引用指定资源的所有资源（使用持久化的反向依赖索引；索引只覆盖 Assets/，其他目录逐个扫描依赖）
         /// </summary>
         private object HandleReferencesSearch(JsonClass args)
         {
@@ -468,6 +612,8 @@ namespace UniMcp.Tools
             string searchPath = args["directory"]?.Value;
             if (string.IsNullOrEmpty(searchPath)) searchPath = "Assets";
             int maxResults = args["max_results"].AsIntDefault(1000);
+            bool includeIndirect = args["include_indirect"].AsBoolDefault(false);
+            bool loadAssets = IsFullDetail(args);
 
             if (string.IsNullOrEmpty(assetPath))
             {
@@ -479,6 +625,11 @@ namespace UniMcp.Tools
             {
                 assetPath = "Assets/" + assetPath.TrimStart('/');
             }
+            searchPath = searchPath.Replace('\\', '/').TrimEnd('/');
+            if (searchPath != "Assets" && !searchPath.StartsWith("Assets/") && !searchPath.StartsWith("Packages/"))
+            {
+                searchPath = "Assets/" + searchPath.TrimStart('/');
+            }
 
             try
             {
@@ -488,49 +639,56 @@ namespace UniMcp.Tools
                     return Response.Error($"Asset not found: {assetPath}");
                 }
 
-                // 获取目标资产的 GUID
-                string targetGuid = AssetDatabase.AssetPathToGUID(assetPath);
+                // 依赖索引只覆盖 Assets/，Packages/ 等目录退回逐个资源读取依赖
+                bool useIndex = searchPath == "Assets" || searchPath.StartsWith("Assets/");
+                bool complete = true;
+                IEnumerable<string> referencers;
+                if (useIndex)
+                {
+                    // 索引查询只与结果数量有关，目录过滤按路径前缀进行
+                    string prefix = searchPath + "/";
+                    referencers = AssetDependencyIndex.FindReferencers(assetPath, includeIndirect, 0, out complete)
+                        .Where(path => path.StartsWith(prefix, StringComparison.Ordinal));
+                }
+                else
+                {
+                    referencers = ScanReferencers(assetPath, searchPath, includeIndirect);
+                }
 
                 List<JsonClass> results = new List<JsonClass>();
-
-                // 搜索所有资产
-                string[] allAssetGuids = AssetDatabase.FindAssets("", new[] { searchPath });
-
-                foreach (string guid in allAssetGuids)
+                foreach (string checkedPath in referencers)
                 {
                     if (results.Count >= maxResults)
                         break;
-
-                    string checkedPath = AssetDatabase.GUIDToAssetPath(guid);
-
-                    // 跳过自身
                     if (checkedPath == assetPath)
                         continue;
 
-                    // 获取该资产的依赖项
-                    string[] dependencies = AssetDatabase.GetDependencies(checkedPath, false);
-
-                    // 检查是否依赖目标资产
-                    if (dependencies.Contains(assetPath))
+                    var refInfo = GetAssetInfo(checkedPath, AssetDatabase.AssetPathToGUID(checkedPath), loadAssets);
+                    if (refInfo != null)
                     {
-                        UnityEngine.Object asset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(checkedPath);
-                        if (asset != null)
-                        {
-                            var refInfo = GetAssetInfo(asset, checkedPath, guid);
-                            results.Add(refInfo);
-                        }
+                        results.Add(refInfo);
                     }
                 }
 
                 string message = $"Found {results.Count} assets referencing '{assetPath}' in '{searchPath}'";
+                if (!complete)
+                {
+                    message += " (dependency index is still building, results may be incomplete)";
+                }
 
                 var resultObj = new JsonClass
                 {
                     ["asset_path"] = assetPath,
                     ["search_directory"] = searchPath,
+                    ["include_indirect"] = includeIndirect,
                     ["total_references"] = results.Count,
+                    ["complete"] = complete,
                     ["references"] = Json.FromObject(results)
                 };
+                if (useIndex)
+                {
+                    resultObj["index"] = AssetDependencyIndex.GetStatus();
+                }
 
                 return Response.Success(message, resultObj);
             }
@@ -540,6 +698,21 @@ namespace UniMcp.Tools
             }
         }
 
+        /// <summary>
+        /// 逐个读取目录下资源的依赖，按需返回引用了目标资源的资源路径（用于依赖索引未覆盖的目录）
+        /// </summary>
+        private static IEnumerable<string> ScanReferencers(string assetPath, string searchPath, bool includeIndirect)
+        {
+            foreach (string guid in AssetDatabase.FindAssets("", new[] { searchPath }))
+            {
+                string checkedPath = AssetDatabase.GUIDToAssetPath(guid);
+                if (checkedPath == assetPath || AssetDatabase.IsValidFolder(checkedPath))
+                    continue;
+                if (Array.IndexOf(AssetDatabase.GetDependencies(checkedPath, includeIndirect), assetPath) >= 0)
+                    yield return checkedPath;
+            }
+        }
+
 
     }
 }
\ No newline at end of file
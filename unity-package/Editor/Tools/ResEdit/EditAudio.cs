@@ -30,7 +30,7 @@ namespace UniMcp.Tools
                     .SetEnumValues("import", "modify", "duplicate", "delete", "get_info", "search", "set_import_settings", "convert_format", "extract_metadata"),
                 
                 // 音频路径
-                new MethodStr("path", L.T("Audio asset path", "音频资源路径"), false)
+                new MethodStr("path", L.T("Audio asset path (not needed for set_import_settings in bulk mode with glob/asset_query)", "音频资源路径（set_import_settings批量模式使用glob/asset_query时不需要）"))
                     .AddExample("Assets/Audio/music.wav"),
                 
                 // 源文件路径
@@ -114,7 +114,7 @@ namespace UniMcp.Tools
                 // 资源包变体
                 new MethodStr("asset_bundle_variant", L.T("Asset bundle variant", "资源包变体"))
                     .AddExample("hd")
-            };
+            }.Concat(ImportSettingsBatch.CreateKeys()).ToArray();
         }
 
         /// <summary>
@@ -449,10 +449,12 @@ namespace UniMcp.Tools
             string path = args["path"]?.Value;
             JsonClass importSettings = args["import_settings"] as JsonClass;
 
-            if (string.IsNullOrEmpty(path))
-                return Response.Error("'path' is required for set_import_settings.");
             if (importSettings == null || importSettings.Count == 0)
                 return Response.Error("'import_settings' are required for set_import_settings.");
+            if (ImportSettingsBatch.IsBulk(args))
+                return ImportSettingsBatch.Run<AudioImporter>(args, "t:AudioClip", "set_import_settings", importer => ApplyAudioImportSettings(importer, importSettings));
+            if (string.IsNullOrEmpty(path))
+                return Response.Error("'path' is required for set_import_settings.");
 
             return SetAudioImportSettings(path, importSettings);
         }
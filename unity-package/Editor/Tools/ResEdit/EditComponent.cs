@@ -17,10 +17,22 @@ namespace UniMcp.Tools
     /// 对应方法名: edit_component
     /// </summary>
     [ToolName("edit_component", "Resource Management", "资源管理")]
+    [ReadOnlyActions("action", "get_component_propertys")]
     public class EditComponent : DualStateMethodBase
     {
         public override string Description => L.T("Manage GameObject components including get and set properties", "管理游戏对象组件，包括获取和设置属性");
 
+        /// <summary>
+        /// 只有设置 parent（移动对象）、name、tag（组件上的这两个属性会改写所属GameObject）时影响层级索引
+        /// </summary>
+        protected override bool ModifiesHierarchy(JsonClass args)
+        {
+            if (args["action"]?.Value != "set_component_propertys")
+                return false;
+            var properties = args["properties"] as JsonClass;
+            return properties != null && (!properties["parent"].IsNull() || !properties["name"].IsNull() || !properties["tag"].IsNull());
+        }
+
         /// <summary>
         /// 目标查找
         /// </summary>
@@ -39,6 +51,10 @@ namespace UniMcp.Tools
                 // 目标查找参数 - 层次结构路径
                 new MethodStr("path", L.T("GameObject path in hierarchy", "GameObject在层次结构中的路径"), false)
                     .AddExample("UI/Canvas/Button"),
+
+                // 目标查找参数 - 多个目标
+                new MethodArr("targets", L.T("Apply the action to multiple GameObjects: instance IDs, hierarchy paths (supports * and ? wildcards) or hierarchy_search query objects like {\"query\": \"t:Light\"}", "对多个GameObject执行操作：实例ID、层级路径（支持*和?通配符）或 hierarchy_search 查询对象，如 {\"query\": \"t:Light\"}"))
+                    .AddExample("-2524", "\"Enemies/*\""),
                 
                 // 操作类型 - 枚举
                 new MethodStr("action", L.T("Action type", "操作类型"))
@@ -66,11 +82,11 @@ namespace UniMcp.Tools
         }
 
         /// <summary>
-        /// 创建目标定位状态树（使用GameObjectSelector）
+        /// 创建目标定位状态树（使用GameObjectSelector，提供 targets 时解析多个目标）
         /// </summary>
         protected override StateTree CreateTargetTree()
         {
-            objectSelector = objectSelector ?? new HierarchySelector<GameObject>();
+            objectSelector = objectSelector ?? new HierarchyTargetsSelector(new HierarchySelector<GameObject>());
             return objectSelector.BuildStateTree();
         }
 
@@ -127,6 +143,20 @@ namespace UniMcp.Tools
             return null;
         }
 
+        /// <summary>
+        /// 通过 targets 参数解析出多个目标时返回 true
+        /// </summary>
+        private bool TryExtractTargetsFromContext(StateTreeContext context, out GameObject[] targets)
+        {
+            targets = null;
+            if (context.TryGetObjectReference("_resolved_targets", out object targetsObj) && targetsObj is GameObject[] gameObjectArray)
+            {
+                targets = gameObjectArray;
+                return true;
+            }
+            return false;
+        }
+
 
 
         #region 组件操作Action Handlers
@@ -136,6 +166,11 @@ namespace UniMcp.Tools
         /// </summary>
         private object HandleGetComponentPropertysAction(StateTreeContext args)
         {
+            if (TryExtractTargetsFromContext(args, out GameObject[] targets))
+            {
+                return GetComponentPropertysFromTargets(args, targets);
+            }
+
             GameObject target = ExtractTargetFromContext(args);
             if (target == null)
             {
@@ -150,6 +185,11 @@ namespace UniMcp.Tools
         /// </summary>
         private object HandleSetComponentPropertysAction(StateTreeContext args)
         {
+            if (TryExtractTargetsFromContext(args, out GameObject[] targets))
+            {
+                return SetComponentPropertysOnTargets(args, targets);
+            }
+
             GameObject target = ExtractTargetFromContext(args);
             if (target == null)
             {
@@ -201,75 +241,7 @@ namespace UniMcp.Tools
                 }
 
                 // 获取组件的所有字段和属性
-                Type componentType = targetComponent.GetType();
-                BindingFlags flags = BindingFlags.Public | BindingFlags.Instance;
-
-                var propertiesDict = new Dictionary<string, object>();
-
-                // 定义要跳过的属性名称（Unity组件快捷访问器和不常用属性）
-                var skipProperties = new HashSet<string>
-                {
-                    "hideFlags", "rigidbody", "rigidbody2D", "camera", "light", "animation",
-                    "constantForce", "renderer", "audio", "networkView", "collider", "collider2D",
-                    "hingeJoint", "particleSystem", "gameObject", "transform", "tag", "name",
-                    "worldToLocalMatrix", "localToWorldMatrix", "isPartOfStaticBatch",
-                    // 跳过会导致实例化的属性（避免副作用）
-                    "material", "materials", "mesh"  // 使用 sharedMaterial, sharedMaterials, sharedMesh 代替
-                };
-
-                // 1. 获取所有公共属性 (Properties)
-                PropertyInfo[] properties = componentType.GetProperties(flags);
-                if (properties != null)
-                {
-                    foreach (PropertyInfo prop in properties)
-                    {
-                        // 跳过黑名单中的属性
-                        if (skipProperties.Contains(prop.Name)) continue;
-
-                        // 只获取可读的、可写的属性（排除只读属性和索引器）
-                        if (prop.CanRead && prop.CanWrite && !prop.GetIndexParameters().Any())
-                        {
-                            try
-                            {
-                                object value = prop.GetValue(targetComponent, null);
-                                propertiesDict[prop.Name] = ConvertToSerializableValue(value);
-                            }
-                            catch (Exception ex)
-                            {
-                                Debug.LogWarning($"[GetComponentPropertysFromTarget] Failed to get property '{prop.Name}': {ex.Message}");
-                                // 不添加错误信息到结果中
-                            }
-                        }
-                    }
-                }
-
-                // 2. 获取所有字段 (Fields) - 包括 SerializeField
-                FieldInfo[] fields = componentType.GetFields(BindingFlags.Public | BindingFlags.NonPublic | BindingFlags.Instance);
-                if (fields != null)
-                {
-                    foreach (FieldInfo field in fields)
-                    {
-                        // 检查字段是否可序列化
-                        // 条件1: public字段
-                        // 条件2: 带有SerializeField特性的非public字段
-                        bool isSerializable = field.IsPublic ||
-                                             field.GetCustomAttributes(typeof(SerializeField), true).Length > 0;
-
-                        if (isSerializable && !propertiesDict.ContainsKey(field.Name)) // 避免重复
-                        {
-                            try
-                            {
-                                object value = field.GetValue(targetComponent);
-                                propertiesDict[field.Name] = ConvertToSerializableValue(value);
-                            }
-                            catch (Exception ex)
-                            {
-                                Debug.LogWarning($"[GetComponentPropertysFromTarget] Failed to get field '{field.Name}': {ex.Message}");
-                                // 不添加错误信息到结果中
-                            }
-                        }
-                    }
-                }
+                var propertiesDict = CollectComponentProperties(targetComponent);
 
                 // 如果没有任何可访问的属性或字段
                 if (propertiesDict.Count == 0)
@@ -340,32 +312,9 @@ namespace UniMcp.Tools
             }
 
             // 获取要设置的属性字典
-            if (!cmd.TryGetValue("properties", out object propertiesObj) || propertiesObj == null)
-            {
-                return Response.Error("'properties' parameter is required for setting component properties.");
-            }
-
-            JsonClass propertiesToSet = null;
-            if (propertiesObj is JsonClass jObj)
-            {
-                propertiesToSet = jObj;
-            }
-            else
-            {
-                // 尝试从其他格式转换
-                try
-                {
-                    propertiesToSet = Json.FromObject(propertiesObj) as JsonClass;
-                }
-                catch (Exception ex)
-                {
-                    return Response.Error($"Failed to parse 'properties' parameter: {ex.Message}");
-                }
-            }
-
-            if (propertiesToSet == null || propertiesToSet.Count == 0)
+            if (!TryGetPropertiesArgument(cmd, out JsonClass propertiesToSet, out object propertiesError))
             {
-                return Response.Error("'properties' dictionary cannot be empty.");
+                return propertiesError;
             }
 
             Undo.RecordObject(targetComponent, "Set Component Properties");
@@ -435,10 +384,296 @@ namespace UniMcp.Tools
 
 
 
+        /// <summary>
+        /// 获取多个目标上同一组件的属性，返回每个目标的状态
+        /// </summary>
+        private object GetComponentPropertysFromTargets(StateTreeContext cmd, GameObject[] targets)
+        {
+            if (!cmd.TryGetValue("component_type", out object compNameObj) || compNameObj == null)
+            {
+                return Response.Error("'component_type' parameter is required.");
+            }
+
+            string compName = compNameObj.ToString();
+            if (!TypeIndex.TryResolve(compName, typeof(Component), out Type componentType, out string typeError))
+            {
+                return Response.Error(typeError);
+            }
+
+            var results = new JsonArray();
+            int successCount = 0;
+            foreach (GameObject targetGo in targets)
+            {
+                JsonClass entry = CreateTargetStatus(targetGo);
+                Component component = targetGo.GetComponent(componentType);
+                if (component == null)
+                {
+                    entry["status"] = "missing_component";
+                }
+                else
+                {
+                    entry["status"] = "ok";
+                    entry["properties"] = ConvertDictionaryToYaml(CollectComponentProperties(component));
+                    successCount++;
+                }
+                results.Add(entry);
+            }
+
+            return CreateTargetsResponse($"Retrieved component '{compName}' properties from {successCount} of {targets.Length} GameObject(s).",
+                cmd, compName, targets.Length, successCount, results);
+        }
+
+        /// <summary>
+        /// 在多个目标上设置同一组件的属性。组件类型和各属性的成员路径只解析一次，
+        /// 可在目标间共享的属性值（值类型、字符串、资源引用）只转换一次，所有修改合并为一个 Undo 步骤
+        /// </summary>
+        private object SetComponentPropertysOnTargets(StateTreeContext cmd, GameObject[] targets)
+        {
+            if (!cmd.TryGetValue("component_type", out object compNameObj) || compNameObj == null)
+            {
+                return Response.Error("'component_type' parameter is required.");
+            }
+
+            string compName = compNameObj.ToString();
+            if (!TypeIndex.TryResolve(compName, typeof(Component), out Type componentType, out string typeError))
+            {
+                return Response.Error(typeError);
+            }
+
+            if (!TryGetPropertiesArgument(cmd, out JsonClass propertiesToSet, out object propertiesError))
+            {
+                return propertiesError;
+            }
+
+            var properties = new List<PreparedProperty>();
+            foreach (var prop in propertiesToSet.AsEnumerable())
+            {
+                properties.Add(PrepareProperty(componentType, prop.Key, prop.Value));
+            }
+
+            var components = new Component[targets.Length];
+            var recorded = new List<UnityEngine.Object>();
+            for (int i = 0; i < targets.Length; i++)
+            {
+                components[i] = targets[i].GetComponent(componentType);
+                if (components[i] != null)
+                    recorded.Add(components[i]);
+            }
+
+            var results = new JsonArray();
+            int successCount = 0;
+            using (new UndoGroupScope($"Set {componentType.Name} Properties on {recorded.Count} Objects"))
+            {
+                Undo.RecordObjects(recorded.ToArray(), "Set Component Properties");
+
+                for (int i = 0; i < targets.Length; i++)
+                {
+                    JsonClass entry = CreateTargetStatus(targets[i]);
+                    results.Add(entry);
+
+                    Component component = components[i];
+                    if (component == null)
+                    {
+                        entry["status"] = "missing_component";
+                        continue;
+                    }
+
+                    var errors = new JsonArray();
+                    foreach (PreparedProperty property in properties)
+                    {
+                        try
+                        {
+                            string error;
+                            bool set = property.HasRawValue
+                                ? property.Member.TrySetRawValue(component, property.RawValue, out error)
+                                : SetComponentProperty(component, property.Name, property.Value, out error);
+                            if (!set)
+                                errors.Add($"{property.Name}: {error}");
+                        }
+                        catch (Exception e)
+                        {
+                            errors.Add($"{property.Name}: {e.Message}");
+                        }
+                    }
+
+                    EditorUtility.SetDirty(component);
+                    if (errors.Count == 0)
+                    {
+                        entry["status"] = "ok";
+                        successCount++;
+                    }
+                    else
+                    {
+                        entry["status"] = errors.Count < properties.Count ? "partial" : "failed";
+                        entry["errors"] = errors;
+                    }
+                }
+            }
+
+            return CreateTargetsResponse($"Set {properties.Count} properties of component '{compName}' on {successCount} of {targets.Length} GameObject(s).",
+                cmd, compName, targets.Length, successCount, results);
+        }
+
+        /// <summary>
+        /// 多目标操作的响应：每个目标一条状态，未匹配到对象的 targets 元素单独列出
+        /// </summary>
+        private object CreateTargetsResponse(string message, StateTreeContext cmd, string compName, int totalCount, int successCount, JsonArray results)
+        {
+            var data = new JsonClass
+            {
+                ["component_type"] = compName,
+                ["total_targets"] = totalCount,
+                ["succeeded"] = successCount,
+                ["failed"] = totalCount - successCount,
+                ["results"] = results
+            };
+
+            if (cmd.TryGetObjectReference(HierarchyTargetsSelector.UnmatchedTargetsKey, out List<string> unmatched) && unmatched.Count > 0)
+            {
+                var unmatchedArray = new JsonArray();
+                foreach (string item in unmatched)
+                    unmatchedArray.Add(item);
+                data["unmatched_targets"] = unmatchedArray;
+            }
+
+            return successCount > 0 ? Response.Success(message, data) : Response.Error(message, data);
+        }
+
+        private static JsonClass CreateTargetStatus(GameObject targetGo)
+        {
+            return new JsonClass
+            {
+                ["instance_id"] = targetGo.GetInstanceID(),
+                ["name"] = targetGo.name
+            };
+        }
+
         #endregion
 
         #region 组件辅助方法
 
+        /// <summary>
+        /// 预先解析的待设置属性
+        /// </summary>
+        private sealed class PreparedProperty
+        {
+            public string Name;
+            public JsonNode Value;
+            public MemberPath Member;
+            public object RawValue;
+            public bool HasRawValue;
+        }
+
+        /// <summary>
+        /// 按组件类型解析属性的成员路径并转换一次属性值。
+        /// 只有值类型、字符串和 Unity 对象引用会被共享；数组、列表等引用类型需要每个目标各自一份，
+        /// 与材质着色器属性和序列化回退一样逐个目标设置
+        /// </summary>
+        private PreparedProperty PrepareProperty(Type componentType, string name, JsonNode value)
+        {
+            var property = new PreparedProperty { Name = name, Value = value };
+            if (name.Contains("._"))
+                return property;
+
+            MemberPath member = MemberAccessorCache.Get(componentType, name);
+            Type valueType = member.ValueType;
+            if (valueType == null)
+                return property;
+
+            bool shareable = valueType.IsValueType || valueType == typeof(string) || typeof(UnityEngine.Object).IsAssignableFrom(valueType);
+            if (!shareable || value == null || value.IsNull())
+                return property;
+
+            object rawValue = JsonValueConverter.Convert(value, valueType);
+            if (rawValue != null)
+            {
+                property.Member = member;
+                property.RawValue = rawValue;
+                property.HasRawValue = true;
+            }
+            return property;
+        }
+
+        /// <summary>
+        /// 读取 properties 参数，缺失、无法解析或为空时返回错误响应
+        /// </summary>
+        private bool TryGetPropertiesArgument(StateTreeContext cmd, out JsonClass propertiesToSet, out object error)
+        {
+            propertiesToSet = null;
+            error = null;
+            if (!cmd.TryGetValue("properties", out object propertiesObj) || propertiesObj == null)
+            {
+                error = Response.Error("'properties' parameter is required for setting component properties.");
+                return false;
+            }
+
+            if (propertiesObj is JsonClass jObj)
+            {
+                propertiesToSet = jObj;
+            }
+            else
+            {
+                // 尝试从其他格式转换
+                try
+                {
+                    propertiesToSet = Json.FromObject(propertiesObj) as JsonClass;
+                }
+                catch (Exception ex)
+                {
+                    error = Response.Error($"Failed to parse 'properties' parameter: {ex.Message}");
+                    return false;
+                }
+            }
+
+            if (propertiesToSet == null || propertiesToSet.Count == 0)
+            {
+                error = Response.Error("'properties' dictionary cannot be empty.");
+                return false;
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// 收集组件上Inspector可见的属性值（跳过快捷访问器和会导致实例化的属性）
+        /// </summary>
+        private Dictionary<string, object> CollectComponentProperties(Component targetComponent)
+        {
+            Type componentType = targetComponent.GetType();
+            var propertiesDict = new Dictionary<string, object>();
+
+            // 定义要跳过的属性名称（Unity组件快捷访问器和不常用属性）
+            var skipProperties = new HashSet<string>
+            {
+                "hideFlags", "rigidbody", "rigidbody2D", "camera", "light", "animation",
+                "constantForce", "renderer", "audio", "networkView", "collider", "collider2D",
+                "hingeJoint", "particleSystem", "gameObject", "transform", "tag", "name",
+                "worldToLocalMatrix", "localToWorldMatrix", "isPartOfStaticBatch",
+                // 跳过会导致实例化的属性（避免副作用）
+                "material", "materials", "mesh"  // 使用 sharedMaterial, sharedMaterials, sharedMesh 代替
+            };
+
+            // 可读写的公共属性在前，可序列化字段（public 或 [SerializeField]）在后，成员列表和读取委托按类型缓存
+            foreach (MemberPath member in MemberAccessorCache.GetReadableMembers(componentType))
+            {
+                // 跳过黑名单中的属性
+                if (skipProperties.Contains(member.Name)) continue;
+
+                try
+                {
+                    if (member.TryGetValue(targetComponent, out object value, out string getError))
+                        propertiesDict[member.Name] = ConvertToSerializableValue(value);
+                    else
+                        Debug.LogWarning($"[GetComponentPropertysFromTarget] Failed to get '{member.Name}': {getError}");
+                }
+                catch (Exception ex)
+                {
+                    Debug.LogWarning($"[GetComponentPropertysFromTarget] Failed to get '{member.Name}': {ex.Message}");
+                    // 不添加错误信息到结果中
+                }
+            }
+            return propertiesDict;
+        }
+
         /// <summary>
         /// 获取组件所有可设置的属性和可序列化字段列表
         /// </summary>
@@ -448,7 +683,6 @@ namespace UniMcp.Tools
             if (component == null) return settableMembers;
 
             Type componentType = component.GetType();
-            BindingFlags flags = BindingFlags.Public | BindingFlags.Instance;
 
             // 定义要跳过的属性名称（Unity组件快捷访问器和不常用属性）
             var skipProperties = new HashSet<string>
@@ -463,40 +697,13 @@ namespace UniMcp.Tools
 
             try
             {
-                // 1. 获取所有可写的公共属性 (Properties)
-                PropertyInfo[] properties = componentType.GetProperties(flags);
-                if (properties != null)
-                {
-                    foreach (PropertyInfo prop in properties)
-                    {
-                        // 跳过黑名单中的属性
-                        if (skipProperties.Contains(prop.Name)) continue;
-
-                        // 只获取可读的、可写的属性（排除只读属性和索引器）
-                        if (prop.CanRead && prop.CanWrite && !prop.GetIndexParameters().Any())
-                        {
-                            settableMembers.Add($"{prop.Name} (Property, {prop.PropertyType.Name})");
-                        }
-                    }
-                }
-
-                // 2. 获取所有可序列化字段 (Fields) - 包括 SerializeField
-                FieldInfo[] fields = componentType.GetFields(BindingFlags.Public | BindingFlags.NonPublic | BindingFlags.Instance);
-                if (fields != null)
+                foreach (MemberPath member in MemberAccessorCache.GetReadableMembers(componentType))
                 {
-                    foreach (FieldInfo field in fields)
-                    {
-                        // 检查字段是否可序列化
-                        // 条件1: public字段
-                        // 条件2: 带有SerializeField特性的非public字段
-                        bool isSerializable = field.IsPublic ||
-                                             field.GetCustomAttributes(typeof(SerializeField), true).Length > 0;
+                    // 跳过黑名单中的属性
+                    if (skipProperties.Contains(member.Name)) continue;
 
-                        if (isSerializable && !settableMembers.Any(m => m.StartsWith(field.Name + " "))) // 避免重复
-                        {
-                            settableMembers.Add($"{field.Name} (Field, {field.FieldType.Name})");
-                        }
-                    }
+                    string kind = member.IsField ? "Field" : "Property";
+                    settableMembers.Add($"{member.Name} ({kind}, {member.ValueType.Name})");
                 }
             }
             catch (Exception ex)
@@ -701,173 +908,65 @@ namespace UniMcp.Tools
         }
 
         /// <summary>
-        /// 获取组件属性值
+        /// 获取组件属性值，支持嵌套路径（如 "center.x"、"sharedMaterials[0].name"）
         /// </summary>
         private object GetComponentProperty(Component component, string propertyName)
         {
-            Type type = component.GetType();
-            BindingFlags flags = BindingFlags.Public | BindingFlags.Instance | BindingFlags.IgnoreCase;
-
+            MemberPath memberPath = MemberAccessorCache.Get(component.GetType(), propertyName);
             try
             {
-                // 处理嵌套属性（点符号分隔）
-                if (propertyName.Contains('.') || propertyName.Contains('['))
-                {
-                    return GetNestedProperty(component, propertyName);
-                }
-
-                PropertyInfo propInfo = type.GetProperty(propertyName, flags);
-                if (propInfo != null && propInfo.CanRead)
-                {
-                    return propInfo.GetValue(component);
-                }
-                else
-                {
-                    FieldInfo fieldInfo = type.GetField(propertyName, flags);
-                    if (fieldInfo != null)
-                    {
-                        return fieldInfo.GetValue(component);
-                    }
-                }
+                if (memberPath.TryGetValue(component, out object value, out string error))
+                    return value;
+                Debug.LogError($"[GetComponentProperty] Failed to get '{propertyName}' from {component.GetType().Name}: {error}");
             }
             catch (Exception ex)
             {
-                Debug.LogError($"[GetComponentProperty] Failed to get '{propertyName}' from {type.Name}: {ex.Message}");
+                Debug.LogError($"[GetComponentProperty] Failed to get '{propertyName}' from {component.GetType().Name}: {ex.Message}");
             }
             return null;
         }
 
         /// <summary>
-        /// 获取嵌套属性值
-        /// </summary>
-        private object GetNestedProperty(object target, string path)
-        {
-            try
-            {
-                string[] pathParts = SplitPropertyPath(path);
-                if (pathParts.Length == 0) return null;
-
-                object currentObject = target;
-                Type currentType = currentObject.GetType();
-                BindingFlags flags = BindingFlags.Public | BindingFlags.Instance | BindingFlags.IgnoreCase;
-
-                for (int i = 0; i < pathParts.Length; i++)
-                {
-                    string part = pathParts[i];
-                    bool isArray = false;
-                    int arrayIndex = -1;
-
-                    if (part.Contains("["))
-                    {
-                        int startBracket = part.IndexOf('[');
-                        int endBracket = part.IndexOf(']');
-                        if (startBracket > 0 && endBracket > startBracket)
-                        {
-                            string indexStr = part.Substring(startBracket + 1, endBracket - startBracket - 1);
-                            if (int.TryParse(indexStr, out arrayIndex))
-                            {
-                                isArray = true;
-                                part = part.Substring(0, startBracket);
-                            }
-                        }
-                    }
-
-                    PropertyInfo propInfo = currentType.GetProperty(part, flags);
-                    FieldInfo fieldInfo = null;
-                    if (propInfo == null)
-                    {
-                        fieldInfo = currentType.GetField(part, flags);
-                        if (fieldInfo == null) return null;
-                    }
-
-                    currentObject = propInfo != null ? propInfo.GetValue(currentObject) : fieldInfo.GetValue(currentObject);
-                    if (currentObject == null) return null;
-
-                    if (isArray)
-                    {
-                        if (currentObject is System.Collections.IList list)
-                        {
-                            if (arrayIndex < 0 || arrayIndex >= list.Count) return null;
-                            currentObject = list[arrayIndex];
-                        }
-                        else return null;
-                    }
-
-                    currentType = currentObject.GetType();
-                }
-
-                return currentObject;
-            }
-            catch (Exception ex)
-            {
-                Debug.LogError($"[GetNestedProperty] Error getting nested property '{path}': {ex.Message}");
-                return null;
-            }
-        }
-
-        /// <summary>
-        /// Helper to set a property or field via reflection, handling basic types.
+        /// Sets a property or field through the cached member path accessors.
+        /// Supports dot notation (e.g., "center.x", "material.color") and array access (e.g., "sharedMaterials[0]");
+        /// struct members are written back along the path. Falls back to SerializedProperty for serialized
+        /// members that are not publicly accessible (e.g., "m_Speed").
         /// </summary>
         private bool SetComponentProperty(object target, string memberName, JsonNode value, out string error)
         {
             Type type = target.GetType();
-            BindingFlags flags =
-                BindingFlags.Public | BindingFlags.Instance | BindingFlags.IgnoreCase;
-
             string targetName = GetSafeObjectName(target);
 
             try
             {
-                // Handle special case for materials with dot notation (material.property)
-                // Examples: material.color, sharedMaterial.color, materials[0].color
-                if (memberName.Contains('.') || memberName.Contains('['))
+                // Shader properties on materials: material._Color, sharedMaterials[0]._MainTex
+                int lastDot = memberName.LastIndexOf('.');
+                if (lastDot > 0 && lastDot < memberName.Length - 1 && memberName[lastDot + 1] == '_')
                 {
-                    return SetNestedProperty(target, memberName, value, out error);
+                    MemberPath holderPath = MemberAccessorCache.Get(type, memberName.Substring(0, lastDot));
+                    if (holderPath.GetValue(target) is Material material)
+                    {
+                        return SetMaterialShaderProperty(material, memberName.Substring(lastDot + 1), value, out error);
+                    }
                 }
 
-                // Try to find and set a field first
-                FieldInfo fieldInfo = type.GetField(memberName, flags);
-                if (fieldInfo != null)
+                MemberPath memberPath = MemberAccessorCache.Get(type, memberName);
+                if (memberPath.IsValid)
                 {
-                    object convertedValue = ConvertJTokenToType(value, fieldInfo.FieldType);
-                    if (convertedValue != null || fieldInfo.FieldType.IsClass)
-                    {
-                        fieldInfo.SetValue(target, convertedValue);
-                        error = null;
+                    if (memberPath.TrySetValue(target, value, out error))
                         return true;
-                    }
-                    else
-                    {
-                        error = $"Failed to convert value for '{memberName}' on {targetName} ({type.Name})";
-                        return false;
-                    }
+                    error = $"{error} ('{memberName}' on {targetName} ({type.Name}))";
+                    return false;
                 }
 
-                // If field not found, try to find and set a property
-                PropertyInfo propertyInfo = type.GetProperty(memberName, flags);
-                if (propertyInfo != null)
+                if (target is UnityEngine.Object unityObject &&
+                    MemberAccessorCache.TrySetSerialized(unityObject, memberName, value, out _))
                 {
-                    if (!propertyInfo.CanWrite)
-                    {
-                        error = $"Property '{memberName}' on {targetName} ({type.Name}) is read-only";
-                        return false;
-                    }
-
-                    object convertedValue = ConvertJTokenToType(value, propertyInfo.PropertyType);
-                    if (convertedValue != null || propertyInfo.PropertyType.IsClass)
-                    {
-                        propertyInfo.SetValue(target, convertedValue);
-                        error = null;
-                        return true;
-                    }
-                    else
-                    {
-                        error = $"Failed to convert value for '{memberName}' on {targetName} ({type.Name})";
-                        return false;
-                    }
+                    error = null;
+                    return true;
                 }
 
-                error = $"Field or Property '{memberName}' not found on {targetName} ({type.Name})";
+                error = $"Field or Property '{memberName}' not found on {targetName} ({type.Name}): {memberPath.Error}";
                 return false;
             }
             catch (Exception ex)
@@ -878,139 +977,6 @@ namespace UniMcp.Tools
             return false;
         }
 
-        /// <summary>
-        /// Sets a nested property using dot notation (e.g., "material.color") or array access (e.g., "materials[0]")
-        /// </summary>
-        private bool SetNestedProperty(object target, string path, JsonNode value, out string error)
-        {
-            string targetName = GetSafeObjectName(target);
-
-            try
-            {
-                // Split the path into parts (handling both dot notation and array indexing)
-                string[] pathParts = SplitPropertyPath(path);
-                if (pathParts.Length == 0)
-                {
-                    error = "Path parts length is 0";
-                    return false;
-                }
-
-                object currentObject = target;
-                Type currentType = currentObject.GetType();
-                BindingFlags flags =
-                    BindingFlags.Public | BindingFlags.Instance | BindingFlags.IgnoreCase;
-
-                // Traverse the path until we reach the final property
-                for (int i = 0; i < pathParts.Length - 1; i++)
-                {
-                    string part = pathParts[i];
-                    bool isArray = false;
-                    int arrayIndex = -1;
-
-                    // Check if this part contains array indexing
-                    if (part.Contains("["))
-                    {
-                        int startBracket = part.IndexOf('[');
-                        int endBracket = part.IndexOf(']');
-                        if (startBracket > 0 && endBracket > startBracket)
-                        {
-                            string indexStr = part.Substring(
-                                startBracket + 1,
-                                endBracket - startBracket - 1
-                            );
-                            if (int.TryParse(indexStr, out arrayIndex))
-                            {
-                                isArray = true;
-                                part = part.Substring(0, startBracket);
-                            }
-                        }
-                    }
-
-                    // Get the property/field
-                    if (!TryGetMemberValue(currentObject, part, flags, out currentObject, out Type memberType, out error))
-                    {
-                        return false;
-                    }
-
-                    // If the current property is null, we need to stop
-                    if (currentObject == null)
-                    {
-                        error = $"Member '{part}' is null on {targetName}, cannot access nested properties";
-                        return false;
-                    }
-
-                    // If this is an array/list access, get the element at the index
-                    if (isArray)
-                    {
-                        if (currentObject is Material[])
-                        {
-                            var materials = currentObject as Material[];
-                            if (arrayIndex < 0 || arrayIndex >= materials.Length)
-                            {
-                                error = $"Material index {arrayIndex} out of range (0-{materials.Length - 1}) on {targetName}";
-                                return false;
-                            }
-                            currentObject = materials[arrayIndex];
-                        }
-                        else if (currentObject is System.Collections.IList)
-                        {
-                            var list = currentObject as System.Collections.IList;
-                            if (arrayIndex < 0 || arrayIndex >= list.Count)
-                            {
-                                error = $"Index {arrayIndex} out of range (0-{list.Count - 1}) on {targetName}";
-                                return false;
-                            }
-                            currentObject = list[arrayIndex];
-                        }
-                        else
-                        {
-                            error = $"Field '{part}' is not an array or list on {targetName}, cannot access by index";
-                            return false;
-                        }
-                    }
-
-                    // Update type for next iteration
-                    currentType = currentObject.GetType();
-                }
-
-                // Validate Unity Object asset path
-                if (typeof(UnityEngine.Object).IsAssignableFrom(currentType))
-                {
-                    var unityObj = currentObject as UnityEngine.Object;
-                    if (unityObj != null)
-                    {
-                        var assetPath = AssetDatabase.GetAssetPath(unityObj);
-                        if (!string.IsNullOrEmpty(assetPath))
-                        {
-                            // Only validate if it's an asset (not a scene object)
-                            if (!assetPath.StartsWith("Assets/") && !assetPath.StartsWith("Packages/"))
-                            {
-                                Debug.LogWarning($"[SetNestedProperty] Asset path '{assetPath}' is not in Assets or Packages folder");
-                            }
-                        }
-                    }
-                }
-
-                // Set the final property
-                string finalPart = pathParts[pathParts.Length - 1];
-
-                // Special handling for Material properties (shader properties)
-                if (currentObject is Material material && finalPart.StartsWith("_"))
-                {
-                    return SetMaterialShaderProperty(material, finalPart, value, out error);
-                }
-
-                // Use helper method to set field or property
-                return TrySetMemberValue(currentObject, finalPart, value, flags, out error);
-            }
-            catch (Exception ex)
-            {
-                error = $"Error setting nested property '{path}' on {targetName}: {ex.Message}";
-                Debug.LogError($"[SetNestedProperty] {error}\n{ex.StackTrace}");
-                return false;
-            }
-        }
-
         /// <summary>
         /// Sets material shader properties
         /// </summary>
@@ -1159,374 +1125,11 @@ namespace UniMcp.Tools
         }
 
         /// <summary>
-        /// Helper to get a field or property value
-        /// </summary>
-        private bool TryGetMemberValue(object obj, string memberName, BindingFlags flags, out object value, out Type memberType, out string error)
-        {
-            Type type = obj.GetType();
-            string targetName = GetSafeObjectName(obj);
-
-            // Try field first
-            FieldInfo fieldInfo = type.GetField(memberName, flags);
-            if (fieldInfo != null)
-            {
-                value = fieldInfo.GetValue(obj);
-                memberType = fieldInfo.FieldType;
-                error = null;
-                return true;
-            }
-
-            // Try property
-            PropertyInfo propertyInfo = type.GetProperty(memberName, flags);
-            if (propertyInfo != null && propertyInfo.CanRead)
-            {
-                value = propertyInfo.GetValue(obj);
-                memberType = propertyInfo.PropertyType;
-                error = null;
-                return true;
-            }
-
-            value = null;
-            memberType = null;
-            error = $"Could not find field or property '{memberName}' on type '{type.Name}' (from {targetName})";
-            return false;
-        }
-
-        /// <summary>
-        /// Helper to set a field or property value
-        /// </summary>
-        private bool TrySetMemberValue(object obj, string memberName, JsonNode jsonValue, BindingFlags flags, out string error)
-        {
-            Type type = obj.GetType();
-            string targetName = GetSafeObjectName(obj);
-
-            // Try field first
-            FieldInfo fieldInfo = type.GetField(memberName, flags);
-            if (fieldInfo != null)
-            {
-                object convertedValue = ConvertJTokenToType(jsonValue, fieldInfo.FieldType);
-                if (convertedValue != null || fieldInfo.FieldType.IsClass)
-                {
-                    fieldInfo.SetValue(obj, convertedValue);
-                    error = null;
-                    return true;
-                }
-                else
-                {
-                    error = $"Failed to convert value for field '{memberName}' on {targetName} ({type.Name})";
-                    return false;
-                }
-            }
-
-            // Try property
-            PropertyInfo propertyInfo = type.GetProperty(memberName, flags);
-            if (propertyInfo != null)
-            {
-                if (!propertyInfo.CanWrite)
-                {
-                    error = $"Property '{memberName}' on {targetName} ({type.Name}) is read-only";
-                    return false;
-                }
-
-                object convertedValue = ConvertJTokenToType(jsonValue, propertyInfo.PropertyType);
-                if (convertedValue != null || propertyInfo.PropertyType.IsClass)
-                {
-                    propertyInfo.SetValue(obj, convertedValue);
-                    error = null;
-                    return true;
-                }
-                else
-                {
-                    error = $"Failed to convert value for property '{memberName}' on {targetName} ({type.Name})";
-                    return false;
-                }
-            }
-
-            error = $"Could not find field or property '{memberName}' on type '{type.Name}' (from {targetName})";
-            return false;
-        }
-
-        /// <summary>
-        /// Split a property path into parts, handling both dot notation and array indexers
-        /// </summary>
-        private string[] SplitPropertyPath(string path)
-        {
-            // Handle complex paths with both dots and array indexers
-            List<string> parts = new List<string>();
-            int startIndex = 0;
-            bool inBrackets = false;
-
-            for (int i = 0; i < path.Length; i++)
-            {
-                char c = path[i];
-
-                if (c == '[')
-                {
-                    inBrackets = true;
-                }
-                else if (c == ']')
-                {
-                    inBrackets = false;
-                }
-                else if (c == '.' && !inBrackets)
-                {
-                    // Found a dot separator outside of brackets
-                    parts.Add(path.Substring(startIndex, i - startIndex));
-                    startIndex = i + 1;
-                }
-            }
-
-            // Add the final part
-            if (startIndex < path.Length)
-            {
-                parts.Add(path.Substring(startIndex));
-            }
-
-            return parts.ToArray();
-        }
-
-        /// <summary>
-        /// Simple JsonNode to Type conversion for common Unity types.
-        /// </summary>
-        private object ConvertJTokenToType(JsonNode token, Type targetType)
-        {
-            try
-            {
-                // Basic types first
-                if (targetType == typeof(string))
-                    return token.Value;
-                if (targetType == typeof(int))
-                    return token.AsInt;
-                if (targetType == typeof(float))
-                    return token.AsFloat;
-                if (targetType == typeof(bool))
-                    return token.AsBool;
-
-                // Vector/Quaternion/Color types
-                // 处理 Vector2
-                if (targetType == typeof(Vector2))
-                {
-                    if (token is JsonArray arrV2 && arrV2.Count == 2)
-                        return new Vector2(arrV2[0].AsFloat, arrV2[1].AsFloat);
-                    if (token.type == JsonNodeType.String)
-                    {
-                        float[] values = ParseNumberArrayFromString(token.Value, 2);
-                        if (values != null)
-                            return new Vector2(values[0], values[1]);
-                    }
-                }
-
-                // 处理 Vector3
-                if (targetType == typeof(Vector3))
-                {
-                    if (token is JsonArray arrV3 && arrV3.Count == 3)
-                        return new Vector3(arrV3[0].AsFloat, arrV3[1].AsFloat, arrV3[2].AsFloat);
-                    if (token.type == JsonNodeType.String)
-                    {
-                        float[] values = ParseNumberArrayFromString(token.Value, 3);
-                        if (values != null)
-                            return new Vector3(values[0], values[1], values[2]);
-                    }
-                }
-
-                // 处理 Vector4
-                if (targetType == typeof(Vector4))
-                {
-                    if (token is JsonArray arrV4 && arrV4.Count == 4)
-                        return new Vector4(arrV4[0].AsFloat, arrV4[1].AsFloat, arrV4[2].AsFloat, arrV4[3].AsFloat);
-                    if (token.type == JsonNodeType.String)
-                    {
-                        float[] values = ParseNumberArrayFromString(token.Value, 4);
-                        if (values != null)
-                            return new Vector4(values[0], values[1], values[2], values[3]);
-                    }
-                }
-
-                // 处理 Quaternion
-                if (targetType == typeof(Quaternion))
-                {
-                    if (token is JsonArray arrQ && arrQ.Count == 4)
-                        return new Quaternion(arrQ[0].AsFloat, arrQ[1].AsFloat, arrQ[2].AsFloat, arrQ[3].AsFloat);
-                    if (token.type == JsonNodeType.String)
-                    {
-                        float[] values = ParseNumberArrayFromString(token.Value, 4);
-                        if (values != null)
-                            return new Quaternion(values[0], values[1], values[2], values[3]);
-                    }
-                }
-
-                // 处理 Color
-                if (targetType == typeof(Color))
-                {
-                    if (token is JsonArray arrC && arrC.Count >= 3)
-                        return new Color(arrC[0].AsFloat, arrC[1].AsFloat, arrC[2].AsFloat, arrC.Count > 3 ? arrC[3].AsFloat : 1.0f);
-                    if (token.type == JsonNodeType.String)
-                    {
-                        float[] values = ParseNumberArrayFromString(token.Value, -1); // -1 表示接受 3 或 4 个值
-                        if (values != null && values.Length >= 3)
-                            return new Color(values[0], values[1], values[2], values.Length > 3 ? values[3] : 1.0f);
-                    }
-                }
-
-                // Enum types
-                if (targetType.IsEnum)
-                    return Enum.Parse(targetType, token.Value, true);
-
-                // Handle Array types
-                if (targetType.IsArray && token is JsonArray JsonArray)
-                {
-                    Type elementType = targetType.GetElementType();
-                    Array array = Array.CreateInstance(elementType, JsonArray.Count);
-
-                    for (int i = 0; i < JsonArray.Count; i++)
-                    {
-                        try
-                        {
-                            object convertedElement = ConvertJTokenToType(JsonArray[i], elementType);
-                            if (convertedElement != null || elementType.IsClass)
-                            {
-                                array.SetValue(convertedElement, i);
-                            }
-                        }
-                        catch (Exception ex)
-                        {
-                            Debug.LogWarning($"[ConvertJTokenToType] Failed to convert array element {i}: {ex.Message}");
-                        }
-                    }
-
-                    return array;
-                }
-
-                // Handle List<> types
-                if (targetType.IsGenericType && targetType.GetGenericTypeDefinition() == typeof(List<>) && token is JsonArray jList)
-                {
-                    Type elementType = targetType.GetGenericArguments()[0];
-                    var list = (System.Collections.IList)Activator.CreateInstance(targetType);
-
-                    for (int i = 0; i < jList.Count; i++)
-                    {
-                        try
-                        {
-                            object convertedElement = ConvertJTokenToType(jList[i], elementType);
-                            if (convertedElement != null || elementType.IsClass)
-                            {
-                                list.Add(convertedElement);
-                            }
-                        }
-                        catch (Exception ex)
-                        {
-                            Debug.LogWarning($"[ConvertJTokenToType] Failed to convert list element {i}: {ex.Message}");
-                        }
-                    }
-
-                    return list;
-                }
-
-                // Handle Unity Objects (Assets)
-                if (typeof(UnityEngine.Object).IsAssignableFrom(targetType))
-                {
-                    if (token.type == JsonNodeType.String)
-                    {
-                        string assetPath = token.Value;
-                        if (!string.IsNullOrEmpty(assetPath) && System.IO.File.Exists(assetPath))
-                        {
-                            UnityEngine.Object loadedAsset = AssetDatabase.LoadAssetAtPath(assetPath, targetType);
-                            if (loadedAsset != null)
-                            {
-                                return loadedAsset;
-                            }
-                            else
-                            {
-                                Debug.LogWarning($"[ConvertJTokenToType] Could not load asset of type '{targetType.Name}' from path: '{assetPath}'");
-                            }
-                        }
-                        else
-                        {
-                            var sceneObj = GameObjectUtils.FindByHierarchyPath(assetPath, targetType);
-                            if (sceneObj != null)
-                            {
-                                return sceneObj;
-                            }
-                            else
-                            {
-                                Debug.LogWarning($"[ConvertJTokenToType] Could not load asset of type '{targetType.Name}' from path: '{assetPath}'");
-                            }
-                        }
-                    }
-                    else if (token.type == JsonNodeType.Integer)
-                    {
-                        var instanceId = token.AsInt;
-                        var objectItem = UnityEditor.EditorUtility.InstanceIDToObject(instanceId);
-                        if (objectItem != null)
-                        {
-                            if (objectItem.GetType() == targetType)
-                            {
-                                return objectItem;
-                            }
-                            else if (objectItem is GameObject go && typeof(Component).IsAssignableFrom(targetType))
-                            {
-                                return go.GetComponent(targetType);
-                            }
-                            else
-                            {
-                                Debug.LogWarning($"[ConvertJTokenToType] Could not load asset of type '{targetType.Name}' from instance id: '{instanceId}'");
-                            }
-                        }
-                        else
-                        {
-                            Debug.LogWarning($"[ConvertJTokenToType] Could not load asset of type '{targetType.Name}' from instance id: '{instanceId}'");
-                        }
-                    }
-
-                    return null;
-                }
-
-                // SimpleJson 不支持 ToObject(targetType)
-                return null;
-            }
-            catch (Exception ex)
-            {
-                Debug.LogWarning($"[ConvertJTokenToType] Could not convert JsonNode '{token}' to type '{targetType.Name}': {ex.Message}");
-                return null;
-            }
-        }
-
-        /// <summary>
-        /// 查找组件类型，遍历所有已加载的程序集
+        /// 查找组件类型，通过全局类型索引解析
         /// </summary>
         private Type FindComponentType(string componentName)
         {
-            if (string.IsNullOrEmpty(componentName))
-                return null;
-
-            // 遍历所有已加载的程序集
-            var assemblies = AppDomain.CurrentDomain.GetAssemblies();
-            foreach (var assembly in assemblies)
-            {
-                Type[] types = null;
-                try
-                {
-                    types = assembly.GetTypes();
-                }
-                catch
-                {
-                    // 某些动态程序集可能抛异常，忽略
-                    continue;
-                }
-
-                foreach (var type in types)
-                {
-                    if (!typeof(Component).IsAssignableFrom(type))
-                        continue;
-
-                    // 名字或全名匹配即可
-                    if (type.Name == componentName || type.FullName == componentName)
-                    {
-                        return type;
-                    }
-                }
-            }
-            return null;
+            return TypeIndex.Find(componentName, typeof(Component));
         }
 
         /// <summary>
@@ -1541,67 +1144,6 @@ namespace UniMcp.Tools
             return new { yaml = yamlData };
         }
 
-        /// <summary>
-        /// 从字符串解析数字数组，支持多种格式：
-        /// "[0.1, 0.2, 0.3]", "(0.1, 0.2, 0.3)", "0.1, 0.2, 0.3"
-        /// </summary>
-        /// <param name="str">输入字符串</param>
-        /// <param name="expectedCount">期望的数字数量，-1 表示不限制</param>
-        /// <returns>解析后的 float 数组，失败返回 null</returns>
-        private float[] ParseNumberArrayFromString(string str, int expectedCount)
-        {
-            if (string.IsNullOrWhiteSpace(str))
-                return null;
-
-            try
-            {
-                // 去除首尾空格
-                str = str.Trim();
-
-                // 移除外层括号（支持方括号和圆括号）
-                if ((str.StartsWith("[") && str.EndsWith("]")) ||
-                    (str.StartsWith("(") && str.EndsWith(")")))
-                {
-                    str = str.Substring(1, str.Length - 2);
-                }
-
-                // 按逗号分割
-                string[] parts = str.Split(new[] { ',' }, StringSplitOptions.RemoveEmptyEntries);
-
-                // 检查数量
-                if (expectedCount > 0 && parts.Length != expectedCount)
-                {
-                    Debug.LogWarning($"[ParseNumberArrayFromString] Expected {expectedCount} values, but got {parts.Length} in string: '{str}'");
-                    return null;
-                }
-
-                if (expectedCount == -1 && (parts.Length < 3 || parts.Length > 4))
-                {
-                    Debug.LogWarning($"[ParseNumberArrayFromString] Expected 3-4 values, but got {parts.Length} in string: '{str}'");
-                    return null;
-                }
-
-                // 解析每个数字
-                float[] result = new float[parts.Length];
-                for (int i = 0; i < parts.Length; i++)
-                {
-                    if (!float.TryParse(parts[i].Trim(), System.Globalization.NumberStyles.Float, System.Globalization.CultureInfo.InvariantCulture, out result[i]))
-                    {
-                        Debug.LogWarning($"[ParseNumberArrayFromString] Failed to parse '{parts[i].Trim()}' as float in string: '{str}'");
-                        return null;
-                    }
-                }
-
-                return result;
-            }
-            catch (Exception ex)
-            {
-                Debug.LogWarning($"[ParseNumberArrayFromString] Failed to parse string '{str}': {ex.Message}");
-                return null;
-            }
-        }
-
-
 
         #endregion
     }
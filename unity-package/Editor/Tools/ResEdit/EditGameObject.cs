@@ -20,17 +20,38 @@ namespace UniMcp.Tools
     /// 对应方法名: gameobject_modify
     /// </summary>
     [ToolName("edit_gameobject", "Resource Management", "资源管理")]
+    [ReadOnlyActions("action", "get_components")]
     public class EditGameObject : DualStateMethodBase
     {
         public override string Description => L.T("Modify GameObject properties using dual state tree", "使用双状态树修改游戏对象属性");
 
+        /// <summary>
+        /// 创建、增删组件、改父对象会改变层级索引；modify 只有修改名称、标签、层或父对象时才会
+        /// </summary>
+        protected override bool ModifiesHierarchy(JsonClass args)
+        {
+            switch (args["action"]?.Value)
+            {
+                case "create":
+                case "add_component":
+                case "remove_component":
+                case "set_parent":
+                    return true;
+                case "get_components":
+                    return false;
+                default:
+                    return !args["name"].IsNull() || !args["tag"].IsNull() || !args["layer"].IsNull()
+                        || !args["parent_id"].IsNull() || !args["parent_path"].IsNull();
+            }
+        }
+
         private HierarchyCreate hierarchyCreate;
         private IObjectSelector objectSelector;
 
         public EditGameObject()
         {
             hierarchyCreate = new HierarchyCreate();
-            objectSelector = objectSelector ?? new ObjectSelector<GameObject>();
+            objectSelector = objectSelector ?? new HierarchyTargetsSelector(new ObjectSelector<GameObject>());
         }
 
         /// <summary>
@@ -48,6 +69,10 @@ namespace UniMcp.Tools
             new MethodInt("instance_id", L.T("Object instance ID", "对象实例ID"))
                 .AddExample("12345"),
             
+            // 多个目标
+            new MethodArr("targets", L.T("Apply the action to multiple GameObjects: instance IDs, hierarchy paths (supports * and ? wildcards) or hierarchy_search query objects like {\"query\": \"t:Light\"}", "对多个游戏对象执行操作：实例ID、层级路径（支持*和?通配符）或 hierarchy_search 查询对象，如 {\"query\": \"t:Light\"}"))
+                .AddExample("12345", "\"Enemies/*\""),
+            
             // 操作类型
             new MethodStr("action", L.T("Operation type", "操作类型"), false)
                 .SetEnumValues("create", "modify", "get_components", "add_component", "remove_component", "set_parent")
@@ -225,13 +250,13 @@ namespace UniMcp.Tools
         }
 
         /// <summary>
-        /// 根据select_many参数获取目标对象（单个或多个）
+        /// 根据select_many参数获取目标对象（单个或多个），通过 targets 指定时返回全部目标
         /// </summary>
         private GameObject[] GetTargetsBasedOnSelectMany(StateTreeContext context)
         {
             GameObject[] targets = ExtractTargetsFromContext(context);
 
-            if (ShouldSelectMany(context))
+            if (ShouldSelectMany(context) || context.ContainsKey("targets"))
             {
                 return targets; // 返回所有匹配的对象
             }
@@ -273,6 +298,26 @@ namespace UniMcp.Tools
             Undo.RecordObject(targetGo.transform, "Modify GameObject Transform");
             Undo.RecordObject(targetGo, "Modify GameObject Properties");
 
+            if (!ApplyModificationChanges(targetGo, args))
+            {
+                return Response.Success(
+                    $"No modifications applied to GameObject '{targetGo.name}'.",
+                    Json.FromObject(GetGameObjectData(targetGo))
+                );
+            }
+
+            EditorUtility.SetDirty(targetGo); // Mark scene as dirty
+            return Response.Success(
+                $"GameObject '{targetGo.name}' modified successfully.",
+                Json.FromObject(GetGameObjectData(targetGo))
+            );
+        }
+
+        /// <summary>
+        /// 应用参数中的各项修改（调用方负责记录 Undo），有任何修改时返回 true
+        /// </summary>
+        private bool ApplyModificationChanges(GameObject targetGo, StateTreeContext args)
+        {
             bool modified = false;
 
             // 应用名称修改
@@ -293,105 +338,28 @@ namespace UniMcp.Tools
             // 应用变换修改
             modified |= ApplyTransformModifications(targetGo, args);
 
-            if (!modified)
-            {
-                return Response.Success(
-                    $"No modifications applied to GameObject '{targetGo.name}'.",
-                    Json.FromObject(GetGameObjectData(targetGo))
-                );
-            }
-
-            EditorUtility.SetDirty(targetGo); // Mark scene as dirty
-            return Response.Success(
-                $"GameObject '{targetGo.name}' modified successfully.",
-                Json.FromObject(GetGameObjectData(targetGo))
-            );
+            return modified;
         }
 
         /// <summary>
-        /// 应用修改到多个GameObject
+        /// 应用修改到多个GameObject，所有修改合并为一个 Undo 步骤
         /// </summary>
         private object ApplyModificationsToMultiple(GameObject[] targets, StateTreeContext args)
         {
-            var results = new List<Dictionary<string, object>>();
-            var errors = new List<string>();
-            int successCount = 0;
-
+            var recorded = new List<UnityEngine.Object>();
             foreach (GameObject targetGo in targets)
             {
                 if (targetGo == null) continue;
-
-                try
-                {
-                    var result = ApplyModifications(targetGo, args);
-
-                    if (IsSuccessResponse(result, out object data, out string responseMessage))
-                    {
-                        successCount++;
-                        if (data is Dictionary<string, object> dictData)
-                        {
-                            results.Add(dictData);
-                        }
-                        else
-                        {
-                            // GetGameObjectData现在返回YAML格式，需要适配
-                            var gameObjectData = GetGameObjectData(targetGo);
-                            results.Add(new Dictionary<string, object>
-                            {
-                                { "target", targetGo.name },
-                                { "instanceID", targetGo.GetInstanceID() },
-                                { "data", gameObjectData }
-                            });
-                        }
-                    }
-                    else
-                    {
-                        errors.Add($"[{targetGo.name}] {responseMessage ?? "Unknown error"}");
-                    }
-                }
-                catch (Exception e)
-                {
-                    errors.Add($"[{targetGo.name}] Error: {e.Message}");
-                }
-            }
-
-            // 构建响应消息
-            string message;
-            if (successCount == targets.Length)
-            {
-                message = $"Successfully modified {successCount} GameObject(s).";
-            }
-            else if (successCount > 0)
-            {
-                message = $"Modified {successCount} of {targets.Length} GameObject(s). {errors.Count} failed.";
-            }
-            else
-            {
-                message = $"Failed to modify any of the {targets.Length} GameObject(s).";
-            }
-
-            var responseData = new Dictionary<string, object>
-            {
-                { "modified_count", successCount },
-                { "total_count", targets.Length },
-                { "success_rate", (double)successCount / targets.Length },
-                { "modified_objects", results }
-            };
-
-            if (errors.Count > 0)
-            {
-                responseData["errors"] = errors;
+                recorded.Add(targetGo.transform);
+                recorded.Add(targetGo);
             }
 
-            // 如果有成功的修改，返回成功响应
-            if (successCount > 0)
-            {
-                return Response.Success(message, responseData);
-            }
-            else
+            return RunOnTargets("modify", targets, args, targetGo =>
             {
-                return Response.Error(message, responseData);
-            }
+                if (ApplyModificationChanges(targetGo, args))
+                    EditorUtility.SetDirty(targetGo);
+                return null;
+            }, recorded.ToArray());
         }
 
         /// <summary>
@@ -669,46 +637,7 @@ namespace UniMcp.Tools
         /// </summary>
         private object SetParentOnMultipleTargets(GameObject[] targets, StateTreeContext args)
         {
-            var results = new List<Dictionary<string, object>>();
-            var errors = new List<string>();
-            int successCount = 0;
-
-            foreach (GameObject target in targets)
-            {
-                if (target == null) continue;
-
-                try
-                {
-                    var result = SetParentOnSingleTarget(target, args);
-
-                    if (IsSuccessResponse(result, out object data, out string message))
-                    {
-                        successCount++;
-                        if (data is Dictionary<string, object> dictData)
-                        {
-                            results.Add(dictData);
-                        }
-                        else
-                        {
-                            results.Add(new Dictionary<string, object>
-                            {
-                                { "target", target.name },
-                                { "target_id", target.GetInstanceID() }
-                            });
-                        }
-                    }
-                    else
-                    {
-                        errors.Add($"[{target.name}] {message ?? "Unknown error"}");
-                    }
-                }
-                catch (Exception e)
-                {
-                    errors.Add($"[{target.name}] Error: {e.Message}");
-                }
-            }
-
-            return CreateBatchOperationResponse("set parent", successCount, targets.Length, results, errors);
+            return RunOnTargets("set parent", targets, args, target => GetResponseError(SetParentOnSingleTarget(target, args)));
         }
 
         #endregion
@@ -866,40 +795,7 @@ namespace UniMcp.Tools
 
         private object AddComponentToTarget(StateTreeContext cmd, GameObject targetGo)
         {
-            string typeName = null;
-            JsonClass properties = null;
-
-            // Allow adding component specified directly or via components array (take first)
-            if (cmd.TryGetValue("component_type", out object componentNameObj))
-            {
-                typeName = componentNameObj?.ToString();
-
-                // Check if props are nested under name
-                if (cmd.TryGetValue("component_properties", out object componentPropsObj))
-                {
-                    if (componentPropsObj is JsonClass allProps && !string.IsNullOrEmpty(typeName))
-                    {
-                        properties = allProps[typeName] as JsonClass ?? allProps;
-                    }
-                    else if (componentPropsObj is JsonClass directProps)
-                    {
-                        properties = directProps;
-                    }
-                }
-            }
-            else if (cmd.TryGetValue("components", out object componentsObj) && componentsObj is JsonArray componentsToAddArray && componentsToAddArray.Count > 0)
-            {
-                var compToken = componentsToAddArray[0];
-                if (compToken != null && compToken.type == JsonNodeType.String)
-                    typeName = compToken.Value;
-                else if (compToken is JsonClass compObj)
-                {
-                    typeName = compObj["typeName"]?.Value;
-                    properties = compObj["properties"] as JsonClass;
-                }
-            }
-
-            if (string.IsNullOrEmpty(typeName))
+            if (!TryGetComponentToAdd(cmd, out string typeName, out JsonClass properties))
             {
                 // 获取当前GameObject上所有组件列表
                 var existingComponents = GetComponentsListFromGameObject(targetGo);
@@ -944,7 +840,51 @@ namespace UniMcp.Tools
             );
         }
 
-        private object RemoveComponentFromTarget(StateTreeContext cmd, GameObject targetGo)
+        /// <summary>
+        /// 读取要添加的组件类型和属性（component_type/component_properties，或 components 数组的第一个元素）
+        /// </summary>
+        private bool TryGetComponentToAdd(StateTreeContext cmd, out string typeName, out JsonClass properties)
+        {
+            typeName = null;
+            properties = null;
+
+            // Allow adding component specified directly or via components array (take first)
+            if (cmd.TryGetValue("component_type", out object componentNameObj))
+            {
+                typeName = componentNameObj?.ToString();
+
+                // Check if props are nested under name
+                if (cmd.TryGetValue("component_properties", out object componentPropsObj))
+                {
+                    if (componentPropsObj is JsonClass allProps && !string.IsNullOrEmpty(typeName))
+                    {
+                        properties = allProps[typeName] as JsonClass ?? allProps;
+                    }
+                    else if (componentPropsObj is JsonClass directProps)
+                    {
+                        properties = directProps;
+                    }
+                }
+            }
+            else if (cmd.TryGetValue("components", out object componentsObj) && componentsObj is JsonArray componentsToAddArray && componentsToAddArray.Count > 0)
+            {
+                var compToken = componentsToAddArray[0];
+                if (compToken != null && compToken.type == JsonNodeType.String)
+                    typeName = compToken.Value;
+                else if (compToken is JsonClass compObj)
+                {
+                    typeName = compObj["typeName"]?.Value;
+                    properties = compObj["properties"] as JsonClass;
+                }
+            }
+
+            return !string.IsNullOrEmpty(typeName);
+        }
+
+        /// <summary>
+        /// 读取要移除的组件类型（component_type，或 components_to_remove 数组的第一个元素）
+        /// </summary>
+        private string GetComponentToRemove(StateTreeContext cmd)
         {
             string typeName = null;
             // Allow removing component specified directly or via components_to_remove array (take first)
@@ -958,6 +898,12 @@ namespace UniMcp.Tools
             {
                 typeName = componentsToRemoveArray[0]?.Value;
             }
+            return typeName;
+        }
+
+        private object RemoveComponentFromTarget(StateTreeContext cmd, GameObject targetGo)
+        {
+            string typeName = GetComponentToRemove(cmd);
 
             if (string.IsNullOrEmpty(typeName))
             {
@@ -1016,49 +962,26 @@ namespace UniMcp.Tools
         /// </summary>
         private object AddComponentToMultipleTargets(StateTreeContext cmd, GameObject[] targets)
         {
-            var results = new List<Dictionary<string, object>>();
-            var errors = new List<string>();
-            int successCount = 0;
-
-            foreach (GameObject targetGo in targets)
+            if (!TryGetComponentToAdd(cmd, out string typeName, out JsonClass properties))
             {
-                if (targetGo == null) continue;
+                return Response.Error("Component type name ('component_type' or first element in 'components') is required.");
+            }
 
-                try
-                {
-                    var result = AddComponentToTarget(cmd, targetGo);
+            return RunOnTargets("add component", targets, cmd, targetGo =>
+            {
+                string error = GetResponseError(AddComponentInternal(targetGo, typeName, properties));
+                if (error != null)
+                    return error;
 
-                    if (IsSuccessResponse(result, out object data, out string message))
-                    {
-                        successCount++;
-                        if (data is Dictionary<string, object> dictData)
-                        {
-                            results.Add(dictData);
-                        }
-                        else
-                        {
-                            // GetGameObjectData现在返回YAML格式，需要适配
-                            var gameObjectData = GetGameObjectData(targetGo);
-                            results.Add(new Dictionary<string, object>
-                            {
-                                { "target", targetGo.name },
-                                { "instanceID", targetGo.GetInstanceID() },
-                                { "data", gameObjectData }
-                            });
-                        }
-                    }
-                    else
-                    {
-                        errors.Add($"[{targetGo.name}] {message ?? "Unknown error"}");
-                    }
-                }
-                catch (Exception e)
+                if (properties != null)
                 {
-                    errors.Add($"[{targetGo.name}] Error: {e.Message}");
+                    string setError = GetResponseError(SetComponentPropertiesInternal(targetGo, typeName, properties));
+                    if (setError != null)
+                        Debug.LogWarning($"[EditGameObject] Failed to set properties for component '{typeName}': {setError}");
                 }
-            }
-
-            return CreateBatchOperationResponse("add component", successCount, targets.Length, results, errors);
+                EditorUtility.SetDirty(targetGo);
+                return null;
+            });
         }
 
         /// <summary>
@@ -1066,49 +989,19 @@ namespace UniMcp.Tools
         /// </summary>
         private object RemoveComponentFromMultipleTargets(StateTreeContext cmd, GameObject[] targets)
         {
-            var results = new List<Dictionary<string, object>>();
-            var errors = new List<string>();
-            int successCount = 0;
-
-            foreach (GameObject targetGo in targets)
+            string typeName = GetComponentToRemove(cmd);
+            if (string.IsNullOrEmpty(typeName))
             {
-                if (targetGo == null) continue;
-
-                try
-                {
-                    var result = RemoveComponentFromTarget(cmd, targetGo);
-
-                    if (IsSuccessResponse(result, out object data, out string message))
-                    {
-                        successCount++;
-                        if (data is Dictionary<string, object> dictData)
-                        {
-                            results.Add(dictData);
-                        }
-                        else
-                        {
-                            // GetGameObjectData现在返回YAML格式，需要适配
-                            var gameObjectData = GetGameObjectData(targetGo);
-                            results.Add(new Dictionary<string, object>
-                            {
-                                { "target", targetGo.name },
-                                { "instanceID", targetGo.GetInstanceID() },
-                                { "data", gameObjectData }
-                            });
-                        }
-                    }
-                    else
-                    {
-                        errors.Add($"[{targetGo.name}] {message ?? "Unknown error"}");
-                    }
-                }
-                catch (Exception e)
-                {
-                    errors.Add($"[{targetGo.name}] Error: {e.Message}");
-                }
+                return Response.Error("Component type name ('component_type' or first element in 'components_to_remove') is required.");
             }
 
-            return CreateBatchOperationResponse("remove component", successCount, targets.Length, results, errors);
+            return RunOnTargets("remove component", targets, cmd, targetGo =>
+            {
+                string error = GetResponseError(RemoveComponentInternal(targetGo, typeName));
+                if (error == null)
+                    EditorUtility.SetDirty(targetGo);
+                return error;
+            });
         }
 
         /// <summary>
@@ -1116,49 +1009,93 @@ namespace UniMcp.Tools
         /// </summary>
         private object SetComponentPropertyOnMultipleTargets(StateTreeContext cmd, GameObject[] targets)
         {
-            var results = new List<Dictionary<string, object>>();
-            var errors = new List<string>();
+            return RunOnTargets("set component properties", targets, cmd, targetGo => GetResponseError(SetComponentPropertyOnTarget(cmd, targetGo)));
+        }
+
+        /// <summary>
+        /// 在多个目标上执行同一操作。所有修改合并为一个 Undo 步骤，每个目标只返回实例ID、名称和状态，不序列化对象数据
+        /// </summary>
+        /// <param name="operation">操作名称</param>
+        /// <param name="targets">目标对象</param>
+        /// <param name="args">调用参数，用于读取未匹配的 targets 元素</param>
+        /// <param name="action">对单个目标执行操作，成功返回 null，失败返回错误信息</param>
+        /// <param name="recordObjects">执行前一次性记录 Undo 的对象，可选</param>
+        private object RunOnTargets(string operation, GameObject[] targets, StateTreeContext args, Func<GameObject, string> action, UnityEngine.Object[] recordObjects = null)
+        {
+            var results = new JsonArray();
             int successCount = 0;
+            int totalCount = 0;
 
-            foreach (GameObject targetGo in targets)
+            using (new UndoGroupScope($"{operation} on {targets.Length} GameObjects"))
             {
-                if (targetGo == null) continue;
+                if (recordObjects != null && recordObjects.Length > 0)
+                    Undo.RecordObjects(recordObjects, operation);
 
-                try
+                foreach (GameObject targetGo in targets)
                 {
-                    var result = SetComponentPropertyOnTarget(cmd, targetGo);
+                    if (targetGo == null) continue;
+                    totalCount++;
 
-                    if (IsSuccessResponse(result, out object data, out string message))
+                    var entry = new JsonClass { ["instance_id"] = targetGo.GetInstanceID() };
+                    string error;
+                    try
+                    {
+                        error = action(targetGo);
+                    }
+                    catch (Exception e)
+                    {
+                        error = e.Message;
+                    }
+
+                    entry["name"] = targetGo.name;
+                    if (error == null)
                     {
+                        entry["status"] = "ok";
                         successCount++;
-                        if (data is Dictionary<string, object> dictData)
-                        {
-                            results.Add(dictData);
-                        }
-                        else
-                        {
-                            // GetGameObjectData现在返回YAML格式，需要适配
-                            var gameObjectData = GetGameObjectData(targetGo);
-                            results.Add(new Dictionary<string, object>
-                            {
-                                { "target", targetGo.name },
-                                { "instanceID", targetGo.GetInstanceID() },
-                                { "data", gameObjectData }
-                            });
-                        }
                     }
                     else
                     {
-                        errors.Add($"[{targetGo.name}] {message ?? "Unknown error"}");
+                        entry["status"] = "error";
+                        entry["error"] = error;
                     }
+                    results.Add(entry);
                 }
-                catch (Exception e)
-                {
-                    errors.Add($"[{targetGo.name}] Error: {e.Message}");
-                }
             }
 
-            return CreateBatchOperationResponse("set component properties", successCount, targets.Length, results, errors);
+            string message;
+            if (successCount == totalCount)
+                message = $"Successfully completed {operation} on {successCount} GameObject(s).";
+            else if (successCount > 0)
+                message = $"Completed {operation} on {successCount} of {totalCount} GameObject(s). {totalCount - successCount} failed.";
+            else
+                message = $"Failed to complete {operation} on any of the {totalCount} GameObject(s).";
+
+            var data = new JsonClass
+            {
+                ["operation"] = operation,
+                ["success_count"] = successCount,
+                ["total_count"] = totalCount,
+                ["results"] = results
+            };
+            if (args.TryGetObjectReference(HierarchyTargetsSelector.UnmatchedTargetsKey, out List<string> unmatched) && unmatched.Count > 0)
+            {
+                var unmatchedArray = new JsonArray();
+                foreach (string item in unmatched)
+                    unmatchedArray.Add(item);
+                data["unmatched_targets"] = unmatchedArray;
+            }
+
+            return successCount > 0 ? Response.Success(message, data) : Response.Error(message, data);
+        }
+
+        /// <summary>
+        /// 返回错误响应中的错误信息，成功（或为 null）时返回 null
+        /// </summary>
+        private string GetResponseError(object response)
+        {
+            if (response == null || IsSuccessResponse(response, out _, out string message))
+                return null;
+            return message ?? "Unknown error";
         }
 
         /// <summary>
@@ -1169,6 +1106,14 @@ namespace UniMcp.Tools
             data = null;
             message = null;
 
+            if (response is JsonClass json)
+            {
+                bool success = json["success"].AsBoolDefault(false);
+                data = json["data"];
+                message = success ? json["message"]?.Value : (json["error"]?.Value ?? json["message"]?.Value);
+                return success;
+            }
+
             var resultType = response.GetType();
             var successProperty = resultType.GetProperty("success");
             var dataProperty = resultType.GetProperty("data");
@@ -1238,10 +1183,9 @@ namespace UniMcp.Tools
         /// </summary>
         private object RemoveComponentInternal(GameObject targetGo, string typeName)
         {
-            Type componentType = FindComponentType(typeName);
-            if (componentType == null)
+            if (!TypeIndex.TryResolve(typeName, typeof(Component), out Type componentType, out string typeError))
             {
-                return Response.Error($"Component type '{typeName}' not found for removal.");
+                return Response.Error($"Cannot remove component: {typeError}");
             }
 
             // Prevent removing essential components
@@ -1288,27 +1232,12 @@ namespace UniMcp.Tools
             // If no specific component instance is provided, find it by type name
             if (targetComponent == null)
             {
-                // Use FindType helper to locate the correct component type
-                Type componentType = FindComponentType(compName);
-                if (componentType != null && typeof(Component).IsAssignableFrom(componentType))
+                // The type index already prefers the common Unity component namespaces
+                if (!TypeIndex.TryResolve(compName, typeof(Component), out Type componentType, out string typeError))
                 {
-                    targetComponent = targetGo.GetComponent(componentType);
-                }
-                else
-                {
-                    // Fallback: try common Unity component namespaces
-                    string[] commonNamespaces = { "UnityEngine", "UnityEngine.UI" };
-                    foreach (string ns in commonNamespaces)
-                    {
-                        string fullTypeName = $"{ns}.{compName}";
-                        componentType = FindComponentType(fullTypeName);
-                        if (componentType != null && typeof(Component).IsAssignableFrom(componentType))
-                        {
-                            targetComponent = targetGo.GetComponent(componentType);
-                            break;
-                        }
-                    }
+                    return Response.Error(typeError);
                 }
+                targetComponent = targetGo.GetComponent(componentType);
             }
 
             if (targetComponent == null)
@@ -1859,11 +1788,10 @@ namespace UniMcp.Tools
                         // If a component type is specified, try to get it
                         if (!string.IsNullOrEmpty(componentTypeName))
                         {
-                            Type compType = FindComponentType(componentTypeName);
-                            if (compType == null)
+                            if (!TypeIndex.TryResolve(componentTypeName, typeof(Component), out Type compType, out string typeError))
                             {
                                 Debug.LogWarning(
-                                    $"[ConvertJTokenToType] Could not find component type '{componentTypeName}' specified in reference object: {token}"
+                                    $"[ConvertJTokenToType] {typeError} Reference object: {token}"
                                 );
                                 return null;
                             }
@@ -1996,59 +1924,17 @@ namespace UniMcp.Tools
             return null;
         }
 
-        /// <summary>
-        /// 查找组件类型
-        /// </summary>
-        /// <summary>
-        /// 查找组件类型，遍历所有已加载的程序集，名字或全名匹配且继承自Component即可
-        /// </summary>
-        private Type FindComponentType(string componentName)
-        {
-            if (string.IsNullOrEmpty(componentName))
-                return null;
-
-            // 遍历所有已加载的程序集
-            var assemblies = AppDomain.CurrentDomain.GetAssemblies();
-            foreach (var assembly in assemblies)
-            {
-                Type[] types = null;
-                try
-                {
-                    types = assembly.GetTypes();
-                }
-                catch
-                {
-                    // 某些动态程序集可能抛异常，忽略
-                    continue;
-                }
-
-                foreach (var type in types)
-                {
-                    if (!typeof(Component).IsAssignableFrom(type))
-                        continue;
-
-                    // 名字或全名匹配即可
-                    if (type.Name == componentName || type.FullName == componentName)
-                    {
-                        return type;
-                    }
-                }
-            }
-            return null;
-        }
-
         /// <summary>
         /// 添加组件到GameObject的内部实现
         /// </summary>
         private object AddComponentInternal(GameObject targetGo, string typeName, JsonClass properties)
         {
-            Type componentType = FindComponentType(typeName);
-            if (componentType == null)
+            if (!TypeIndex.TryResolve(typeName, typeof(Component), out Type componentType, out string typeError))
             {
                 // 获取当前GameObject上所有组件列表
                 var existingComponents = GetComponentsListFromGameObject(targetGo);
                 return Response.Error(
-                    $"Component type '{typeName}' not found or not compiled.",
+                    $"Component type '{typeName}' not found or not compiled. {typeError}",
                     new Dictionary<string, object> { { "existing_components", existingComponents } }
                 );
             }
@@ -28,11 +28,12 @@ namespace UniMcp.Tools
             {
                 // 操作类型 - 枚举字符串
                 new MethodStr("action", L.T("Action type", "操作类型"), false)
-                    .SetEnumValues("create", "set_properties", "duplicate", "delete", "get_info", "search", "copy_properties", "change_shader", "enable_keyword", "disable_keyword"),
+                    .SetEnumValues("create", "set_properties", "duplicate", "delete", "get_info", "search", "copy_properties", "change_shader", "enable_keyword", "disable_keyword", "migrate_shader"),
                 
                 // 材质路径 - 必需参数
-                new MethodStr("path", L.T("Material asset path, Unity standard format", "材质资源路径，Unity标准格式"), false)
-                    .AddExample("Assets/Materials/MyMaterial.mat"),
+                new MethodStr("path", L.T("Material asset path, Unity standard format; folder or glob scope for search/migrate_shader", "材质资源路径，Unity标准格式；search/migrate_shader 时为文件夹或通配范围"), false)
+                    .AddExample("Assets/Materials/MyMaterial.mat")
+                    .AddExample("Assets/Materials/**/*.mat"),
                 
                 // 着色器名称 - 可选参数
                 new MethodStr("shader_name", L.T("Shader name or path", "着色器名称或路径"))
@@ -55,7 +56,7 @@ namespace UniMcp.Tools
                     .AddExample("Assets/Materials/CopiedMaterial.mat"),
                 
                 // 搜索模式
-                new MethodStr("query", L.T("Search pattern, supports wildcards", "搜索模式，支持通配符"))
+                new MethodStr("query", L.T("AssetDatabase.FindAssets filter (name terms, l:label, t:type); no wildcards, use 'path' for * and ? patterns", "AssetDatabase.FindAssets 过滤条件（名称关键字、l:标签、t:类型）；不支持通配符，* 和 ? 通配请使用 path"))
                     .AddExample("*.mat"),
                 
                 // 递归搜索
@@ -77,7 +78,22 @@ namespace UniMcp.Tools
                 
                 // 关键字 - 用于启用/禁用着色器关键字
                 new MethodStr("keyword", L.T("Shader keyword name", "着色器关键字名称"))
-                    .AddExample("_NORMALMAP")
+                    .AddExample("_NORMALMAP"),
+
+                // 着色器迁移映射 - 用于 migrate_shader
+                new MethodObj("shader_map", L.T("Source shader name -> target shader name (used by migrate_shader); when omitted every material is migrated to shader_name", "源着色器名 -> 目标着色器名（migrate_shader 使用）；未提供时所有材质迁移到 shader_name"))
+                    .AddExample("{\"Standard\": \"Universal Render Pipeline/Lit\"}"),
+
+                // 属性重映射表
+                new MethodObj("property_remap", L.T("Property remap table applied by migrate_shader, old property -> new property", "migrate_shader 使用的属性重映射表，旧属性名 -> 新属性名"))
+                    .AddExample("{\"_MainTex\": \"_BaseMap\", \"_Color\": \"_BaseColor\", \"_Glossiness\": \"_Smoothness\"}"),
+
+                // 关键字重映射表
+                new MethodObj("keyword_remap", L.T("Keyword remap table applied by migrate_shader, enabled old keyword -> new keyword (empty string drops it)", "migrate_shader 使用的关键字重映射表，已启用的旧关键字 -> 新关键字（空字符串表示移除）"))
+                    .AddExample("{\"_GLOSSYREFLECTIONS_OFF\": \"_ENVIRONMENTREFLECTIONS_OFF\"}"),
+
+                // 预演
+                new MethodBool("dry_run", L.T("migrate_shader: only report what would change, default false", "migrate_shader：只报告将要进行的修改，默认为false"))
             };
         }
 
@@ -98,6 +114,7 @@ namespace UniMcp.Tools
                     .Leaf("change_shader", ChangeMaterialShader)
                     .Leaf("enable_keyword", EnableMaterialKeyword)
                     .Leaf("disable_keyword", DisableMaterialKeyword)
+                    .Leaf("migrate_shader", MigrateShader)
                 .Build();
         }
 
@@ -509,8 +526,283 @@ namespace UniMcp.Tools
             }
         }
 
+        /// <summary>
+        /// 批量迁移着色器：按 path（文件夹或通配）和 query 选出材质，按 shader_map 切换着色器，
+        /// 并按 property_remap / keyword_remap 搬运属性值和关键字。已使用目标着色器的材质跳过；
+        /// 所有修改在一个 StartAssetEditing 批次中完成，最后只保存一次。
+        /// </summary>
+        private object MigrateShader(JsonClass args)
+        {
+            string scope = args["path"]?.Value;
+            string query = args["query"]?.Value;
+            bool dryRun = args["dry_run"].AsBoolDefault(false);
+            JsonClass shaderMapArg = args["shader_map"] as JsonClass;
+            string shaderName = args["shader_name"]?.Value;
+
+            // 解析着色器映射，目标着色器必须全部存在
+            var shaderMap = new Dictionary<string, Shader>(StringComparer.Ordinal);
+            Shader defaultTarget = null;
+            if (shaderMapArg != null && shaderMapArg.Count > 0)
+            {
+                foreach (var entry in shaderMapArg.Properties())
+                {
+                    Shader target = FindShader(entry.Value?.Value);
+                    if (target == null)
+                        return Response.Error($"Target shader '{entry.Value?.Value}' for '{entry.Key}' not found.");
+                    shaderMap[entry.Key] = target;
+                }
+            }
+            else if (!string.IsNullOrEmpty(shaderName))
+            {
+                defaultTarget = FindShader(shaderName);
+                if (defaultTarget == null)
+                    return Response.Error($"Shader '{shaderName}' not found.");
+            }
+            else
+            {
+                return Response.Error("'shader_map' or 'shader_name' is required for migrate_shader.");
+            }
+            var targets = new HashSet<Shader>(shaderMap.Values);
+            if (defaultTarget != null)
+                targets.Add(defaultTarget);
+
+            var propertyRemap = ReadRemap(args["property_remap"] as JsonClass);
+            var keywordRemap = ReadRemap(args["keyword_remap"] as JsonClass);
+
+            List<string> paths = ResolveMaterialPaths(scope, query);
+            if (paths.Count == 0)
+                return Response.Error($"No materials matched path '{scope}' / query '{query}'.");
+
+            var results = new JsonArray();
+            int migrated = 0, alreadyConverted = 0, unmapped = 0, failed = 0;
+
+            using (new UndoGroupScope("Migrate Material Shaders"))
+            {
+                AssetDatabase.StartAssetEditing();
+                try
+                {
+                    for (int i = 0; i < paths.Count; i++)
+                    {
+                        string path = paths[i];
+                        if (i % 100 == 0)
+                            McpProgress.Report(i, paths.Count, $"migrate_shader: {path}");
+
+                        var status = new JsonClass { ["path"] = path };
+                        try
+                        {
+                            Material material = AssetDatabase.LoadAssetAtPath<Material>(path);
+                            if (material == null)
+                            {
+                                status["status"] = "failed";
+                                status["error"] = "Failed to load material.";
+                                failed++;
+                                results.Add(status);
+                                continue;
+                            }
+
+                            Shader source = material.shader;
+                            string sourceName = source != null ? source.name : string.Empty;
+                            if (source != null && targets.Contains(source))
+                            {
+                                alreadyConverted++;
+                                continue;
+                            }
+                            if (!shaderMap.TryGetValue(sourceName, out Shader target))
+                                target = defaultTarget;
+                            if (target == null)
+                            {
+                                unmapped++;
+                                continue;
+                            }
+
+                            status["from"] = sourceName;
+                            status["to"] = target.name;
+                            var remapped = new JsonArray();
+                            if (dryRun)
+                            {
+                                foreach (var pair in propertyRemap)
+                                {
+                                    if (material.HasProperty(pair.Key) && HasShaderProperty(target, pair.Value))
+                                        remapped.Add(pair.Key + "->" + pair.Value);
+                                }
+                                status["status"] = "would_migrate";
+                            }
+                            else
+                            {
+                                Undo.RecordObject(material, "Migrate Material Shader");
+                                MigrateMaterial(material, target, propertyRemap, keywordRemap, remapped);
+                                EditorUtility.SetDirty(material);
+                                status["status"] = "migrated";
+                            }
+                            if (remapped.Count > 0)
+                                status["remapped"] = remapped;
+                            migrated++;
+                        }
+                        catch (Exception e)
+                        {
+                            status["status"] = "failed";
+                            status["error"] = e.Message;
+                            failed++;
+                        }
+                        results.Add(status);
+                    }
+                }
+                finally
+                {
+                    AssetDatabase.StopAssetEditing();
+                }
+            }
+
+            if (!dryRun && migrated > 0)
+                AssetDatabase.SaveAssets();
+
+            McpLogger.Log($"[ManageMaterial] migrate_shader: {paths.Count} matched, {migrated} {(dryRun ? "would migrate" : "migrated")}, {alreadyConverted} already converted, {unmapped} unmapped, {failed} failed");
+
+            var data = new JsonClass
+            {
+                ["dry_run"] = dryRun,
+                ["matched"] = paths.Count,
+                [dryRun ? "would_migrate" : "migrated"] = migrated,
+                ["already_converted"] = alreadyConverted,
+                ["unmapped"] = unmapped,
+                ["failed"] = failed,
+                ["materials"] = results
+            };
+            string message = dryRun
+                ? $"{migrated} of {paths.Count} material(s) would be migrated ({alreadyConverted} already converted, {unmapped} without a mapping)."
+                : $"Migrated {migrated} of {paths.Count} material(s) ({alreadyConverted} already converted, {unmapped} without a mapping, {failed} failed).";
+            return Response.Success(message, data);
+        }
+
         // --- 内部辅助方法 ---
 
+        /// <summary>
+        /// 切换着色器并按重映射表搬运属性值和关键字。旧属性值在切换前读取，
+        /// 切换后写入目标着色器中存在的新属性；同名属性由 Unity 自动保留。
+        /// </summary>
+        private void MigrateMaterial(Material material, Shader target, List<KeyValuePair<string, string>> propertyRemap,
+            List<KeyValuePair<string, string>> keywordRemap, JsonArray remapped)
+        {
+            Shader source = material.shader;
+            var captured = new List<(string from, string to, object value)>();
+            foreach (var pair in propertyRemap)
+            {
+                if (!material.HasProperty(pair.Key))
+                    continue;
+                int index = source != null ? source.FindPropertyIndex(pair.Key) : -1;
+                if (index < 0)
+                    continue;
+                switch (source.GetPropertyType(index))
+                {
+                    case UnityEngine.Rendering.ShaderPropertyType.Color:
+                        captured.Add((pair.Key, pair.Value, material.GetColor(pair.Key)));
+                        break;
+                    case UnityEngine.Rendering.ShaderPropertyType.Vector:
+                        captured.Add((pair.Key, pair.Value, material.GetVector(pair.Key)));
+                        break;
+                    case UnityEngine.Rendering.ShaderPropertyType.Float:
+                    case UnityEngine.Rendering.ShaderPropertyType.Range:
+                        captured.Add((pair.Key, pair.Value, material.GetFloat(pair.Key)));
+                        break;
+                    case UnityEngine.Rendering.ShaderPropertyType.Texture:
+                        captured.Add((pair.Key, pair.Value, new object[]
+                        {
+                            material.GetTexture(pair.Key), material.GetTextureScale(pair.Key), material.GetTextureOffset(pair.Key)
+                        }));
+                        break;
+                }
+            }
+            var enabledKeywords = new List<string>();
+            foreach (var pair in keywordRemap)
+            {
+                if (material.IsKeywordEnabled(pair.Key))
+                    enabledKeywords.Add(pair.Key);
+            }
+
+            material.shader = target;
+
+            foreach (var (from, newName, value) in captured)
+            {
+                if (string.IsNullOrEmpty(newName) || !material.HasProperty(newName))
+                    continue;
+
+                switch (value)
+                {
+                    case Color color:
+                        material.SetColor(newName, color);
+                        break;
+                    case Vector4 vector:
+                        material.SetVector(newName, vector);
+                        break;
+                    case float number:
+                        material.SetFloat(newName, number);
+                        break;
+                    case object[] texture:
+                        material.SetTexture(newName, texture[0] as Texture);
+                        material.SetTextureScale(newName, (Vector2)texture[1]);
+                        material.SetTextureOffset(newName, (Vector2)texture[2]);
+                        break;
+                }
+                remapped.Add(from + "->" + newName);
+            }
+
+            foreach (var pair in keywordRemap)
+            {
+                if (!enabledKeywords.Contains(pair.Key))
+                    continue;
+                material.DisableKeyword(pair.Key);
+                if (!string.IsNullOrEmpty(pair.Value))
+                    material.EnableKeyword(pair.Value);
+            }
+        }
+
+        /// <summary>
+        /// 读取重映射表（旧名 -> 新名），保持声明顺序
+        /// </summary>
+        private static List<KeyValuePair<string, string>> ReadRemap(JsonClass table)
+        {
+            var remap = new List<KeyValuePair<string, string>>();
+            if (table == null)
+                return remap;
+            foreach (var entry in table.Properties())
+                remap.Add(new KeyValuePair<string, string>(entry.Key, entry.Value?.Value ?? string.Empty));
+            return remap;
+        }
+
+        /// <summary>
+        /// 按名称或资源路径查找着色器
+        /// </summary>
+        private Shader FindShader(string shaderName)
+        {
+            if (string.IsNullOrEmpty(shaderName))
+                return null;
+            Shader shader = Shader.Find(shaderName);
+            if (shader == null)
+                shader = AssetDatabase.LoadAssetAtPath<Shader>(SanitizeAssetPath(shaderName));
+            return shader;
+        }
+
+        private static bool HasShaderProperty(Shader shader, string propertyName)
+        {
+            return !string.IsNullOrEmpty(propertyName) && shader.FindPropertyIndex(propertyName) >= 0;
+        }
+
+        /// <summary>
+        /// 解析 migrate_shader 的材质范围：path 可以是单个材质、文件夹（递归）或通配，为空时为整个 Assets
+        /// </summary>
+        private List<string> ResolveMaterialPaths(string scope, string query)
+        {
+            if (string.IsNullOrEmpty(scope))
+                return ImportSettingsBatch.ResolvePaths(null, query, "t:Material");
+
+            string fullPath = SanitizeAssetPath(scope).TrimEnd('/');
+            if (fullPath.IndexOfAny(new[] { '*', '?' }) >= 0)
+                return ImportSettingsBatch.ResolvePaths(fullPath, query, "t:Material");
+            if (AssetDatabase.IsValidFolder(fullPath))
+                return ImportSettingsBatch.ResolvePaths(fullPath + "/**", query, "t:Material");
+            return AssetExists(fullPath) ? new List<string> { fullPath } : new List<string>();
+        }
+
         /// <summary>
         /// 确保资产路径以"Assets/"开头
         /// </summary>
@@ -20,6 +20,8 @@ namespace UniMcp.Tools
     {
         public override string Description => L.T("Manage mesh assets including import and modify", "管理网格资源，包括导入和修改");
 
+        protected override bool StrictArguments => true;
+
         /// <summary>
         /// 创建当前方法支持的参数键列表
         /// </summary>
@@ -84,8 +86,8 @@ namespace UniMcp.Tools
                     .Leaf("modify", ModifyMesh)
                     .Leaf("optimize", OptimizeMesh)
                     .Leaf("generate_primitive", GeneratePrimitiveMesh)
-                    .Leaf("subdivide", SubdivideMesh)
-                    .Leaf("smooth", SmoothMesh)
+                    .Leaf("subdivide", (Func<StateTreeContext, object>)SubdivideMesh)
+                    .Leaf("smooth", (Func<StateTreeContext, object>)SmoothMesh)
                     .Node("export", "export_format")
                         .Leaf("obj", ExportMeshToOBJ)
                         .Leaf("asset", ExportMeshToAsset)
@@ -316,10 +318,10 @@ namespace UniMcp.Tools
             }
         }
 
-        private object SubdivideMesh(JsonClass args)
+        private object SubdivideMesh(StateTreeContext ctx)
         {
-            string path = args["path"]?.Value;
-            int subdivisionLevel = args["subdivision_level"].AsIntDefault(1);
+            string path = ctx.GetArg<string>("path");
+            int subdivisionLevel = ctx.GetArg("subdivision_level", 1);
 
             if (string.IsNullOrEmpty(path))
                 return Response.Error("'path' is required for subdivide.");
@@ -362,10 +364,10 @@ namespace UniMcp.Tools
             }
         }
 
-        private object SmoothMesh(JsonClass args)
+        private object SmoothMesh(StateTreeContext ctx)
         {
-            string path = args["path"]?.Value;
-            float smoothFactor = args["smooth_factor"].AsFloatDefault(0.5f);
+            string path = ctx.GetArg<string>("path");
+            float smoothFactor = ctx.GetArg("smooth_factor", 0.5f);
 
             if (string.IsNullOrEmpty(path))
                 return Response.Error("'path' is required for smooth.");
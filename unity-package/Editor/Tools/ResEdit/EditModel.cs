@@ -31,7 +31,7 @@ namespace UniMcp.Tools
                     .SetEnumValues("import", "modify", "duplicate", "delete", "get_info", "search", "set_import_settings", "extract_materials", "optimize", "remap_materials"),
                 
                 // 模型路径
-                new MethodStr("path", L.T("Model asset path", "模型资源路径"), false)
+                new MethodStr("path", L.T("Model asset path (not needed for set_import_settings in bulk mode with glob/asset_query)", "模型资源路径（set_import_settings批量模式使用glob/asset_query时不需要）"))
                     .AddExample("Assets/Models/Character.fbx"),
                 
                 // 源文件路径
@@ -157,7 +157,7 @@ namespace UniMcp.Tools
                 
                 // 材质重定向映射
                 new MethodObj("material_remaps", L.T("Material remaps", "材质重定向映射"))
-            };
+            }.Concat(ImportSettingsBatch.CreateKeys()).ToArray();
         }
 
         /// <summary>
@@ -430,10 +430,12 @@ namespace UniMcp.Tools
             string path = args["path"]?.Value;
             JsonClass importSettings = args["import_settings"] as JsonClass;
 
-            if (string.IsNullOrEmpty(path))
-                return Response.Error("'path' is required for set_import_settings.");
             if (importSettings == null || importSettings.Count == 0)
                 return Response.Error("'import_settings' are required for set_import_settings.");
+            if (ImportSettingsBatch.IsBulk(args))
+                return ImportSettingsBatch.Run<ModelImporter>(args, "t:Model", "set_import_settings", importer => ApplyModelImportSettings(importer, importSettings));
+            if (string.IsNullOrEmpty(path))
+                return Response.Error("'path' is required for set_import_settings.");
 
             string fullPath = SanitizeAssetPath(path);
             if (!AssetExists(fullPath))
@@ -19,6 +19,27 @@ namespace UniMcp.Tools
     {
         public override string Description => L.T("Manage prefab assets including create and modify", "管理预制体资源，包括创建和修改");
 
+        /// <summary>
+        /// 会在场景中创建、替换或解包预制体实例的操作；资源本身的读写不影响层级索引
+        /// </summary>
+        protected override bool ModifiesHierarchy(JsonClass args)
+        {
+            switch (args["action"]?.Value)
+            {
+                case "create":
+                case "instantiate":
+                case "unpack":
+                case "pack":
+                case "connect_to_prefab":
+                case "apply_changes":
+                case "revert_changes":
+                case "break_connection":
+                    return true;
+                default:
+                    return false;
+            }
+        }
+
         /// <summary>
         /// 创建当前方法支持的参数键列表
         /// </summary>
@@ -28,7 +49,7 @@ namespace UniMcp.Tools
             {
                 // 操作类型
                 new MethodStr("action", L.T("Operation type", "操作类型"), false)
-                    .SetEnumValues("create", "modify", "duplicate", "get_info", "search", "instantiate", "unpack", "pack"),
+                    .SetEnumValues("create", "modify", "batch_edit", "duplicate", "get_info", "search", "instantiate", "unpack", "pack"),
                 
                 // 预制体路径
                 new MethodStr("path", L.T("Prefab asset path", "预制体资源路径"), false)
@@ -101,7 +122,25 @@ namespace UniMcp.Tools
                 
                 // 父对象
                 new MethodStr("parent", L.T("Parent object name or path", "父对象名称或路径"))
-                    .AddExample("Player")
+                    .AddExample("Player"),
+                
+                // 预制体编辑操作
+                new MethodArr("operations", L.T("modify/batch_edit: operations applied inside the prefab (" + string.Join(", ", PrefabBatchEditor.Operations) + "), target is a child path relative to the prefab root", "modify/batch_edit：在预制体内执行的操作（" + string.Join(", ", PrefabBatchEditor.Operations) + "），target 为相对预制体根节点的子路径"), true, "object")
+                    .AddExample("{\"op\": \"set_property\", \"target\": \"Body\", \"component\": \"MeshRenderer\", \"property\": \"enabled\", \"value\": false}", "{\"op\": \"add_component\", \"component\": \"BoxCollider\"}"),
+                
+                // 批量编辑列表
+                new MethodArr("edits", L.T("batch_edit: per-prefab edits [{path, operations}]", "batch_edit：每个预制体的编辑 [{path, operations}]"), true, "object")
+                    .AddExample("{\"path\": \"Assets/Prefabs/Enemy.prefab\", \"operations\": [{\"op\": \"set_active\", \"target\": \"FX\", \"value\": false}]}"),
+                
+                // 批量选择
+                new MethodStr("glob", L.T("batch_edit: prefab path glob, every match gets 'operations'", "batch_edit：预制体路径通配，每个匹配项执行 operations"))
+                    .AddExample("Assets/Prefabs/Enemies/**/*.prefab"),
+                new MethodStr("asset_query", L.T("batch_edit: project_search style query (FindAssets syntax), combined with glob when both are given", "batch_edit：project_search 风格查询（FindAssets语法），与glob同时提供时取交集"))
+                    .AddExample("l:Enemy"),
+                
+                // 多个实例
+                new MethodArr("targets", L.T("apply_changes/revert_changes: apply or revert several prefab instances in one call (instance IDs, hierarchy paths or hierarchy_search query objects); apply_changes runs in one asset-editing batch", "apply_changes/revert_changes：一次应用或还原多个预制体实例（实例ID、层级路径或 hierarchy_search 查询对象）；apply_changes 在一个资源编辑批次中执行"))
+                    .AddExample("12345", "\"Enemies/*\"")
             };
         }
 
@@ -115,6 +154,7 @@ namespace UniMcp.Tools
                 .Key("action")
                     .Leaf("create", CreatePrefab)
                     .Leaf("modify", ModifyPrefab)
+                    .Leaf("batch_edit", BatchEditPrefabs)
                     .Leaf("duplicate", DuplicatePrefab)
                     .Leaf("get_info", GetPrefabInfo)
                     .Leaf("search", SearchPrefabs)
@@ -219,12 +259,12 @@ namespace UniMcp.Tools
         private object ModifyPrefab(JsonClass args)
         {
             string path = args["path"]?.Value;
-            JsonClass modifications = args["modifications"] as JsonClass;
+            JsonArray operations = args["operations"] as JsonArray;
 
             if (string.IsNullOrEmpty(path))
                 return Response.Error("'path' is required for modify.");
-            if (modifications == null || modifications.Count == 0)
-                return Response.Error("'modifications' are required for modify.");
+            if (operations == null || operations.Count == 0)
+                return Response.Error("'operations' are required for modify.");
 
             string fullPath = SanitizeAssetPath(path);
             if (!AssetExists(fullPath))
@@ -232,43 +272,35 @@ namespace UniMcp.Tools
 
             try
             {
-                GameObject prefabAsset = AssetDatabase.LoadAssetAtPath<GameObject>(fullPath);
-                if (prefabAsset == null)
-                    return Response.Error($"Failed to load prefab at path: {fullPath}");
-
-                // 打开预制体编辑模式
-                // 注意：OpenPrefab 方法在某些Unity版本中可能不可用
-                // PrefabUtility.OpenPrefab(fullPath);
-                LogWarning($"[ManagePrefab] OpenPrefab method not supported in current Unity version");
-
-                bool modified = false;
+                var edits = new List<PrefabBatchEditor.Edit> { new PrefabBatchEditor.Edit { Path = fullPath, Operations = operations } };
+                return PrefabBatchEditor.Run(edits, "modify");
+            }
+            catch (Exception e)
+            {
+                return Response.Error($"Failed to modify prefab '{fullPath}': {e.Message}");
+            }
+        }
 
-                // 应用修改
-                foreach (var modification in modifications.Properties())
-                {
-                    string propertyPath = modification.Key;
-                    JsonNode propertyValue = modification.Value;
+        private object BatchEditPrefabs(JsonClass args)
+        {
+            if (!PrefabBatchEditor.TryParseEdits(args, out var edits, out string error))
+                return Response.Error(error);
 
-                    // 这里需要根据具体的修改需求来实现
-                    // 例如：修改组件属性、添加/删除组件、修改Transform等
-                    LogWarning($"[ManagePrefab] Prefab modification for '{propertyPath}' not fully implemented yet.");
-                }
+            for (int i = 0; i < edits.Count; i++)
+            {
+                string fullPath = SanitizeAssetPath(edits[i].Path);
+                if (!AssetExists(fullPath) || !IsPrefabFile(fullPath))
+                    return Response.Error($"Prefab not found at path: {fullPath}");
+                edits[i] = new PrefabBatchEditor.Edit { Path = fullPath, Operations = edits[i].Operations };
+            }
 
-                if (modified)
-                {
-                    PrefabUtility.SaveAsPrefabAsset(prefabAsset, fullPath);
-                    AssetDatabase.SaveAssets();
-                    McpLogger.Log($"[ManagePrefab] Modified prefab at '{fullPath}'");
-                    return Response.Success($"Prefab '{fullPath}' modified successfully.", GetPrefabData(fullPath));
-                }
-                else
-                {
-                    return Response.Success($"No applicable modifications found for prefab '{fullPath}'.", GetPrefabData(fullPath));
-                }
+            try
+            {
+                return PrefabBatchEditor.Run(edits, "batch_edit");
             }
             catch (Exception e)
             {
-                return Response.Error($"Failed to modify prefab '{fullPath}': {e.Message}");
+                return Response.Error($"Failed to batch edit prefabs: {e.Message}");
             }
         }
 
@@ -625,6 +657,15 @@ namespace UniMcp.Tools
 
         private object ApplyPrefabChanges(JsonClass args)
         {
+            if (args["targets"] is JsonNode targets && !targets.IsNull())
+            {
+                if (!HierarchyTargetsSelector.TryResolve(targets, out GameObject[] instances, out List<string> unmatched, out string error))
+                    return Response.Error(error);
+                if (instances.Length == 0)
+                    return Response.Error($"No GameObjects matched 'targets': {string.Join(", ", unmatched)}");
+                return PrefabBatchEditor.ApplyInstances(instances, "apply_changes");
+            }
+
             string path = args["path"]?.Value;
             string targetObject = args["target_object"]?.Value;
 
@@ -656,6 +697,15 @@ namespace UniMcp.Tools
 
         private object RevertPrefabChanges(JsonClass args)
         {
+            if (args["targets"] is JsonNode targets && !targets.IsNull())
+            {
+                if (!HierarchyTargetsSelector.TryResolve(targets, out GameObject[] instances, out List<string> unmatched, out string error))
+                    return Response.Error(error);
+                if (instances.Length == 0)
+                    return Response.Error($"No GameObjects matched 'targets': {string.Join(", ", unmatched)}");
+                return PrefabBatchEditor.RevertInstances(instances, "revert_changes");
+            }
+
             string targetObject = args["target_object"]?.Value;
 
             if (string.IsNullOrEmpty(targetObject))
@@ -17,6 +17,7 @@ namespace UniMcp.Tools
     /// 对应方法名: manage_scene
     /// </summary>
     [ToolName("edit_scene", "Resource Management", "资源管理")]
+    [ReadOnlyActions("action", "get_hierarchy", "get_active", "get_build_settings")]
     public class EditScene : StateMethodBase
     {
         public override string Description => L.T("Manage scene assets including create and load", "管理场景资源，包括创建和加载");
@@ -43,7 +44,11 @@ namespace UniMcp.Tools
                 // 构建索引
                 new MethodInt("build_index", L.T("Build index", "构建索引"))
                     .SetRange(0, 100)
-                    .AddExample(0)
+                    .AddExample(0),
+
+                // 增量层级
+                new MethodInt("since_version", L.T("For get_hierarchy: return only nodes added, removed or changed since this hierarchy version (from a previous response)", "用于 get_hierarchy：只返回该层级版本（来自上一次响应）之后新增、删除或变化的节点"))
+                    .AddExample(12)
             };
         }
 
@@ -152,6 +157,16 @@ namespace UniMcp.Tools
         /// </summary>
         private object HandleGetHierarchyAction(JsonClass args)
         {
+            if (!args["since_version"].IsNull())
+            {
+                if (!long.TryParse(args["since_version"].Value, out long sinceVersion) || sinceVersion < 0)
+                {
+                    return Response.Error("'since_version' must be a non-negative integer returned by a previous get_hierarchy call.");
+                }
+                McpLogger.Log($"[ManageScene] Getting scene hierarchy changes since version {sinceVersion}");
+                return GetSceneHierarchyChanges(sinceVersion);
+            }
+
             McpLogger.Log("[ManageScene] Getting scene hierarchy");
             return GetSceneHierarchy();
         }
@@ -520,9 +535,17 @@ isLoaded: {activeScene.isLoaded.ToString().ToLower()}
 hierarchy: |
 {string.Join("\n", rootSummary.Select(s => $"  - {s}"))}";
 
+                // 播放模式下不维护层级版本，不返回 version
+                if (!HierarchySnapshot.IsVersioned)
+                {
+                    return Response.Success(
+                        $"Retrieved hierarchy for scene '{activeScene.name}'.",
+                        new { yaml = sceneYaml }
+                    );
+                }
                 return Response.Success(
                     $"Retrieved hierarchy for scene '{activeScene.name}'.",
-                    new { yaml = sceneYaml }
+                    new { yaml = sceneYaml, version = HierarchySnapshot.Version }
                 );
             }
             catch (Exception e)
@@ -531,6 +554,36 @@ hierarchy: |
             }
         }
 
+        /// <summary>
+        /// 获取指定层级版本之后的变化，历史不可用或变化过多时返回完整快照
+        /// </summary>
+        private object GetSceneHierarchyChanges(long sinceVersion)
+        {
+            try
+            {
+                Scene activeScene = EditorSceneManager.GetActiveScene();
+                if (!activeScene.IsValid() || !activeScene.isLoaded)
+                {
+                    return Response.Error(
+                        "No valid and loaded scene is active to get hierarchy from."
+                    );
+                }
+
+                JsonClass changes = HierarchySnapshot.GetChanges(sinceVersion);
+                string message = changes["full"].AsBool
+                    ? changes["version"].IsNull()
+                        ? $"Returned full hierarchy snapshot for scene '{activeScene.name}': {changes["reason"].Value}."
+                        : $"Returned full hierarchy snapshot for scene '{activeScene.name}' at version {changes["version"].Value}: {changes["reason"].Value}."
+                    : $"Retrieved {changes["added"].Count} added, {changes["removed"].Count} removed and {changes["changed"].Count} changed objects in scene '{activeScene.name}' since version {sinceVersion}.";
+                changes["scene"] = activeScene.name;
+                return Response.Success(message, changes);
+            }
+            catch (Exception e)
+            {
+                return Response.Error($"Error getting scene hierarchy changes: {e.Message}");
+            }
+        }
+
         /// <summary>
         /// Recursively builds a data representation of a GameObject and its children.
         /// </summary>
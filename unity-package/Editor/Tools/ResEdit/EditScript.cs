@@ -608,71 +608,35 @@ namespace UniMcp.Tools
         private List<object> SearchTypes(string query)
         {
             var results = new List<object>();
-            var loadedAssemblies = AppDomain.CurrentDomain.GetAssemblies();
 
-            // 转换查询为小写以进行不区分大小写的搜索
-            string lowerQuery = query.ToLowerInvariant();
-            bool isExactMatch = !lowerQuery.Contains("*");
+            // 不区分大小写的搜索；通配符模式只编译一次
+            bool isExactMatch = !query.Contains("*");
+            Regex pattern = isExactMatch
+                ? null
+                : new Regex("^" + Regex.Escape(query).Replace("\\*", ".*") + "$", RegexOptions.IgnoreCase);
 
-            foreach (var assembly in loadedAssemblies)
+            // 使用全局类型索引中缓存的类型列表，避免每次调用都遍历程序集
+            foreach (var type in TypeIndex.AllTypes)
             {
-                try
-                {
-                    // 跳过动态程序集，它们可能会导致问题
-                    if (assembly.IsDynamic)
-                        continue;
+                string typeName = type.Name;
+                string fullName = type.FullName ?? "";
 
-                    Type[] types;
-                    try
-                    {
-                        types = assembly.GetTypes();
-                    }
-                    catch (ReflectionTypeLoadException ex)
-                    {
-                        // 处理无法加载的类型
-                        types = ex.Types.Where(t => t != null).ToArray();
-                    }
+                // 检查是否匹配
+                bool isMatch = isExactMatch
+                    ? typeName.Contains(query, StringComparison.OrdinalIgnoreCase) ||
+                      fullName.Contains(query, StringComparison.OrdinalIgnoreCase)
+                    : pattern.IsMatch(typeName) || pattern.IsMatch(fullName);
 
-                    foreach (var type in types)
-                    {
-                        if (type == null)
-                            continue;
-
-                        bool isMatch = false;
-                        string typeName = type.Name;
-                        string fullName = type.FullName ?? "";
-
-                        // 检查是否匹配
-                        if (isExactMatch)
-                        {
-                            isMatch = typeName.ToLowerInvariant().Contains(lowerQuery) ||
-                                     fullName.ToLowerInvariant().Contains(lowerQuery);
-                        }
-                        else
-                        {
-                            // 支持通配符搜索
-                            string pattern = "^" + Regex.Escape(lowerQuery).Replace("\\*", ".*") + "$";
-                            isMatch = Regex.IsMatch(typeName.ToLowerInvariant(), pattern, RegexOptions.IgnoreCase) ||
-                                     Regex.IsMatch(fullName.ToLowerInvariant(), pattern, RegexOptions.IgnoreCase);
-                        }
-
-                        if (isMatch)
-                        {
-                            results.Add(new
-                            {
-                                name = type.Name,
-                                fullName = type.FullName,
-                                assemblyName = assembly.GetName().Name,
-                                baseType = type.BaseType?.FullName,
-                                nameSpace = type.Namespace
-                            });
-                        }
-                    }
-                }
-                catch (Exception ex)
+                if (isMatch)
                 {
-                    // 记录错误但继续处理其他程序集
-                    McpLogger.LogWarning($"Error searching in assembly {assembly.FullName}: {ex.Message}");
+                    results.Add(new
+                    {
+                        name = type.Name,
+                        fullName = type.FullName,
+                        assemblyName = type.Assembly.GetName().Name,
+                        baseType = type.BaseType?.FullName,
+                        nameSpace = type.Namespace
+                    });
                 }
             }
 
@@ -2,6 +2,7 @@ using System;
 using System.Collections.Generic;
 using System.Linq;
 using System.IO;
+using System.Reflection;
 using UnityEditor;
 using UnityEngine;
 using UnityEngine.U2D;
@@ -34,11 +35,17 @@ namespace UniMcp.Tools
                 // 图集路径
                 new MethodStr("atlas_path", L.T("Atlas asset path", "图集资源路径"), false),
                 
+                // 批量打包的图集路径
+                new MethodArr("atlas_paths", L.T("Atlas path array (pack: pack several atlases in one batch)", "图集路径数组（pack：一次批量打包多个图集）")),
+                
                 // 精灵路径
                 new MethodArr("sprite_paths", L.T("Sprite path array", "精灵路径数组")),
                 
                 // 文件夹路径
-                new MethodArr("folder_paths", L.T("Folder path array", "文件夹路径数组")),
+                new MethodArr("folder_paths", L.T("Folder path array (pack: folders searched for atlases)", "文件夹路径数组（pack：在这些文件夹中查找图集）")),
+                
+                // 强制打包
+                new MethodBool("force", L.T("pack: also pack atlases whose content hash is unchanged, default false", "pack：内容哈希未变化的图集也重新打包，默认为false")),
                 
                 // 包含子文件夹
                 new MethodBool("include_subfolders", L.T("Include subfolders", "包含子文件夹")),
@@ -199,15 +206,38 @@ namespace UniMcp.Tools
         /// </summary>
         private object HandlePackAction(JsonClass args)
         {
+            var atlasPaths = new SortedSet<string>(StringComparer.Ordinal);
             string atlasPath = args["atlas_path"]?.Value;
+            if (!string.IsNullOrEmpty(atlasPath))
+            {
+                atlasPaths.Add(atlasPath);
+            }
+            if (args["atlas_paths"] is JsonArray pathArray)
+            {
+                foreach (var pathNode in pathArray.Childs)
+                {
+                    if (!string.IsNullOrEmpty(pathNode.Value))
+                        atlasPaths.Add(pathNode.Value);
+                }
+            }
+            if (args["folder_paths"] is JsonArray folderArray)
+            {
+                var folders = folderArray.Childs.Select(node => node.Value).Where(AssetDatabase.IsValidFolder).ToArray();
+                if (folders.Length > 0)
+                {
+                    foreach (string guid in AssetDatabase.FindAssets("t:SpriteAtlas", folders))
+                        atlasPaths.Add(AssetDatabase.GUIDToAssetPath(guid));
+                }
+            }
 
-            if (string.IsNullOrEmpty(atlasPath))
+            if (atlasPaths.Count == 0)
             {
-                return Response.Error("'atlas_path' parameter is required.");
+                return Response.Error("'atlas_path', 'atlas_paths' or 'folder_paths' parameter is required for pack.");
             }
 
-            McpLogger.Log($"[EditSpriteAtlas] Packing atlas '{atlasPath}'");
-            return PackAtlas(atlasPath);
+            bool force = args["force"].AsBoolDefault(false);
+            McpLogger.Log($"[EditSpriteAtlas] Packing {atlasPaths.Count} atlas(es){(force ? " (forced)" : string.Empty)}");
+            return PackAtlases(atlasPaths, force);
         }
 
         // --- Core Methods ---
@@ -354,17 +384,19 @@ namespace UniMcp.Tools
                     }
                 }
 
-                // 添加到图集
-                if (objectsToAdd.Count > 0)
+                // 只添加图集中尚不存在的对象，没有变化时不写入图集
+                var existing = new HashSet<UnityEngine.Object>(atlas.GetPackables() ?? new UnityEngine.Object[0]);
+                var newObjects = objectsToAdd.Where(obj => !existing.Contains(obj)).Distinct().ToArray();
+                if (newObjects.Length > 0)
                 {
-                    atlas.Add(objectsToAdd.ToArray());
+                    atlas.Add(newObjects);
                     EditorUtility.SetDirty(atlas);
                     AssetDatabase.SaveAssets();
                     AssetDatabase.Refresh();
                 }
 
-                McpLogger.Log($"[EditSpriteAtlas] Added {objectsToAdd.Count} objects to sprite atlas '{atlasPath}'");
-                return Response.Success($"Added {objectsToAdd.Count} objects to sprite atlas '{atlasPath}'.");
+                McpLogger.Log($"[EditSpriteAtlas] Added {newObjects.Length} objects to sprite atlas '{atlasPath}' ({objectsToAdd.Count - newObjects.Length} already present)");
+                return Response.Success($"Added {newObjects.Length} objects to sprite atlas '{atlasPath}'.", GetChangeData(atlas, atlasPath, newObjects.Length > 0, newObjects.Length));
             }
             catch (Exception e)
             {
@@ -434,17 +466,19 @@ namespace UniMcp.Tools
                     }
                 }
 
-                // 从图集移除
-                if (objectsToRemove.Count > 0)
+                // 只移除图集中实际存在的对象，没有变化时不写入图集
+                var existing = new HashSet<UnityEngine.Object>(atlas.GetPackables() ?? new UnityEngine.Object[0]);
+                var presentObjects = objectsToRemove.Where(existing.Contains).Distinct().ToArray();
+                if (presentObjects.Length > 0)
                 {
-                    atlas.Remove(objectsToRemove.ToArray());
+                    atlas.Remove(presentObjects);
                     EditorUtility.SetDirty(atlas);
                     AssetDatabase.SaveAssets();
                     AssetDatabase.Refresh();
                 }
 
-                McpLogger.Log($"[EditSpriteAtlas] Removed {objectsToRemove.Count} objects from sprite atlas '{atlasPath}'");
-                return Response.Success($"Removed {objectsToRemove.Count} objects from sprite atlas '{atlasPath}'.");
+                McpLogger.Log($"[EditSpriteAtlas] Removed {presentObjects.Length} objects from sprite atlas '{atlasPath}'");
+                return Response.Success($"Removed {presentObjects.Length} objects from sprite atlas '{atlasPath}'.", GetChangeData(atlas, atlasPath, presentObjects.Length > 0, presentObjects.Length));
             }
             catch (Exception e)
             {
@@ -565,25 +599,73 @@ namespace UniMcp.Tools
         }
 
         /// <summary>
-        /// 打包图集
+        /// 打包图集：按内容哈希筛出脏图集，在一次 PackAtlases 调用中为当前构建目标打包
         /// </summary>
-        private object PackAtlas(string atlasPath)
+        private object PackAtlases(ICollection<string> atlasPaths, bool force)
         {
             try
             {
-                // 加载图集
-                SpriteAtlas atlas = AssetDatabase.LoadAssetAtPath<SpriteAtlas>(atlasPath);
-                if (atlas == null)
+                BuildTarget target = EditorUserBuildSettings.activeBuildTarget;
+                var results = new JsonArray();
+                var dirtyAtlases = new List<SpriteAtlas>();
+                var dirtyEntries = new List<(string path, string hash, JsonClass status)>();
+                int clean = 0, missing = 0;
+
+                foreach (string atlasPath in atlasPaths)
                 {
-                    return Response.Error($"Sprite Atlas not found at '{atlasPath}'.");
+                    var status = new JsonClass { ["path"] = atlasPath };
+                    results.Add(status);
+
+                    SpriteAtlas atlas = AssetDatabase.LoadAssetAtPath<SpriteAtlas>(atlasPath);
+                    if (atlas == null)
+                    {
+                        status["status"] = "not_found";
+                        missing++;
+                        continue;
+                    }
+
+                    string hash = SpriteAtlasPackState.ComputeHash(atlas, target, out int memberCount);
+                    status["members"] = memberCount;
+                    if (!force && !SpriteAtlasPackState.IsDirty(atlasPath, hash, target))
+                    {
+                        status["status"] = "clean";
+                        clean++;
+                        continue;
+                    }
+
+                    dirtyAtlases.Add(atlas);
+                    dirtyEntries.Add((atlasPath, hash, status));
                 }
 
-                // 打包图集
-                EditorUtility.SetDirty(atlas);
-                UnityEditor.U2D.SpriteAtlasUtility.PackAtlases(new[] { atlas }, EditorUserBuildSettings.activeBuildTarget);
+                double packMs = 0;
+                if (dirtyAtlases.Count > 0)
+                {
+                    var stopwatch = System.Diagnostics.Stopwatch.StartNew();
+                    SpriteAtlasUtility.PackAtlases(dirtyAtlases.ToArray(), target);
+                    packMs = stopwatch.Elapsed.TotalMilliseconds;
+
+                    for (int i = 0; i < dirtyEntries.Count; i++)
+                    {
+                        var (path, hash, status) = dirtyEntries[i];
+                        SpriteAtlasPackState.MarkPacked(path, hash, target);
+                        status["status"] = "packed";
+                        AppendPackedSize(dirtyAtlases[i], status);
+                    }
+                    SpriteAtlasPackState.Save();
+                }
+
+                McpLogger.Log($"[EditSpriteAtlas] Packed {dirtyAtlases.Count} atlas(es) for {target} in {packMs:F0}ms, {clean} clean, {missing} not found");
 
-                McpLogger.Log($"[EditSpriteAtlas] Successfully packed sprite atlas '{atlasPath}'");
-                return Response.Success($"Packed sprite atlas '{atlasPath}'.");
+                var data = new JsonClass
+                {
+                    ["build_target"] = target.ToString(),
+                    ["packed"] = dirtyAtlases.Count,
+                    ["clean"] = clean,
+                    ["not_found"] = missing,
+                    ["pack_ms"] = Math.Round(packMs, 1),
+                    ["atlases"] = results
+                };
+                return Response.Success($"Packed {dirtyAtlases.Count} of {atlasPaths.Count} atlas(es) for {target} in {packMs:F0}ms ({clean} unchanged).", data);
             }
             catch (Exception e)
             {
@@ -594,6 +676,47 @@ namespace UniMcp.Tools
 
         // --- Helper Methods ---
 
+        private static readonly MethodInfo _getPreviewTextures =
+            typeof(SpriteAtlasExtensions).GetMethod("GetPreviewTextures", BindingFlags.NonPublic | BindingFlags.Static);
+
+        /// <summary>
+        /// 写入打包结果的尺寸：精灵数、图集页纹理尺寸和内存大小（预览纹理通过内部接口读取，不可用时只报告精灵数）
+        /// </summary>
+        private static void AppendPackedSize(SpriteAtlas atlas, JsonClass status)
+        {
+            status["sprite_count"] = atlas.spriteCount;
+            if (!(_getPreviewTextures?.Invoke(null, new object[] { atlas }) is Texture2D[] textures))
+                return;
+
+            var pages = new JsonArray();
+            long bytes = 0;
+            foreach (var texture in textures)
+            {
+                if (texture == null)
+                    continue;
+                pages.Add($"{texture.width}x{texture.height}");
+                bytes += UnityEngine.Profiling.Profiler.GetRuntimeMemorySizeLong(texture);
+            }
+            status["pages"] = pages;
+            status["size_bytes"] = bytes;
+        }
+
+        /// <summary>
+        /// 修改图集后的返回数据：是否有变化、变化数量，以及当前构建目标下是否需要重新打包
+        /// </summary>
+        private static JsonClass GetChangeData(SpriteAtlas atlas, string atlasPath, bool changed, int count)
+        {
+            BuildTarget target = EditorUserBuildSettings.activeBuildTarget;
+            string hash = SpriteAtlasPackState.ComputeHash(atlas, target, out int memberCount);
+            return new JsonClass
+            {
+                ["changed"] = changed,
+                ["count"] = count,
+                ["members"] = memberCount,
+                ["needs_pack"] = SpriteAtlasPackState.IsDirty(atlasPath, hash, target)
+            };
+        }
+
         /// <summary>
         /// 应用图集设置
         /// </summary>
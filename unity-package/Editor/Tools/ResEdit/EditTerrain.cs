@@ -18,6 +18,13 @@ namespace UniMcp.Tools
     {
         public override string Description => L.T("Manage terrain assets including create and modify heightmaps", "管理地形资源，包括创建和修改高度图");
 
+        /// <summary>
+        /// 只有 create 会在场景中创建地形对象
+        /// </summary>
+        protected override bool ModifiesHierarchy(JsonClass args) => args["action"]?.Value == "create";
+
+        protected override bool StrictArguments => true;
+
         /// <summary>
         /// 创建当前方法支持的参数键列表
         /// </summary>
@@ -99,7 +106,7 @@ namespace UniMcp.Tools
             return StateTreeBuilder
                 .Create()
                 .Key("action")
-                    .Leaf("create", CreateTerrain)
+                    .Leaf("create", (Func<StateTreeContext, object>)CreateTerrain)
                     .Leaf("modify", ModifyTerrain)
                     .Leaf("set_height", SetTerrainHeight)
                     .Leaf("paint_texture", PaintTexture)
@@ -117,38 +124,16 @@ namespace UniMcp.Tools
         }
 
         // ===== 创建Terrain =====
-        private object CreateTerrain(JsonClass args)
+        private object CreateTerrain(StateTreeContext ctx)
         {
             try
             {
-                // 获取参数
-                string pathStr = args["path"]?.Value;
-                var positionNode = args["position"];
-                var terrainSizeNode = args["terrain_size"];
-                int heightmapRes = args["heightmap_resolution"].AsIntDefault(513);
-                string terrainDataPath = args["terrain_data_path"]?.Value;
-
-                // 解析位置
-                Vector3 position = Vector3.zero;
-                if (positionNode is JsonArray posArray && posArray.Count >= 3)
-                {
-                    position = new Vector3(
-                        posArray[0].AsFloat,
-                        posArray[1].AsFloat,
-                        posArray[2].AsFloat
-                    );
-                }
-
-                // 解析尺寸
-                Vector3 terrainSize = new Vector3(1000, 600, 1000);
-                if (terrainSizeNode is JsonArray sizeArray && sizeArray.Count >= 3)
-                {
-                    terrainSize = new Vector3(
-                        sizeArray[0].AsFloat,
-                        sizeArray[1].AsFloat,
-                        sizeArray[2].AsFloat
-                    );
-                }
+                // 获取参数（已由 MethodKeyBinder 预先解析）
+                string pathStr = ctx.GetArg<string>("path");
+                int heightmapRes = ctx.GetArg("heightmap_resolution", 513);
+                string terrainDataPath = ctx.GetArg<string>("terrain_data_path");
+                Vector3 position = ctx.GetArg("position", Vector3.zero);
+                Vector3 terrainSize = ctx.GetArg("terrain_size", new Vector3(1000, 600, 1000));
 
                 // 创建TerrainData
                 TerrainData terrainData = new TerrainData();
@@ -27,10 +27,10 @@ namespace UniMcp.Tools
             {
                 // 操作类型
                 new MethodStr("action", L.T("Action type", "操作类型"), false)
-                    .SetEnumValues("set_type", "set_sprite_settings", "get_settings"),
+                    .SetEnumValues("set_type", "set_sprite_settings", "set_import_settings", "get_settings"),
                 
                 // 纹理路径
-                new MethodStr("texture_path", L.T("Texture asset path", "纹理资源路径"), false)
+                new MethodStr("texture_path", L.T("Texture asset path (not needed in bulk mode with glob/asset_query)", "纹理资源路径（批量模式使用glob/asset_query时不需要）"))
                     .AddExample("Assets/Textures/player.png"),
                 
                 // 纹理类型
@@ -86,7 +86,7 @@ namespace UniMcp.Tools
                 
                 // sRGB纹理
                 new MethodBool("srgb_texture", L.T("sRGB texture", "sRGB纹理"))
-            };
+            }.Concat(ImportSettingsBatch.CreateKeys()).ToArray();
         }
 
         protected override StateTree CreateStateTree()
@@ -96,6 +96,7 @@ namespace UniMcp.Tools
                 .Key("action")
                     .Leaf("set_type", HandleSetTypeAction)
                     .Leaf("set_sprite_settings", HandleSetSpriteSettingsAction)
+                    .Leaf("set_import_settings", HandleSetImportSettingsAction)
                     .Leaf("get_settings", HandleGetSettingsAction)
                 .Build();
         }
@@ -110,14 +111,23 @@ namespace UniMcp.Tools
             string texturePath = args["texture_path"]?.Value;
             string textureType = args["texture_type"]?.Value;
 
-            if (string.IsNullOrEmpty(texturePath))
+            if (string.IsNullOrEmpty(textureType))
             {
-                return Response.Error("'texture_path' parameter is required.");
+                return Response.Error("'texture_type' parameter is required.");
             }
 
-            if (string.IsNullOrEmpty(textureType))
+            if (ImportSettingsBatch.IsBulk(args))
             {
-                return Response.Error("'texture_type' parameter is required.");
+                if (!Enum.TryParse<TextureImporterType>(textureType, true, out TextureImporterType type))
+                {
+                    return Response.Error($"Invalid texture type '{textureType}'. Valid types: {string.Join(", ", Enum.GetNames(typeof(TextureImporterType)))}");
+                }
+                return ImportSettingsBatch.Run<TextureImporter>(args, "t:Texture", "set_type", importer => ApplyTextureType(importer, type));
+            }
+
+            if (string.IsNullOrEmpty(texturePath))
+            {
+                return Response.Error("'texture_path' parameter is required.");
             }
 
             McpLogger.Log($"[ManageTexture] Setting texture type to '{textureType}' for '{texturePath}'");
@@ -131,6 +141,12 @@ namespace UniMcp.Tools
         {
             string texturePath = args["texture_path"]?.Value;
 
+            if (ImportSettingsBatch.IsBulk(args))
+            {
+                // 批量模式只应用显式提供的设置
+                return ImportSettingsBatch.Run<TextureImporter>(args, "t:Texture", "set_sprite_settings", importer => ApplySpriteSettings(importer, args, true));
+            }
+
             if (string.IsNullOrEmpty(texturePath))
             {
                 return Response.Error("'texture_path' parameter is required.");
@@ -140,6 +156,49 @@ namespace UniMcp.Tools
             return SetSpriteSettings(args, texturePath);
         }
 
+        /// <summary>
+        /// 处理设置导入设置的操作（压缩、尺寸、过滤、包装、可读写、Mip、sRGB，只应用提供的参数，不改变纹理类型）
+        /// </summary>
+        private object HandleSetImportSettingsAction(JsonClass args)
+        {
+            string texturePath = args["texture_path"]?.Value;
+
+            if (ImportSettingsBatch.IsBulk(args))
+            {
+                return ImportSettingsBatch.Run<TextureImporter>(args, "t:Texture", "set_import_settings", importer => ApplyImportSettings(importer, args));
+            }
+
+            if (string.IsNullOrEmpty(texturePath))
+            {
+                return Response.Error("'texture_path' parameter is required.");
+            }
+
+            try
+            {
+                TextureImporter textureImporter = GetTextureImporter(texturePath);
+                if (textureImporter == null)
+                {
+                    return Response.Error($"Could not get TextureImporter for '{texturePath}'. Make sure the path is correct and points to a texture.");
+                }
+
+                if (!ApplyImportSettings(textureImporter, args))
+                {
+                    return Response.Success($"No import settings provided for '{texturePath}'.");
+                }
+
+                EditorUtility.SetDirty(textureImporter);
+                textureImporter.SaveAndReimport();
+
+                McpLogger.Log($"[ManageTexture] Successfully applied import settings to '{texturePath}'");
+                return Response.Success($"Import settings applied to '{texturePath}'.");
+            }
+            catch (Exception e)
+            {
+                McpLogger.Log($"[ManageTexture] Error setting import settings: {e.Message}");
+                return Response.Error($"Error setting import settings: {e.Message}");
+            }
+        }
+
         /// <summary>
         /// 处理获取纹理设置的操作
         /// </summary>
@@ -178,16 +237,7 @@ namespace UniMcp.Tools
                     return Response.Error($"Invalid texture type '{textureType}'. Valid types: {string.Join(", ", Enum.GetNames(typeof(TextureImporterType)))}");
                 }
 
-                // 设置纹理类型
-                textureImporter.textureType = type;
-
-                // 如果设置为Sprite，自动配置常用的Sprite设置
-                if (type == TextureImporterType.Sprite)
-                {
-                    textureImporter.spriteImportMode = SpriteImportMode.Single;
-                    textureImporter.spritePixelsPerUnit = 100f;
-                    textureImporter.spritePivot = Vector2.one * 0.5f; // Center
-                }
+                ApplyTextureType(textureImporter, type);
 
                 // 应用设置并重新导入
                 EditorUtility.SetDirty(textureImporter);
@@ -217,42 +267,7 @@ namespace UniMcp.Tools
                     return Response.Error($"Could not get TextureImporter for '{texturePath}'. Make sure the path is correct and points to a texture.");
                 }
 
-                // 确保是Sprite类型
-                if (textureImporter.textureType != TextureImporterType.Sprite)
-                {
-                    textureImporter.textureType = TextureImporterType.Sprite;
-                }
-
-                // 设置Sprite模式
-                string spriteMode = args["sprite_mode"]?.Value;
-                if (!string.IsNullOrEmpty(spriteMode))
-                {
-                    if (Enum.TryParse<SpriteImportMode>(spriteMode, true, out SpriteImportMode mode))
-                    {
-                        textureImporter.spriteImportMode = mode;
-                    }
-                }
-
-                // 设置每单位像素数
-                float pixelsPerUnit = args["pixels_per_unit"].AsFloatDefault(100f);
-                textureImporter.spritePixelsPerUnit = pixelsPerUnit;
-
-                // 设置轴心点
-                string spritePivot = args["sprite_pivot"]?.Value;
-                if (!string.IsNullOrEmpty(spritePivot))
-                {
-                    Vector2 pivot = GetPivotVector(spritePivot);
-                    textureImporter.spritePivot = pivot;
-                }
-
-                // 注意：某些高级Sprite设置可能在不同Unity版本中不可用
-                // 这些设置通常通过Unity Editor UI手动配置
-
-                // 设置压缩和质量
-                SetTextureCompressionSettings(textureImporter, args);
-
-                // 设置其他通用设置
-                SetGeneralTextureSettings(textureImporter, args);
+                ApplySpriteSettings(textureImporter, args, false);
 
                 // 应用设置并重新导入
                 EditorUtility.SetDirty(textureImporter);
@@ -307,6 +322,85 @@ namespace UniMcp.Tools
 
         // --- Helper Methods ---
 
+        /// <summary>
+        /// 设置纹理类型（设置为Sprite时自动配置常用的Sprite设置），不保存
+        /// </summary>
+        private bool ApplyTextureType(TextureImporter textureImporter, TextureImporterType type)
+        {
+            textureImporter.textureType = type;
+
+            // 如果设置为Sprite，自动配置常用的Sprite设置
+            if (type == TextureImporterType.Sprite)
+            {
+                textureImporter.spriteImportMode = SpriteImportMode.Single;
+                textureImporter.spritePixelsPerUnit = 100f;
+                textureImporter.spritePivot = Vector2.one * 0.5f; // Center
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// 应用Sprite设置，不保存。onlyProvided 为 true 时未提供的参数保持不变，否则使用默认值
+        /// </summary>
+        private bool ApplySpriteSettings(TextureImporter textureImporter, JsonClass args, bool onlyProvided)
+        {
+            // 确保是Sprite类型
+            if (textureImporter.textureType != TextureImporterType.Sprite)
+            {
+                textureImporter.textureType = TextureImporterType.Sprite;
+            }
+
+            // 设置Sprite模式
+            string spriteMode = args["sprite_mode"]?.Value;
+            if (!string.IsNullOrEmpty(spriteMode))
+            {
+                if (Enum.TryParse<SpriteImportMode>(spriteMode, true, out SpriteImportMode mode))
+                {
+                    textureImporter.spriteImportMode = mode;
+                }
+            }
+
+            // 设置每单位像素数
+            if (!onlyProvided || !args["pixels_per_unit"].IsNull())
+            {
+                textureImporter.spritePixelsPerUnit = args["pixels_per_unit"].AsFloatDefault(100f);
+            }
+
+            // 设置轴心点
+            string spritePivot = args["sprite_pivot"]?.Value;
+            if (!string.IsNullOrEmpty(spritePivot))
+            {
+                Vector2 pivot = GetPivotVector(spritePivot);
+                textureImporter.spritePivot = pivot;
+            }
+
+            // 注意：某些高级Sprite设置可能在不同Unity版本中不可用
+            // 这些设置通常通过Unity Editor UI手动配置
+
+            // 设置压缩和质量
+            SetTextureCompressionSettings(textureImporter, args, onlyProvided);
+
+            // 设置其他通用设置
+            SetGeneralTextureSettings(textureImporter, args, onlyProvided);
+            return true;
+        }
+
+        /// <summary>
+        /// 应用导入设置（只应用提供的参数），不保存；没有提供任何设置时返回 false
+        /// </summary>
+        private bool ApplyImportSettings(TextureImporter textureImporter, JsonClass args)
+        {
+            string[] keys = { "compression", "max_texture_size", "filter_mode", "wrap_mode", "readable", "generate_mip_maps", "srgb_texture" };
+            if (!keys.Any(key => !args[key].IsNull()))
+            {
+                return false;
+            }
+
+            SetTextureCompressionSettings(textureImporter, args, true);
+            SetGeneralTextureSettings(textureImporter, args, true);
+            return true;
+        }
+
         /// <summary>
         /// 获取纹理导入器
         /// </summary>
@@ -357,7 +451,7 @@ namespace UniMcp.Tools
         /// <summary>
         /// 设置纹理压缩设置
         /// </summary>
-        private void SetTextureCompressionSettings(TextureImporter textureImporter, JsonClass args)
+        private void SetTextureCompressionSettings(TextureImporter textureImporter, JsonClass args, bool onlyProvided = false)
         {
             // 设置压缩格式
             string compression = args["compression"]?.Value;
@@ -381,14 +475,17 @@ namespace UniMcp.Tools
             }
 
             // 设置最大纹理尺寸
-            int maxSize = args["max_texture_size"].AsIntDefault(2048);
-            textureImporter.maxTextureSize = maxSize;
+            if (!onlyProvided || !args["max_texture_size"].IsNull())
+            {
+                int maxSize = args["max_texture_size"].AsIntDefault(2048);
+                textureImporter.maxTextureSize = maxSize;
+            }
         }
 
         /// <summary>
         /// 设置通用纹理设置
         /// </summary>
-        private void SetGeneralTextureSettings(TextureImporter textureImporter, JsonClass args)
+        private void SetGeneralTextureSettings(TextureImporter textureImporter, JsonClass args, bool onlyProvided = false)
         {
             // 设置过滤模式
             string filterMode = args["filter_mode"]?.Value;
@@ -411,16 +508,25 @@ namespace UniMcp.Tools
             }
 
             // 设置是否可读
-            bool readable = args["readable"].AsBoolDefault(false);
-            textureImporter.isReadable = readable;
+            if (!onlyProvided || !args["readable"].IsNull())
+            {
+                bool readable = args["readable"].AsBoolDefault(false);
+                textureImporter.isReadable = readable;
+            }
 
             // 设置是否生成Mip贴图
-            bool generateMipMaps = args["generate_mip_maps"].AsBoolDefault(true);
-            textureImporter.mipmapEnabled = generateMipMaps;
+            if (!onlyProvided || !args["generate_mip_maps"].IsNull())
+            {
+                bool generateMipMaps = args["generate_mip_maps"].AsBoolDefault(true);
+                textureImporter.mipmapEnabled = generateMipMaps;
+            }
 
             // 设置sRGB纹理
-            bool srgbTexture = args["srgb_texture"].AsBoolDefault(true);
-            textureImporter.sRGBTexture = srgbTexture;
+            if (!onlyProvided || !args["srgb_texture"].IsNull())
+            {
+                bool srgbTexture = args["srgb_texture"].AsBoolDefault(true);
+                textureImporter.sRGBTexture = srgbTexture;
+            }
         }
     }
 }
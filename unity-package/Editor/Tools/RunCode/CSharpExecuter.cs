@@ -27,6 +27,8 @@ namespace UniMcp.Tools
     {
         public override string Description => "使用 Roslyn 在内存中编译并执行 C# 代码（无临时文件，同步执行）";
 
+        protected override bool ModifiesHierarchy(JsonClass args) => true;
+
         private class ExecutionResult
         {
             public string MethodName { get; set; }
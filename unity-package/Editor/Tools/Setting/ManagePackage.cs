@@ -198,7 +198,10 @@ namespace UniMcp.Tools
                     .SetDefault(60),
                 
                 // Disable auto refresh
-                new MethodBool("disable_auto_refresh", L.T("Disable automatic assembly refresh", "禁用自动程序集刷新"))
+                new MethodBool("disable_auto_refresh", L.T("Disable automatic assembly refresh", "禁用自动程序集刷新")),
+                
+                // Bypass catalog cache
+                new MethodBool("refresh", L.T("list/search: bypass the local catalog cache and wait for a fresh result from the Package Manager", "list/search：绕过本地包目录缓存，等待包管理器返回最新结果"))
             };
         }
 
@@ -274,6 +277,13 @@ namespace UniMcp.Tools
         private object HandleListPackages(StateTreeContext ctx)
         {
             McpLogger.Log("[ManagePackage] Executing list packages operation");
+            bool includeIndirect = ctx.JsonData["include_dependencies"].AsBoolDefault(false);
+            if (!ctx.JsonData["refresh"].AsBoolDefault(false))
+            {
+                // 由 manifest/lock 哈希对应的本地快照直接回答，快照过期时后台重新校验
+                var packages = PackageCatalogCache.GetInstalled(includeIndirect, out bool fresh, out DateTime capturedUtc);
+                return BuildPackagesResult("list", packages, fresh ? "snapshot" : "stale_snapshot", capturedUtc, true);
+            }
             // 为包管理操作设置超时时间（60秒）
             return ctx.AsyncReturn(ExecuteListPackagesAsync(ctx), 60f);
         }
@@ -284,6 +294,15 @@ namespace UniMcp.Tools
         private object HandleSearchPackages(StateTreeContext ctx)
         {
             McpLogger.Log("[ManagePackage] Executing search packages operation");
+            string keywords = ctx.JsonData["search_keywords"]?.Value ?? string.Empty;
+            if (!ctx.JsonData["refresh"].AsBoolDefault(false) &&
+                PackageCatalogCache.TryGetSearch(keywords, out var cached, out bool stale, out DateTime capturedUtc))
+            {
+                // 过期结果立即返回，同时在后台刷新
+                if (stale)
+                    PackageCatalogCache.Search(keywords, null);
+                return BuildPackagesResult("search", cached, stale ? "stale_cache" : "cache", capturedUtc, false);
+            }
             // 为包管理操作设置超时时间（120秒）
             return ctx.AsyncReturn(ExecuteSearchPackagesAsync(ctx), 120f);
         }
@@ -552,32 +571,37 @@ namespace UniMcp.Tools
         /// </summary>
         private IEnumerator ExecuteListPackagesAsync(StateTreeContext ctx)
         {
-            // 在协程外部处理异常，避免在try-catch中使用yield return
             operationResult = null;
-            ListRequest request = null;
-            bool failed = false;
+            bool includeIndirect = ctx.JsonData["include_dependencies"].AsBoolDefault(false);
+            McpLogger.Log($"[ManagePackage] 列出包 (包含间接依赖: {includeIndirect})");
 
+            int timeout = ctx.JsonData["timeout"].AsIntDefault(60);
+            var signal = new CoroutineRunner.WaitForSignal(timeout);
+            bool waiting = true;
+            object result = null;
             try
             {
-                bool includeIndirect = ctx.JsonData["include_dependencies"].AsBoolDefault(false);
-                McpLogger.Log($"[ManagePackage] 列出包 (包含间接依赖: {includeIndirect})");
-
-                request = Client.List(includeIndirect);
+                PackageCatalogCache.RefreshInstalled((packages, error) =>
+                {
+                    // 超时后到达的结果不再写入，避免覆盖后续操作
+                    if (!waiting)
+                        return;
+                    result = error != null
+                        ? Response.Error($"Failed to list packages: {error}")
+                        : BuildPackagesResult("list", packages.Where(p => includeIndirect || p.IsDirect).ToList(), "package_manager", DateTime.UtcNow, true);
+                    signal.Set();
+                });
             }
             catch (Exception e)
             {
                 LogError($"[ManagePackage] 列出包失败: {e.Message}");
-                operationResult = Response.Error($"Failed to list packages: {e.Message}");
-                failed = true;
-            }
-
-            if (failed)
-            {
-                yield return operationResult;
-                yield break;
+                result = Response.Error($"Failed to list packages: {e.Message}");
+                signal.Set();
             }
 
-            yield return MonitorOperationAsync(request, "list", ctx.JsonData);
+            yield return signal;
+            waiting = false;
+            operationResult = signal.IsSet ? result : Response.Error($"Operation timeout ({timeout} seconds)");
             yield return operationResult;
         }
 
@@ -586,42 +610,38 @@ namespace UniMcp.Tools
         /// </summary>
         private IEnumerator ExecuteSearchPackagesAsync(StateTreeContext ctx)
         {
-            // 在协程外部处理异常，避免在try-catch中使用yield return
             operationResult = null;
-            SearchRequest request = null;
-            bool failed = false;
+            string keywords = ctx.JsonData["search_keywords"]?.Value ?? string.Empty;
+            McpLogger.Log(keywords.Length == 0 ? "[ManagePackage] 搜索所有包" : $"[ManagePackage] 搜索包: {keywords}");
 
+            int timeout = ctx.JsonData["timeout"].AsIntDefault(60);
+            var signal = new CoroutineRunner.WaitForSignal(timeout);
+            bool waiting = true;
+            object result = null;
             try
             {
-                string keywords = ctx.JsonData["search_keywords"]?.Value;
-
-                if (string.IsNullOrEmpty(keywords))
+                // 关键词为空时搜索所有包，结果写入带 TTL 的缓存
+                PackageCatalogCache.Search(keywords, (packages, error) =>
                 {
-                    // 如果没有关键词，搜索所有包
-                    McpLogger.Log("[ManagePackage] 搜索所有包");
-                    request = Client.SearchAll();
-                }
-                else
-                {
-                    // 搜索特定包
-                    McpLogger.Log($"[ManagePackage] 搜索包: {keywords}");
-                    request = Client.Search(keywords);
-                }
+                    // 超时后到达的结果不再写入，避免覆盖后续操作
+                    if (!waiting)
+                        return;
+                    result = error != null
+                        ? Response.Error($"Failed to search packages: {error}")
+                        : BuildPackagesResult("search", packages, "registry", DateTime.UtcNow, false);
+                    signal.Set();
+                });
             }
             catch (Exception e)
             {
                 LogError($"[ManagePackage] 搜索包失败: {e.Message}");
-                operationResult = Response.Error($"Failed to search packages: {e.Message}");
-                failed = true;
+                result = Response.Error($"Failed to search packages: {e.Message}");
+                signal.Set();
             }
 
-            if (failed)
-            {
-                yield return operationResult;
-                yield break;
-            }
-
-            yield return MonitorOperationAsync(request, "search", ctx.JsonData);
+            yield return signal;
+            waiting = false;
+            operationResult = signal.IsSet ? result : Response.Error($"Operation timeout ({timeout} seconds)");
             yield return operationResult;
         }
 
@@ -679,22 +699,14 @@ namespace UniMcp.Tools
         private IEnumerator MonitorOperationAsync(Request request, string operationType, JsonClass args)
         {
             int timeout = args["timeout"].AsIntDefault(60); // 增加超时时间到60秒
-            float elapsedTime = 0f;
 
             McpLogger.Log($"[ManagePackage] 开始监控 {operationType} 操作，超时时间: {timeout}秒");
 
-            while (!request.IsCompleted && elapsedTime < timeout)
-            {
-                yield return new WaitForSeconds(0.1f);
-                elapsedTime += 0.1f;
-
-                if (Mathf.FloorToInt(elapsedTime) != Mathf.FloorToInt(elapsedTime - 0.1f))
-                {
-                    McpLogger.Log($"[ManagePackage] {operationType} 操作进行中... 已等待: {elapsedTime:F1}s");
-                }
-            }
+            var signal = new CoroutineRunner.WaitForSignal(timeout);
+            PackageCatalogCache.Watch(request, _ => signal.Set());
+            yield return signal;
 
-            if (elapsedTime >= timeout)
+            if (!signal.IsSet)
             {
                 operationResult = Response.Error($"Operation timeout ({timeout} seconds)");
             }
@@ -719,23 +731,14 @@ namespace UniMcp.Tools
         /// </summary>
         private IEnumerator WaitForRequestOnlyAsync(Request request, string operationType, int timeout, string packageName, bool wasAutoRefreshDisabled = false)
         {
-            float elapsedTime = 0f;
-
             McpLogger.Log($"[ManagePackage] 开始等待 {operationType} 请求完成: {packageName}，超时时间: {timeout}秒");
 
-            while (!request.IsCompleted && elapsedTime < timeout)
-            {
-                yield return new WaitForSeconds(0.1f);
-                elapsedTime += 0.1f;
-
-                if (Mathf.FloorToInt(elapsedTime) != Mathf.FloorToInt(elapsedTime - 0.1f))
-                {
-                    McpLogger.Log($"[ManagePackage] 等待 {operationType} 请求完成中... 已等待: {elapsedTime:F1}s");
-                }
-            }
+            var signal = new CoroutineRunner.WaitForSignal(timeout);
+            PackageCatalogCache.Watch(request, _ => signal.Set());
+            yield return signal;
 
             // 处理请求结果
-            if (elapsedTime >= timeout)
+            if (!signal.IsSet)
             {
                 operationResult = Response.Error($"Request timeout ({timeout} seconds)");
                 LogWarning($"[ManagePackage] {operationType} 请求超时: {packageName}");
@@ -937,10 +940,6 @@ namespace UniMcp.Tools
                     return ProcessAddResult(request as AddRequest);
                 case "remove":
                     return ProcessRemoveResult(request as RemoveRequest);
-                case "list":
-                    return ProcessListResult(request as ListRequest);
-                case "search":
-                    return ProcessSearchResult(request as SearchRequest);
                 default:
                     return Response.Success($"{operationType} operation completed");
             }
@@ -990,69 +989,40 @@ namespace UniMcp.Tools
         }
 
         /// <summary>
-        /// 处理列出包的结果
+        /// 构建 list/search 的返回结果，cache 描述结果来源和快照时间
         /// </summary>
-        private object ProcessListResult(ListRequest request)
+        private object BuildPackagesResult(string operation, List<PackageCatalogCache.Entry> packages, string source, DateTime capturedUtc, bool includeResolvedPath)
         {
-            var packages = request.Result;
-            if (packages != null)
+            var packageList = packages.Select(pkg =>
             {
-                var packageList = packages.Select(pkg => new
+                var info = new Dictionary<string, object>
                 {
-                    name = pkg.name,
-                    display_name = pkg.displayName,
-                    version = pkg.version,
-                    description = pkg.description,
-                    // status = pkg.status.ToString(), // Removed deprecated API
-                    source = pkg.source.ToString(),
-                    package_id = pkg.packageId,
-                    resolved_path = pkg.resolvedPath
-                }).ToArray();
-
-                return Response.Success(
-                    $"找到 {packageList.Length} 个包",
-                    new
-                    {
-                        operation = "list",
-                        package_count = packageList.Length,
-                        packages = packageList
-                    }
-                );
-            }
-
-            return Response.Success("Package list operation completed, but no package information returned");
-        }
+                    { "name", pkg.Name },
+                    { "display_name", pkg.DisplayName },
+                    { "version", pkg.Version },
+                    { "description", pkg.Description },
+                    { "source", pkg.Source },
+                    { "package_id", pkg.PackageId }
+                };
+                if (includeResolvedPath)
+                    info["resolved_path"] = pkg.ResolvedPath;
+                return info;
+            }).ToArray();
 
-        /// <summary>
-        /// 处理搜索包的结果
-        /// </summary>
-        private object ProcessSearchResult(SearchRequest request)
-        {
-            var searchResult = request.Result;
-            if (searchResult != null)
-            {
-                var packages = searchResult.Select(pkg => new
+            return Response.Success(
+                operation == "list" ? $"找到 {packageList.Length} 个包" : $"搜索到 {packageList.Length} 个包",
+                new
                 {
-                    name = pkg.name,
-                    display_name = pkg.displayName,
-                    version = pkg.version,
-                    description = pkg.description,
-                    source = pkg.source.ToString(),
-                    package_id = pkg.packageId
-                }).ToArray();
-
-                return Response.Success(
-                    $"搜索到 {packages.Length} 个包",
-                    new
+                    operation = operation,
+                    package_count = packageList.Length,
+                    packages = packageList,
+                    cache = new
                     {
-                        operation = "search",
-                        package_count = packages.Length,
-                        packages = packages
+                        source = source,
+                        captured_at = capturedUtc.ToLocalTime().ToString("yyyy-MM-dd HH:mm:ss")
                     }
-                );
-            }
-
-            return Response.Success("Package search operation completed, but no search results returned");
+                }
+            );
         }
     }
 }
\ No newline at end of file
@@ -365,9 +365,10 @@ namespace UniMcp.Tools
         /// </summary>
         private bool ApplyAnchorPreset(RectTransform rectTransform, StateTreeContext args)
         {
-            if (args.TryGetValue("tattoo_preset", out object presetObj) && presetObj != null)
+            string presetArg = args.GetArg<string>("tattoo_preset");
+            if (!string.IsNullOrEmpty(presetArg))
             {
-                string preset = presetObj.ToString().ToLower();
+                string preset = presetArg.ToLower();
                 Vector2 targetAnchorMin, targetAnchorMax, targetPivot;
 
                 switch (preset)
@@ -437,14 +438,7 @@ namespace UniMcp.Tools
                 }
 
                 // 检查是否使用tattoo_self模式
-                bool anchorSelf = false;
-                if (args.TryGetValue("tattoo_self", out object anchorSelfObj))
-                {
-                    if (anchorSelfObj is bool anchorSelfBool)
-                        anchorSelf = anchorSelfBool;
-                    else if (bool.TryParse(anchorSelfObj?.ToString(), out bool parsedAnchorSelf))
-                        anchorSelf = parsedAnchorSelf;
-                }
+                bool anchorSelf = args.GetArg("tattoo_self", false);
 
                 // 如果使用tattoo_self模式，基于元素当前位置重新计算锚点
                 if (anchorSelf)
@@ -688,14 +682,11 @@ namespace UniMcp.Tools
         /// </summary>
         private bool ApplyAnchoredPosition(RectTransform rectTransform, StateTreeContext args)
         {
-            if (args.TryGetValue("anchored_pos", out object positionObj) || args.TryGetValue("anchored_position", out positionObj))
+            Vector2? position = GetVector2Arg(args, "anchored_pos") ?? GetVector2Arg(args, "anchored_position");
+            if (position.HasValue && rectTransform.anchoredPosition != position.Value)
             {
-                Vector2? position = ParseVector2(positionObj);
-                if (position.HasValue && rectTransform.anchoredPosition != position.Value)
-                {
-                    rectTransform.anchoredPosition = position.Value;
-                    return true;
-                }
+                rectTransform.anchoredPosition = position.Value;
+                return true;
             }
             return false;
         }
@@ -708,26 +699,23 @@ namespace UniMcp.Tools
         /// </summary>
         private bool ApplySizeDelta(RectTransform rectTransform, StateTreeContext args)
         {
-            if (args.TryGetValue("size_delta", out object sizeObj))
+            Vector2? size = GetVector2Arg(args, "size_delta");
+            if (size.HasValue && rectTransform.sizeDelta != size.Value)
             {
-                Vector2? size = ParseVector2(sizeObj);
-                if (size.HasValue && rectTransform.sizeDelta != size.Value)
+                Vector2 anchorMin = rectTransform.anchorMin;
+                Vector2 anchorMax = rectTransform.anchorMax;
+                // 检查水平方向或垂直方向是否为拉伸（anchorMin ≠ anchorMax）
+                if ((Mathf.Abs(anchorMin.x - anchorMax.x) > 1e-4f) || (Mathf.Abs(anchorMin.y - anchorMax.y) > 1e-4f))
                 {
-                    Vector2 anchorMin = rectTransform.anchorMin;
-                    Vector2 anchorMax = rectTransform.anchorMax;
-                    // 检查水平方向或垂直方向是否为拉伸（anchorMin ≠ anchorMax）
-                    if ((Mathf.Abs(anchorMin.x - anchorMax.x) > 1e-4f) || (Mathf.Abs(anchorMin.y - anchorMax.y) > 1e-4f))
-                    {
-                        // 拉伸模式下直接设置sizeDelta可能无效，需要用SetSizeWithCurrentAnchors
-                        rectTransform.SetSizeWithCurrentAnchors(RectTransform.Axis.Horizontal, size.Value.x);
-                        rectTransform.SetSizeWithCurrentAnchors(RectTransform.Axis.Vertical, size.Value.y);
-                    }
-                    else
-                    {
-                        rectTransform.sizeDelta = size.Value;
-                    }
-                    return true;
+                    // 拉伸模式下直接设置sizeDelta可能无效，需要用SetSizeWithCurrentAnchors
+                    rectTransform.SetSizeWithCurrentAnchors(RectTransform.Axis.Horizontal, size.Value.x);
+                    rectTransform.SetSizeWithCurrentAnchors(RectTransform.Axis.Vertical, size.Value.y);
+                }
+                else
+                {
+                    rectTransform.sizeDelta = size.Value;
                 }
+                return true;
             }
             return false;
         }
@@ -737,14 +725,11 @@ namespace UniMcp.Tools
         /// </summary>
         private bool ApplyAnchorMin(RectTransform rectTransform, StateTreeContext args)
         {
-            if (args.TryGetValue("anchor_min", out object anchorObj))
+            Vector2? anchor = GetVector2Arg(args, "anchor_min");
+            if (anchor.HasValue && rectTransform.anchorMin != anchor.Value)
             {
-                Vector2? anchor = ParseVector2(anchorObj);
-                if (anchor.HasValue && rectTransform.anchorMin != anchor.Value)
-                {
-                    rectTransform.anchorMin = anchor.Value;
-                    return true;
-                }
+                rectTransform.anchorMin = anchor.Value;
+                return true;
             }
             return false;
         }
@@ -754,14 +739,11 @@ namespace UniMcp.Tools
         /// </summary>
         private bool ApplyAnchorMax(RectTransform rectTransform, StateTreeContext args)
         {
-            if (args.TryGetValue("anchor_max", out object anchorObj))
+            Vector2? anchor = GetVector2Arg(args, "anchor_max");
+            if (anchor.HasValue && rectTransform.anchorMax != anchor.Value)
             {
-                Vector2? anchor = ParseVector2(anchorObj);
-                if (anchor.HasValue && rectTransform.anchorMax != anchor.Value)
-                {
-                    rectTransform.anchorMax = anchor.Value;
-                    return true;
-                }
+                rectTransform.anchorMax = anchor.Value;
+                return true;
             }
             return false;
         }
@@ -771,14 +753,11 @@ namespace UniMcp.Tools
         /// </summary>
         private bool ApplyPivot(RectTransform rectTransform, StateTreeContext args)
         {
-            if (args.TryGetValue("pivot", out object pivotObj))
+            Vector2? pivot = GetVector2Arg(args, "pivot");
+            if (pivot.HasValue && rectTransform.pivot != pivot.Value)
             {
-                Vector2? pivot = ParseVector2(pivotObj);
-                if (pivot.HasValue && rectTransform.pivot != pivot.Value)
-                {
-                    rectTransform.pivot = pivot.Value;
-                    return true;
-                }
+                rectTransform.pivot = pivot.Value;
+                return true;
             }
             return false;
         }
@@ -789,16 +768,15 @@ namespace UniMcp.Tools
         /// </summary>
         private bool ApplySetSiblingIndex(RectTransform rectTransform, StateTreeContext args)
         {
-            if (args.TryGetValue("sibling_index", out object indexObj))
+            int? siblingIndexArg = args.GetArg<int?>("sibling_index");
+            if (siblingIndexArg.HasValue)
             {
-                if (int.TryParse(indexObj?.ToString(), out int siblingIndex))
+                int siblingIndex = siblingIndexArg.Value;
+                int currentIndex = rectTransform.GetSiblingIndex();
+                if (currentIndex != siblingIndex)
                 {
-                    int currentIndex = rectTransform.GetSiblingIndex();
-                    if (currentIndex != siblingIndex)
-                    {
-                        rectTransform.SetSiblingIndex(siblingIndex);
-                        return true;
-                    }
+                    rectTransform.SetSiblingIndex(siblingIndex);
+                    return true;
                 }
             }
             return false;
@@ -1111,6 +1089,18 @@ namespace UniMcp.Tools
             }
         }
 
+        /// <summary>
+        /// 读取二维向量参数：优先使用绑定器解析好的值，未绑定（别名或宽松模式下无法转换）时按原始参数解析
+        /// </summary>
+        private Vector2? GetVector2Arg(StateTreeContext args, string key)
+        {
+            if (args.Arguments != null && args.Arguments.TryGetProvided(key, out Vector2 bound))
+                return bound;
+            if (args.Arguments != null && args.Arguments.IsProvided(key))
+                return null;
+            return args.TryGetValue(key, out object raw) ? ParseVector2(raw) : null;
+        }
+
         /// <summary>
         /// 解析Vector2，支持多种格式：JsonArray、Vector2、字符串
         /// 支持格式: [1, 2], ["1", "2"], "[1, 2]", "(1, 2)", "1, 2"
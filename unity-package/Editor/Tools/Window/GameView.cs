@@ -16,6 +16,8 @@ namespace UniMcp.Tools
     /// 对应方法名: game_view
     /// </summary>
     [ToolName("game_view", "Window Management", "窗口管理")]
+    [ReadOnlyActions("action", "get_resolution")]
+    [ReadOnlyActions("action", "get_stats", MaxAgeSeconds = 1)]
     public class GameView : StateMethodBase
     {
         public override string Description => L.T("Manage and control Unity Game view window", "管理和控制Unity游戏视图窗口");
@@ -0,0 +1,308 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using UnityEditor;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 持久化的资源反向依赖索引（谁引用了这个资源）。
+    /// 以 GUID 记录 Assets/ 下每个资源的直接依赖、依赖哈希和路径，并维护反向边，
+    /// 直接引用和传递引用的查询时间只与结果数量有关。
+    /// 索引保存在 Library/UniMcp/AssetDependencyIndex.bin，域重载后加载缓存，
+    /// 再由 AssetIndexScanner 分片校验全部资源（依赖哈希未变化的资源跳过），首次使用时即为完整构建。
+    /// 资源导入、删除、移动由 AssetPostprocessor 增量更新。仅在主线程访问。
+    /// </summary>
+    [InitializeOnLoad]
+    public static class AssetDependencyIndex
+    {
+        private const int FormatVersion = 1;
+
+        private sealed class Entry
+        {
+            public string Path;
+            public string Hash;
+            public string[] Dependencies;
+        }
+
+        private static readonly Dictionary<string, Entry> _entries = new Dictionary<string, Entry>(StringComparer.Ordinal);
+        private static readonly Dictionary<string, HashSet<string>> _referencers = new Dictionary<string, HashSet<string>>(StringComparer.Ordinal);
+        private static readonly Scanner _scanner = new Scanner();
+
+        private static DateTime _lastUpdateUtc;
+
+        static AssetDependencyIndex()
+        {
+            EditorApplication.quitting += _scanner.Save;
+            AssemblyReloadEvents.beforeAssemblyReload += _scanner.Save;
+            EditorApplication.delayCall += _scanner.EnsureLoaded;
+        }
+
+        /// <summary>
+        /// 索引是否完整且没有待处理的资源
+        /// </summary>
+        public static bool IsReady => _scanner.IsReady;
+
+        /// <summary>
+        /// 查询 assetPath 的引用者（资源路径）。transitive 为 true 时包含间接引用。
+        /// 查询前先在 budgetMs 内同步处理待更新的资源；索引尚未完整时 complete 为 false
+        /// </summary>
+        /// <param name="assetPath">被引用的资源路径</param>
+        /// <param name="transitive">是否包含间接引用</param>
+        /// <param name="maxResults">最多返回的数量，0 表示不限制</param>
+        /// <param name="complete">索引是否完整（结果未被截断时即为全部引用者）</param>
+        /// <param name="budgetMs">查询前同步处理待更新资源的时间预算</param>
+        public static List<string> FindReferencers(string assetPath, bool transitive, int maxResults, out bool complete, double budgetMs = 2000)
+        {
+            _scanner.EnsureLoaded();
+            _scanner.ProcessWork(budgetMs);
+            complete = IsReady;
+
+            var results = new List<string>();
+            string guid = AssetDatabase.AssetPathToGUID(assetPath);
+            if (string.IsNullOrEmpty(guid))
+                return results;
+
+            var visited = new HashSet<string>(StringComparer.Ordinal) { guid };
+            var queue = new Queue<string>();
+            queue.Enqueue(guid);
+            while (queue.Count > 0)
+            {
+                if (!_referencers.TryGetValue(queue.Dequeue(), out var referencers))
+                    continue;
+
+                foreach (string referencer in referencers)
+                {
+                    if (!visited.Add(referencer) || !_entries.TryGetValue(referencer, out var entry))
+                        continue;
+
+                    results.Add(entry.Path);
+                    if (maxResults > 0 && results.Count >= maxResults)
+                        return results;
+                    if (transitive)
+                        queue.Enqueue(referencer);
+                }
+            }
+            return results;
+        }
+
+        /// <summary>
+        /// 索引新鲜度：是否完整、已索引/待处理的资源数、扫描进度和最近更新时间（UTC）
+        /// </summary>
+        public static JsonClass GetStatus()
+        {
+            _scanner.EnsureLoaded();
+            var status = new JsonClass
+            {
+                ["indexed_assets"] = _entries.Count
+            };
+            _scanner.WriteStatus(status);
+            if (_lastUpdateUtc != default)
+                status["last_update"] = _lastUpdateUtc.ToString("o");
+            return status;
+        }
+
+        /// <summary>
+        /// 丢弃索引并重新扫描全部资源
+        /// </summary>
+        public static void Rebuild()
+        {
+            _scanner.EnsureLoaded();
+            _scanner.Rebuild();
+        }
+
+        // --- 增量更新 ---
+
+        internal static void OnAssetsChanged(string[] importedAssets, string[] deletedAssets, string[] movedAssets, string[] movedFromAssetPaths)
+        {
+            if (!_scanner.IsLoaded)
+                return;
+
+            foreach (string path in deletedAssets)
+            {
+                // 删除后已无法通过路径取得 GUID，按记录的路径查找
+                _scanner.Dequeue(path);
+                string guid = FindGuidByPath(path);
+                if (guid != null)
+                    RemoveEntry(guid);
+            }
+
+            for (int i = 0; i < movedAssets.Length; i++)
+            {
+                string guid = AssetDatabase.AssetPathToGUID(movedAssets[i]);
+                if (!string.IsNullOrEmpty(guid) && _entries.TryGetValue(guid, out var entry))
+                {
+                    entry.Path = movedAssets[i];
+                    _scanner.MarkDirty();
+                }
+                else
+                {
+                    _scanner.Enqueue(movedAssets[i]);
+                }
+            }
+
+            foreach (string path in importedAssets)
+                _scanner.Enqueue(path);
+            _lastUpdateUtc = DateTime.UtcNow;
+        }
+
+        private static string FindGuidByPath(string path)
+        {
+            string guid = AssetDatabase.AssetPathToGUID(path);
+            if (!string.IsNullOrEmpty(guid) && _entries.TryGetValue(guid, out var entry) && entry.Path == path)
+                return guid;
+            foreach (var pair in _entries)
+            {
+                if (pair.Value.Path == path)
+                    return pair.Key;
+            }
+            return null;
+        }
+
+        // --- 索引维护 ---
+
+        private static bool IsIndexedPath(string path)
+        {
+            return path != null && path.StartsWith("Assets/", StringComparison.Ordinal) && !AssetDatabase.IsValidFolder(path);
+        }
+
+        /// <summary>
+        /// 依赖哈希变化时重新读取资源的直接依赖
+        /// </summary>
+        private static void IndexAsset(string path, HashSet<string> seen)
+        {
+            string guid = AssetDatabase.AssetPathToGUID(path);
+            if (string.IsNullOrEmpty(guid))
+                return;
+            seen?.Add(guid);
+
+            string hash = AssetDatabase.GetAssetDependencyHash(path).ToString();
+            if (_entries.TryGetValue(guid, out var existing) && existing.Hash == hash)
+            {
+                if (existing.Path != path)
+                {
+                    existing.Path = path;
+                    _scanner.MarkDirty();
+                }
+                return;
+            }
+
+            var dependencies = new List<string>();
+            foreach (string dependencyPath in AssetDatabase.GetDependencies(path, false))
+            {
+                if (dependencyPath == path)
+                    continue;
+                string dependencyGuid = AssetDatabase.AssetPathToGUID(dependencyPath);
+                if (!string.IsNullOrEmpty(dependencyGuid))
+                    dependencies.Add(dependencyGuid);
+            }
+
+            RemoveEntry(guid);
+            AddEntry(guid, new Entry { Path = path, Hash = hash, Dependencies = dependencies.ToArray() });
+        }
+
+        private static void AddEntry(string guid, Entry entry)
+        {
+            _entries[guid] = entry;
+            foreach (string dependency in entry.Dependencies)
+            {
+                if (!_referencers.TryGetValue(dependency, out var referencers))
+                {
+                    referencers = new HashSet<string>(StringComparer.Ordinal);
+                    _referencers[dependency] = referencers;
+                }
+                referencers.Add(guid);
+            }
+            _scanner.MarkDirty();
+        }
+
+        private static void RemoveEntry(string guid)
+        {
+            if (!_entries.TryGetValue(guid, out var entry))
+                return;
+
+            foreach (string dependency in entry.Dependencies)
+            {
+                if (_referencers.TryGetValue(dependency, out var referencers))
+                {
+                    referencers.Remove(guid);
+                    if (referencers.Count == 0)
+                        _referencers.Remove(dependency);
+                }
+            }
+            _entries.Remove(guid);
+            _scanner.MarkDirty();
+        }
+
+        // --- 持久化（文件头由 AssetIndexScanner 读写） ---
+
+        private static void ReadEntries(BinaryReader reader)
+        {
+            _lastUpdateUtc = new DateTime(reader.ReadInt64(), DateTimeKind.Utc);
+
+            int count = reader.ReadInt32();
+            for (int i = 0; i < count; i++)
+            {
+                string guid = reader.ReadString();
+                var entry = new Entry { Path = reader.ReadString(), Hash = reader.ReadString() };
+                entry.Dependencies = new string[reader.ReadInt32()];
+                for (int d = 0; d < entry.Dependencies.Length; d++)
+                    entry.Dependencies[d] = reader.ReadString();
+                AddEntry(guid, entry);
+            }
+        }
+
+        private static void WriteEntries(BinaryWriter writer)
+        {
+            writer.Write(_lastUpdateUtc.Ticks);
+            writer.Write(_entries.Count);
+            foreach (var pair in _entries)
+            {
+                writer.Write(pair.Key);
+                writer.Write(pair.Value.Path);
+                writer.Write(pair.Value.Hash);
+                writer.Write(pair.Value.Dependencies.Length);
+                foreach (string dependency in pair.Value.Dependencies)
+                    writer.Write(dependency);
+            }
+        }
+
+        private sealed class Scanner : AssetIndexScanner
+        {
+            public Scanner() : base(nameof(AssetDependencyIndex), FormatVersion)
+            {
+            }
+
+            protected override bool IsIndexedPath(string path) => AssetDependencyIndex.IsIndexedPath(path);
+            protected override void IndexAsset(string path, HashSet<string> seen) => AssetDependencyIndex.IndexAsset(path, seen);
+            protected override IEnumerable<string> IndexedGuids => _entries.Keys;
+            protected override void RemoveEntry(string guid) => AssetDependencyIndex.RemoveEntry(guid);
+            protected override void ReadEntries(BinaryReader reader) => AssetDependencyIndex.ReadEntries(reader);
+            protected override void WriteEntries(BinaryWriter writer) => AssetDependencyIndex.WriteEntries(writer);
+
+            protected override void ClearEntries()
+            {
+                _entries.Clear();
+                _referencers.Clear();
+                _lastUpdateUtc = default;
+            }
+
+            protected override void OnScanFinished()
+            {
+                _lastUpdateUtc = LastFullScanUtc;
+            }
+        }
+    }
+
+    /// <summary>
+    /// 资源导入、删除、移动后增量更新反向依赖索引
+    /// </summary>
+    internal class AssetDependencyIndexPostprocessor : AssetPostprocessor
+    {
+        private static void OnPostprocessAllAssets(string[] importedAssets, string[] deletedAssets, string[] movedAssets, string[] movedFromAssetPaths)
+        {
+            AssetDependencyIndex.OnAssetsChanged(importedAssets, deletedAssets, movedAssets, movedFromAssetPaths);
+        }
+    }
+}
@@ -0,0 +1,314 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using UnityEditor;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 持久化资源索引（AssetDependencyIndex、AssetSearchIndex）共用的增量扫描与缓存读写。
+    /// 维护待处理队列和全量扫描，在 EditorApplication.update 中按时间预算分片处理；
+    /// 扫描期间处理过的资源都记入本轮扫描，扫描结束时移除未出现的记录（对应已删除的资源）。
+    /// 缓存为 Library/UniMcp 下的二进制文件，先写临时文件再替换。仅在主线程访问。
+    /// </summary>
+    internal abstract class AssetIndexScanner
+    {
+        /// <summary>
+        /// 每帧分片处理的时间预算（毫秒）
+        /// </summary>
+        private const double SliceBudgetMs = 8;
+
+        private readonly string _name;
+        private readonly string _cachePath;
+        private readonly int _formatVersion;
+        private readonly HashSet<string> _pending = new HashSet<string>(StringComparer.Ordinal);
+
+        private string[] _scanPaths;
+        private int _scanIndex;
+        private HashSet<string> _scanSeen;
+        private bool _loaded;
+        private bool _dirty;
+        private bool _ticking;
+
+        protected AssetIndexScanner(string name, int formatVersion)
+        {
+            _name = name;
+            _cachePath = $"Library/UniMcp/{name}.bin";
+            _formatVersion = formatVersion;
+        }
+
+        /// <summary>
+        /// 缓存是否已加载（加载前不处理资源变更）
+        /// </summary>
+        public bool IsLoaded => _loaded;
+
+        /// <summary>
+        /// 索引是否完整且没有待处理的资源
+        /// </summary>
+        public bool IsReady => _loaded && _scanPaths == null && _pending.Count == 0;
+
+        /// <summary>
+        /// 待处理的资源数（增量队列与扫描剩余之和）
+        /// </summary>
+        public int PendingCount => _pending.Count + (_scanPaths != null ? _scanPaths.Length - _scanIndex : 0);
+
+        /// <summary>
+        /// 最近一次完整扫描的时间（UTC），从未完成时为 default
+        /// </summary>
+        public DateTime LastFullScanUtc { get; private set; }
+
+        // --- 由具体索引实现 ---
+
+        /// <summary>
+        /// 该路径是否纳入索引
+        /// </summary>
+        protected abstract bool IsIndexedPath(string path);
+
+        /// <summary>
+        /// 索引单个资源（记录未变化时跳过），并把资源 GUID 记入 seen（可为 null）
+        /// </summary>
+        protected abstract void IndexAsset(string path, HashSet<string> seen);
+
+        /// <summary>
+        /// 当前已索引的全部 GUID
+        /// </summary>
+        protected abstract IEnumerable<string> IndexedGuids { get; }
+
+        /// <summary>
+        /// 移除 GUID 对应的记录
+        /// </summary>
+        protected abstract void RemoveEntry(string guid);
+
+        /// <summary>
+        /// 清空全部记录
+        /// </summary>
+        protected abstract void ClearEntries();
+
+        /// <summary>
+        /// 读取缓存中的记录（文件头之后的部分）
+        /// </summary>
+        protected abstract void ReadEntries(BinaryReader reader);
+
+        /// <summary>
+        /// 写入全部记录（文件头之后的部分）
+        /// </summary>
+        protected abstract void WriteEntries(BinaryWriter writer);
+
+        /// <summary>
+        /// 完整扫描结束后调用
+        /// </summary>
+        protected virtual void OnScanFinished()
+        {
+        }
+
+        // --- 状态 ---
+
+        /// <summary>
+        /// 标记索引已修改，下次空闲时保存
+        /// </summary>
+        public void MarkDirty()
+        {
+            _dirty = true;
+        }
+
+        /// <summary>
+        /// 写入通用的新鲜度字段：是否完整、待处理数、扫描进度和最近一次完整扫描时间
+        /// </summary>
+        public void WriteStatus(JsonClass status)
+        {
+            status["ready"] = IsReady;
+            status["pending_assets"] = PendingCount;
+            if (_scanPaths != null)
+                status["scan_progress"] = _scanPaths.Length == 0 ? 1.0 : Math.Round((double)_scanIndex / _scanPaths.Length, 3);
+            if (LastFullScanUtc != default)
+                status["last_full_scan"] = LastFullScanUtc.ToString("o");
+        }
+
+        // --- 增量更新与分片处理 ---
+
+        /// <summary>
+        /// 首次访问时加载缓存并开始校验扫描（没有缓存时即为完整构建）
+        /// </summary>
+        public void EnsureLoaded()
+        {
+            if (_loaded)
+                return;
+            _loaded = true;
+            Load();
+            StartScan();
+        }
+
+        /// <summary>
+        /// 丢弃全部记录并重新扫描
+        /// </summary>
+        public void Rebuild()
+        {
+            ClearEntries();
+            _pending.Clear();
+            _dirty = true;
+            StartScan();
+        }
+
+        /// <summary>
+        /// 加入待处理队列（不纳入索引的路径忽略）
+        /// </summary>
+        public void Enqueue(string path)
+        {
+            if (!IsIndexedPath(path))
+                return;
+            _pending.Add(path);
+            StartTicking();
+        }
+
+        /// <summary>
+        /// 从待处理队列移除（资源已删除）
+        /// </summary>
+        public void Dequeue(string path)
+        {
+            _pending.Remove(path);
+        }
+
+        /// <summary>
+        /// 在时间预算内处理待更新的资源和扫描队列
+        /// </summary>
+        public void ProcessWork(double budgetMs)
+        {
+            if (_pending.Count == 0 && _scanPaths == null)
+                return;
+
+            var stopwatch = Stopwatch.StartNew();
+            if (_pending.Count > 0)
+            {
+                var paths = new List<string>(_pending);
+                foreach (string path in paths)
+                {
+                    _pending.Remove(path);
+                    // 扫描进行中时同样记入 _scanSeen，否则 FinishScan 会把扫描位置之前导入的资源当作已删除
+                    IndexAsset(path, _scanSeen);
+                    if (stopwatch.Elapsed.TotalMilliseconds >= budgetMs)
+                        return;
+                }
+            }
+
+            while (_scanPaths != null && stopwatch.Elapsed.TotalMilliseconds < budgetMs)
+            {
+                if (_scanIndex >= _scanPaths.Length)
+                {
+                    FinishScan();
+                    break;
+                }
+
+                string path = _scanPaths[_scanIndex++];
+                if (IsIndexedPath(path))
+                    IndexAsset(path, _scanSeen);
+            }
+        }
+
+        private void StartScan()
+        {
+            _scanPaths = AssetDatabase.GetAllAssetPaths();
+            _scanIndex = 0;
+            _scanSeen = new HashSet<string>(StringComparer.Ordinal);
+            StartTicking();
+        }
+
+        private void StartTicking()
+        {
+            if (_ticking)
+                return;
+            _ticking = true;
+            EditorApplication.update += Tick;
+        }
+
+        private void Tick()
+        {
+            if (EditorApplication.isCompiling || EditorApplication.isUpdating)
+                return;
+
+            ProcessWork(SliceBudgetMs);
+            if (_scanPaths == null && _pending.Count == 0)
+            {
+                EditorApplication.update -= Tick;
+                _ticking = false;
+                if (_dirty)
+                    Save();
+            }
+        }
+
+        private void FinishScan()
+        {
+            // 扫描中未出现的记录对应已删除的资源
+            var stale = new List<string>();
+            foreach (string guid in IndexedGuids)
+            {
+                if (!_scanSeen.Contains(guid))
+                    stale.Add(guid);
+            }
+            foreach (string guid in stale)
+                RemoveEntry(guid);
+
+            _scanPaths = null;
+            _scanSeen = null;
+            LastFullScanUtc = DateTime.UtcNow;
+            OnScanFinished();
+            _dirty = true;
+        }
+
+        // --- 持久化 ---
+
+        private void Load()
+        {
+            if (!File.Exists(_cachePath))
+                return;
+
+            try
+            {
+                using (var reader = new BinaryReader(File.OpenRead(_cachePath)))
+                {
+                    if (reader.ReadInt32() != _formatVersion)
+                        return;
+                    LastFullScanUtc = new DateTime(reader.ReadInt64(), DateTimeKind.Utc);
+                    ReadEntries(reader);
+                }
+                _dirty = false;
+            }
+            catch (Exception ex)
+            {
+                McpLogger.LogWarning($"[{_name}] Failed to load cache, rebuilding: {ex.Message}");
+                ClearEntries();
+                LastFullScanUtc = default;
+            }
+        }
+
+        /// <summary>
+        /// 有修改时保存缓存
+        /// </summary>
+        public void Save()
+        {
+            if (!_loaded || !_dirty)
+                return;
+
+            try
+            {
+                Directory.CreateDirectory(Path.GetDirectoryName(_cachePath));
+                string tempPath = _cachePath + ".tmp";
+                using (var writer = new BinaryWriter(File.Create(tempPath)))
+                {
+                    writer.Write(_formatVersion);
+                    writer.Write(LastFullScanUtc.Ticks);
+                    WriteEntries(writer);
+                }
+                if (File.Exists(_cachePath))
+                    File.Delete(_cachePath);
+                File.Move(tempPath, _cachePath);
+                _dirty = false;
+            }
+            catch (Exception ex)
+            {
+                McpLogger.LogWarning($"[{_name}] Failed to save cache: {ex.Message}");
+            }
+        }
+    }
+}
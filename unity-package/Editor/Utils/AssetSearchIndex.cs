@@ -0,0 +1,736 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using System.Text.RegularExpressions;
+using UnityEditor;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 资源全文搜索索引。为 Assets/ 下的资源建立倒排索引，收录名称、路径分段、主资源类型、.meta 标签、
+    /// 外部注释（如 asset_index 的名称/分类/备注，通过 SetAnnotations 提供）和可选的脚本类型名。
+    /// 词条按驼峰、下划线、数字边界拆分；查询支持精确、前缀和三元组（trigram）模糊匹配，按字段权重排序，
+    /// 另提供词条前缀补全。索引保存在 Library/UniMcp/AssetSearchIndex.bin，
+    /// 加载后由 AssetIndexScanner 分片校验（文件时间戳未变化的资源跳过），由 AssetPostprocessor 增量更新。仅在主线程访问。
+    /// </summary>
+    [InitializeOnLoad]
+    public static class AssetSearchIndex
+    {
+        private const int FormatVersion = 1;
+
+        /// <summary>
+        /// 每个查询词最多展开的前缀/模糊词条数
+        /// </summary>
+        private const int MaxExpansions = 64;
+
+        /// <summary>
+        /// 模糊匹配的最低三元组相似度（Jaccard）
+        /// </summary>
+        private const double MinFuzzySimilarity = 0.4;
+
+        [Flags]
+        private enum Field : byte
+        {
+            Name = 1,
+            Path = 2,
+            Type = 4,
+            Label = 8,
+            Symbol = 16,
+            Note = 32
+        }
+
+        private sealed class Doc
+        {
+            public string Guid;
+            public string Path;
+            public string Name;
+            public string Type;
+            public string[] Labels;
+            public string[] Symbols;
+            public long Stamp;
+            public string[] Terms;
+        }
+
+        /// <summary>
+        /// 搜索结果
+        /// </summary>
+        public struct Hit
+        {
+            public string Guid;
+            public string Path;
+            public string Type;
+            public double Score;
+        }
+
+        private static readonly List<Doc> _docs = new List<Doc>();
+        private static readonly Stack<int> _freeIds = new Stack<int>();
+        private static readonly Dictionary<string, int> _idsByGuid = new Dictionary<string, int>(StringComparer.Ordinal);
+        private static readonly Dictionary<string, Dictionary<int, Field>> _postings = new Dictionary<string, Dictionary<int, Field>>(StringComparer.Ordinal);
+        private static readonly SortedSet<string> _terms = new SortedSet<string>(StringComparer.Ordinal);
+        private static readonly Dictionary<string, HashSet<string>> _trigrams = new Dictionary<string, HashSet<string>>(StringComparer.Ordinal);
+        private static readonly Dictionary<string, Dictionary<string, string>> _annotations = new Dictionary<string, Dictionary<string, string>>(StringComparer.Ordinal);
+        private static readonly Scanner _scanner = new Scanner();
+
+        private static readonly Regex _symbolRegex = new Regex(@"\b(?:class|struct|interface|enum|record)\s+([A-Za-z_][A-Za-z0-9_]*)", RegexOptions.Compiled);
+
+        static AssetSearchIndex()
+        {
+            EditorApplication.quitting += _scanner.Save;
+            AssemblyReloadEvents.beforeAssemblyReload += _scanner.Save;
+            EditorApplication.delayCall += _scanner.EnsureLoaded;
+        }
+
+        /// <summary>
+        /// 索引是否完整且没有待处理的资源
+        /// </summary>
+        public static bool IsReady => _scanner.IsReady;
+
+        /// <summary>
+        /// 搜索资源。query 中的 t:Type 过滤主资源类型，l:label 过滤标签，其余词条全部需要匹配（精确、前缀或模糊）。
+        /// 只有过滤条件时按路径排序返回。查询直接使用当前索引，待更新的资源由 EditorApplication.update 分片处理
+        /// </summary>
+        /// <param name="query">查询文本</param>
+        /// <param name="maxResults">最多返回的数量</param>
+        /// <param name="pathPrefix">只返回该目录下的资源（可为 null）</param>
+        /// <param name="fuzzy">是否启用模糊匹配</param>
+        /// <param name="complete">索引是否完整</param>
+        /// <param name="totalMatches">排序截断前的匹配总数</param>
+        public static List<Hit> Search(string query, int maxResults, string pathPrefix, bool fuzzy, out bool complete, out int totalMatches)
+        {
+            _scanner.EnsureLoaded();
+            complete = IsReady;
+
+            var words = new List<string>();
+            var typeFilters = new List<string>();
+            var labelFilters = new List<string>();
+            foreach (string part in (query ?? string.Empty).Split((char[])null, StringSplitOptions.RemoveEmptyEntries))
+            {
+                if (part.StartsWith("t:", StringComparison.OrdinalIgnoreCase) && part.Length > 2)
+                    typeFilters.Add(part.Substring(2));
+                else if (part.StartsWith("l:", StringComparison.OrdinalIgnoreCase) && part.Length > 2)
+                    labelFilters.Add(part.Substring(2));
+                else
+                    words.AddRange(SplitWords(part.ToLowerInvariant()));
+            }
+
+            Dictionary<int, double> scores = null;
+            foreach (string word in words)
+            {
+                var matches = MatchWord(word, fuzzy);
+                if (scores == null)
+                {
+                    scores = matches;
+                }
+                else
+                {
+                    var merged = new Dictionary<int, double>();
+                    // 遍历较小的集合求交集
+                    var (small, large) = matches.Count < scores.Count ? (matches, scores) : (scores, matches);
+                    foreach (var pair in small)
+                    {
+                        if (large.TryGetValue(pair.Key, out double other))
+                            merged[pair.Key] = pair.Value + other;
+                    }
+                    scores = merged;
+                }
+                if (scores.Count == 0)
+                    break;
+            }
+
+            if (scores == null)
+            {
+                // 没有搜索词：只按过滤条件列出
+                scores = new Dictionary<int, double>();
+                if (typeFilters.Count > 0 || labelFilters.Count > 0)
+                {
+                    for (int id = 0; id < _docs.Count; id++)
+                    {
+                        if (_docs[id] != null)
+                            scores[id] = 0;
+                    }
+                }
+            }
+
+            var hits = new List<Hit>();
+            foreach (var pair in scores)
+            {
+                Doc doc = _docs[pair.Key];
+                if (pathPrefix != null && !doc.Path.StartsWith(pathPrefix, StringComparison.Ordinal))
+                    continue;
+                if (typeFilters.Count > 0 && !typeFilters.Exists(t => string.Equals(t, doc.Type, StringComparison.OrdinalIgnoreCase)))
+                    continue;
+                if (labelFilters.Count > 0 && !labelFilters.TrueForAll(l => Array.Exists(doc.Labels, label => string.Equals(label, l, StringComparison.OrdinalIgnoreCase))))
+                    continue;
+                hits.Add(new Hit { Guid = doc.Guid, Path = doc.Path, Type = doc.Type, Score = Math.Round(pair.Value, 3) });
+            }
+
+            totalMatches = hits.Count;
+            hits.Sort((a, b) =>
+            {
+                int byScore = b.Score.CompareTo(a.Score);
+                if (byScore != 0) return byScore;
+                int byLength = a.Path.Length.CompareTo(b.Path.Length);
+                return byLength != 0 ? byLength : string.CompareOrdinal(a.Path, b.Path);
+            });
+            if (maxResults > 0 && hits.Count > maxResults)
+                hits.RemoveRange(maxResults, hits.Count - maxResults);
+            return hits;
+        }
+
+        /// <summary>
+        /// 前缀补全：返回以 prefix 开头的词条及其文档数，按文档数降序
+        /// </summary>
+        public static List<KeyValuePair<string, int>> Suggest(string prefix, int maxResults)
+        {
+            _scanner.EnsureLoaded();
+
+            var suggestions = new List<KeyValuePair<string, int>>();
+            string lower = (prefix ?? string.Empty).Trim().ToLowerInvariant();
+            if (lower.Length == 0)
+                return suggestions;
+
+            foreach (string term in _terms.GetViewBetween(lower, lower + char.MaxValue))
+            {
+                suggestions.Add(new KeyValuePair<string, int>(term, _postings[term].Count));
+            }
+            suggestions.Sort((a, b) => b.Value != a.Value ? b.Value.CompareTo(a.Value) : string.CompareOrdinal(a.Key, b.Key));
+            if (maxResults > 0 && suggestions.Count > maxResults)
+                suggestions.RemoveRange(maxResults, suggestions.Count - maxResults);
+            return suggestions;
+        }
+
+        /// <summary>
+        /// 替换某个来源提供的注释文本（guid -> 文本），注释参与搜索但不持久化，来源应在加载时重新提供
+        /// </summary>
+        /// <param name="source">来源名称，如 "asset_index"</param>
+        /// <param name="annotationsByGuid">该来源的全部注释，null 表示清除</param>
+        public static void SetAnnotations(string source, IDictionary<string, string> annotationsByGuid)
+        {
+            var affected = new HashSet<string>(StringComparer.Ordinal);
+            if (_annotations.TryGetValue(source, out var previous))
+                affected.UnionWith(previous.Keys);
+
+            if (annotationsByGuid == null || annotationsByGuid.Count == 0)
+            {
+                _annotations.Remove(source);
+            }
+            else
+            {
+                var copy = new Dictionary<string, string>(annotationsByGuid, StringComparer.Ordinal);
+                _annotations[source] = copy;
+                affected.UnionWith(copy.Keys);
+            }
+
+            foreach (string guid in affected)
+            {
+                if (_idsByGuid.TryGetValue(guid, out int id))
+                {
+                    Unindex(id);
+                    IndexTerms(id);
+                }
+            }
+        }
+
+        /// <summary>
+        /// 索引新鲜度：是否完整、已索引/待处理的资源数、词条数和最近一次完整扫描时间（UTC）
+        /// </summary>
+        public static JsonClass GetStatus()
+        {
+            _scanner.EnsureLoaded();
+            var status = new JsonClass
+            {
+                ["indexed_assets"] = _idsByGuid.Count,
+                ["terms"] = _terms.Count
+            };
+            _scanner.WriteStatus(status);
+            return status;
+        }
+
+        /// <summary>
+        /// 丢弃索引并重新扫描全部资源
+        /// </summary>
+        public static void Rebuild()
+        {
+            if (!_scanner.IsLoaded)
+                return;
+            _scanner.Rebuild();
+        }
+
+        /// <summary>
+        /// 从 .meta 文件读取资源标签（labels 段），无需加载资源
+        /// </summary>
+        public static string[] ReadMetaLabels(string assetPath)
+        {
+            string metaPath = assetPath + ".meta";
+            var labels = new List<string>();
+            try
+            {
+                if (!File.Exists(metaPath))
+                    return labels.ToArray();
+
+                bool inLabels = false;
+                foreach (string line in File.ReadLines(metaPath))
+                {
+                    if (!inLabels)
+                    {
+                        inLabels = line == "labels:";
+                        continue;
+                    }
+                    if (!line.StartsWith("- "))
+                        break;
+                    labels.Add(line.Substring(2).Trim());
+                }
+            }
+            catch
+            {
+                // 忽略 .meta 读取错误
+            }
+            return labels.ToArray();
+        }
+
+        // --- 查询 ---
+
+        private static Dictionary<int, double> MatchWord(string word, bool fuzzy)
+        {
+            var scores = new Dictionary<int, double>();
+            AddPostings(word, 1.0, scores);
+
+            int expansions = 0;
+            foreach (string term in _terms.GetViewBetween(word, word + char.MaxValue))
+            {
+                if (term.Length == word.Length)
+                    continue;
+                // 前缀越接近完整词条得分越高
+                AddPostings(term, 0.5 + 0.3 * word.Length / term.Length, scores);
+                if (++expansions >= MaxExpansions)
+                    break;
+            }
+
+            if (fuzzy && word.Length >= 3)
+            {
+                foreach (var candidate in FuzzyTerms(word))
+                    AddPostings(candidate.Key, 0.6 * candidate.Value, scores);
+            }
+            return scores;
+        }
+
+        private static void AddPostings(string term, double factor, Dictionary<int, double> scores)
+        {
+            if (!_postings.TryGetValue(term, out var postings))
+                return;
+
+            foreach (var posting in postings)
+            {
+                double score = factor * FieldWeight(posting.Value);
+                if (!scores.TryGetValue(posting.Key, out double existing) || existing < score)
+                    scores[posting.Key] = score;
+            }
+        }
+
+        private static double FieldWeight(Field fields)
+        {
+            if ((fields & Field.Name) != 0) return 4;
+            if ((fields & (Field.Symbol | Field.Label | Field.Note)) != 0) return 3;
+            if ((fields & Field.Type) != 0) return 2;
+            return 1;
+        }
+
+        /// <summary>
+        /// 按三元组 Jaccard 相似度查找近似词条（不含精确匹配）
+        /// </summary>
+        private static List<KeyValuePair<string, double>> FuzzyTerms(string word)
+        {
+            var wordTrigrams = GetTrigrams(word);
+            var shared = new Dictionary<string, int>(StringComparer.Ordinal);
+            foreach (string trigram in wordTrigrams)
+            {
+                if (!_trigrams.TryGetValue(trigram, out var terms))
+                    continue;
+                foreach (string term in terms)
+                {
+                    shared.TryGetValue(term, out int count);
+                    shared[term] = count + 1;
+                }
+            }
+
+            var candidates = new List<KeyValuePair<string, double>>();
+            foreach (var pair in shared)
+            {
+                if (pair.Key == word)
+                    continue;
+                // 补边界符后长度为 n 的词条有 n 个三元组（忽略重复）
+                int termTrigrams = pair.Key.Length;
+                double similarity = (double)pair.Value / (wordTrigrams.Count + termTrigrams - pair.Value);
+                if (similarity >= MinFuzzySimilarity)
+                    candidates.Add(new KeyValuePair<string, double>(pair.Key, similarity));
+            }
+            candidates.Sort((a, b) => b.Value.CompareTo(a.Value));
+            if (candidates.Count > MaxExpansions)
+                candidates.RemoveRange(MaxExpansions, candidates.Count - MaxExpansions);
+            return candidates;
+        }
+
+        private static HashSet<string> GetTrigrams(string term)
+        {
+            // 两端补边界符，使短词和词首/词尾也有区分度
+            string padded = "$" + term + "$";
+            var trigrams = new HashSet<string>(StringComparer.Ordinal);
+            for (int i = 0; i + 3 <= padded.Length; i++)
+                trigrams.Add(padded.Substring(i, 3));
+            return trigrams;
+        }
+
+        // --- 分词 ---
+
+        /// <summary>
+        /// 按非字母数字字符切分（不拆驼峰），用于查询
+        /// </summary>
+        private static IEnumerable<string> SplitWords(string text)
+        {
+            var builder = new StringBuilder();
+            foreach (char c in text)
+            {
+                if (char.IsLetterOrDigit(c))
+                {
+                    builder.Append(c);
+                }
+                else if (builder.Length > 0)
+                {
+                    yield return builder.ToString();
+                    builder.Clear();
+                }
+            }
+            if (builder.Length > 0)
+                yield return builder.ToString();
+        }
+
+        /// <summary>
+        /// 生成词条：每个单词本身，以及按驼峰、字母/数字边界拆出的部分（均为小写）
+        /// </summary>
+        private static void AddTokens(string text, Field field, Dictionary<string, Field> terms)
+        {
+            if (string.IsNullOrEmpty(text))
+                return;
+
+            foreach (string word in SplitWords(text))
+            {
+                AddTerm(word.ToLowerInvariant(), field, terms);
+
+                int start = 0;
+                for (int i = 1; i <= word.Length; i++)
+                {
+                    bool boundary = i == word.Length
+                        || (char.IsUpper(word[i]) && (char.IsLower(word[i - 1]) || (i + 1 < word.Length && char.IsLower(word[i + 1]))))
+                        || char.IsDigit(word[i]) != char.IsDigit(word[i - 1]);
+                    if (!boundary)
+                        continue;
+                    if (start > 0 || i < word.Length)
+                        AddTerm(word.Substring(start, i - start).ToLowerInvariant(), field, terms);
+                    start = i;
+                }
+            }
+        }
+
+        private static void AddTerm(string term, Field field, Dictionary<string, Field> terms)
+        {
+            terms.TryGetValue(term, out Field existing);
+            terms[term] = existing | field;
+        }
+
+        // --- 索引维护 ---
+
+        private static void IndexTerms(int id)
+        {
+            Doc doc = _docs[id];
+            var terms = new Dictionary<string, Field>(StringComparer.Ordinal);
+            AddTokens(doc.Name, Field.Name, terms);
+            AddTokens(doc.Type, Field.Type, terms);
+
+            // 路径分段（不含文件名和公共的 Assets 根目录）
+            string[] segments = doc.Path.Split('/');
+            for (int i = 1; i < segments.Length - 1; i++)
+                AddTokens(segments[i], Field.Path, terms);
+            AddTokens(Path.GetExtension(doc.Path).TrimStart('.'), Field.Path, terms);
+
+            foreach (string label in doc.Labels)
+                AddTokens(label, Field.Label, terms);
+            foreach (string symbol in doc.Symbols)
+                AddTokens(symbol, Field.Symbol, terms);
+            foreach (var source in _annotations.Values)
+            {
+                if (source.TryGetValue(doc.Guid, out string note))
+                    AddTokens(note, Field.Note, terms);
+            }
+
+            doc.Terms = new string[terms.Count];
+            int index = 0;
+            foreach (var pair in terms)
+            {
+                doc.Terms[index++] = pair.Key;
+                if (!_postings.TryGetValue(pair.Key, out var postings))
+                {
+                    postings = new Dictionary<int, Field>();
+                    _postings[pair.Key] = postings;
+                    _terms.Add(pair.Key);
+                    foreach (string trigram in GetTrigrams(pair.Key))
+                    {
+                        if (!_trigrams.TryGetValue(trigram, out var trigramTerms))
+                        {
+                            trigramTerms = new HashSet<string>(StringComparer.Ordinal);
+                            _trigrams[trigram] = trigramTerms;
+                        }
+                        trigramTerms.Add(pair.Key);
+                    }
+                }
+                postings[id] = pair.Value;
+            }
+        }
+
+        private static void Unindex(int id)
+        {
+            Doc doc = _docs[id];
+            if (doc.Terms == null)
+                return;
+
+            foreach (string term in doc.Terms)
+            {
+                if (!_postings.TryGetValue(term, out var postings))
+                    continue;
+                postings.Remove(id);
+                if (postings.Count > 0)
+                    continue;
+
+                _postings.Remove(term);
+                _terms.Remove(term);
+                foreach (string trigram in GetTrigrams(term))
+                {
+                    if (_trigrams.TryGetValue(trigram, out var trigramTerms))
+                    {
+                        trigramTerms.Remove(term);
+                        if (trigramTerms.Count == 0)
+                            _trigrams.Remove(trigram);
+                    }
+                }
+            }
+            doc.Terms = null;
+        }
+
+        private static void AddDoc(Doc doc)
+        {
+            int id;
+            if (_freeIds.Count > 0)
+            {
+                id = _freeIds.Pop();
+                _docs[id] = doc;
+            }
+            else
+            {
+                id = _docs.Count;
+                _docs.Add(doc);
+            }
+            _idsByGuid[doc.Guid] = id;
+            IndexTerms(id);
+            _scanner.MarkDirty();
+        }
+
+        private static void RemoveDoc(string guid)
+        {
+            if (!_idsByGuid.TryGetValue(guid, out int id))
+                return;
+            Unindex(id);
+            _docs[id] = null;
+            _freeIds.Push(id);
+            _idsByGuid.Remove(guid);
+            _scanner.MarkDirty();
+        }
+
+        /// <summary>
+        /// 文件或 .meta 时间戳变化时重新读取资源信息
+        /// </summary>
+        private static void IndexAsset(string path, HashSet<string> seen)
+        {
+            string guid = AssetDatabase.AssetPathToGUID(path);
+            if (string.IsNullOrEmpty(guid))
+                return;
+            seen?.Add(guid);
+
+            long stamp = GetStamp(path);
+            if (_idsByGuid.TryGetValue(guid, out int id) && _docs[id].Stamp == stamp && _docs[id].Path == path)
+                return;
+
+            Type type = AssetDatabase.GetMainAssetTypeAtPath(path);
+            var doc = new Doc
+            {
+                Guid = guid,
+                Path = path,
+                Name = AssetDatabase.IsValidFolder(path) ? Path.GetFileName(path) : Path.GetFileNameWithoutExtension(path),
+                Type = type != null ? type.Name : string.Empty,
+                Labels = ReadMetaLabels(path),
+                Symbols = ReadScriptSymbols(path),
+                Stamp = stamp
+            };
+            RemoveDoc(guid);
+            AddDoc(doc);
+        }
+
+        private static long GetStamp(string path)
+        {
+            try
+            {
+                long assetTicks = File.Exists(path) ? File.GetLastWriteTimeUtc(path).Ticks : 0;
+                long metaTicks = File.GetLastWriteTimeUtc(path + ".meta").Ticks;
+                return unchecked(assetTicks * 31 + metaTicks);
+            }
+            catch
+            {
+                return 0;
+            }
+        }
+
+        private static string[] ReadScriptSymbols(string path)
+        {
+            if (!path.EndsWith(".cs", StringComparison.OrdinalIgnoreCase) || !McpLocalSettings.Instance.IndexScriptSymbols)
+                return Array.Empty<string>();
+
+            try
+            {
+                var symbols = new HashSet<string>(StringComparer.Ordinal);
+                foreach (Match match in _symbolRegex.Matches(File.ReadAllText(path)))
+                    symbols.Add(match.Groups[1].Value);
+                var result = new string[symbols.Count];
+                symbols.CopyTo(result);
+                return result;
+            }
+            catch
+            {
+                return Array.Empty<string>();
+            }
+        }
+
+        // --- 增量更新 ---
+
+        internal static void OnAssetsChanged(string[] importedAssets, string[] deletedAssets, string[] movedAssets, string[] movedFromAssetPaths)
+        {
+            if (!_scanner.IsLoaded)
+                return;
+
+            foreach (string path in deletedAssets)
+            {
+                _scanner.Dequeue(path);
+                string guid = FindGuidByPath(path);
+                if (guid != null)
+                    RemoveDoc(guid);
+            }
+
+            // 移动后路径分段变化，需要重新生成词条
+            foreach (string path in movedAssets)
+                _scanner.Enqueue(path);
+            foreach (string path in importedAssets)
+                _scanner.Enqueue(path);
+        }
+
+        private static string FindGuidByPath(string path)
+        {
+            foreach (var pair in _idsByGuid)
+            {
+                if (_docs[pair.Value].Path == path)
+                    return pair.Key;
+            }
+            return null;
+        }
+
+        private static bool IsIndexedPath(string path)
+        {
+            return path != null && path.StartsWith("Assets/", StringComparison.Ordinal);
+        }
+
+        // --- 持久化（只保存原始字段，词条在加载时重新生成；文件头由 AssetIndexScanner 读写） ---
+
+        private static void ReadEntries(BinaryReader reader)
+        {
+            int count = reader.ReadInt32();
+            for (int i = 0; i < count; i++)
+            {
+                var doc = new Doc
+                {
+                    Guid = reader.ReadString(),
+                    Path = reader.ReadString(),
+                    Name = reader.ReadString(),
+                    Type = reader.ReadString(),
+                    Stamp = reader.ReadInt64(),
+                    Labels = ReadStrings(reader),
+                    Symbols = ReadStrings(reader)
+                };
+                AddDoc(doc);
+            }
+        }
+
+        private static string[] ReadStrings(BinaryReader reader)
+        {
+            var values = new string[reader.ReadInt32()];
+            for (int i = 0; i < values.Length; i++)
+                values[i] = reader.ReadString();
+            return values;
+        }
+
+        private static void WriteStrings(BinaryWriter writer, string[] values)
+        {
+            writer.Write(values.Length);
+            foreach (string value in values)
+                writer.Write(value);
+        }
+
+        private static void WriteEntries(BinaryWriter writer)
+        {
+            writer.Write(_idsByGuid.Count);
+            foreach (int id in _idsByGuid.Values)
+            {
+                Doc doc = _docs[id];
+                writer.Write(doc.Guid);
+                writer.Write(doc.Path);
+                writer.Write(doc.Name);
+                writer.Write(doc.Type);
+                writer.Write(doc.Stamp);
+                WriteStrings(writer, doc.Labels);
+                WriteStrings(writer, doc.Symbols);
+            }
+        }
+
+        private sealed class Scanner : AssetIndexScanner
+        {
+            public Scanner() : base(nameof(AssetSearchIndex), FormatVersion)
+            {
+            }
+
+            protected override bool IsIndexedPath(string path) => AssetSearchIndex.IsIndexedPath(path);
+            protected override void IndexAsset(string path, HashSet<string> seen) => AssetSearchIndex.IndexAsset(path, seen);
+            protected override IEnumerable<string> IndexedGuids => _idsByGuid.Keys;
+            protected override void RemoveEntry(string guid) => RemoveDoc(guid);
+            protected override void ReadEntries(BinaryReader reader) => AssetSearchIndex.ReadEntries(reader);
+            protected override void WriteEntries(BinaryWriter writer) => AssetSearchIndex.WriteEntries(writer);
+
+            protected override void ClearEntries()
+            {
+                _docs.Clear();
+                _freeIds.Clear();
+                _idsByGuid.Clear();
+                _postings.Clear();
+                _terms.Clear();
+                _trigrams.Clear();
+            }
+        }
+    }
+
+    /// <summary>
+    /// 资源导入、删除、移动后增量更新搜索索引
+    /// </summary>
+    internal class AssetSearchIndexPostprocessor : AssetPostprocessor
+    {
+        private static void OnPostprocessAllAssets(string[] importedAssets, string[] deletedAssets, string[] movedAssets, string[] movedFromAssetPaths)
+        {
+            AssetSearchIndex.OnAssetsChanged(importedAssets, deletedAssets, movedAssets, movedFromAssetPaths);
+        }
+    }
+}
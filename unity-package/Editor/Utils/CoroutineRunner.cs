@@ -43,6 +43,40 @@ namespace UniMcp
             // UnityWebRequestAsyncOperation支持
             public bool IsWaitingForWebRequest { get; set; } // 是否在等待网络请求
             public UnityWebRequestAsyncOperation WebRequestOperation { get; set; } // 网络请求操作
+
+            // WaitForSignal支持
+            public WaitForSignal Signal { get; set; } // 等待的回调信号
+
+            // 链路追踪：启动协程时的追踪上下文，每一步在该上下文中执行
+            public McpSpan Span { get; set; }
+        }
+
+        /// <summary>
+        /// 由回调置位的等待：协程让出该对象后不再逐帧执行，直到 Set 被调用或超时
+        /// </summary>
+        public sealed class WaitForSignal
+        {
+            private readonly double _deadline;
+
+            public WaitForSignal(double timeoutSeconds)
+            {
+                _deadline = EditorApplication.timeSinceStartup + timeoutSeconds;
+            }
+
+            /// <summary>
+            /// 是否已置位（超时返回时为 false）
+            /// </summary>
+            public bool IsSet { get; private set; }
+
+            /// <summary>
+            /// 置位，等待的协程在下一帧继续
+            /// </summary>
+            public void Set()
+            {
+                IsSet = true;
+            }
+
+            internal bool IsDone => IsSet || EditorApplication.timeSinceStartup >= _deadline;
         }
 
         /// <summary>
@@ -136,6 +170,16 @@ namespace UniMcp
                         }
                     }
 
+                    // 如果正在等待回调信号，检查是否置位或超时
+                    if (coroutineInfo.Signal != null)
+                    {
+                        if (!coroutineInfo.Signal.IsDone)
+                        {
+                            continue;
+                        }
+                        coroutineInfo.Signal = null;
+                    }
+
                     // 2. 如果正在等待时间，检查时间是否到了
                     if (coroutineInfo.IsWaitingForTime)
                     {
@@ -190,7 +234,14 @@ namespace UniMcp
                     // 3. 如果不在等待子协程、时间和网络请求，执行协程的下一步
                     if (!coroutineInfo.WaitingForSubCoroutine && !coroutineInfo.IsWaitingForTime && !coroutineInfo.IsWaitingForWebRequest)
                     {
-                        if (coroutineInfo.Coroutine.MoveNext())
+                        bool hasNext;
+                        using (McpTracer.Activate(coroutineInfo.Span?.Context))
+                        using (McpTracer.StartSpan("coroutine.step", "coroutine"))
+                        {
+                            hasNext = coroutineInfo.Coroutine.MoveNext();
+                        }
+
+                        if (hasNext)
                         {
                             processedCount++; // 增加已处理的协程计数
                             // 协程还在运行，检查返回值
@@ -215,7 +266,8 @@ namespace UniMcp
                                     IsWaitingForTime = false,
                                     WaitEndTime = 0,
                                     IsWaitingForWebRequest = false,
-                                    WebRequestOperation = null
+                                    WebRequestOperation = null,
+                                    Span = McpTracer.StartSpan(coroutineInfo.Span?.Context, "coroutine.sub", "coroutine", activate: false)
                                 };
 
                                 // 将子协程添加到协程列表
@@ -236,6 +288,11 @@ namespace UniMcp
                                 coroutineInfo.Result = current;
                                 coroutineInfo.HasResult = true;
                             }
+                            // 检查是否返回了WaitForSignal（不作为结果保存）
+                            else if (current is WaitForSignal signal)
+                            {
+                                coroutineInfo.Signal = signal;
+                            }
                             // 检查是否返回了WaitForSeconds
                             else if (current is WaitForSeconds waitForSeconds)
                             {
@@ -291,6 +348,7 @@ namespace UniMcp
                     coroutineInfo.WaitEndTime = 0;
                     coroutineInfo.IsWaitingForWebRequest = false;
                     coroutineInfo.WebRequestOperation = null;
+                    coroutineInfo.Signal = null;
                     completedCoroutines.Add(coroutineInfo);
                 }
             }
@@ -299,6 +357,7 @@ namespace UniMcp
             foreach (var completed in completedCoroutines)
             {
                 _coroutines.Remove(completed);
+                completed.Span?.End();
                 try
                 {
                     // 决定传递给回调的结果
@@ -354,7 +413,8 @@ namespace UniMcp
                     IsWaitingForTime = false,
                     WaitEndTime = 0,
                     IsWaitingForWebRequest = false,
-                    WebRequestOperation = null
+                    WebRequestOperation = null,
+                    Span = McpTracer.StartSpan("coroutine", "coroutine", activate: false)
                 };
 
                 _coroutines.Add(coroutineInfo);
@@ -87,23 +87,25 @@ namespace UniMcp
             switch (searchMethod)
             {
                 case "by_id":
-                    if (int.TryParse(searchTerm, out int instanceId))
+                    if (int.TryParse(searchTerm, out int instanceId)
+                        && HierarchyIndex.TryGetGameObject(instanceId, out GameObject obj)
+                        && (searchInactive || obj.activeInHierarchy))
                     {
-                        var allObjects = GetAllSceneObjects(searchInactive);
-                        GameObject obj = allObjects.FirstOrDefault(go =>
-                            go.GetInstanceID() == instanceId
-                        );
-                        if (obj != null)
-                            results.Add(obj);
+                        results.Add(obj);
                     }
                     break;
                 case "by_name":
-                    var searchPoolName = rootSearchObject
-                        ? rootSearchObject
+                    if (rootSearchObject)
+                    {
+                        results.AddRange(rootSearchObject
                             .GetComponentsInChildren<Transform>(searchInactive)
                             .Select(t => t.gameObject)
-                        : GetAllSceneObjects(searchInactive);
-                    results.AddRange(searchPoolName.Where(go => go.name == searchTerm));
+                            .Where(go => go.name == searchTerm));
+                    }
+                    else
+                    {
+                        results.AddRange(HierarchyIndex.FindByName(searchTerm, searchInactive));
+                    }
                     break;
                 case "by_path":
                     Transform foundTransform = rootSearchObject
@@ -113,33 +115,38 @@ namespace UniMcp
                         results.Add(foundTransform.gameObject);
                     break;
                 case "by_tag":
-                    var searchPoolTag = rootSearchObject
-                        ? rootSearchObject
+                    if (rootSearchObject)
+                    {
+                        results.AddRange(rootSearchObject
                             .GetComponentsInChildren<Transform>(searchInactive)
                             .Select(t => t.gameObject)
-                        : GetAllSceneObjects(searchInactive);
-                    results.AddRange(searchPoolTag.Where(go => go.CompareTag(searchTerm)));
+                            .Where(go => go.CompareTag(searchTerm)));
+                    }
+                    else
+                    {
+                        results.AddRange(HierarchyIndex.FindByTag(searchTerm, searchInactive));
+                    }
                     break;
                 case "by_layer":
-                    var searchPoolLayer = rootSearchObject
-                        ? rootSearchObject
+                    int layerIndex = int.TryParse(searchTerm, out int parsedLayer)
+                        ? parsedLayer
+                        : LayerMask.NameToLayer(searchTerm);
+                    if (layerIndex == -1)
+                        break;
+                    if (rootSearchObject)
+                    {
+                        results.AddRange(rootSearchObject
                             .GetComponentsInChildren<Transform>(searchInactive)
                             .Select(t => t.gameObject)
-                        : GetAllSceneObjects(searchInactive);
-                    if (int.TryParse(searchTerm, out int layerIndex))
-                    {
-                        results.AddRange(searchPoolLayer.Where(go => go.layer == layerIndex));
+                            .Where(go => go.layer == layerIndex));
                     }
                     else
                     {
-                        int namedLayer = LayerMask.NameToLayer(searchTerm);
-                        if (namedLayer != -1)
-                            results.AddRange(searchPoolLayer.Where(go => go.layer == namedLayer));
+                        results.AddRange(HierarchyIndex.FindByLayer(layerIndex, searchInactive));
                     }
                     break;
                 case "by_component":
-                    Type componentType = FindType(searchTerm);
-                    if (componentType != null)
+                    if (TypeIndex.TryResolve(searchTerm, typeof(Component), out Type componentType, out string typeError))
                     {
                         FindObjectsInactive findInactive = searchInactive
                             ? FindObjectsInactive.Include
@@ -160,22 +167,16 @@ namespace UniMcp
                     else
                     {
                         UnityEngine.Debug.LogWarning(
-                            $"[GameObjectUtils.Find] Component type not found: {searchTerm}"
+                            $"[GameObjectUtils.Find] Component type not resolved: {typeError}"
                         );
                     }
                     break;
                 case "by_id_or_name_or_path":
-                    if (int.TryParse(searchTerm, out int id))
+                    if (int.TryParse(searchTerm, out int id)
+                        && HierarchyIndex.TryGetGameObject(id, out GameObject objById))
                     {
-                        var allObjectsId = GetAllSceneObjects(true);
-                        GameObject objById = allObjectsId.FirstOrDefault(go =>
-                            go.GetInstanceID() == id
-                        );
-                        if (objById != null)
-                        {
-                            results.Add(objById);
-                            break;
-                        }
+                        results.Add(objById);
+                        break;
                     }
                     GameObject objByPath = GameObject.Find(searchTerm);
                     if (objByPath != null)
@@ -184,8 +185,7 @@ namespace UniMcp
                         break;
                     }
 
-                    var allObjectsName = GetAllSceneObjects(true);
-                    results.AddRange(allObjectsName.Where(go => go.name == searchTerm));
+                    results.AddRange(HierarchyIndex.FindByName(searchTerm, true));
                     break;
                 default:
                     UnityEngine.Debug.LogWarning(
@@ -211,13 +211,8 @@ namespace UniMcp
                 return null;
 
             // 尝试按ID查找
-            if (int.TryParse(searchTerm, out int id))
-            {
-                var allObjects = GetAllSceneObjects(true);
-                GameObject objById = allObjects.FirstOrDefault(go => go.GetInstanceID() == id);
-                if (objById != null)
-                    return objById;
-            }
+            if (int.TryParse(searchTerm, out int id) && HierarchyIndex.TryGetGameObject(id, out GameObject objById))
+                return objById;
             var go = FindByHierarchyPath(searchTerm, typeof(GameObject));
             if (go != null)
                 return go as GameObject;
@@ -247,62 +242,13 @@ namespace UniMcp
                 componentTypeName = parts.Length > 1 ? parts[1] : null;
             }
 
-            // 获取当前活动场景中的所有根对象
-            Scene activeScene = SceneManager.GetActiveScene();
-            if (!activeScene.isLoaded)
-            {
-                return null;
-            }
-
-            GameObject[] rootObjects = activeScene.GetRootGameObjects();
-
-            // 分割路径
-            string[] pathSegments = gameObjectPath.Split('/');
-            if (pathSegments.Length == 0)
-            {
-                return null;
-            }
-
-            // 递归查找所有可能的路径
-            List<GameObject> currentLevel = new List<GameObject>();
-            // 首先找到所有名字匹配的根对象
-            foreach (var rootObject in rootObjects)
-            {
-                if (rootObject.name == pathSegments[0])
-                {
-                    currentLevel.Add(rootObject);
-                }
-            }
-
+            // 从层级索引按完整路径查找，结果按层级顺序排列，可能包含多个同名路径的对象
+            List<GameObject> currentLevel = HierarchyIndex.FindByPath(gameObjectPath, true);
             if (currentLevel.Count == 0)
             {
                 return null;
             }
 
-            // 逐层查找
-            for (int i = 1; i < pathSegments.Length; i++)
-            {
-                string segment = pathSegments[i];
-                List<GameObject> nextLevel = new List<GameObject>();
-                foreach (var parent in currentLevel)
-                {
-                    // 这里不能用Find，因为Find只会返回第一个匹配的
-                    for (int j = 0; j < parent.transform.childCount; j++)
-                    {
-                        var child = parent.transform.GetChild(j);
-                        if (child.name == segment)
-                        {
-                            nextLevel.Add(child.gameObject);
-                        }
-                    }
-                }
-                if (nextLevel.Count == 0)
-                {
-                    return null;
-                }
-                currentLevel = nextLevel;
-            }
-
             // 最终所有匹配的对象都在currentLevel里，返回最后一个类型匹配的（新创建的对象通常在后面）
             object lastMatch = null;
             foreach (var obj in currentLevel)
@@ -310,8 +256,8 @@ namespace UniMcp
                 // 如果指定了组件类型名，优先使用指定的组件类型
                 if (!string.IsNullOrEmpty(componentTypeName))
                 {
-                    Type specifiedComponentType = FindType(componentTypeName);
-                    if (specifiedComponentType != null && typeof(UnityEngine.Component).IsAssignableFrom(specifiedComponentType))
+                    Type specifiedComponentType = TypeIndex.Find(componentTypeName, typeof(UnityEngine.Component));
+                    if (specifiedComponentType != null)
                     {
                         var comp = obj.GetComponent(specifiedComponentType);
                         if (comp != null)
@@ -375,45 +321,11 @@ namespace UniMcp
         }
 
         /// <summary>
-        /// 根据类型名称查找Type，搜索相关程序集
+        /// 根据类型名称查找Type，通过全局类型索引解析（名称有歧义时返回null）
         /// </summary>
         public static Type FindType(string typeName)
         {
-            if (string.IsNullOrEmpty(typeName))
-                return null;
-
-            var type =
-                Type.GetType($"UnityEngine.{typeName}, UnityEngine.CoreModule")
-                ?? Type.GetType($"UnityEngine.{typeName}, UnityEngine.PhysicsModule")
-                ?? Type.GetType($"UnityEngine.UI.{typeName}, UnityEngine.UI")
-                ?? Type.GetType($"UnityEditor.{typeName}, UnityEditor.CoreModule")
-                ?? Type.GetType(typeName);
-
-            if (type != null)
-                return type;
-
-            foreach (var assembly in AppDomain.CurrentDomain.GetAssemblies())
-            {
-                type = assembly.GetType(typeName);
-                if (type != null)
-                    return type;
-                type = assembly.GetType("UnityEngine." + typeName);
-                if (type != null)
-                    return type;
-                type = assembly.GetType("UnityEditor." + typeName);
-                if (type != null)
-                    return type;
-                type = assembly.GetType("UnityEngine.UI." + typeName);
-                if (type != null)
-                    return type;
-                foreach (var typeNext in assembly.GetTypes())
-                {
-                    if (typeNext.Name == typeName)
-                        return typeNext;
-                }
-            }
-
-            return null;
+            return TypeIndex.Find(typeName);
         }
 
         /// <summary>
@@ -454,6 +366,63 @@ namespace UniMcp
             return result;
         }
 
+        /// <summary>
+        /// 可按字段投影输出的GameObject字段名
+        /// </summary>
+        public static readonly string[] ProjectableFields =
+        {
+            "name", "instance_id", "path", "tag", "layer", "active", "active_in_hierarchy", "static",
+            "position", "local_position", "rotation", "scale", "components", "parent_id", "child_count", "scene"
+        };
+
+        /// <summary>
+        /// 只输出指定字段的GameObject数据，跳过完整YAML的构建；字段名需来自 ProjectableFields
+        /// </summary>
+        public static JsonClass GetGameObjectFields(GameObject go, IReadOnlyList<string> fields)
+        {
+            if (go == null)
+                return null;
+
+            JsonClass result = new JsonClass();
+            Transform transform = go.transform;
+            foreach (string field in fields)
+            {
+                switch (field)
+                {
+                    case "name": result[field] = go.name; break;
+                    case "instance_id": result[field] = go.GetInstanceID(); break;
+                    case "path": result[field] = GetHierarchyPath(go); break;
+                    case "tag": result[field] = go.tag; break;
+                    case "layer": result[field] = go.layer; break;
+                    case "active": result[field] = go.activeSelf; break;
+                    case "active_in_hierarchy": result[field] = go.activeInHierarchy; break;
+                    case "static": result[field] = go.isStatic; break;
+                    case "position": result[field] = ToJsonArray(transform.position); break;
+                    case "local_position": result[field] = ToJsonArray(transform.localPosition); break;
+                    case "rotation": result[field] = ToJsonArray(transform.eulerAngles); break;
+                    case "scale": result[field] = ToJsonArray(transform.localScale); break;
+                    case "components":
+                        var components = new JsonArray();
+                        foreach (var component in go.GetComponents<Component>())
+                        {
+                            if (component != null)
+                                components.Add(component.GetType().Name);
+                        }
+                        result[field] = components;
+                        break;
+                    case "parent_id": result[field] = transform.parent != null ? transform.parent.gameObject.GetInstanceID() : 0; break;
+                    case "child_count": result[field] = transform.childCount; break;
+                    case "scene": result[field] = go.scene.name; break;
+                }
+            }
+            return result;
+        }
+
+        private static JsonArray ToJsonArray(Vector3 v)
+        {
+            return new JsonArray { v.x, v.y, v.z };
+        }
+
         /// <summary>
         /// 创建GameObject的YAML格式数据表示（节省token）
         /// </summary>
@@ -868,29 +837,13 @@ scene: {go.scene.name}";
             if (properties == null || properties.Count == 0)
                 return;
 
-            // 查找组件类型
-            Type componentType = FindType(componentName);
-            Component targetComponent = null;
-
-            if (componentType != null && typeof(Component).IsAssignableFrom(componentType))
+            // 查找组件类型（类型索引已优先匹配常见的Unity命名空间），名称有歧义时报告候选
+            if (!TypeIndex.TryResolve(componentName, typeof(Component), out Type componentType, out string typeError))
             {
-                targetComponent = targetGo.GetComponent(componentType);
-            }
-            else
-            {
-                // 尝试常见的Unity组件命名空间
-                string[] commonNamespaces = { "UnityEngine", "UnityEngine.UI" };
-                foreach (string ns in commonNamespaces)
-                {
-                    string fullTypeName = $"{ns}.{componentName}";
-                    componentType = FindType(fullTypeName);
-                    if (componentType != null && typeof(Component).IsAssignableFrom(componentType))
-                    {
-                        targetComponent = targetGo.GetComponent(componentType);
-                        break;
-                    }
-                }
+                logAction?.Invoke(typeError);
+                return;
             }
+            Component targetComponent = targetGo.GetComponent(componentType);
 
             if (targetComponent == null)
             {
@@ -956,133 +909,28 @@ scene: {go.scene.name}";
                     }
                 }
 
-                // 处理嵌套属性 (如 material.color)
-                if (memberName.Contains('.'))
+                // 普通属性和嵌套路径（如 center.x、material.color）统一走缓存的成员访问器，结构体会逐级写回
+                MemberPath memberPath = MemberAccessorCache.Get(type, memberName);
+                if (memberPath.IsValid)
                 {
-                    return SetNestedProperty(target, memberName, value, logAction);
-                }
-
-                // 处理普通属性
-                PropertyInfo propInfo = type.GetProperty(memberName, flags);
-                if (propInfo != null && propInfo.CanWrite)
-                {
-                    object convertedValue = ConvertJTokenToType(value, propInfo.PropertyType);
-                    if (convertedValue != null)
-                    {
-                        propInfo.SetValue(target, convertedValue);
+                    if (memberPath.TrySetValue(target, value, out string setError))
                         return true;
-                    }
-                }
-                else
-                {
-                    FieldInfo fieldInfo = type.GetField(memberName, flags);
-                    if (fieldInfo != null)
-                    {
-                        object convertedValue = ConvertJTokenToType(value, fieldInfo.FieldType);
-                        if (convertedValue != null)
-                        {
-                            fieldInfo.SetValue(target, convertedValue);
-                            return true;
-                        }
-                    }
-                }
-            }
-            catch (Exception ex)
-            {
-                logAction?.Invoke($"Failed to set '{memberName}' on {type.Name}: {ex.Message}");
-            }
-            return false;
-        }
-
-        /// <summary>
-        /// 设置嵌套属性
-        /// </summary>
-        private static bool SetNestedProperty(object target, string path, JsonNode value, Action<string> logAction = null)
-        {
-            string[] pathParts = path.Split('.');
-            if (pathParts.Length < 2)
-                return false;
-
-            object currentObject = target;
-            Type currentType = currentObject.GetType();
-            BindingFlags flags = BindingFlags.Public | BindingFlags.Instance | BindingFlags.IgnoreCase;
-
-            // 遍历到最后一个属性之前
-            for (int i = 0; i < pathParts.Length - 1; i++)
-            {
-                string part = pathParts[i];
-                PropertyInfo propInfo = currentType.GetProperty(part, flags);
-                if (propInfo != null)
-                {
-                    currentObject = propInfo.GetValue(currentObject);
-                    if (currentObject == null)
-                    {
-                        logAction?.Invoke($"Property '{part}' is null, cannot access nested properties.");
-                        return false;
-                    }
-                    currentType = currentObject.GetType();
-                }
-                else
-                {
-                    logAction?.Invoke($"Could not find property '{part}' on type '{currentType.Name}'");
+                    logAction?.Invoke($"Failed to set '{memberName}' on {type.Name}: {setError}");
                     return false;
                 }
-            }
 
-            // 设置最终属性
-            string finalPart = pathParts[pathParts.Length - 1];
-            return SetObjectPropertyDeepth(currentObject, finalPart, value, logAction);
-        }
+                // 反射找不到时尝试序列化字段（如私有的 m_Speed）
+                if (target is UnityEngine.Object unityObject &&
+                    MemberAccessorCache.TrySetSerialized(unityObject, memberName, value, out _))
+                    return true;
 
-        /// <summary>
-        /// 转换JToken为指定类型
-        /// </summary>
-        private static object ConvertJTokenToType(JsonNode token, Type targetType)
-        {
-            try
-            {
-                if (targetType == typeof(string))
-                    return token.Value;
-                if (targetType == typeof(int))
-                    return token.AsInt;
-                if (targetType == typeof(float))
-                    return token.AsFloat;
-                if (targetType == typeof(bool))
-                    return token.AsBool;
-
-                // Vector类型
-                if (targetType == typeof(Vector2) && token is JsonArray arrV2 && arrV2.Count == 2)
-                    return new Vector2(arrV2[0].AsFloat, arrV2[1].AsFloat);
-                if (targetType == typeof(Vector3) && token is JsonArray arrV3 && arrV3.Count == 3)
-                    return new Vector3(arrV3[0].AsFloat, arrV3[1].AsFloat, arrV3[2].AsFloat);
-                if (targetType == typeof(Vector4) && token is JsonArray arrV4 && arrV4.Count == 4)
-                    return new Vector4(arrV4[0].AsFloat, arrV4[1].AsFloat, arrV4[2].AsFloat, arrV4[3].AsFloat);
-
-                // Color类型
-                if (targetType == typeof(Color) && token is JsonArray arrC && arrC.Count >= 3)
-                    return new Color(arrC[0].AsFloat, arrC[1].AsFloat, arrC[2].AsFloat, arrC.Count > 3 ? arrC[3].AsFloat : 1.0f);
-
-                // 枚举类型
-                if (targetType.IsEnum)
-                    return Enum.Parse(targetType, token.Value, true);
-
-                // Unity Object类型（Material, Texture等）
-                if (typeof(UnityEngine.Object).IsAssignableFrom(targetType) && token.type == JsonNodeType.String)
-                {
-                    string assetPath = token.Value;
-                    if (!string.IsNullOrEmpty(assetPath))
-                    {
-                        return AssetDatabase.LoadAssetAtPath(assetPath, targetType);
-                    }
-                }
-
-                // 尝试直接转换
-                return token.ToObject(targetType);
+                logAction?.Invoke(memberPath.Error);
             }
-            catch
+            catch (Exception ex)
             {
-                return null;
+                logAction?.Invoke($"Failed to set '{memberName}' on {type.Name}: {ex.Message}");
             }
+            return false;
         }
 
         /// <summary>
@@ -1095,17 +943,12 @@ scene: {go.scene.name}";
             JsonClass properties = null
         )
         {
-            Type componentType = FindType(typeName);
-            if (componentType == null)
+            if (!TypeIndex.TryResolve(typeName, typeof(Component), out Type componentType, out string typeError))
             {
                 return Response.Error(
-                    $"Component type '{typeName}' not found or is not a valid Component."
+                    $"Component type '{typeName}' not found or is not a valid Component. {typeError}"
                 );
             }
-            if (!typeof(Component).IsAssignableFrom(componentType))
-            {
-                return Response.Error($"Type '{typeName}' is not a Component.");
-            }
 
             // Prevent adding Transform again
             if (componentType == typeof(Transform))
@@ -0,0 +1,625 @@
+using System;
+using System.Collections.Generic;
+using UnityEditor;
+using UnityEditor.SceneManagement;
+using UnityEngine;
+using UnityEngine.SceneManagement;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 当前激活场景的层级索引。
+    /// 按名称（含忽略大小写排序的名称表，用于前缀/通配符查找）、标签、层、组件类型和完整路径建立索引，
+    /// 通过 ObjectChangeEvents 增量维护，场景打开/关闭、Undo/Redo 和播放模式切换时整体重建。
+    /// hierarchyChanged 若没有伴随任何 ObjectChangeEvents（如运行时脚本修改层级），同样标记为需要重建。
+    /// 组件索引在第一次按组件查询时才建立。
+    /// 查询结果会与对象当前状态核对，发现过期条目时立即重建并重新查询，结果按层级顺序返回。
+    /// ObjectChangeEvents 与 hierarchyChanged 要到之后的编辑器更新才送达，核对也发现不了尚未索引的新对象，
+    /// 因此工具在 ModifiesHierarchy 对本次调用参数返回 true 时于执行后调用 Invalidate，同一 batch_call 中的后续查找能看到这些修改；
+    /// 按实例ID查找未命中时直接检查该对象并补入索引。
+    /// 索引内容每次变化（重建、增删子树、标签/层/组件变化）时 Version 递增，供分页游标判断结果是否过期。
+    /// 仅在主线程访问。
+    /// </summary>
+    [InitializeOnLoad]
+    public static class HierarchyIndex
+    {
+        private sealed class Entry
+        {
+            public GameObject GameObject;
+            public int ParentId;
+            public string Name;
+            public string Path;
+            public string Tag;
+            public int Layer;
+            public Type[] Components;
+            public readonly List<int> Children = new List<int>();
+        }
+
+        private static readonly Dictionary<int, Entry> _entries = new Dictionary<int, Entry>();
+        private static readonly Dictionary<string, HashSet<int>> _byName = new Dictionary<string, HashSet<int>>(StringComparer.Ordinal);
+        private static readonly Dictionary<string, HashSet<int>> _byPath = new Dictionary<string, HashSet<int>>(StringComparer.Ordinal);
+        private static readonly Dictionary<string, HashSet<int>> _byTag = new Dictionary<string, HashSet<int>>(StringComparer.Ordinal);
+        private static readonly Dictionary<int, HashSet<int>> _byLayer = new Dictionary<int, HashSet<int>>();
+        private static readonly Dictionary<Type, HashSet<int>> _byComponent = new Dictionary<Type, HashSet<int>>();
+        private static readonly List<Component> _componentBuffer = new List<Component>();
+
+        private static string[] _sortedNames = Array.Empty<string>();
+        private static bool _namesDirty = true;
+        private static bool _componentsIndexed;
+        private static bool _dirty = true;
+        private static bool _eventsSinceHierarchyChanged;
+        private static int _sceneHandle;
+        private static long _version;
+
+        /// <summary>
+        /// 索引版本，索引内容变化时递增（会先应用待处理的重建）
+        /// </summary>
+        public static long Version
+        {
+            get
+            {
+                EnsureReady();
+                return _version;
+            }
+        }
+
+        /// <summary>
+        /// 已索引的GameObject数量
+        /// </summary>
+        public static int Count
+        {
+            get
+            {
+                EnsureReady();
+                return _entries.Count;
+            }
+        }
+
+        /// <summary>
+        /// 整体重建次数，用于诊断
+        /// </summary>
+        public static long RebuildCount { get; private set; }
+
+        static HierarchyIndex()
+        {
+            ObjectChangeEvents.changesPublished += OnChangesPublished;
+            EditorApplication.hierarchyChanged += OnHierarchyChanged;
+            EditorApplication.playModeStateChanged += state => Invalidate();
+            EditorSceneManager.sceneOpened += (scene, mode) => Invalidate();
+            EditorSceneManager.sceneClosed += scene => Invalidate();
+            EditorSceneManager.newSceneCreated += (scene, setup, mode) => Invalidate();
+            EditorSceneManager.activeSceneChangedInEditMode += (previous, current) => Invalidate();
+            Undo.undoRedoPerformed += Invalidate;
+        }
+
+        /// <summary>
+        /// 标记索引需要在下一次查询时整体重建
+        /// </summary>
+        public static void Invalidate()
+        {
+            _dirty = true;
+        }
+
+        // --- 查询 ---
+
+        /// <summary>
+        /// 按实例ID获取当前场景中的GameObject
+        /// </summary>
+        public static bool TryGetGameObject(int instanceId, out GameObject gameObject)
+        {
+            EnsureReady();
+            if (_entries.TryGetValue(instanceId, out var entry) && entry.GameObject != null)
+            {
+                gameObject = entry.GameObject;
+                return true;
+            }
+
+            // 尚未送达事件的新对象：确认在当前场景后补入索引
+            gameObject = EditorUtility.InstanceIDToObject(instanceId) as GameObject;
+            if (gameObject != null && gameObject.scene.handle == _sceneHandle)
+            {
+                ReindexSubtree(instanceId);
+                return true;
+            }
+
+            gameObject = null;
+            return false;
+        }
+
+        /// <summary>
+        /// 按名称精确查找（区分大小写）
+        /// </summary>
+        public static List<GameObject> FindByName(string name, bool includeInactive)
+        {
+            if (name == null)
+                return new List<GameObject>();
+            return Query(() => Lookup(_byName, name), includeInactive);
+        }
+
+        /// <summary>
+        /// 按名称条件查找。prefix 不为空时只检查以该前缀开头（忽略大小写）的名称，
+        /// 适用于通配符模式中第一个 * 之前的字面部分
+        /// </summary>
+        /// <param name="match">名称匹配条件</param>
+        /// <param name="includeInactive">是否包含非激活对象</param>
+        /// <param name="prefix">可选的名称前缀</param>
+        public static List<GameObject> FindByNameMatch(Func<string, bool> match, bool includeInactive, string prefix = null)
+        {
+            return Query(() =>
+            {
+                var ids = new List<int>();
+                foreach (var name in GetNameRange(prefix))
+                {
+                    if (match(name))
+                        ids.AddRange(_byName[name]);
+                }
+                return ids;
+            }, includeInactive);
+        }
+
+        /// <summary>
+        /// 按完整层级路径（"Parent/Child/Target"）查找，同一路径可能对应多个同名对象
+        /// </summary>
+        public static List<GameObject> FindByPath(string path, bool includeInactive)
+        {
+            if (string.IsNullOrEmpty(path))
+                return new List<GameObject>();
+            return Query(() => Lookup(_byPath, path.Trim('/')), includeInactive);
+        }
+
+        /// <summary>
+        /// 按完整层级路径条件查找
+        /// </summary>
+        public static List<GameObject> FindByPathMatch(Func<string, bool> match, bool includeInactive)
+        {
+            return Query(() => Select(_byPath, match), includeInactive);
+        }
+
+        /// <summary>
+        /// 按标签查找
+        /// </summary>
+        public static List<GameObject> FindByTag(string tag, bool includeInactive)
+        {
+            if (tag == null)
+                return new List<GameObject>();
+            return Query(() => Lookup(_byTag, tag), includeInactive);
+        }
+
+        /// <summary>
+        /// 按标签条件查找
+        /// </summary>
+        public static List<GameObject> FindByTagMatch(Func<string, bool> match, bool includeInactive)
+        {
+            return Query(() => Select(_byTag, match), includeInactive);
+        }
+
+        /// <summary>
+        /// 按层查找
+        /// </summary>
+        public static List<GameObject> FindByLayer(int layer, bool includeInactive)
+        {
+            return Query(() => Lookup(_byLayer, layer), includeInactive);
+        }
+
+        /// <summary>
+        /// 按层条件查找
+        /// </summary>
+        public static List<GameObject> FindByLayerMatch(Func<int, bool> match, bool includeInactive)
+        {
+            return Query(() => Select(_byLayer, match), includeInactive);
+        }
+
+        /// <summary>
+        /// 查找挂有指定类型（含子类）组件的对象
+        /// </summary>
+        public static List<GameObject> FindByComponent(Type componentType, bool includeInactive)
+        {
+            if (componentType == null)
+                return new List<GameObject>();
+            return FindByComponentMatch(componentType.IsAssignableFrom, includeInactive);
+        }
+
+        /// <summary>
+        /// 按组件类型条件查找
+        /// </summary>
+        public static List<GameObject> FindByComponentMatch(Func<Type, bool> match, bool includeInactive)
+        {
+            return Query(() =>
+            {
+                EnsureComponentsIndexed();
+                return Select(_byComponent, match);
+            }, includeInactive);
+        }
+
+        private static IEnumerable<int> Lookup<TKey>(Dictionary<TKey, HashSet<int>> map, TKey key)
+        {
+            return map.TryGetValue(key, out var ids) ? (IEnumerable<int>)ids : Array.Empty<int>();
+        }
+
+        private static IEnumerable<int> Select<TKey>(Dictionary<TKey, HashSet<int>> map, Func<TKey, bool> match)
+        {
+            var ids = new HashSet<int>();
+            foreach (var pair in map)
+            {
+                if (match(pair.Key))
+                    ids.UnionWith(pair.Value);
+            }
+            return ids;
+        }
+
+        /// <summary>
+        /// 执行查询并核对结果；发现过期条目时重建索引后重试一次
+        /// </summary>
+        private static List<GameObject> Query(Func<IEnumerable<int>> select, bool includeInactive)
+        {
+            EnsureReady();
+            if (TryCollect(select(), includeInactive, out var results))
+                return results;
+
+            Rebuild();
+            TryCollect(select(), includeInactive, out results);
+            return results;
+        }
+
+        private static bool TryCollect(IEnumerable<int> ids, bool includeInactive, out List<GameObject> results)
+        {
+            results = new List<GameObject>();
+            bool current = true;
+            foreach (int id in ids)
+            {
+                if (!_entries.TryGetValue(id, out var entry))
+                    continue;
+                if (!IsCurrent(entry))
+                {
+                    current = false;
+                    continue;
+                }
+                if (includeInactive || entry.GameObject.activeInHierarchy)
+                    results.Add(entry.GameObject);
+            }
+
+            if (results.Count > 1)
+                SortByHierarchyOrder(results);
+            return current;
+        }
+
+        private static bool IsCurrent(Entry entry)
+        {
+            var go = entry.GameObject;
+            if (go == null || go.name != entry.Name || go.layer != entry.Layer || go.tag != entry.Tag)
+                return false;
+            var parent = go.transform.parent;
+            return (parent != null ? parent.gameObject.GetInstanceID() : 0) == entry.ParentId;
+        }
+
+        /// <summary>
+        /// 返回名称表中以 prefix 开头（忽略大小写）的所有不同名称
+        /// </summary>
+        private static IEnumerable<string> GetNameRange(string prefix)
+        {
+            if (string.IsNullOrEmpty(prefix))
+                return _byName.Keys;
+
+            if (_namesDirty)
+            {
+                _sortedNames = new string[_byName.Count];
+                _byName.Keys.CopyTo(_sortedNames, 0);
+                Array.Sort(_sortedNames, StringComparer.OrdinalIgnoreCase);
+                _namesDirty = false;
+            }
+
+            // 二分查找第一个不小于 prefix 的名称
+            int low = 0, high = _sortedNames.Length;
+            while (low < high)
+            {
+                int mid = (low + high) >> 1;
+                if (string.Compare(_sortedNames[mid], prefix, StringComparison.OrdinalIgnoreCase) < 0)
+                    low = mid + 1;
+                else
+                    high = mid;
+            }
+
+            var names = new List<string>();
+            for (int i = low; i < _sortedNames.Length; i++)
+            {
+                if (!_sortedNames[i].StartsWith(prefix, StringComparison.OrdinalIgnoreCase))
+                    break;
+                names.Add(_sortedNames[i]);
+            }
+            return names;
+        }
+
+        /// <summary>
+        /// 按层级顺序（与 Hierarchy 窗口一致）排序
+        /// </summary>
+        public static void SortByHierarchyOrder(List<GameObject> objects)
+        {
+            var keys = new Dictionary<GameObject, int[]>(objects.Count);
+            var chain = new List<int>();
+            foreach (var go in objects)
+            {
+                chain.Clear();
+                for (var t = go.transform; t != null; t = t.parent)
+                    chain.Add(t.GetSiblingIndex());
+                chain.Reverse();
+                keys[go] = chain.ToArray();
+            }
+
+            objects.Sort((a, b) =>
+            {
+                int[] x = keys[a], y = keys[b];
+                int length = Math.Min(x.Length, y.Length);
+                for (int i = 0; i < length; i++)
+                {
+                    if (x[i] != y[i])
+                        return x[i].CompareTo(y[i]);
+                }
+                return x.Length.CompareTo(y.Length);
+            });
+        }
+
+        // --- 构建与维护 ---
+
+        private static void EnsureReady()
+        {
+            if (_dirty || SceneManager.GetActiveScene().handle != _sceneHandle)
+                Rebuild();
+        }
+
+        private static void Rebuild()
+        {
+            _entries.Clear();
+            _byName.Clear();
+            _byPath.Clear();
+            _byTag.Clear();
+            _byLayer.Clear();
+            _byComponent.Clear();
+            _namesDirty = true;
+            _componentsIndexed = false;
+            _dirty = false;
+            RebuildCount++;
+            _version++;
+
+            Scene activeScene = SceneManager.GetActiveScene();
+            _sceneHandle = activeScene.handle;
+            if (!activeScene.IsValid() || !activeScene.isLoaded)
+                return;
+
+            foreach (var root in activeScene.GetRootGameObjects())
+                AddSubtree(root.transform, 0, null);
+        }
+
+        private static void EnsureComponentsIndexed()
+        {
+            if (_componentsIndexed)
+                return;
+            foreach (var pair in _entries)
+                IndexComponents(pair.Key, pair.Value);
+            _componentsIndexed = true;
+        }
+
+        private static void AddSubtree(Transform transform, int parentId, string parentPath)
+        {
+            var go = transform.gameObject;
+            int id = go.GetInstanceID();
+            var entry = new Entry
+            {
+                GameObject = go,
+                ParentId = parentId,
+                Name = go.name,
+                Tag = go.tag,
+                Layer = go.layer
+            };
+            entry.Path = parentPath == null ? entry.Name : parentPath + "/" + entry.Name;
+
+            _entries[id] = entry;
+            _version++;
+            if (parentId != 0 && _entries.TryGetValue(parentId, out var parent))
+                parent.Children.Add(id);
+
+            AddToMap(_byName, entry.Name, id);
+            AddToMap(_byPath, entry.Path, id);
+            AddToMap(_byTag, entry.Tag, id);
+            AddToMap(_byLayer, entry.Layer, id);
+            if (_componentsIndexed)
+                IndexComponents(id, entry);
+
+            for (int i = 0; i < transform.childCount; i++)
+                AddSubtree(transform.GetChild(i), id, entry.Path);
+        }
+
+        private static void RemoveSubtree(int id)
+        {
+            if (!_entries.TryGetValue(id, out var entry))
+                return;
+
+            foreach (int childId in entry.Children.ToArray())
+                RemoveSubtree(childId);
+
+            if (entry.ParentId != 0 && _entries.TryGetValue(entry.ParentId, out var parent))
+                parent.Children.Remove(id);
+
+            RemoveFromMap(_byName, entry.Name, id);
+            RemoveFromMap(_byPath, entry.Path, id);
+            RemoveFromMap(_byTag, entry.Tag, id);
+            RemoveFromMap(_byLayer, entry.Layer, id);
+            UnindexComponents(id, entry);
+            _entries.Remove(id);
+            _version++;
+        }
+
+        /// <summary>
+        /// 重新索引以 instanceId 为根的子树；对象已不在当前场景时移除
+        /// </summary>
+        private static void ReindexSubtree(int instanceId)
+        {
+            RemoveSubtree(instanceId);
+
+            var go = EditorUtility.InstanceIDToObject(instanceId) as GameObject;
+            if (go == null || go.scene.handle != _sceneHandle)
+                return;
+
+            var parentTransform = go.transform.parent;
+            if (parentTransform == null)
+            {
+                AddSubtree(go.transform, 0, null);
+                return;
+            }
+
+            int parentId = parentTransform.gameObject.GetInstanceID();
+            if (_entries.TryGetValue(parentId, out var parent))
+                AddSubtree(go.transform, parentId, parent.Path);
+            else
+                _dirty = true;
+        }
+
+        private static void IndexComponents(int id, Entry entry)
+        {
+            UnindexComponents(id, entry);
+            if (entry.GameObject == null)
+                return;
+
+            entry.GameObject.GetComponents(_componentBuffer);
+            var types = new List<Type>(_componentBuffer.Count);
+            foreach (var component in _componentBuffer)
+            {
+                // 丢失脚本的组件为 null
+                if (component == null)
+                    continue;
+                var type = component.GetType();
+                types.Add(type);
+                AddToMap(_byComponent, type, id);
+            }
+            _componentBuffer.Clear();
+            entry.Components = types.ToArray();
+        }
+
+        private static void UnindexComponents(int id, Entry entry)
+        {
+            if (entry.Components == null)
+                return;
+            foreach (var type in entry.Components)
+                RemoveFromMap(_byComponent, type, id);
+            entry.Components = null;
+        }
+
+        private static void AddToMap<TKey>(Dictionary<TKey, HashSet<int>> map, TKey key, int id)
+        {
+            if (!map.TryGetValue(key, out var ids))
+            {
+                ids = new HashSet<int>();
+                map[key] = ids;
+                if (ReferenceEquals(map, _byName))
+                    _namesDirty = true;
+            }
+            ids.Add(id);
+        }
+
+        private static void RemoveFromMap<TKey>(Dictionary<TKey, HashSet<int>> map, TKey key, int id)
+        {
+            if (!map.TryGetValue(key, out var ids))
+                return;
+            ids.Remove(id);
+            if (ids.Count == 0)
+            {
+                map.Remove(key);
+                if (ReferenceEquals(map, _byName))
+                    _namesDirty = true;
+            }
+        }
+
+        // --- 事件 ---
+
+        private static void OnHierarchyChanged()
+        {
+            // 播放模式下脚本修改层级不会产生 ObjectChangeEvents；编辑模式下没有伴随事件的层级变化同样无法增量处理
+            if (EditorApplication.isPlayingOrWillChangePlaymode || !_eventsSinceHierarchyChanged)
+                _dirty = true;
+            _eventsSinceHierarchyChanged = false;
+        }
+
+        private static void OnChangesPublished(ref ObjectChangeEventStream stream)
+        {
+            if (stream.length == 0)
+                return;
+            _eventsSinceHierarchyChanged = true;
+
+            // 索引已需要重建时无需处理单个事件
+            if (_dirty)
+                return;
+
+            for (int i = 0; i < stream.length && !_dirty; i++)
+            {
+                switch (stream.GetEventType(i))
+                {
+                    case ObjectChangeKind.CreateGameObjectHierarchy:
+                        stream.GetCreateGameObjectHierarchyEvent(i, out var created);
+                        ReindexSubtree(created.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectStructureHierarchy:
+                        stream.GetChangeGameObjectStructureHierarchyEvent(i, out var structureHierarchy);
+                        ReindexSubtree(structureHierarchy.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectParent:
+                        stream.GetChangeGameObjectParentEvent(i, out var parentChanged);
+                        ReindexSubtree(parentChanged.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectStructure:
+                        stream.GetChangeGameObjectStructureEvent(i, out var structure);
+                        if (_entries.TryGetValue(structure.instanceId, out var structureEntry))
+                        {
+                            if (_componentsIndexed)
+                                IndexComponents(structure.instanceId, structureEntry);
+                            _version++;
+                        }
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectOrComponentProperties:
+                        stream.GetChangeGameObjectOrComponentPropertiesEvent(i, out var properties);
+                        OnPropertiesChanged(properties.instanceId);
+                        break;
+                    case ObjectChangeKind.DestroyGameObjectHierarchy:
+                        stream.GetDestroyGameObjectHierarchyEvent(i, out var destroyed);
+                        RemoveSubtree(destroyed.instanceId);
+                        break;
+                    case ObjectChangeKind.CreateAssetObject:
+                    case ObjectChangeKind.DestroyAssetObject:
+                    case ObjectChangeKind.ChangeAssetObjectProperties:
+                        break;
+                    default:
+                        // ChangeScene、UpdatePrefabInstances 等无法精确定位的变化
+                        _dirty = true;
+                        break;
+                }
+            }
+        }
+
+        private static void OnPropertiesChanged(int instanceId)
+        {
+            // 组件属性变化不影响名称、标签、层和路径
+            if (!(EditorUtility.InstanceIDToObject(instanceId) is GameObject go))
+                return;
+
+            if (!_entries.TryGetValue(instanceId, out var entry) || go.name != entry.Name)
+            {
+                ReindexSubtree(instanceId);
+                return;
+            }
+
+            string tag = go.tag;
+            if (tag != entry.Tag)
+            {
+                RemoveFromMap(_byTag, entry.Tag, instanceId);
+                entry.Tag = tag;
+                AddToMap(_byTag, tag, instanceId);
+                _version++;
+            }
+            if (go.layer != entry.Layer)
+            {
+                RemoveFromMap(_byLayer, entry.Layer, instanceId);
+                entry.Layer = go.layer;
+                AddToMap(_byLayer, entry.Layer, instanceId);
+                _version++;
+            }
+        }
+    }
+}
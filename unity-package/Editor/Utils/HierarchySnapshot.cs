@@ -0,0 +1,630 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using UnityEditor;
+using UnityEditor.SceneManagement;
+using UnityEngine;
+using UnityEngine.SceneManagement;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 当前激活场景的版本化层级快照，供 edit_scene get_hierarchy 的增量同步使用。
+    /// 第一次读取时建立快照，之后记录 ObjectChangeEvents 涉及的对象，在下一次读取时统一刷新：
+    /// 有变化时版本号加一，每个节点记录加入版本和各字段的最后修改版本，删除的节点保留墓碑。
+    /// 调用方传入上次拿到的版本号即可取得此后新增、删除的节点和发生变化的字段；
+    /// 历史已不可用（切换场景、墓碑被裁剪）或变化量接近整个场景时返回完整快照。
+    /// Undo/Redo、播放模式切换及无法定位的变化会触发一次全场景比对，仍然产生精确的差异。
+    /// 脚本直接修改（未经 Undo）的 Transform 不产生事件，读取时比对 Transform.hasChanged 的节点并清除该标记；
+    /// 脚本直接修改的名称、激活状态等只在所属对象下次产生事件或全场景比对时更新。
+    /// 播放模式下脚本与物理随时修改场景，不维护版本：完整快照直接从场景生成且不带版本号。仅在主线程访问。
+    /// </summary>
+    [InitializeOnLoad]
+    public static class HierarchySnapshot
+    {
+        /// <summary>
+        /// 节点字段名，差异中的 changed 使用这些名称
+        /// </summary>
+        public static readonly string[] FieldNames =
+        {
+            "name", "parent_id", "sibling_index", "active", "tag", "layer", "static", "components", "position", "rotation", "scale"
+        };
+
+        /// <summary>
+        /// 保留的删除记录上限，超出时裁剪最早的一半，更早的版本只能取完整快照
+        /// </summary>
+        public const int MaxTombstones = 4096;
+
+        /// <summary>
+        /// 差异节点数超过该值且超过场景对象数的一半时改为返回完整快照
+        /// </summary>
+        public const int MinFullSnapshotChanges = 64;
+
+        private const int FieldName = 0, FieldParent = 1, FieldSibling = 2, FieldActive = 3, FieldTag = 4, FieldLayer = 5,
+            FieldStatic = 6, FieldComponents = 7, FieldPosition = 8, FieldRotation = 9, FieldScale = 10;
+
+        private sealed class Node
+        {
+            public int Id;
+            public string Name;
+            public int ParentId;
+            public int SiblingIndex;
+            public bool Active;
+            public string Tag;
+            public int Layer;
+            public bool IsStatic;
+            public string[] Components;
+            public Vector3 Position;
+            public Vector3 Rotation;
+            public Vector3 Scale;
+            public Transform Transform;
+            public long AddedVersion;
+            public readonly long[] FieldVersions = new long[FieldNames.Length];
+            public readonly HashSet<int> Children = new HashSet<int>();
+        }
+
+        private struct Tombstone
+        {
+            public long AddedVersion;
+            public long RemovedVersion;
+        }
+
+        private static readonly Dictionary<int, Node> _nodes = new Dictionary<int, Node>();
+        private static readonly Dictionary<int, Tombstone> _removed = new Dictionary<int, Tombstone>();
+        private static readonly HashSet<int> _pendingSubtrees = new HashSet<int>();
+        private static readonly HashSet<int> _pendingNodes = new HashSet<int>();
+        private static readonly List<Component> _componentBuffer = new List<Component>();
+
+        private static bool _tracking;
+        private static bool _resyncNeeded;
+        private static bool _eventsSinceHierarchyChanged;
+        private static int _sceneHandle;
+        private static long _version;
+        private static long _baseVersion;
+        private static long _nextVersion;
+        private static bool _changed;
+
+        static HierarchySnapshot()
+        {
+            ObjectChangeEvents.changesPublished += OnChangesPublished;
+            EditorApplication.hierarchyChanged += OnHierarchyChanged;
+            EditorApplication.playModeStateChanged += state => MarkResync();
+            EditorSceneManager.sceneOpened += (scene, mode) => MarkResync();
+            EditorSceneManager.sceneClosed += scene => MarkResync();
+            Undo.undoRedoPerformed += MarkResync;
+        }
+
+        /// <summary>
+        /// 是否维护版本化快照（播放模式下不维护）
+        /// </summary>
+        public static bool IsVersioned => !EditorApplication.isPlaying;
+
+        /// <summary>
+        /// 当前快照版本（会先应用尚未处理的变化）；播放模式下为最近一次编辑模式下的版本
+        /// </summary>
+        public static long Version
+        {
+            get
+            {
+                Flush();
+                return _version;
+            }
+        }
+
+        /// <summary>
+        /// 返回完整快照：version、full=true、按层级顺序排列的 nodes；播放模式下直接从场景生成，不带 version
+        /// </summary>
+        /// <param name="reason">返回完整快照的原因，可选</param>
+        public static JsonClass GetFull(string reason = null)
+        {
+            Flush();
+            var nodes = new JsonArray();
+            Scene scene = SceneManager.GetActiveScene();
+            if (scene.IsValid() && scene.isLoaded)
+            {
+                var roots = scene.GetRootGameObjects();
+                for (int i = 0; i < roots.Length; i++)
+                {
+                    if (IsVersioned)
+                        AppendSubtree(roots[i].transform, nodes);
+                    else
+                        AppendLiveSubtree(roots[i].transform, 0, i, nodes);
+                }
+            }
+
+            var result = new JsonClass
+            {
+                ["full"] = true,
+                ["nodes"] = nodes
+            };
+            if (IsVersioned)
+                result["version"] = _version;
+            if (!string.IsNullOrEmpty(reason))
+                result["reason"] = reason;
+            return result;
+        }
+
+        /// <summary>
+        /// 返回 sinceVersion 之后的变化：added（完整节点）、removed（实例ID）、changed（实例ID与变化的字段）；
+        /// 历史不可用或变化过多时返回完整快照
+        /// </summary>
+        public static JsonClass GetChanges(long sinceVersion)
+        {
+            if (!IsVersioned)
+                return GetFull("versioned hierarchy snapshots are not kept in play mode");
+            Flush();
+            if (sinceVersion > _version)
+                return GetFull($"since_version {sinceVersion} is newer than the current version {_version}");
+            if (sinceVersion < _baseVersion)
+                return GetFull($"history before version {_baseVersion} is no longer available");
+
+            var added = new List<Node>();
+            var changed = new List<Node>();
+            foreach (var node in _nodes.Values)
+            {
+                if (node.AddedVersion > sinceVersion)
+                    added.Add(node);
+                else if (node.FieldVersions.Any(v => v > sinceVersion))
+                    changed.Add(node);
+            }
+            var removed = _removed
+                .Where(pair => pair.Value.RemovedVersion > sinceVersion && pair.Value.AddedVersion <= sinceVersion)
+                .Select(pair => pair.Key)
+                .ToList();
+
+            int changeCount = added.Count + changed.Count + removed.Count;
+            if (changeCount > MinFullSnapshotChanges && changeCount > _nodes.Count / 2)
+                return GetFull($"{changeCount} nodes changed since version {sinceVersion}");
+
+            var addedArray = new JsonArray();
+            foreach (var node in added)
+                addedArray.Add(ToJson(node, null));
+
+            var changedArray = new JsonArray();
+            foreach (var node in changed)
+                changedArray.Add(ToJson(node, sinceVersion));
+
+            var removedArray = new JsonArray();
+            foreach (int id in removed)
+                removedArray.Add(id);
+
+            return new JsonClass
+            {
+                ["version"] = _version,
+                ["since_version"] = sinceVersion,
+                ["full"] = false,
+                ["added"] = addedArray,
+                ["removed"] = removedArray,
+                ["changed"] = changedArray
+            };
+        }
+
+        private static void AppendSubtree(Transform transform, JsonArray nodes)
+        {
+            if (_nodes.TryGetValue(transform.gameObject.GetInstanceID(), out var node))
+                nodes.Add(ToJson(node, null));
+            for (int i = 0; i < transform.childCount; i++)
+                AppendSubtree(transform.GetChild(i), nodes);
+        }
+
+        /// <summary>
+        /// 直接从场景序列化子树（播放模式），不修改快照
+        /// </summary>
+        private static void AppendLiveSubtree(Transform transform, int parentId, int siblingIndex, JsonArray nodes)
+        {
+            var node = CreateNode(transform.gameObject, parentId, siblingIndex);
+            nodes.Add(ToJson(node, null));
+            for (int i = 0; i < transform.childCount; i++)
+                AppendLiveSubtree(transform.GetChild(i), node.Id, i, nodes);
+        }
+
+        /// <summary>
+        /// 序列化节点；sinceVersion 不为 null 时只输出该版本之后变化的字段
+        /// </summary>
+        private static JsonClass ToJson(Node node, long? sinceVersion)
+        {
+            var json = new JsonClass { ["id"] = node.Id };
+            for (int field = 0; field < FieldNames.Length; field++)
+            {
+                if (sinceVersion.HasValue && node.FieldVersions[field] <= sinceVersion.Value)
+                    continue;
+                json[FieldNames[field]] = GetFieldValue(node, field);
+            }
+            return json;
+        }
+
+        private static JsonNode GetFieldValue(Node node, int field)
+        {
+            switch (field)
+            {
+                case FieldName: return node.Name;
+                case FieldParent: return node.ParentId;
+                case FieldSibling: return node.SiblingIndex;
+                case FieldActive: return node.Active;
+                case FieldTag: return node.Tag;
+                case FieldLayer: return node.Layer;
+                case FieldStatic: return node.IsStatic;
+                case FieldComponents:
+                    var components = new JsonArray();
+                    foreach (var name in node.Components)
+                        components.Add(name);
+                    return components;
+                case FieldPosition: return ToJsonArray(node.Position);
+                case FieldRotation: return ToJsonArray(node.Rotation);
+                default: return ToJsonArray(node.Scale);
+            }
+        }
+
+        private static JsonArray ToJsonArray(Vector3 v)
+        {
+            return new JsonArray { (float)Math.Round(v.x, 3), (float)Math.Round(v.y, 3), (float)Math.Round(v.z, 3) };
+        }
+
+        // --- 刷新 ---
+
+        private static void MarkResync()
+        {
+            _resyncNeeded = true;
+        }
+
+        /// <summary>
+        /// 应用记录的变化；第一次调用或场景切换时重新建立快照。播放模式下不处理，退出播放模式后做一次全场景比对
+        /// </summary>
+        private static void Flush()
+        {
+            if (!IsVersioned)
+                return;
+
+            Scene scene = SceneManager.GetActiveScene();
+            _nextVersion = _version + 1;
+            _changed = false;
+
+            if (!_tracking || scene.handle != _sceneHandle)
+            {
+                // 新场景的历史与之前的版本无关，更早的版本只能取完整快照
+                _nodes.Clear();
+                _removed.Clear();
+                _sceneHandle = scene.handle;
+                _tracking = true;
+                _resyncNeeded = true;
+                _version = _nextVersion;
+                _baseVersion = _version;
+                _nextVersion = _version;
+            }
+
+            if (_resyncNeeded)
+            {
+                Resync(scene);
+            }
+            else
+            {
+                foreach (int id in _pendingSubtrees)
+                    RefreshSubtree(id);
+                foreach (int id in _pendingNodes)
+                    RefreshNode(id);
+                SyncDirtyTransforms();
+            }
+            _pendingSubtrees.Clear();
+            _pendingNodes.Clear();
+            _resyncNeeded = false;
+
+            if (_changed)
+                _version = _nextVersion;
+            TrimTombstones();
+        }
+
+        /// <summary>
+        /// 与整个场景比对
+        /// </summary>
+        private static void Resync(Scene scene)
+        {
+            var seen = new HashSet<int>();
+            if (scene.IsValid() && scene.isLoaded)
+            {
+                var roots = scene.GetRootGameObjects();
+                for (int i = 0; i < roots.Length; i++)
+                    UpsertSubtree(roots[i].transform, 0, i, seen);
+            }
+
+            foreach (int id in _nodes.Keys.Where(id => !seen.Contains(id)).ToList())
+                Remove(id);
+        }
+
+        /// <summary>
+        /// 比对 Transform.hasChanged 的节点，捕获脚本直接修改（未产生 ObjectChangeEvents）的变换，比对后清除该标记
+        /// </summary>
+        private static void SyncDirtyTransforms()
+        {
+            foreach (var node in _nodes.Values)
+            {
+                Transform transform = node.Transform;
+                if (transform == null || !transform.hasChanged)
+                    continue;
+                transform.hasChanged = false;
+                UpdateProperties(node, transform.gameObject);
+            }
+        }
+
+        private static void RefreshSubtree(int instanceId)
+        {
+            // 先记下旧的子树和父节点，刷新后删除不再存在的节点并更新兄弟节点的顺序
+            var previous = new HashSet<int>();
+            CollectSubtree(instanceId, previous);
+            int previousParent = _nodes.TryGetValue(instanceId, out var existing) ? existing.ParentId : -1;
+
+            var seen = new HashSet<int>();
+            var go = EditorUtility.InstanceIDToObject(instanceId) as GameObject;
+            if (go != null && go.scene.handle == _sceneHandle)
+            {
+                Transform parent = go.transform.parent;
+                int parentId = parent != null ? parent.gameObject.GetInstanceID() : 0;
+                if (parentId != 0 && !_nodes.ContainsKey(parentId))
+                {
+                    // 父节点不在快照中，无法增量处理
+                    Resync(SceneManager.GetActiveScene());
+                    return;
+                }
+                UpsertSubtree(go.transform, parentId, go.transform.GetSiblingIndex(), seen);
+                RefreshSiblings(parentId);
+            }
+
+            foreach (int id in previous)
+            {
+                if (!seen.Contains(id))
+                    Remove(id);
+            }
+            if (previousParent >= 0)
+                RefreshSiblings(previousParent);
+        }
+
+        private static void RefreshNode(int instanceId)
+        {
+            if (!_nodes.ContainsKey(instanceId))
+            {
+                RefreshSubtree(instanceId);
+                return;
+            }
+
+            var go = EditorUtility.InstanceIDToObject(instanceId) as GameObject;
+            if (go == null || go.scene.handle != _sceneHandle)
+            {
+                RefreshSubtree(instanceId);
+                return;
+            }
+
+            Transform parent = go.transform.parent;
+            Upsert(go, parent != null ? parent.gameObject.GetInstanceID() : 0, go.transform.GetSiblingIndex());
+        }
+
+        /// <summary>
+        /// 更新父节点（0 表示场景根）下所有直接子节点的兄弟序号
+        /// </summary>
+        private static void RefreshSiblings(int parentId)
+        {
+            if (parentId == 0)
+            {
+                Scene scene = SceneManager.GetActiveScene();
+                if (!scene.IsValid() || !scene.isLoaded)
+                    return;
+                var roots = scene.GetRootGameObjects();
+                for (int i = 0; i < roots.Length; i++)
+                    SetSibling(roots[i].GetInstanceID(), i);
+                return;
+            }
+
+            if (!(EditorUtility.InstanceIDToObject(parentId) is GameObject parent))
+                return;
+            for (int i = 0; i < parent.transform.childCount; i++)
+                SetSibling(parent.transform.GetChild(i).gameObject.GetInstanceID(), i);
+        }
+
+        private static void SetSibling(int id, int siblingIndex)
+        {
+            if (_nodes.TryGetValue(id, out var node) && node.SiblingIndex != siblingIndex)
+            {
+                node.SiblingIndex = siblingIndex;
+                Touch(node, FieldSibling);
+            }
+        }
+
+        private static void CollectSubtree(int id, HashSet<int> ids)
+        {
+            if (!_nodes.TryGetValue(id, out var node) || !ids.Add(id))
+                return;
+            foreach (int childId in node.Children)
+                CollectSubtree(childId, ids);
+        }
+
+        private static void UpsertSubtree(Transform transform, int parentId, int siblingIndex, HashSet<int> seen)
+        {
+            var go = transform.gameObject;
+            int id = go.GetInstanceID();
+            seen.Add(id);
+            Upsert(go, parentId, siblingIndex);
+            for (int i = 0; i < transform.childCount; i++)
+                UpsertSubtree(transform.GetChild(i), id, i, seen);
+        }
+
+        private static void Upsert(GameObject go, int parentId, int siblingIndex)
+        {
+            int id = go.GetInstanceID();
+            // 下面读取了当前的变换，之前的 hasChanged 已无需比对
+            go.transform.hasChanged = false;
+
+            if (!_nodes.TryGetValue(id, out var node))
+            {
+                node = CreateNode(go, parentId, siblingIndex);
+                _nodes[id] = node;
+                _removed.Remove(id);
+                if (_nodes.TryGetValue(parentId, out var newParent))
+                    newParent.Children.Add(id);
+                _changed = true;
+                return;
+            }
+
+            if (node.ParentId != parentId)
+            {
+                if (_nodes.TryGetValue(node.ParentId, out var oldParent))
+                    oldParent.Children.Remove(id);
+                if (_nodes.TryGetValue(parentId, out var newParent))
+                    newParent.Children.Add(id);
+                node.ParentId = parentId;
+                Touch(node, FieldParent);
+            }
+            if (node.SiblingIndex != siblingIndex) { node.SiblingIndex = siblingIndex; Touch(node, FieldSibling); }
+            string[] components = GetComponentNames(go);
+            if (!node.Components.SequenceEqual(components)) { node.Components = components; Touch(node, FieldComponents); }
+            UpdateProperties(node, go);
+        }
+
+        /// <summary>
+        /// 按对象当前状态创建节点，加入版本和各字段版本都为 _nextVersion
+        /// </summary>
+        private static Node CreateNode(GameObject go, int parentId, int siblingIndex)
+        {
+            Transform transform = go.transform;
+            var node = new Node
+            {
+                Id = go.GetInstanceID(),
+                Name = go.name,
+                ParentId = parentId,
+                SiblingIndex = siblingIndex,
+                Active = go.activeSelf,
+                Tag = go.tag,
+                Layer = go.layer,
+                IsStatic = go.isStatic,
+                Components = GetComponentNames(go),
+                Position = transform.localPosition,
+                Rotation = transform.localEulerAngles,
+                Scale = transform.localScale,
+                Transform = transform,
+                AddedVersion = _nextVersion
+            };
+            for (int i = 0; i < node.FieldVersions.Length; i++)
+                node.FieldVersions[i] = _nextVersion;
+            return node;
+        }
+
+        private static void UpdateProperties(Node node, GameObject go)
+        {
+            Transform transform = go.transform;
+            if (node.Name != go.name) { node.Name = go.name; Touch(node, FieldName); }
+            if (node.Active != go.activeSelf) { node.Active = go.activeSelf; Touch(node, FieldActive); }
+            if (node.Tag != go.tag) { node.Tag = go.tag; Touch(node, FieldTag); }
+            if (node.Layer != go.layer) { node.Layer = go.layer; Touch(node, FieldLayer); }
+            if (node.IsStatic != go.isStatic) { node.IsStatic = go.isStatic; Touch(node, FieldStatic); }
+            if (node.Position != transform.localPosition) { node.Position = transform.localPosition; Touch(node, FieldPosition); }
+            if (node.Rotation != transform.localEulerAngles) { node.Rotation = transform.localEulerAngles; Touch(node, FieldRotation); }
+            if (node.Scale != transform.localScale) { node.Scale = transform.localScale; Touch(node, FieldScale); }
+        }
+
+        private static void Touch(Node node, int field)
+        {
+            node.FieldVersions[field] = _nextVersion;
+            _changed = true;
+        }
+
+        private static void Remove(int id)
+        {
+            if (!_nodes.TryGetValue(id, out var node))
+                return;
+            if (_nodes.TryGetValue(node.ParentId, out var parent))
+                parent.Children.Remove(id);
+            _nodes.Remove(id);
+            _removed[id] = new Tombstone { AddedVersion = node.AddedVersion, RemovedVersion = _nextVersion };
+            _changed = true;
+        }
+
+        private static void TrimTombstones()
+        {
+            if (_removed.Count <= MaxTombstones)
+                return;
+
+            var ordered = _removed.OrderBy(pair => pair.Value.RemovedVersion).ToList();
+            int dropCount = ordered.Count / 2;
+            for (int i = 0; i < dropCount; i++)
+                _removed.Remove(ordered[i].Key);
+            // 被裁剪版本之前的差异已不完整
+            _baseVersion = Math.Max(_baseVersion, ordered[dropCount - 1].Value.RemovedVersion);
+        }
+
+        private static string[] GetComponentNames(GameObject go)
+        {
+            go.GetComponents(_componentBuffer);
+            var names = new string[_componentBuffer.Count];
+            for (int i = 0; i < names.Length; i++)
+            {
+                // 丢失脚本的组件为 null
+                names[i] = _componentBuffer[i] != null ? _componentBuffer[i].GetType().Name : "Missing";
+            }
+            _componentBuffer.Clear();
+            return names;
+        }
+
+        // --- 事件 ---
+
+        private static void OnHierarchyChanged()
+        {
+            // 播放模式下脚本修改层级不会产生 ObjectChangeEvents；没有伴随事件的层级变化需要全场景比对
+            if (_tracking && (EditorApplication.isPlayingOrWillChangePlaymode || !_eventsSinceHierarchyChanged))
+                _resyncNeeded = true;
+            _eventsSinceHierarchyChanged = false;
+        }
+
+        private static void OnChangesPublished(ref ObjectChangeEventStream stream)
+        {
+            if (stream.length == 0)
+                return;
+            _eventsSinceHierarchyChanged = true;
+
+            // 尚未开始跟踪、已需要全场景比对或处于播放模式（退出时全场景比对）时无需记录单个事件
+            if (!_tracking || _resyncNeeded || EditorApplication.isPlaying)
+                return;
+
+            for (int i = 0; i < stream.length && !_resyncNeeded; i++)
+            {
+                switch (stream.GetEventType(i))
+                {
+                    case ObjectChangeKind.CreateGameObjectHierarchy:
+                        stream.GetCreateGameObjectHierarchyEvent(i, out var created);
+                        _pendingSubtrees.Add(created.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectStructureHierarchy:
+                        stream.GetChangeGameObjectStructureHierarchyEvent(i, out var structureHierarchy);
+                        _pendingSubtrees.Add(structureHierarchy.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectParent:
+                        stream.GetChangeGameObjectParentEvent(i, out var parentChanged);
+                        _pendingSubtrees.Add(parentChanged.instanceId);
+                        break;
+                    case ObjectChangeKind.DestroyGameObjectHierarchy:
+                        stream.GetDestroyGameObjectHierarchyEvent(i, out var destroyed);
+                        _pendingSubtrees.Add(destroyed.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectStructure:
+                        stream.GetChangeGameObjectStructureEvent(i, out var structure);
+                        _pendingNodes.Add(structure.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectOrComponentProperties:
+                        stream.GetChangeGameObjectOrComponentPropertiesEvent(i, out var properties);
+                        // Transform 等组件的属性变化归到所属的 GameObject
+                        var target = EditorUtility.InstanceIDToObject(properties.instanceId);
+                        if (target is GameObject)
+                            _pendingNodes.Add(properties.instanceId);
+                        else if (target is Component component)
+                            _pendingNodes.Add(component.gameObject.GetInstanceID());
+                        break;
+                    case ObjectChangeKind.CreateAssetObject:
+                    case ObjectChangeKind.DestroyAssetObject:
+                    case ObjectChangeKind.ChangeAssetObjectProperties:
+                        break;
+                    default:
+                        // ChangeScene、UpdatePrefabInstances 等无法精确定位的变化
+                        _resyncNeeded = true;
+                        break;
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,279 @@
+using System;
+using System.Collections.Generic;
+using System.Text;
+using System.Text.RegularExpressions;
+using UnityEditor;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 批量导入设置引擎。按 glob（如 Assets/Art/**/*.png）和/或 project_search 查询（FindAssets 语法，如 "l:UI player"）选出资源，
+    /// 对每个导入器应用修改并比较修改前后的序列化结果：没有差异的资源视为已符合要求并跳过；
+    /// dry_run 时报告差异后还原导入器；否则写入导入设置，并在 StartAssetEditing/StopAssetEditing 中一次性重新导入。
+    /// </summary>
+    public static class ImportSettingsBatch
+    {
+        /// <summary>
+        /// 批量模式的参数键
+        /// </summary>
+        public static MethodKey[] CreateKeys()
+        {
+            return new MethodKey[]
+            {
+                new MethodStr("glob", L.T("Bulk mode: asset path glob (* within a folder, ** across folders, ?)", "批量模式：资源路径通配（*匹配单层，**匹配多层，?匹配单个字符）"))
+                    .AddExample("Assets/Art/**/*.png"),
+                new MethodStr("asset_query", L.T("Bulk mode: project_search style query (FindAssets syntax), combined with glob when both are given", "批量模式：project_search 风格查询（FindAssets语法），与glob同时提供时取交集"))
+                    .AddExample("l:UI"),
+                new MethodBool("dry_run", L.T("Bulk mode: only report the per-asset settings diff without applying, default false", "批量模式：只报告每个资源的设置差异而不应用，默认为false"))
+            };
+        }
+
+        /// <summary>
+        /// 是否为批量模式（提供了 glob 或 asset_query）
+        /// </summary>
+        public static bool IsBulk(JsonClass args)
+        {
+            return !string.IsNullOrEmpty(args["glob"]?.Value) || !string.IsNullOrEmpty(args["asset_query"]?.Value);
+        }
+
+        /// <summary>
+        /// 对匹配的资源批量应用导入设置
+        /// </summary>
+        /// <typeparam name="TImporter">导入器类型，其他导入器的资源标记为 skipped</typeparam>
+        /// <param name="args">工具参数（glob、asset_query、dry_run）</param>
+        /// <param name="typeFilter">FindAssets 类型过滤，如 "t:Texture"</param>
+        /// <param name="operation">操作名称，用于消息和日志</param>
+        /// <param name="apply">修改导入器（不保存、不重新导入），返回是否设置了任何值</param>
+        public static object Run<TImporter>(JsonClass args, string typeFilter, string operation, Func<TImporter, bool> apply) where TImporter : AssetImporter
+        {
+            string glob = args["glob"]?.Value;
+            string query = args["asset_query"]?.Value;
+            bool dryRun = args["dry_run"].AsBoolDefault(false);
+
+            List<string> paths = ResolvePaths(glob, query, typeFilter);
+            if (paths.Count == 0)
+            {
+                return Response.Error($"No assets matched glob '{glob}' / query '{query}'.");
+            }
+
+            var results = new JsonArray();
+            var toImport = new List<string>();
+            int compliant = 0, skipped = 0, failed = 0;
+
+            for (int i = 0; i < paths.Count; i++)
+            {
+                string path = paths[i];
+                if (i % 100 == 0)
+                    McpProgress.Report(i, paths.Count, $"{operation}: {path}");
+
+                var status = new JsonClass { ["path"] = path };
+                results.Add(status);
+
+                TImporter importer = AssetImporter.GetAtPath(path) as TImporter;
+                if (importer == null)
+                {
+                    status["status"] = "skipped";
+                    skipped++;
+                    continue;
+                }
+
+                try
+                {
+                    string before = EditorJsonUtility.ToJson(importer);
+                    string after = apply(importer) ? EditorJsonUtility.ToJson(importer) : before;
+                    if (after == before)
+                    {
+                        status["status"] = "compliant";
+                        compliant++;
+                        continue;
+                    }
+
+                    var changes = new JsonClass();
+                    Diff(Unwrap(Json.Parse(before)), Unwrap(Json.Parse(after)), string.Empty, changes);
+
+                    if (dryRun)
+                    {
+                        // 还原内存中的导入器，避免之后被其他保存操作写入
+                        EditorJsonUtility.FromJsonOverwrite(before, importer);
+                        EditorUtility.ClearDirty(importer);
+                        status["status"] = "would_change";
+                        status["changes"] = changes;
+                    }
+                    else
+                    {
+                        EditorUtility.SetDirty(importer);
+                        AssetDatabase.WriteImportSettingsIfDirty(path);
+                        toImport.Add(path);
+                        status["status"] = "changed";
+                        status["changes"] = Json.FromObject(new List<string>(changes.Keys));
+                    }
+                }
+                catch (Exception ex)
+                {
+                    status["status"] = "failed";
+                    status["error"] = ex.Message;
+                    failed++;
+                }
+            }
+
+            if (toImport.Count > 0)
+            {
+                AssetDatabase.StartAssetEditing();
+                try
+                {
+                    foreach (string path in toImport)
+                        AssetDatabase.ImportAsset(path);
+                }
+                finally
+                {
+                    AssetDatabase.StopAssetEditing();
+                }
+            }
+
+            int changedCount = dryRun ? paths.Count - compliant - skipped - failed : toImport.Count;
+            McpLogger.Log($"[ImportSettingsBatch] {operation}: {paths.Count} matched, {changedCount} {(dryRun ? "would change" : "changed")}, {compliant} compliant, {skipped} skipped, {failed} failed");
+
+            var data = new JsonClass
+            {
+                ["operation"] = operation,
+                ["dry_run"] = dryRun,
+                ["matched"] = paths.Count,
+                [dryRun ? "would_change" : "changed"] = changedCount,
+                ["compliant"] = compliant,
+                ["skipped"] = skipped,
+                ["failed"] = failed,
+                ["assets"] = results
+            };
+            string message = dryRun
+                ? $"{operation}: {changedCount} of {paths.Count} asset(s) would change ({compliant} already compliant)."
+                : $"{operation}: changed {changedCount} of {paths.Count} asset(s) in one import batch ({compliant} already compliant).";
+            return Response.Success(message, data);
+        }
+
+        /// <summary>
+        /// 解析 glob 与查询，返回排序后的资源路径
+        /// </summary>
+        public static List<string> ResolvePaths(string glob, string query, string typeFilter)
+        {
+            Regex globRegex = null;
+            string root = "Assets";
+            if (!string.IsNullOrEmpty(glob))
+            {
+                glob = glob.Replace('\\', '/').TrimStart('/');
+                if (!glob.StartsWith("Assets/") && !glob.StartsWith("Packages/"))
+                    glob = "Assets/" + glob;
+                globRegex = new Regex(GlobToRegex(glob), RegexOptions.IgnoreCase | RegexOptions.CultureInvariant);
+
+                // 通配符之前的目录作为搜索根目录
+                int wildcard = glob.IndexOfAny(new[] { '*', '?' });
+                string literal = wildcard < 0 ? glob : glob.Substring(0, wildcard);
+                int slash = literal.LastIndexOf('/');
+                if (slash > 0 && AssetDatabase.IsValidFolder(literal.Substring(0, slash)))
+                    root = literal.Substring(0, slash);
+            }
+
+            string filter = string.IsNullOrEmpty(query) ? typeFilter : $"{typeFilter} {query}";
+            var paths = new List<string>();
+            var seen = new HashSet<string>(StringComparer.Ordinal);
+            foreach (string guid in AssetDatabase.FindAssets(filter, new[] { root }))
+            {
+                string path = AssetDatabase.GUIDToAssetPath(guid);
+                if (string.IsNullOrEmpty(path) || !seen.Add(path))
+                    continue;
+                if (globRegex != null && !globRegex.IsMatch(path))
+                    continue;
+                paths.Add(path);
+            }
+            paths.Sort(StringComparer.Ordinal);
+            return paths;
+        }
+
+        /// <summary>
+        /// glob 转正则：** 匹配多层目录，* 匹配单层内任意字符，? 匹配单个字符
+        /// </summary>
+        private static string GlobToRegex(string glob)
+        {
+            var builder = new StringBuilder("^");
+            for (int i = 0; i < glob.Length; i++)
+            {
+                char c = glob[i];
+                if (c == '*')
+                {
+                    if (i + 1 < glob.Length && glob[i + 1] == '*')
+                    {
+                        bool folderWildcard = i + 2 < glob.Length && glob[i + 2] == '/';
+                        builder.Append(folderWildcard ? "(?:.*/)?" : ".*");
+                        i += folderWildcard ? 2 : 1;
+                    }
+                    else
+                    {
+                        builder.Append("[^/]*");
+                    }
+                }
+                else if (c == '?')
+                {
+                    builder.Append("[^/]");
+                }
+                else
+                {
+                    builder.Append(Regex.Escape(c.ToString()));
+                }
+            }
+            return builder.Append('$').ToString();
+        }
+
+        /// <summary>
+        /// 比较两份序列化结果，将变化的叶子字段写入 changes（路径 -> {from, to}）
+        /// </summary>
+        private static void Diff(JsonNode before, JsonNode after, string path, JsonClass changes)
+        {
+            if (before is JsonClass beforeClass && after is JsonClass afterClass)
+            {
+                var keys = new HashSet<string>(beforeClass.Keys);
+                keys.UnionWith(afterClass.Keys);
+                foreach (string key in keys)
+                {
+                    string childPath = path.Length == 0 ? key : path + "." + key;
+                    Diff(beforeClass.ContainsKey(key) ? beforeClass[key] : null,
+                        afterClass.ContainsKey(key) ? afterClass[key] : null, childPath, changes);
+                }
+                return;
+            }
+
+            if (before is JsonArray beforeArray && after is JsonArray afterArray && beforeArray.Count == afterArray.Count)
+            {
+                for (int i = 0; i < beforeArray.Count; i++)
+                    Diff(beforeArray[i], afterArray[i], $"{path}[{i}]", changes);
+                return;
+            }
+
+            string beforeText = before?.ToString();
+            string afterText = after?.ToString();
+            if (beforeText == afterText)
+                return;
+
+            changes[path] = new JsonClass
+            {
+                ["from"] = Json.FromObject(before),
+                ["to"] = Json.FromObject(after)
+            };
+        }
+
+        /// <summary>
+        /// 去掉序列化结果的根节点名（如 {"TextureImporter": {...}}）
+        /// </summary>
+        private static JsonNode Unwrap(JsonNode node)
+        {
+            if (node is JsonClass root && root.Count == 1)
+            {
+                foreach (string key in root.Keys)
+                {
+                    if (root[key] is JsonClass inner)
+                        return inner;
+                }
+            }
+            return node;
+        }
+    }
+}
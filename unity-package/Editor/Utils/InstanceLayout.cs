@@ -0,0 +1,233 @@
+using System;
+using System.Collections.Generic;
+using UnityEngine;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 批量实例化的程序化布局。grid 按行列（可分层）排列，scatter 在包围盒或圆盘内按种子随机散布，
+    /// path 沿折线等距分布（可朝向路径切线）。生成的位置、旋转、缩放均为相对父对象的本地值。
+    /// </summary>
+    public static class InstanceLayout
+    {
+        /// <summary>
+        /// 支持的布局类型
+        /// </summary>
+        public static readonly string[] Types = { "grid", "scatter", "path" };
+
+        /// <summary>
+        /// 单个实例的摆放（未指定的旋转、缩放保留模板的值）
+        /// </summary>
+        public struct Placement
+        {
+            public Vector3? Position;
+            public Vector3? Rotation;
+            public Vector3? Scale;
+        }
+
+        /// <summary>
+        /// 按布局参数生成摆放列表
+        /// </summary>
+        public static bool TryGenerate(JsonClass layout, out List<Placement> placements, out string error)
+        {
+            placements = new List<Placement>();
+            error = null;
+
+            string type = layout["type"]?.Value;
+            Vector3 origin = ReadVector(layout["origin"], Vector3.zero);
+            var random = new System.Random(layout["seed"].AsIntDefault(0));
+            bool generated;
+            switch (type)
+            {
+                case "grid":
+                    generated = Grid(layout, origin, placements, out error);
+                    break;
+                case "scatter":
+                    generated = Scatter(layout, origin, random, placements, out error);
+                    break;
+                case "path":
+                    generated = Path(layout, origin, placements, out error);
+                    break;
+                default:
+                    error = $"Unknown layout type '{type}'. Supported: {string.Join(", ", Types)}";
+                    return false;
+            }
+            if (!generated)
+                return false;
+
+            ApplyVariation(layout, random, placements);
+            return true;
+        }
+
+        private static bool Grid(JsonClass layout, Vector3 origin, List<Placement> placements, out string error)
+        {
+            int rows = layout["rows"].AsIntDefault(0);
+            int columns = layout["columns"].AsIntDefault(0);
+            int count = layout["count"].AsIntDefault(rows > 0 && columns > 0 ? rows * columns : 0);
+            if (count <= 0)
+            {
+                error = "Grid layout requires 'count' or both 'rows' and 'columns'.";
+                return false;
+            }
+            if (columns <= 0)
+                columns = rows > 0 ? Mathf.CeilToInt((float)count / rows) : Mathf.CeilToInt(Mathf.Sqrt(count));
+
+            // 超出 rows*columns 的实例向上堆叠为新的一层
+            Vector3 spacing = ReadVector(layout["spacing"], Vector3.one);
+            int perLayer = rows > 0 ? rows * columns : int.MaxValue;
+            for (int i = 0; i < count; i++)
+            {
+                int layer = i / perLayer;
+                int index = i % perLayer;
+                placements.Add(new Placement
+                {
+                    Position = origin + new Vector3(index % columns * spacing.x, layer * spacing.y, index / columns * spacing.z)
+                });
+            }
+            error = null;
+            return true;
+        }
+
+        private static bool Scatter(JsonClass layout, Vector3 origin, System.Random random, List<Placement> placements, out string error)
+        {
+            int count = layout["count"].AsIntDefault(0);
+            if (count <= 0)
+            {
+                error = "Scatter layout requires a positive 'count'.";
+                return false;
+            }
+
+            float radius = layout["radius"].AsFloatDefault(0f);
+            Vector3 size = ReadVector(layout["size"], new Vector3(10f, 0f, 10f));
+            for (int i = 0; i < count; i++)
+            {
+                Vector3 offset;
+                if (radius > 0f)
+                {
+                    // 圆盘内均匀分布（XZ 平面）
+                    double angle = random.NextDouble() * Math.PI * 2;
+                    float distance = radius * (float)Math.Sqrt(random.NextDouble());
+                    offset = new Vector3(distance * (float)Math.Cos(angle), 0f, distance * (float)Math.Sin(angle));
+                }
+                else
+                {
+                    offset = new Vector3(
+                        (float)(random.NextDouble() - 0.5) * size.x,
+                        (float)(random.NextDouble() - 0.5) * size.y,
+                        (float)(random.NextDouble() - 0.5) * size.z);
+                }
+                placements.Add(new Placement { Position = origin + offset });
+            }
+            error = null;
+            return true;
+        }
+
+        private static bool Path(JsonClass layout, Vector3 origin, List<Placement> placements, out string error)
+        {
+            var points = new List<Vector3>();
+            if (layout["points"] is JsonArray pointArray)
+            {
+                foreach (JsonNode node in pointArray.Childs)
+                {
+                    float[] values = JsonValueConverter.ReadFloats(node, 3);
+                    if (values == null)
+                    {
+                        error = $"Invalid path point {node}, expected [x, y, z].";
+                        return false;
+                    }
+                    points.Add(origin + new Vector3(values[0], values[1], values[2]));
+                }
+            }
+            if (points.Count < 2)
+            {
+                error = "Path layout requires at least two 'points'.";
+                return false;
+            }
+
+            bool closed = layout["closed"].AsBoolDefault(false);
+            if (closed)
+                points.Add(points[0]);
+
+            var cumulative = new float[points.Count];
+            for (int i = 1; i < points.Count; i++)
+                cumulative[i] = cumulative[i - 1] + Vector3.Distance(points[i - 1], points[i]);
+            float length = cumulative[points.Count - 1];
+
+            // count 优先；否则按 spacing 间距计算数量
+            int count = layout["count"].AsIntDefault(0);
+            if (count <= 0)
+            {
+                float spacing = layout["spacing"].AsFloatDefault(0f);
+                if (spacing <= 0f)
+                {
+                    error = "Path layout requires 'count' or a positive 'spacing'.";
+                    return false;
+                }
+                count = Mathf.FloorToInt(length / spacing) + (closed ? 0 : 1);
+            }
+
+            bool align = layout["align_to_path"].AsBoolDefault(true);
+            int segment = 1;
+            for (int i = 0; i < count; i++)
+            {
+                // 闭合路径不重复起点
+                float t = count == 1 ? 0f : (float)i / (closed ? count : count - 1);
+                float distance = t * length;
+                while (segment < points.Count - 1 && cumulative[segment] < distance)
+                    segment++;
+
+                float segmentLength = cumulative[segment] - cumulative[segment - 1];
+                float local = segmentLength > 0f ? (distance - cumulative[segment - 1]) / segmentLength : 0f;
+                Vector3 direction = points[segment] - points[segment - 1];
+                var placement = new Placement { Position = Vector3.Lerp(points[segment - 1], points[segment], local) };
+                if (align && direction.sqrMagnitude > 0f)
+                    placement.Rotation = Quaternion.LookRotation(direction).eulerAngles;
+                placements.Add(placement);
+            }
+            error = null;
+            return true;
+        }
+
+        /// <summary>
+        /// 按种子叠加随机偏航角与均匀缩放
+        /// </summary>
+        private static void ApplyVariation(JsonClass layout, System.Random random, List<Placement> placements)
+        {
+            bool randomYaw = layout["random_yaw"].AsBoolDefault(false);
+            float[] scaleRange = layout["scale_range"].IsNull() ? null : JsonValueConverter.ReadFloats(layout["scale_range"], 2);
+            if (!randomYaw && scaleRange == null)
+                return;
+
+            for (int i = 0; i < placements.Count; i++)
+            {
+                Placement placement = placements[i];
+                if (randomYaw)
+                {
+                    Vector3 rotation = placement.Rotation ?? Vector3.zero;
+                    rotation.y += (float)(random.NextDouble() * 360.0);
+                    placement.Rotation = rotation;
+                }
+                if (scaleRange != null)
+                {
+                    float scale = Mathf.Lerp(scaleRange[0], scaleRange[1], (float)random.NextDouble());
+                    placement.Scale = new Vector3(scale, scale, scale);
+                }
+                placements[i] = placement;
+            }
+        }
+
+        /// <summary>
+        /// 读取向量，支持 [x, y, z] 或单个数字（三个分量相同）
+        /// </summary>
+        private static Vector3 ReadVector(JsonNode node, Vector3 fallback)
+        {
+            if (node == null || node.IsNull())
+                return fallback;
+            if (node.type == JsonNodeType.Integer || node.type == JsonNodeType.Float)
+                return Vector3.one * node.AsFloat;
+            float[] values = JsonValueConverter.ReadFloats(node, 3);
+            return values != null ? new Vector3(values[0], values[1], values[2]) : fallback;
+        }
+    }
+}
@@ -0,0 +1,278 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Globalization;
+using System.Text;
+using UnityEditor;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// SimpleJson 性能基准。
+    /// 负载取自调试记录（McpExecuteRecordObject）中捕获的真实请求/响应，并补充合成的大型 batch_call 请求，
+    /// 对比快速解析器与宽松解析器的耗时和内存分配，同时校验两者的解析结果一致。
+    /// 另提供网格规模数值数组的基准，对比字符串存储与类型化存储的 JsonData。
+    /// </summary>
+    public static class JsonBenchmark
+    {
+        private const int DefaultIterations = 20;
+        private const int DefaultVertexCount = 10000;
+
+        [MenuItem("Window/MCP/Benchmark/Json Parse")]
+        private static void RunParseBenchmarkMenu()
+        {
+            UnityEngine.Debug.Log(RunParseBenchmark(DefaultIterations));
+        }
+
+        [MenuItem("Window/MCP/Benchmark/Json Numeric Array")]
+        private static void RunNumericBenchmarkMenu()
+        {
+            UnityEngine.Debug.Log(RunNumericBenchmark(DefaultVertexCount, DefaultIterations));
+        }
+
+        /// <summary>
+        /// 运行解析基准，返回文本报告
+        /// </summary>
+        /// <param name="iterations">每类负载的重复次数</param>
+        public static string RunParseBenchmark(int iterations)
+        {
+            var sb = new StringBuilder();
+            sb.AppendLine($"[JsonBenchmark] Json.Parse  iterations={iterations}");
+            sb.AppendLine($"{"payload",-24}{"count",7}{"KB",9}{"legacy ms",12}{"fast ms",10}{"speedup",9}{"legacy KB",11}{"fast KB",9}{"diff",6}");
+
+            foreach (var category in CollectPayloads())
+            {
+                var payloads = category.Value;
+                if (payloads.Count == 0)
+                    continue;
+
+                long bytes = 0;
+                int mismatches = 0;
+                foreach (var json in payloads)
+                {
+                    bytes += json.Length * sizeof(char);
+                    if (!SameResult(json))
+                        mismatches++;
+                }
+
+                Measure(payloads, iterations, JsonNode.ParseLegacy, out double legacyMs, out long legacyAlloc);
+                Measure(payloads, iterations, JsonNode.Parse, out double fastMs, out long fastAlloc);
+
+                sb.AppendLine($"{category.Key,-24}{payloads.Count,7}{bytes / 1024.0,9:F1}{legacyMs,12:F3}{fastMs,10:F3}" +
+                              $"{(fastMs > 0 ? legacyMs / fastMs : 0),8:F2}x{legacyAlloc / 1024.0,11:F1}{fastAlloc / 1024.0,9:F1}{mismatches,6}");
+            }
+            return sb.ToString();
+        }
+
+        /// <summary>
+        /// 收集基准负载，按来源分类
+        /// </summary>
+        public static Dictionary<string, List<string>> CollectPayloads()
+        {
+            var result = new Dictionary<string, List<string>>
+            {
+                { "http.request", new List<string>() },
+                { "http.response", new List<string>() },
+                { "record.cmd", new List<string>() },
+                { "record.result", new List<string>() },
+                { "synthetic.batch_call", new List<string> { BuildBatchCallPayload(200) } },
+            };
+
+            var recordObject = McpExecuteRecordObject.instance;
+            foreach (var http in recordObject.GetHttpRequestRecords())
+            {
+                AddPayload(result["http.request"], http.requestContent);
+                AddPayload(result["http.response"], http.responseContent);
+            }
+
+            foreach (var group in recordObject.recordGroups)
+            {
+                foreach (var record in group.records)
+                {
+                    AddPayload(result["record.cmd"], record.cmd);
+                    AddPayload(result["record.result"], record.result);
+                }
+            }
+            return result;
+        }
+
+        private static void AddPayload(List<string> list, string json)
+        {
+            if (string.IsNullOrWhiteSpace(json))
+                return;
+            char first = json.TrimStart()[0];
+            if (first == '{' || first == '[' || first == '"')
+                list.Add(json);
+        }
+
+        /// <summary>
+        /// 合成一个包含 count 个子调用的 batch_call 请求体
+        /// </summary>
+        private static string BuildBatchCallPayload(int count)
+        {
+            var sb = new StringBuilder("{\"jsonrpc\":\"2.0\",\"id\":1,\"method\":\"tools/call\",\"params\":{\"name\":\"batch_call\",\"arguments\":{\"args\":[");
+            for (int i = 0; i < count; i++)
+            {
+                if (i > 0)
+                    sb.Append(',');
+                sb.Append("{\"func\":\"edit_gameobject\",\"args\":{\"action\":\"modify\",\"path\":\"Root/Child_").Append(i)
+                  .Append("\",\"position\":[1.5,").Append(i).Append(",-3.25],\"name\":\"Item \\\"").Append(i).Append("\\\"\"}}");
+            }
+            sb.Append("]}}}");
+            return sb.ToString();
+        }
+
+        /// <summary>
+        /// 运行数值数组基准：构建 vertexCount 个顶点（每个 3 个浮点数）的数组，序列化后再逐个读回，
+        /// 对比字符串存储（旧行为）与类型化存储的耗时和内存分配
+        /// </summary>
+        /// <param name="vertexCount">顶点数量</param>
+        /// <param name="iterations">重复次数</param>
+        public static string RunNumericBenchmark(int vertexCount, int iterations)
+        {
+            var values = new float[vertexCount * 3];
+            var random = new Random(12345);
+            for (int i = 0; i < values.Length; i++)
+                values[i] = (float)(random.NextDouble() * 200.0 - 100.0);
+
+            var sb = new StringBuilder();
+            sb.AppendLine($"[JsonBenchmark] numeric array  floats={values.Length} iterations={iterations}");
+            sb.AppendLine($"{"storage",-12}{"build ms",10}{"write ms",10}{"read ms",10}{"total ms",10}{"alloc KB",11}");
+            AppendNumericRow(sb, "string", values, iterations, v => new JsonData(v.ToString(CultureInfo.InvariantCulture)));
+            AppendNumericRow(sb, "typed", values, iterations, v => new JsonData(v));
+            return sb.ToString();
+        }
+
+        private static void AppendNumericRow(StringBuilder sb, string label, float[] values, int iterations, Func<float, JsonData> create)
+        {
+            // 预热一次，排除 JIT 开销
+            RunNumericRound(values, create, out _, out _, out _);
+
+            GC.Collect();
+            double buildMs = 0, writeMs = 0, readMs = 0;
+            long allocStart = GC.GetAllocatedBytesForCurrentThread();
+            for (int i = 0; i < iterations; i++)
+            {
+                RunNumericRound(values, create, out double build, out double write, out double read);
+                buildMs += build;
+                writeMs += write;
+                readMs += read;
+            }
+            long allocated = (GC.GetAllocatedBytesForCurrentThread() - allocStart) / iterations;
+
+            buildMs /= iterations;
+            writeMs /= iterations;
+            readMs /= iterations;
+            sb.AppendLine($"{label,-12}{buildMs,10:F3}{writeMs,10:F3}{readMs,10:F3}{buildMs + writeMs + readMs,10:F3}{allocated / 1024.0,11:F1}");
+        }
+
+        private static void RunNumericRound(float[] values, Func<float, JsonData> create, out double buildMs, out double writeMs, out double readMs)
+        {
+            var stopwatch = Stopwatch.StartNew();
+            var array = new JsonArray();
+            for (int i = 0; i < values.Length; i++)
+                array.Add(create(values[i]));
+            buildMs = stopwatch.Elapsed.TotalMilliseconds;
+
+            stopwatch.Restart();
+            string json = array.ToString();
+            writeMs = stopwatch.Elapsed.TotalMilliseconds;
+
+            stopwatch.Restart();
+            float sum = 0;
+            for (int i = 0; i < array.Count; i++)
+                sum += array[i].AsFloat;
+            readMs = stopwatch.Elapsed.TotalMilliseconds;
+
+            if (json.Length == 0 || float.IsNaN(sum))
+                UnityEngine.Debug.LogWarning("[JsonBenchmark] Unexpected numeric benchmark result");
+        }
+
+        private static bool SameResult(string json)
+        {
+            try
+            {
+                return SameNode(JsonNode.Parse(json), JsonNode.ParseLegacy(json));
+            }
+            catch (Exception)
+            {
+                return false;
+            }
+        }
+
+        /// <summary>
+        /// 按语义比较两个节点：快速解析器会规范化数值文本（如 1.50 与 1.5），因此数值按值比较
+        /// </summary>
+        private static bool SameNode(JsonNode a, JsonNode b)
+        {
+            if (a == null || b == null)
+                return a == null && b == null;
+            if (a.GetType() != b.GetType() || a.Count != b.Count)
+                return false;
+
+            if (a is JsonClass objA)
+            {
+                var objB = (JsonClass)b;
+                foreach (var key in objA.GetKeys())
+                {
+                    if (!SameNode(objA[key], objB[key]))
+                        return false;
+                }
+                return true;
+            }
+
+            if (a is JsonArray)
+            {
+                for (int i = 0; i < a.Count; i++)
+                {
+                    if (!SameNode(a[i], b[i]))
+                        return false;
+                }
+                return true;
+            }
+
+            if (a.type != b.type)
+                return false;
+            if (a.type == JsonNodeType.Integer || a.type == JsonNodeType.Float)
+            {
+                return double.TryParse(a.Value, NumberStyles.Float, CultureInfo.InvariantCulture, out double x)
+                    && double.TryParse(b.Value, NumberStyles.Float, CultureInfo.InvariantCulture, out double y)
+                    && x.Equals(y);
+            }
+            return a.Value == b.Value;
+        }
+
+        private static void Measure(List<string> payloads, int iterations, Func<string, JsonNode> parse, out double milliseconds, out long allocatedBytes)
+        {
+            // 预热一次，排除 JIT 开销
+            foreach (var json in payloads)
+                TryParse(parse, json);
+
+            GC.Collect();
+            long allocStart = GC.GetAllocatedBytesForCurrentThread();
+            var stopwatch = Stopwatch.StartNew();
+            for (int i = 0; i < iterations; i++)
+            {
+                foreach (var json in payloads)
+                    TryParse(parse, json);
+            }
+            stopwatch.Stop();
+
+            milliseconds = stopwatch.Elapsed.TotalMilliseconds / iterations;
+            allocatedBytes = (GC.GetAllocatedBytesForCurrentThread() - allocStart) / iterations;
+        }
+
+        private static void TryParse(Func<string, JsonNode> parse, string json)
+        {
+            try
+            {
+                parse(json);
+            }
+            catch (Exception)
+            {
+                // 记录中可能包含截断或非法的 JSON，基准只关心耗时
+            }
+        }
+    }
+}
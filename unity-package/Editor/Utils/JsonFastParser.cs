@@ -0,0 +1,437 @@
+using System;
+using System.Buffers;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Text;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 单遍、基于 Span 的 JSON 解析器（JsonNode.Parse 的快速路径）。
+    /// 只接受标准 JSON 且根节点为对象或数组；遇到非标准输入（转义包裹、尾随逗号、未加引号的键等）时返回 false，
+    /// 由调用方回退到宽松解析器。对标准 JSON 生成的节点结构与宽松解析器一致，数值直接以 long/double 存储。
+    /// </summary>
+    internal static class JsonFastParser
+    {
+        /// <summary>
+        /// 最大嵌套深度，超出时交给宽松解析器（非递归）处理
+        /// </summary>
+        private const int MaxDepth = 256;
+
+        /// <summary>
+        /// 参与驻留的键名最大长度
+        /// </summary>
+        private const int MaxInternedKeyLength = 64;
+
+        /// <summary>
+        /// 直接累加不会溢出 long 的最大整数位数
+        /// </summary>
+        private const int MaxFastIntegerDigits = 18;
+
+        private const int KeyCacheMask = 1023;
+
+        // 键名驻留表：按哈希直接映射，冲突时覆盖；多线程下的竞争写入只会降低命中率，不影响正确性
+        private static readonly string[] s_KeyCache = new string[KeyCacheMask + 1];
+
+        [ThreadStatic]
+        private static StringBuilder t_EscapeBuilder;
+
+        // 解析中的成员/元素暂存栈：容器闭合后按实际数量一次性创建，避免 Dictionary/List 反复扩容
+        [ThreadStatic]
+        private static List<KeyValuePair<string, JsonNode>> t_Members;
+        [ThreadStatic]
+        private static List<JsonNode> t_Items;
+
+        /// <summary>
+        /// 解析 UTF-16 文本
+        /// </summary>
+        public static bool TryParse(ReadOnlySpan<char> json, out JsonNode result)
+        {
+            result = null;
+            int pos = SkipWhitespace(json, 0);
+            if (pos >= json.Length || (json[pos] != '{' && json[pos] != '['))
+                return false;
+
+            var members = t_Members ??= new List<KeyValuePair<string, JsonNode>>(64);
+            var items = t_Items ??= new List<JsonNode>(64);
+            try
+            {
+                if (!TryParseValue(json, ref pos, 0, out JsonNode node))
+                    return false;
+
+                if (SkipWhitespace(json, pos) != json.Length)
+                    return false;
+
+                result = node;
+                return true;
+            }
+            finally
+            {
+                // 失败时暂存栈中可能残留节点，统一清空以免持有引用
+                members.Clear();
+                items.Clear();
+            }
+        }
+
+        /// <summary>
+        /// 解析 UTF-8 字节，解码到池化缓冲区后按 UTF-16 解析，避免生成中间字符串
+        /// </summary>
+        public static bool TryParse(ReadOnlySpan<byte> utf8, out JsonNode result)
+        {
+            char[] buffer = ArrayPool<char>.Shared.Rent(Math.Max(1, Encoding.UTF8.GetMaxCharCount(utf8.Length)));
+            try
+            {
+                int length = Encoding.UTF8.GetChars(utf8, buffer);
+                return TryParse(new ReadOnlySpan<char>(buffer, 0, length), out result);
+            }
+            finally
+            {
+                ArrayPool<char>.Shared.Return(buffer);
+            }
+        }
+
+        private static bool TryParseValue(ReadOnlySpan<char> s, ref int pos, int depth, out JsonNode node)
+        {
+            node = null;
+            switch (s[pos])
+            {
+                case '{':
+                    return TryParseObject(s, ref pos, depth, out node);
+                case '[':
+                    return TryParseArray(s, ref pos, depth, out node);
+                case '"':
+                    if (!TryParseString(s, ref pos, false, out string str))
+                        return false;
+                    node = new JsonData(str);
+                    return true;
+                case 't':
+                    return TryParseLiteral(s, ref pos, "true", out node);
+                case 'f':
+                    return TryParseLiteral(s, ref pos, "false", out node);
+                case 'n':
+                    return TryParseLiteral(s, ref pos, "null", out node);
+                default:
+                    return TryParseNumber(s, ref pos, out node);
+            }
+        }
+
+        private static bool TryParseObject(ReadOnlySpan<char> s, ref int pos, int depth, out JsonNode node)
+        {
+            node = null;
+            if (depth >= MaxDepth)
+                return false;
+
+            pos = SkipWhitespace(s, pos + 1);
+            if (pos < s.Length && s[pos] == '}')
+            {
+                pos++;
+                node = new JsonClass();
+                return true;
+            }
+
+            var members = t_Members;
+            int first = members.Count;
+            while (true)
+            {
+                if (pos >= s.Length || s[pos] != '"' || !TryParseString(s, ref pos, true, out string key))
+                    return false;
+
+                pos = SkipWhitespace(s, pos);
+                if (pos >= s.Length || s[pos] != ':')
+                    return false;
+
+                pos = SkipWhitespace(s, pos + 1);
+                if (pos >= s.Length || !TryParseValue(s, ref pos, depth + 1, out JsonNode value))
+                    return false;
+
+                // 与宽松解析器保持一致：键名去除首尾空白，空键名的成员被忽略
+                if (key.Length > 0 && (char.IsWhiteSpace(key[0]) || char.IsWhiteSpace(key[key.Length - 1])))
+                    key = key.Trim();
+                if (key.Length > 0)
+                    members.Add(new KeyValuePair<string, JsonNode>(key, value));
+
+                pos = SkipWhitespace(s, pos);
+                if (pos >= s.Length)
+                    return false;
+
+                char c = s[pos++];
+                if (c == '}')
+                    break;
+                if (c != ',')
+                    return false;
+                pos = SkipWhitespace(s, pos);
+            }
+
+            var obj = new JsonClass(members.Count - first);
+            for (int i = first; i < members.Count; i++)
+                obj.Add(members[i].Key, members[i].Value);
+            members.RemoveRange(first, members.Count - first);
+            node = obj;
+            return true;
+        }
+
+        private static bool TryParseArray(ReadOnlySpan<char> s, ref int pos, int depth, out JsonNode node)
+        {
+            node = null;
+            if (depth >= MaxDepth)
+                return false;
+
+            pos = SkipWhitespace(s, pos + 1);
+            if (pos < s.Length && s[pos] == ']')
+            {
+                pos++;
+                node = new JsonArray();
+                return true;
+            }
+
+            var items = t_Items;
+            int first = items.Count;
+            while (true)
+            {
+                if (pos >= s.Length || !TryParseValue(s, ref pos, depth + 1, out JsonNode item))
+                    return false;
+                items.Add(item);
+
+                pos = SkipWhitespace(s, pos);
+                if (pos >= s.Length)
+                    return false;
+
+                char c = s[pos++];
+                if (c == ']')
+                    break;
+                if (c != ',')
+                    return false;
+                pos = SkipWhitespace(s, pos);
+            }
+
+            var arr = new JsonArray(items.Count - first);
+            for (int i = first; i < items.Count; i++)
+                arr.Add(items[i]);
+            items.RemoveRange(first, items.Count - first);
+            node = arr;
+            return true;
+        }
+
+        private static bool TryParseString(ReadOnlySpan<char> s, ref int pos, bool intern, out string value)
+        {
+            value = null;
+            int start = pos + 1;
+            int i = start;
+
+            // 快速路径：不含转义的字符串直接从原文切片
+            while (i < s.Length)
+            {
+                char c = s[i];
+                if (c == '"')
+                {
+                    var span = s.Slice(start, i - start);
+                    value = intern ? Intern(span) : new string(span);
+                    pos = i + 1;
+                    return true;
+                }
+                if (c == '\\')
+                    break;
+                if (c < ' ')
+                    return false;
+                i++;
+            }
+            if (i >= s.Length)
+                return false;
+
+            // 慢速路径：逐段复制并处理转义
+            var sb = t_EscapeBuilder ??= new StringBuilder(256);
+            sb.Clear();
+            sb.Append(s.Slice(start, i - start));
+            while (i < s.Length)
+            {
+                char c = s[i];
+                if (c == '"')
+                {
+                    value = sb.ToString();
+                    pos = i + 1;
+                    return true;
+                }
+                if (c < ' ')
+                    return false;
+                if (c != '\\')
+                {
+                    int runStart = i;
+                    while (i < s.Length && s[i] != '"' && s[i] != '\\' && s[i] >= ' ')
+                        i++;
+                    sb.Append(s.Slice(runStart, i - runStart));
+                    continue;
+                }
+
+                if (++i >= s.Length)
+                    return false;
+                switch (s[i])
+                {
+                    case '"': sb.Append('"'); break;
+                    case '\\': sb.Append('\\'); break;
+                    case '/': sb.Append('/'); break;
+                    case 'b': sb.Append('\b'); break;
+                    case 'f': sb.Append('\f'); break;
+                    case 'n': sb.Append('\n'); break;
+                    case 'r': sb.Append('\r'); break;
+                    case 't': sb.Append('\t'); break;
+                    case 'u':
+                        if (i + 4 >= s.Length || !TryParseHex(s.Slice(i + 1, 4), out char u))
+                            return false;
+                        sb.Append(u);
+                        i += 4;
+                        break;
+                    default:
+                        return false;
+                }
+                i++;
+            }
+            return false;
+        }
+
+        private static bool TryParseNumber(ReadOnlySpan<char> s, ref int pos, out JsonNode node)
+        {
+            node = null;
+            int start = pos;
+            int i = pos;
+
+            bool negative = s[i] == '-';
+            if (negative)
+                i++;
+            if (i >= s.Length)
+                return false;
+
+            int digitsStart = i;
+            if (s[i] == '0')
+                i++;
+            else if (IsDigit(s[i]))
+                i = SkipDigits(s, i);
+            else
+                return false;
+            int digitsEnd = i;
+            bool integral = true;
+
+            if (i < s.Length && s[i] == '.')
+            {
+                integral = false;
+                int fraction = ++i;
+                i = SkipDigits(s, i);
+                if (i == fraction)
+                    return false;
+            }
+
+            if (i < s.Length && (s[i] == 'e' || s[i] == 'E'))
+            {
+                integral = false;
+                i++;
+                if (i < s.Length && (s[i] == '+' || s[i] == '-'))
+                    i++;
+                int exponent = i;
+                i = SkipDigits(s, i);
+                if (i == exponent)
+                    return false;
+            }
+
+            var text = s.Slice(start, i - start);
+            pos = i;
+
+            // 数值直接从原文解析为 long/double，不生成子串；-0 与超出范围的数值保留原文
+            if (integral && digitsEnd - digitsStart <= MaxFastIntegerDigits && !(negative && s[digitsStart] == '0'))
+            {
+                long value = 0;
+                for (int d = digitsStart; d < digitsEnd; d++)
+                    value = value * 10 + (s[d] - '0');
+                node = new JsonData(negative ? -value : value);
+                return true;
+            }
+
+            if (!integral && double.TryParse(text, NumberStyles.Float, CultureInfo.InvariantCulture, out double number) &&
+                !double.IsInfinity(number))
+            {
+                node = new JsonData(number);
+                return true;
+            }
+
+            node = new JsonData(new string(text));
+            return true;
+        }
+
+        private static bool TryParseLiteral(ReadOnlySpan<char> s, ref int pos, string literal, out JsonNode node)
+        {
+            node = null;
+            if (!s.Slice(pos).StartsWith(literal.AsSpan()))
+                return false;
+            node = new JsonData(literal);
+            pos += literal.Length;
+            return true;
+        }
+
+        private static bool TryParseHex(ReadOnlySpan<char> hex, out char value)
+        {
+            int result = 0;
+            for (int i = 0; i < hex.Length; i++)
+            {
+                char c = hex[i];
+                int digit;
+                if (c >= '0' && c <= '9') digit = c - '0';
+                else if (c >= 'a' && c <= 'f') digit = c - 'a' + 10;
+                else if (c >= 'A' && c <= 'F') digit = c - 'A' + 10;
+                else
+                {
+                    value = '\0';
+                    return false;
+                }
+                result = (result << 4) | digit;
+            }
+            value = (char)result;
+            return true;
+        }
+
+        /// <summary>
+        /// 键名驻留：同一批请求中重复出现的键（func、args、action 等）共享同一个字符串实例
+        /// </summary>
+        private static string Intern(ReadOnlySpan<char> span)
+        {
+            if (span.Length == 0)
+                return string.Empty;
+            if (span.Length > MaxInternedKeyLength)
+                return new string(span);
+
+            uint hash = 2166136261;
+            for (int i = 0; i < span.Length; i++)
+                hash = (hash ^ span[i]) * 16777619;
+
+            int slot = (int)(hash & KeyCacheMask);
+            string cached = s_KeyCache[slot];
+            if (cached != null && span.SequenceEqual(cached.AsSpan()))
+                return cached;
+
+            cached = new string(span);
+            s_KeyCache[slot] = cached;
+            return cached;
+        }
+
+        private static int SkipWhitespace(ReadOnlySpan<char> s, int pos)
+        {
+            while (pos < s.Length)
+            {
+                char c = s[pos];
+                if (c != ' ' && c != '\t' && c != '\n' && c != '\r')
+                    break;
+                pos++;
+            }
+            return pos;
+        }
+
+        private static int SkipDigits(ReadOnlySpan<char> s, int pos)
+        {
+            while (pos < s.Length && IsDigit(s[pos]))
+                pos++;
+            return pos;
+        }
+
+        private static bool IsDigit(char c)
+        {
+            return c >= '0' && c <= '9';
+        }
+    }
+}
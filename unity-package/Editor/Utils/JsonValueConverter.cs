@@ -0,0 +1,249 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Globalization;
+using UnityEditor;
+using UnityEngine;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// JsonNode 到成员类型的转换器，每个目标类型只构建一次转换委托。
+    /// 支持基础类型、枚举（名称或数值）、Vector2/3/4、Quaternion、Color（数组或 "1,2,3" 形式的字符串）、
+    /// 数组与 List&lt;T&gt;（元素转换器同样预先构建）以及 Unity 对象引用（资源路径、场景层级路径或实例ID）。
+    /// 无法转换时返回 null。仅在主线程访问。
+    /// </summary>
+    public static class JsonValueConverter
+    {
+        private static readonly Dictionary<Type, Func<JsonNode, object>> _converters = new Dictionary<Type, Func<JsonNode, object>>();
+
+        /// <summary>
+        /// 将 JsonNode 转换为指定类型，失败时记录警告并返回 null
+        /// </summary>
+        public static object Convert(JsonNode token, Type targetType)
+        {
+            if (token == null || targetType == null)
+                return null;
+
+            try
+            {
+                return GetConverter(targetType)(token);
+            }
+            catch (Exception ex)
+            {
+                Debug.LogWarning($"[JsonValueConverter] Could not convert JsonNode '{token}' to type '{targetType.Name}': {ex.Message}");
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// 获取（必要时构建）指定类型的转换委托
+        /// </summary>
+        public static Func<JsonNode, object> GetConverter(Type targetType)
+        {
+            if (!_converters.TryGetValue(targetType, out var converter))
+            {
+                converter = CreateConverter(targetType);
+                _converters[targetType] = converter;
+            }
+            return converter;
+        }
+
+        private static Func<JsonNode, object> CreateConverter(Type targetType)
+        {
+            if (targetType == typeof(string))
+                return token => token.IsNull() ? null : token.Value;
+            if (targetType == typeof(int))
+                return token => token.AsInt;
+            if (targetType == typeof(float))
+                return token => token.AsFloat;
+            if (targetType == typeof(double))
+                return token => token.AsDouble;
+            if (targetType == typeof(bool))
+                return token => token.AsBool;
+            if (targetType == typeof(long))
+                return token => long.Parse(token.Value, NumberStyles.Integer, CultureInfo.InvariantCulture);
+
+            if (targetType == typeof(Vector2))
+                return token => ReadFloats(token, 2) is float[] v ? new Vector2(v[0], v[1]) : (object)null;
+            if (targetType == typeof(Vector3))
+                return token => ReadFloats(token, 3) is float[] v ? new Vector3(v[0], v[1], v[2]) : (object)null;
+            if (targetType == typeof(Vector4))
+                return token => ReadFloats(token, 4) is float[] v ? new Vector4(v[0], v[1], v[2], v[3]) : (object)null;
+            if (targetType == typeof(Quaternion))
+                return token => ReadFloats(token, 4) is float[] v ? new Quaternion(v[0], v[1], v[2], v[3]) : (object)null;
+            if (targetType == typeof(Color))
+                return token => ReadFloats(token, -1) is float[] v ? new Color(v[0], v[1], v[2], v.Length > 3 ? v[3] : 1.0f) : (object)null;
+
+            if (targetType.IsEnum)
+            {
+                return token => token.type == JsonNodeType.Integer
+                    ? Enum.ToObject(targetType, token.AsInt)
+                    : Enum.Parse(targetType, token.Value, true);
+            }
+
+            if (targetType.IsArray)
+            {
+                Type elementType = targetType.GetElementType();
+                var elementConverter = GetConverter(elementType);
+                return token =>
+                {
+                    if (!(token is JsonArray items))
+                        return null;
+                    Array array = Array.CreateInstance(elementType, items.Count);
+                    for (int i = 0; i < items.Count; i++)
+                    {
+                        object element = ConvertElement(elementConverter, items[i], elementType, i);
+                        if (element != null)
+                            array.SetValue(element, i);
+                    }
+                    return array;
+                };
+            }
+
+            if (targetType.IsGenericType && targetType.GetGenericTypeDefinition() == typeof(List<>))
+            {
+                Type elementType = targetType.GetGenericArguments()[0];
+                var elementConverter = GetConverter(elementType);
+                return token =>
+                {
+                    if (!(token is JsonArray items))
+                        return null;
+                    var list = (IList)Activator.CreateInstance(targetType);
+                    for (int i = 0; i < items.Count; i++)
+                    {
+                        object element = ConvertElement(elementConverter, items[i], elementType, i);
+                        if (element != null || !elementType.IsValueType)
+                            list.Add(element);
+                    }
+                    return list;
+                };
+            }
+
+            if (typeof(UnityEngine.Object).IsAssignableFrom(targetType))
+                return token => LoadUnityObject(token, targetType);
+
+            // 其余类型交给 SimpleJson 的通用转换
+            return token => token.ToObject(targetType);
+        }
+
+        private static object ConvertElement(Func<JsonNode, object> converter, JsonNode item, Type elementType, int index)
+        {
+            try
+            {
+                return converter(item);
+            }
+            catch (Exception ex)
+            {
+                Debug.LogWarning($"[JsonValueConverter] Failed to convert element {index} to '{elementType.Name}': {ex.Message}");
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// 读取固定数量的浮点数，支持数组和 "[1, 2, 3]"、"(1, 2, 3)" 形式的字符串；
+        /// expectedCount 为 -1 时接受 3 或 4 个值（颜色）
+        /// </summary>
+        public static float[] ReadFloats(JsonNode token, int expectedCount)
+        {
+            if (token is JsonArray array)
+            {
+                bool countMatches = expectedCount > 0 ? array.Count == expectedCount : array.Count >= 3;
+                if (!countMatches)
+                    return null;
+                int count = expectedCount > 0 ? expectedCount : Math.Min(array.Count, 4);
+                var values = new float[count];
+                for (int i = 0; i < count; i++)
+                    values[i] = array[i].AsFloat;
+                return values;
+            }
+
+            if (token.type == JsonNodeType.String)
+                return ParseNumberArrayFromString(token.Value, expectedCount);
+            return null;
+        }
+
+        /// <summary>
+        /// 解析 "[1, 2, 3]"、"(1, 2, 3)" 或 "1, 2, 3" 形式的数字字符串
+        /// </summary>
+        public static float[] ParseNumberArrayFromString(string str, int expectedCount)
+        {
+            if (string.IsNullOrWhiteSpace(str))
+                return null;
+
+            // 去除首尾空格并移除外层括号（支持方括号和圆括号）
+            str = str.Trim();
+            if ((str.StartsWith("[") && str.EndsWith("]")) ||
+                (str.StartsWith("(") && str.EndsWith(")")))
+            {
+                str = str.Substring(1, str.Length - 2);
+            }
+
+            string[] parts = str.Split(new[] { ',' }, StringSplitOptions.RemoveEmptyEntries);
+            if (expectedCount > 0 && parts.Length != expectedCount)
+            {
+                Debug.LogWarning($"[ParseNumberArrayFromString] Expected {expectedCount} values, but got {parts.Length} in string: '{str}'");
+                return null;
+            }
+            if (expectedCount == -1 && (parts.Length < 3 || parts.Length > 4))
+            {
+                Debug.LogWarning($"[ParseNumberArrayFromString] Expected 3-4 values, but got {parts.Length} in string: '{str}'");
+                return null;
+            }
+
+            float[] result = new float[parts.Length];
+            for (int i = 0; i < parts.Length; i++)
+            {
+                if (!float.TryParse(parts[i].Trim(), NumberStyles.Float, CultureInfo.InvariantCulture, out result[i]))
+                {
+                    Debug.LogWarning($"[ParseNumberArrayFromString] Failed to parse '{parts[i].Trim()}' as float in string: '{str}'");
+                    return null;
+                }
+            }
+            return result;
+        }
+
+        /// <summary>
+        /// 按资源路径、场景层级路径或实例ID加载 Unity 对象
+        /// </summary>
+        private static object LoadUnityObject(JsonNode token, Type targetType)
+        {
+            if (token.type == JsonNodeType.String)
+            {
+                string assetPath = token.Value;
+                if (string.IsNullOrEmpty(assetPath))
+                    return null;
+
+                if (System.IO.File.Exists(assetPath))
+                {
+                    var loadedAsset = AssetDatabase.LoadAssetAtPath(assetPath, targetType);
+                    if (loadedAsset != null)
+                        return loadedAsset;
+                }
+                else
+                {
+                    var sceneObj = GameObjectUtils.FindByHierarchyPath(assetPath, targetType);
+                    if (sceneObj != null)
+                        return sceneObj;
+                }
+
+                Debug.LogWarning($"[JsonValueConverter] Could not load asset of type '{targetType.Name}' from path: '{assetPath}'");
+                return null;
+            }
+
+            if (token.type == JsonNodeType.Integer)
+            {
+                int instanceId = token.AsInt;
+                var objectItem = EditorUtility.InstanceIDToObject(instanceId);
+                if (objectItem != null && targetType.IsInstanceOfType(objectItem))
+                    return objectItem;
+                if (objectItem is GameObject go && typeof(Component).IsAssignableFrom(targetType))
+                    return go.GetComponent(targetType);
+
+                Debug.LogWarning($"[JsonValueConverter] Could not load asset of type '{targetType.Name}' from instance id: '{instanceId}'");
+            }
+            return null;
+        }
+    }
+}
@@ -0,0 +1,144 @@
+using System;
+using System.Diagnostics;
+using System.Reflection;
+using System.Text;
+using UnityEditor;
+using UnityEngine;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 成员路径设置基准。
+    /// 在隐藏的临时 BoxCollider 上批量设置属性（包含需要结构体写回的 "center.x"），
+    /// 对比每次调用都做反射查找与使用 MemberAccessorCache 缓存访问器的耗时和内存分配，并校验最终值。
+    /// </summary>
+    public static class MemberAccessorBenchmark
+    {
+        private const int DefaultSetCount = 10000;
+        private const BindingFlags LookupFlags = BindingFlags.Public | BindingFlags.Instance | BindingFlags.IgnoreCase;
+
+        private static readonly string[] Paths = { "center.x", "size", "isTrigger", "center" };
+
+        [MenuItem("Window/MCP/Benchmark/Member Path Set")]
+        private static void RunSetBenchmarkMenu()
+        {
+            UnityEngine.Debug.Log(RunSetBenchmark(DefaultSetCount));
+        }
+
+        /// <summary>
+        /// 运行成员路径设置基准，返回文本报告
+        /// </summary>
+        /// <param name="setCount">每种方式设置属性的总次数</param>
+        public static string RunSetBenchmark(int setCount)
+        {
+            var values = new JsonNode[]
+            {
+                new JsonData(2.5f),
+                new JsonArray { new JsonData(1f), new JsonData(2f), new JsonData(3f) },
+                new JsonData(true),
+                new JsonArray { new JsonData(0f), new JsonData(0.5f), new JsonData(0f) },
+            };
+
+            var go = new GameObject("MemberAccessorBenchmark") { hideFlags = HideFlags.HideAndDontSave };
+            try
+            {
+                var collider = go.AddComponent<BoxCollider>();
+                var sb = new StringBuilder();
+                sb.AppendLine($"[MemberAccessorBenchmark] set count={setCount} paths={string.Join(", ", Paths)}");
+                sb.AppendLine($"{"accessor",-14}{"ms",10}{"us/set",9}{"alloc KB",11}{"ok",6}");
+                AppendRow(sb, "reflection", collider, values, setCount, SetByReflection);
+                AppendRow(sb, "cached", collider, values, setCount, SetByCachedPath);
+                return sb.ToString();
+            }
+            finally
+            {
+                UnityEngine.Object.DestroyImmediate(go);
+            }
+        }
+
+        private static void AppendRow(StringBuilder sb, string label, BoxCollider collider, JsonNode[] values, int setCount,
+            Func<object, string, JsonNode, bool> set)
+        {
+            // 预热一次，排除 JIT 和首次解析开销
+            for (int i = 0; i < Paths.Length; i++)
+                set(collider, Paths[i], values[i]);
+
+            collider.center = Vector3.zero;
+            GC.Collect();
+            long allocStart = GC.GetAllocatedBytesForCurrentThread();
+            var stopwatch = Stopwatch.StartNew();
+            int failures = 0;
+            for (int i = 0; i < setCount; i++)
+            {
+                int index = i % Paths.Length;
+                if (!set(collider, Paths[index], values[index]))
+                    failures++;
+            }
+            stopwatch.Stop();
+            long allocated = GC.GetAllocatedBytesForCurrentThread() - allocStart;
+
+            // 校验结构体写回：单独写入 center.x 后 center 必须随之改变
+            collider.center = Vector3.zero;
+            bool ok = failures == 0 && set(collider, Paths[0], values[0])
+                && Mathf.Approximately(collider.center.x, 2.5f)
+                && collider.isTrigger && collider.size == new Vector3(1f, 2f, 3f);
+
+            double ms = stopwatch.Elapsed.TotalMilliseconds;
+            sb.AppendLine($"{label,-14}{ms,10:F3}{ms * 1000.0 / setCount,9:F3}{allocated / 1024.0,11:F1}{(ok ? "yes" : "no"),6}");
+        }
+
+        private static bool SetByCachedPath(object target, string path, JsonNode value)
+        {
+            return MemberAccessorCache.Get(target.GetType(), path).TrySetValue(target, value, out _);
+        }
+
+        /// <summary>
+        /// 基线：每次调用都按名称查找成员并逐段读取，结构体段手动写回
+        /// </summary>
+        private static bool SetByReflection(object target, string path, JsonNode value)
+        {
+            string[] parts = path.Split('.');
+            var holders = new object[parts.Length];
+            var members = new MemberInfo[parts.Length];
+            object current = target;
+            for (int i = 0; i < parts.Length; i++)
+            {
+                holders[i] = current;
+                Type type = current.GetType();
+                members[i] = (MemberInfo)type.GetProperty(parts[i], LookupFlags) ?? type.GetField(parts[i], LookupFlags);
+                if (members[i] == null)
+                    return false;
+                if (i < parts.Length - 1)
+                    current = GetMember(members[i], current);
+            }
+
+            Type memberType = members[parts.Length - 1] is PropertyInfo p ? p.PropertyType : ((FieldInfo)members[parts.Length - 1]).FieldType;
+            object updated = JsonValueConverter.Convert(value, memberType);
+            if (updated == null)
+                return false;
+
+            for (int i = parts.Length - 1; i >= 0; i--)
+            {
+                SetMember(members[i], holders[i], updated);
+                if (!holders[i].GetType().IsValueType)
+                    break;
+                updated = holders[i];
+            }
+            return true;
+        }
+
+        private static object GetMember(MemberInfo member, object holder)
+        {
+            return member is PropertyInfo property ? property.GetValue(holder) : ((FieldInfo)member).GetValue(holder);
+        }
+
+        private static void SetMember(MemberInfo member, object holder, object value)
+        {
+            if (member is PropertyInfo property)
+                property.SetValue(holder, value);
+            else
+                ((FieldInfo)member).SetValue(holder, value);
+        }
+    }
+}
@@ -0,0 +1,639 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Linq;
+using System.Linq.Expressions;
+using System.Reflection;
+using UnityEditor;
+using UnityEngine;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 已解析的成员路径（如 "center.x"、"sharedMaterials[1]"、"material.color"），由 MemberAccessorCache 创建并缓存。
+    /// 每一段保存编译后的 getter/setter；setter 返回更新后的宿主，值类型宿主（结构体）修改后会沿路径逐级写回。
+    /// 某一段在声明类型上找不到时，剩余路径在运行时按实际类型解析（同样缓存）。
+    /// </summary>
+    public sealed class MemberPath
+    {
+        internal sealed class Step
+        {
+            public string Name;
+            public Type MemberType;
+            public Type ValueType;
+            public bool IsField;
+            public Func<object, object> Getter;
+            public Func<object, object, object> Setter;
+            public int Index = -1;
+        }
+
+        private readonly Step[] _steps;
+        private readonly string _tail;
+
+        internal MemberPath(Type rootType, string path, Step[] steps, string tail, string error)
+        {
+            RootType = rootType;
+            Path = path;
+            _steps = steps;
+            _tail = tail;
+            Error = error;
+        }
+
+        /// <summary>
+        /// 解析路径时使用的根类型
+        /// </summary>
+        public Type RootType { get; }
+
+        /// <summary>
+        /// 成员路径
+        /// </summary>
+        public string Path { get; }
+
+        /// <summary>
+        /// 路径无法解析时的错误信息，可解析时为 null
+        /// </summary>
+        public string Error { get; }
+
+        /// <summary>
+        /// 路径是否可解析
+        /// </summary>
+        public bool IsValid => Error == null;
+
+        /// <summary>
+        /// 最终值的类型；路径末尾需要在运行时解析时为 null
+        /// </summary>
+        public Type ValueType => IsValid && _tail == null ? _steps[_steps.Length - 1].ValueType : null;
+
+        /// <summary>
+        /// 单段路径的成员名（用于枚举成员）
+        /// </summary>
+        public string Name => _steps != null && _steps.Length > 0 ? _steps[_steps.Length - 1].Name : Path;
+
+        /// <summary>
+        /// 路径末端是否为字段（否则为属性）
+        /// </summary>
+        public bool IsField => _steps != null && _steps.Length > 0 && _tail == null && _steps[_steps.Length - 1].IsField;
+
+        /// <summary>
+        /// 读取路径对应的值
+        /// </summary>
+        public bool TryGetValue(object root, out object value, out string error)
+        {
+            value = null;
+            if (!IsValid)
+            {
+                error = Error;
+                return false;
+            }
+
+            object current = root;
+            foreach (var step in _steps)
+            {
+                if (!TryRead(step, current, out current, out error))
+                    return false;
+            }
+
+            if (_tail != null)
+            {
+                if (current == null)
+                {
+                    error = $"Member '{_steps[_steps.Length - 1].Name}' is null, cannot access '{_tail}'";
+                    return false;
+                }
+                return MemberAccessorCache.Get(current.GetType(), _tail).TryGetValue(current, out value, out error);
+            }
+
+            value = current;
+            error = null;
+            return true;
+        }
+
+        /// <summary>
+        /// 读取路径对应的值，失败时返回 null
+        /// </summary>
+        public object GetValue(object root)
+        {
+            return TryGetValue(root, out object value, out _) ? value : null;
+        }
+
+        /// <summary>
+        /// 将 JSON 值转换为成员类型后写入。显式的 null 或空字符串可清空引用类型成员
+        /// </summary>
+        public bool TrySetValue(object root, JsonNode value, out string error)
+        {
+            return TrySetCore(root, value, null, out _, out error);
+        }
+
+        /// <summary>
+        /// 直接写入已转换的值
+        /// </summary>
+        public bool TrySetRawValue(object root, object value, out string error)
+        {
+            return TrySetCore(root, null, value, out _, out error);
+        }
+
+        /// <summary>
+        /// 沿路径写入值，返回更新后的根（根为结构体时是新的装箱副本）
+        /// </summary>
+        internal bool TrySetCore(object root, JsonNode json, object rawValue, out object updatedRoot, out string error)
+        {
+            updatedRoot = root;
+            if (!IsValid)
+            {
+                error = Error;
+                return false;
+            }
+
+            // 记录每一段的宿主，用于结构体写回
+            int count = _tail != null ? _steps.Length : _steps.Length - 1;
+            var holders = new object[count + 1];
+            holders[0] = root;
+            for (int i = 0; i < count; i++)
+            {
+                if (!TryRead(_steps[i], holders[i], out holders[i + 1], out error))
+                    return false;
+                if (holders[i + 1] == null)
+                {
+                    error = $"Member '{_steps[i].Name}' is null, cannot access nested members";
+                    return false;
+                }
+            }
+
+            object updated;
+            if (_tail != null)
+            {
+                object holder = holders[count];
+                if (!MemberAccessorCache.Get(holder.GetType(), _tail).TrySetCore(holder, json, rawValue, out updated, out error))
+                    return false;
+            }
+            else
+            {
+                var last = _steps[count];
+                object value = rawValue;
+                if (json != null && !TryConvert(json, last.ValueType, out value, out error))
+                    return false;
+                if (!TryWrite(last, holders[count], value, out updated, out error))
+                    return false;
+            }
+
+            // 值类型宿主是副本，需要逐级写回，直到遇到引用类型宿主（已原地修改）
+            bool reachedRoot = true;
+            for (int i = count - 1; i >= 0; i--)
+            {
+                if (!holders[i + 1].GetType().IsValueType)
+                {
+                    reachedRoot = false;
+                    break;
+                }
+                if (!TryWrite(_steps[i], holders[i], updated, out updated, out error))
+                    return false;
+            }
+
+            if (reachedRoot)
+                updatedRoot = updated;
+            error = null;
+            return true;
+        }
+
+        private static bool TryConvert(JsonNode json, Type valueType, out object value, out string error)
+        {
+            value = JsonValueConverter.Convert(json, valueType);
+            if (value != null)
+            {
+                error = null;
+                return true;
+            }
+
+            bool explicitNull = json.IsNull() || (json.type == JsonNodeType.String && string.IsNullOrEmpty(json.Value));
+            if (explicitNull && !valueType.IsValueType)
+            {
+                error = null;
+                return true;
+            }
+
+            error = $"Failed to convert value '{json}' to type '{valueType.Name}'";
+            return false;
+        }
+
+        private static bool TryRead(Step step, object holder, out object value, out string error)
+        {
+            value = step.Getter(holder);
+            if (step.Index >= 0)
+            {
+                if (!(value is IList list))
+                {
+                    error = $"Member '{step.Name}' is not an array or list, cannot access by index";
+                    return false;
+                }
+                if (step.Index >= list.Count)
+                {
+                    error = $"Index {step.Index} out of range (0-{list.Count - 1}) for '{step.Name}'";
+                    return false;
+                }
+                value = list[step.Index];
+            }
+            error = null;
+            return true;
+        }
+
+        private static bool TryWrite(Step step, object holder, object value, out object updatedHolder, out string error)
+        {
+            updatedHolder = holder;
+            if (step.Index >= 0)
+            {
+                // 数组属性（如 sharedMaterials）通常返回副本，修改元素后再整体写回
+                if (!(step.Getter(holder) is IList list) || step.Index >= list.Count)
+                {
+                    error = $"Index {step.Index} out of range for '{step.Name}'";
+                    return false;
+                }
+                list[step.Index] = value;
+                if (step.Setter != null)
+                    updatedHolder = step.Setter(holder, list);
+                error = null;
+                return true;
+            }
+
+            if (step.Setter == null)
+            {
+                error = $"Member '{step.Name}' on type '{holder.GetType().Name}' is read-only";
+                return false;
+            }
+            updatedHolder = step.Setter(holder, value);
+            error = null;
+            return true;
+        }
+    }
+
+    /// <summary>
+    /// 按 (类型, 成员路径) 缓存的成员访问器，避免批量设置属性时重复的反射查找。
+    /// 成员名先精确匹配，再忽略大小写匹配，字段优先于属性；getter/setter 通过表达式树编译，编译失败时退回反射。
+    /// 另缓存 SerializedProperty 回退路径，用于访问非公共的序列化字段（如 m_Speed）。
+    /// 无法解析的路径不缓存；缓存条目超过 MaxCachedPaths 时整体清空。仅在主线程访问。
+    /// </summary>
+    public static class MemberAccessorCache
+    {
+        private const BindingFlags MemberFlags = BindingFlags.Public | BindingFlags.Instance;
+
+        /// <summary>
+        /// 成员路径缓存和序列化路径缓存各自的条目上限
+        /// </summary>
+        public const int MaxCachedPaths = 4096;
+
+        private static readonly Dictionary<(Type, string), MemberPath> _paths = new Dictionary<(Type, string), MemberPath>();
+        private static readonly Dictionary<Type, MemberPath[]> _readableMembers = new Dictionary<Type, MemberPath[]>();
+        private static readonly Dictionary<(Type, string), string> _serializedPaths = new Dictionary<(Type, string), string>();
+
+        /// <summary>
+        /// 获取（必要时解析并缓存）类型上的成员路径；无法解析时返回的 MemberPath.IsValid 为 false
+        /// </summary>
+        public static MemberPath Get(Type type, string path)
+        {
+            var key = (type, path);
+            if (!_paths.TryGetValue(key, out var memberPath))
+            {
+                memberPath = Resolve(type, path);
+                if (memberPath.IsValid)
+                    AddBounded(_paths, key, memberPath);
+            }
+            return memberPath;
+        }
+
+        private static void AddBounded<TValue>(Dictionary<(Type, string), TValue> cache, (Type, string) key, TValue value)
+        {
+            // 路径来自调用参数，数量没有上限；超出时清空，常用路径会很快重新缓存
+            if (cache.Count >= MaxCachedPaths)
+                cache.Clear();
+            cache[key] = value;
+        }
+
+        /// <summary>
+        /// 获取类型上所有可读写的公共属性（不含索引器）和可序列化字段（public 或 [SerializeField]），属性在前
+        /// </summary>
+        public static IReadOnlyList<MemberPath> GetReadableMembers(Type type)
+        {
+            if (_readableMembers.TryGetValue(type, out var members))
+                return members;
+
+            var list = new List<MemberPath>();
+            var names = new HashSet<string>();
+            foreach (var property in type.GetProperties(MemberFlags))
+            {
+                if (property.CanRead && property.CanWrite && property.GetIndexParameters().Length == 0 && names.Add(property.Name))
+                    list.Add(CreateSingle(type, property));
+            }
+            foreach (var field in type.GetFields(MemberFlags | BindingFlags.NonPublic))
+            {
+                bool serializable = field.IsPublic || field.IsDefined(typeof(SerializeField), true);
+                if (serializable && names.Add(field.Name))
+                    list.Add(CreateSingle(type, field));
+            }
+
+            members = list.ToArray();
+            _readableMembers[type] = members;
+            return members;
+        }
+
+        /// <summary>
+        /// 通过 SerializedProperty 写入值，用于反射无法访问的序列化字段。
+        /// 路径按原样、"m_" 前缀（m_Speed）和 "_" 前缀依次尝试，解析结果按 (类型, 路径) 缓存
+        /// </summary>
+        public static bool TrySetSerialized(UnityEngine.Object target, string path, JsonNode value, out string error)
+        {
+            if (target == null)
+            {
+                error = "Target object is null";
+                return false;
+            }
+
+            using (var serializedObject = new SerializedObject(target))
+            {
+                var key = (target.GetType(), path);
+                if (!_serializedPaths.TryGetValue(key, out string propertyPath))
+                {
+                    propertyPath = ResolveSerializedPath(serializedObject, path);
+                    if (propertyPath != null)
+                        AddBounded(_serializedPaths, key, propertyPath);
+                }
+
+                var property = propertyPath != null ? serializedObject.FindProperty(propertyPath) : null;
+                if (property == null)
+                {
+                    error = $"Serialized property '{path}' not found on type '{target.GetType().Name}'";
+                    return false;
+                }
+
+                if (!TryAssignSerialized(property, value, out error))
+                    return false;
+                serializedObject.ApplyModifiedProperties();
+                return true;
+            }
+        }
+
+        private static string ResolveSerializedPath(SerializedObject serializedObject, string path)
+        {
+            // "items[2].name" 对应序列化路径 "items.Array.data[2].name"
+            string normalized = System.Text.RegularExpressions.Regex.Replace(path, @"\[(\d+)\]", ".Array.data[$1]");
+            string first = normalized.Split('.')[0];
+            string rest = normalized.Substring(first.Length);
+            string capitalized = first.Length > 0 ? char.ToUpperInvariant(first[0]) + first.Substring(1) : first;
+
+            foreach (var candidate in new[] { normalized, "m_" + capitalized + rest, "_" + normalized })
+            {
+                if (serializedObject.FindProperty(candidate) != null)
+                    return candidate;
+            }
+            return null;
+        }
+
+        private static bool TryAssignSerialized(SerializedProperty property, JsonNode value, out string error)
+        {
+            error = null;
+            switch (property.propertyType)
+            {
+                case SerializedPropertyType.Integer:
+                case SerializedPropertyType.LayerMask:
+                    property.intValue = value.AsInt;
+                    return true;
+                case SerializedPropertyType.Boolean:
+                    property.boolValue = value.AsBool;
+                    return true;
+                case SerializedPropertyType.Float:
+                    property.floatValue = value.AsFloat;
+                    return true;
+                case SerializedPropertyType.String:
+                    property.stringValue = value.Value;
+                    return true;
+                case SerializedPropertyType.Enum:
+                    if (value.type == JsonNodeType.Integer)
+                    {
+                        property.enumValueIndex = value.AsInt;
+                        return true;
+                    }
+                    int index = Array.FindIndex(property.enumNames, n => string.Equals(n, value.Value, StringComparison.OrdinalIgnoreCase));
+                    if (index < 0)
+                    {
+                        error = $"Enum value '{value.Value}' not found for '{property.propertyPath}'";
+                        return false;
+                    }
+                    property.enumValueIndex = index;
+                    return true;
+                case SerializedPropertyType.Color:
+                    return Assign<Color>(value, v => property.colorValue = v, out error);
+                case SerializedPropertyType.Vector2:
+                    return Assign<Vector2>(value, v => property.vector2Value = v, out error);
+                case SerializedPropertyType.Vector3:
+                    return Assign<Vector3>(value, v => property.vector3Value = v, out error);
+                case SerializedPropertyType.Vector4:
+                    return Assign<Vector4>(value, v => property.vector4Value = v, out error);
+                case SerializedPropertyType.Quaternion:
+                    return Assign<Quaternion>(value, v => property.quaternionValue = v, out error);
+                case SerializedPropertyType.ObjectReference:
+                    if (value.IsNull() || (value.type == JsonNodeType.String && string.IsNullOrEmpty(value.Value)))
+                    {
+                        property.objectReferenceValue = null;
+                        return true;
+                    }
+                    var reference = JsonValueConverter.Convert(value, typeof(UnityEngine.Object)) as UnityEngine.Object;
+                    if (reference == null)
+                    {
+                        error = $"Could not resolve object reference '{value}' for '{property.propertyPath}'";
+                        return false;
+                    }
+                    property.objectReferenceValue = reference;
+                    return true;
+                default:
+                    error = $"Serialized property type '{property.propertyType}' of '{property.propertyPath}' is not supported";
+                    return false;
+            }
+        }
+
+        private static bool Assign<T>(JsonNode value, Action<T> assign, out string error)
+        {
+            if (JsonValueConverter.Convert(value, typeof(T)) is T converted)
+            {
+                assign(converted);
+                error = null;
+                return true;
+            }
+            error = $"Failed to convert value '{value}' to type '{typeof(T).Name}'";
+            return false;
+        }
+
+        // --- 路径解析 ---
+
+        private static MemberPath Resolve(Type rootType, string path)
+        {
+            if (string.IsNullOrEmpty(path))
+                return new MemberPath(rootType, path, null, null, "Member path is empty");
+
+            string[] parts = SplitPath(path);
+            var steps = new List<MemberPath.Step>(parts.Length);
+            Type currentType = rootType;
+            for (int i = 0; i < parts.Length; i++)
+            {
+                string part = parts[i];
+                int index = -1;
+                int bracket = part.IndexOf('[');
+                if (bracket > 0 && part.EndsWith("]"))
+                {
+                    if (!int.TryParse(part.Substring(bracket + 1, part.Length - bracket - 2), out index) || index < 0)
+                        return new MemberPath(rootType, path, null, null, $"Invalid index in '{part}'");
+                    part = part.Substring(0, bracket);
+                }
+
+                MemberInfo member = FindMember(currentType, part);
+                if (member == null)
+                {
+                    // 声明类型上没有该成员：若不是首段且声明类型可能被派生，剩余路径改为运行时按实际类型解析
+                    if (i > 0 && !currentType.IsSealed && !currentType.IsValueType)
+                        return new MemberPath(rootType, path, steps.ToArray(), string.Join(".", parts, i, parts.Length - i), null);
+                    return new MemberPath(rootType, path, null, null, $"Field or property '{part}' not found on type '{currentType.Name}'");
+                }
+
+                var step = CreateStep(currentType, member);
+                if (index >= 0)
+                {
+                    step.Index = index;
+                    step.ValueType = GetElementType(step.MemberType);
+                }
+                steps.Add(step);
+                currentType = step.ValueType;
+            }
+            return new MemberPath(rootType, path, steps.ToArray(), null, null);
+        }
+
+        /// <summary>
+        /// 按 "." 拆分路径，方括号内的内容不拆分
+        /// </summary>
+        private static string[] SplitPath(string path)
+        {
+            var parts = new List<string>();
+            int start = 0;
+            bool inBrackets = false;
+            for (int i = 0; i < path.Length; i++)
+            {
+                char c = path[i];
+                if (c == '[')
+                    inBrackets = true;
+                else if (c == ']')
+                    inBrackets = false;
+                else if (c == '.' && !inBrackets)
+                {
+                    parts.Add(path.Substring(start, i - start));
+                    start = i + 1;
+                }
+            }
+            if (start < path.Length)
+                parts.Add(path.Substring(start));
+            return parts.ToArray();
+        }
+
+        private static MemberInfo FindMember(Type type, string name)
+        {
+            return FindMember(type, name, StringComparison.Ordinal) ?? FindMember(type, name, StringComparison.OrdinalIgnoreCase);
+        }
+
+        private static MemberInfo FindMember(Type type, string name, StringComparison comparison)
+        {
+            var field = type.GetFields(MemberFlags).FirstOrDefault(f => string.Equals(f.Name, name, comparison));
+            if (field != null)
+                return field;
+
+            // 使用 new 隐藏的属性会出现多个同名项，取最派生类型上声明的那个
+            PropertyInfo best = null;
+            foreach (var property in type.GetProperties(MemberFlags))
+            {
+                if (property.GetIndexParameters().Length > 0 || !string.Equals(property.Name, name, comparison))
+                    continue;
+                if (best == null || best.DeclaringType.IsAssignableFrom(property.DeclaringType))
+                    best = property;
+            }
+            return best;
+        }
+
+        private static Type GetElementType(Type listType)
+        {
+            if (listType.IsArray)
+                return listType.GetElementType();
+            var genericList = listType.GetInterfaces().Append(listType)
+                .FirstOrDefault(t => t.IsGenericType && t.GetGenericTypeDefinition() == typeof(IList<>));
+            return genericList != null ? genericList.GetGenericArguments()[0] : typeof(object);
+        }
+
+        private static MemberPath CreateSingle(Type type, MemberInfo member)
+        {
+            return new MemberPath(type, member.Name, new[] { CreateStep(type, member) }, null, null);
+        }
+
+        private static MemberPath.Step CreateStep(Type declaringType, MemberInfo member)
+        {
+            var field = member as FieldInfo;
+            var property = member as PropertyInfo;
+            Type memberType = field != null ? field.FieldType : property.PropertyType;
+            bool writable = field != null ? !field.IsInitOnly && !field.IsLiteral : property.CanWrite;
+
+            return new MemberPath.Step
+            {
+                Name = member.Name,
+                MemberType = memberType,
+                ValueType = memberType,
+                IsField = field != null,
+                Getter = CompileGetter(declaringType, member, field, property),
+                Setter = writable ? CompileSetter(declaringType, member, memberType, field, property) : null
+            };
+        }
+
+        private static Func<object, object> CompileGetter(Type declaringType, MemberInfo member, FieldInfo field, PropertyInfo property)
+        {
+            if (property != null && !property.CanRead)
+                return holder => throw new InvalidOperationException($"Property '{property.Name}' is write-only");
+            // 非公共的 [SerializeField] 字段直接用反射读取，避免编译委托的可见性检查
+            if (field != null && !field.IsPublic)
+                return field.GetValue;
+
+            try
+            {
+                // (object holder) => (object)((TDeclaring)holder).Member
+                var holder = Expression.Parameter(typeof(object), "holder");
+                var access = Expression.MakeMemberAccess(Expression.Convert(holder, declaringType), member);
+                return Expression.Lambda<Func<object, object>>(Expression.Convert(access, typeof(object)), holder).Compile();
+            }
+            catch (Exception)
+            {
+                if (field != null)
+                    return field.GetValue;
+                return holder => property.GetValue(holder);
+            }
+        }
+
+        private static Func<object, object, object> CompileSetter(Type declaringType, MemberInfo member, Type memberType, FieldInfo field, PropertyInfo property)
+        {
+            if (field != null && !field.IsPublic)
+                return (holder, value) => { field.SetValue(holder, value); return holder; };
+
+            try
+            {
+                // (object holder, object value) => { TDeclaring tmp = (TDeclaring)holder; tmp.Member = (TMember)value; return (object)tmp; }
+                // 结构体宿主返回修改后的新装箱副本，类宿主返回原引用
+                var holder = Expression.Parameter(typeof(object), "holder");
+                var value = Expression.Parameter(typeof(object), "value");
+                var instance = Expression.Variable(declaringType, "instance");
+                var body = Expression.Block(
+                    new[] { instance },
+                    Expression.Assign(instance, Expression.Convert(holder, declaringType)),
+                    Expression.Assign(Expression.MakeMemberAccess(instance, member), Expression.Convert(value, memberType)),
+                    Expression.Convert(instance, typeof(object)));
+                return Expression.Lambda<Func<object, object, object>>(body, holder, value).Compile();
+            }
+            catch (Exception)
+            {
+                // 反射对装箱结构体的修改直接作用在装箱对象上
+                if (field != null)
+                    return (holder, value) => { field.SetValue(holder, value); return holder; };
+                return (holder, value) => { property.SetValue(holder, value); return holder; };
+            }
+        }
+    }
+}
@@ -0,0 +1,368 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using UnityEditor;
+using UnityEditor.PackageManager;
+using UnityEditor.PackageManager.Requests;
+using UnityEngine;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 本地包目录缓存。已安装包的快照以 Packages/manifest.json + packages-lock.json 的内容哈希为键：
+    /// 哈希未变化时 list 直接由快照回答；哈希变化时先返回旧快照，同时在后台用离线 Client.List 重新校验。
+    /// Registry 搜索结果按关键词缓存并带 TTL，过期结果立即返回并在后台刷新。
+    /// 快照随 Events.registeredPackages 更新；Client 请求通过完成回调通知，不再定时轮询。
+    /// 缓存保存在 Library/UniMcp/PackageCatalog.bin。仅在主线程访问。
+    /// </summary>
+    [InitializeOnLoad]
+    public static class PackageCatalogCache
+    {
+        private const int FormatVersion = 1;
+        private const string CachePath = "Library/UniMcp/PackageCatalog.bin";
+        private const string ManifestPath = "Packages/manifest.json";
+        private const string LockPath = "Packages/packages-lock.json";
+
+        /// <summary>
+        /// 搜索结果的有效期
+        /// </summary>
+        public static readonly TimeSpan SearchTtl = TimeSpan.FromMinutes(30);
+
+        /// <summary>
+        /// 包信息（与 UPM PackageInfo 对应的可持久化子集）
+        /// </summary>
+        public sealed class Entry
+        {
+            public string Name;
+            public string DisplayName;
+            public string Version;
+            public string Description;
+            public string Source;
+            public string PackageId;
+            public string ResolvedPath;
+            public bool IsDirect;
+        }
+
+        private sealed class Snapshot
+        {
+            public string Key;
+            public DateTime CapturedUtc;
+            public List<Entry> Packages;
+        }
+
+        private static Snapshot _installed;
+        private static readonly Dictionary<string, Snapshot> _searches = new Dictionary<string, Snapshot>(StringComparer.OrdinalIgnoreCase);
+        private static readonly Dictionary<string, List<Action<List<Entry>, string>>> _pendingSearches =
+            new Dictionary<string, List<Action<List<Entry>, string>>>(StringComparer.OrdinalIgnoreCase);
+        private static readonly List<Action<List<Entry>, string>> _pendingList = new List<Action<List<Entry>, string>>();
+        private static readonly List<KeyValuePair<Request, Action<Request>>> _watched = new List<KeyValuePair<Request, Action<Request>>>();
+        private static bool _loaded;
+        private static bool _dirty;
+        private static bool _listRunning;
+
+        static PackageCatalogCache()
+        {
+            Events.registeredPackages += OnRegisteredPackages;
+            EditorApplication.quitting += Save;
+            AssemblyReloadEvents.beforeAssemblyReload += Save;
+        }
+
+        // --- 已安装包 ---
+
+        /// <summary>
+        /// 返回已安装包快照。fresh 表示快照与当前 manifest/lock 一致；不一致时返回旧快照并在后台重新校验
+        /// </summary>
+        public static List<Entry> GetInstalled(bool includeIndirect, out bool fresh, out DateTime capturedUtc)
+        {
+            EnsureLoaded();
+            string key = ComputeManifestHash();
+            if (_installed == null)
+                CaptureRegistered(key);
+
+            fresh = _installed.Key == key;
+            if (!fresh)
+                RefreshInstalled(null);
+
+            capturedUtc = _installed.CapturedUtc;
+            return includeIndirect ? new List<Entry>(_installed.Packages) : _installed.Packages.Where(p => p.IsDirect).ToList();
+        }
+
+        /// <summary>
+        /// 用离线 Client.List 重新获取已安装包，完成后回调（同时进行的请求会合并）
+        /// </summary>
+        public static void RefreshInstalled(Action<List<Entry>, string> onComplete)
+        {
+            if (onComplete != null)
+                _pendingList.Add(onComplete);
+            if (_listRunning)
+                return;
+
+            _listRunning = true;
+            ListRequest request = Client.List(true, true);
+            Watch(request, completed =>
+            {
+                _listRunning = false;
+                string error = null;
+                if (completed.Status == StatusCode.Success)
+                    _installed = CreateSnapshot(ComputeManifestHash(), request.Result);
+                else
+                    error = completed.Error?.message ?? "Unknown error";
+
+                var callbacks = _pendingList.ToArray();
+                _pendingList.Clear();
+                foreach (var callback in callbacks)
+                    callback(_installed?.Packages, error);
+            });
+        }
+
+        /// <summary>
+        /// 当前 manifest.json 与 packages-lock.json 的内容哈希
+        /// </summary>
+        public static string ComputeManifestHash()
+        {
+            string manifest = File.Exists(ManifestPath) ? File.ReadAllText(ManifestPath) : string.Empty;
+            string lockFile = File.Exists(LockPath) ? File.ReadAllText(LockPath) : string.Empty;
+            return Hash128.Compute(manifest + "\n" + lockFile).ToString();
+        }
+
+        private static void OnRegisteredPackages(PackageRegistrationEventArgs args)
+        {
+            EnsureLoaded();
+            CaptureRegistered(ComputeManifestHash());
+        }
+
+        private static void CaptureRegistered(string key)
+        {
+            _installed = CreateSnapshot(key, UnityEditor.PackageManager.PackageInfo.GetAllRegisteredPackages());
+        }
+
+        private static Snapshot CreateSnapshot(string key, IEnumerable<UnityEditor.PackageManager.PackageInfo> packages)
+        {
+            _dirty = true;
+            return new Snapshot
+            {
+                Key = key,
+                CapturedUtc = DateTime.UtcNow,
+                Packages = packages.Select(pkg => new Entry
+                {
+                    Name = pkg.name,
+                    DisplayName = pkg.displayName,
+                    Version = pkg.version,
+                    Description = pkg.description,
+                    Source = pkg.source.ToString(),
+                    PackageId = pkg.packageId,
+                    ResolvedPath = pkg.resolvedPath,
+                    IsDirect = pkg.isDirectDependency
+                }).OrderBy(entry => entry.Name, StringComparer.Ordinal).ToList()
+            };
+        }
+
+        // --- Registry 搜索 ---
+
+        /// <summary>
+        /// 读取缓存的搜索结果。stale 表示已超过 TTL（调用方应立即返回并调用 Search 在后台刷新）
+        /// </summary>
+        public static bool TryGetSearch(string keywords, out List<Entry> results, out bool stale, out DateTime capturedUtc)
+        {
+            EnsureLoaded();
+            if (_searches.TryGetValue(keywords ?? string.Empty, out var snapshot))
+            {
+                results = snapshot.Packages;
+                capturedUtc = snapshot.CapturedUtc;
+                stale = DateTime.UtcNow - snapshot.CapturedUtc > SearchTtl;
+                return true;
+            }
+            results = null;
+            stale = true;
+            capturedUtc = default;
+            return false;
+        }
+
+        /// <summary>
+        /// 向 Registry 搜索（关键词为空时搜索全部），完成后写入缓存并回调；相同关键词的进行中请求会合并
+        /// </summary>
+        public static void Search(string keywords, Action<List<Entry>, string> onComplete)
+        {
+            keywords = keywords ?? string.Empty;
+            if (_pendingSearches.TryGetValue(keywords, out var waiting))
+            {
+                if (onComplete != null)
+                    waiting.Add(onComplete);
+                return;
+            }
+
+            waiting = new List<Action<List<Entry>, string>>();
+            if (onComplete != null)
+                waiting.Add(onComplete);
+            _pendingSearches[keywords] = waiting;
+
+            SearchRequest request = keywords.Length == 0 ? Client.SearchAll() : Client.Search(keywords);
+            Watch(request, completed =>
+            {
+                _pendingSearches.Remove(keywords);
+                List<Entry> results = null;
+                string error = null;
+                if (completed.Status == StatusCode.Success)
+                {
+                    var snapshot = CreateSnapshot(keywords, request.Result ?? new UnityEditor.PackageManager.PackageInfo[0]);
+                    _searches[keywords] = snapshot;
+                    results = snapshot.Packages;
+                }
+                else
+                {
+                    error = completed.Error?.message ?? "Unknown error";
+                }
+
+                foreach (var callback in waiting)
+                    callback(results, error);
+            });
+        }
+
+        // --- 请求完成回调 ---
+
+        /// <summary>
+        /// 请求完成时回调（在编辑器更新中检查 IsCompleted，没有进行中的请求时不占用更新）
+        /// </summary>
+        public static void Watch(Request request, Action<Request> onComplete)
+        {
+            if (request.IsCompleted)
+            {
+                onComplete(request);
+                return;
+            }
+            if (_watched.Count == 0)
+                EditorApplication.update += TickWatched;
+            _watched.Add(new KeyValuePair<Request, Action<Request>>(request, onComplete));
+        }
+
+        private static void TickWatched()
+        {
+            for (int i = _watched.Count - 1; i >= 0; i--)
+            {
+                var pair = _watched[i];
+                if (!pair.Key.IsCompleted)
+                    continue;
+                _watched.RemoveAt(i);
+                try
+                {
+                    pair.Value(pair.Key);
+                }
+                catch (Exception ex)
+                {
+                    McpLogger.LogWarning($"[PackageCatalogCache] Request callback failed: {ex.Message}");
+                }
+            }
+            if (_watched.Count == 0)
+                EditorApplication.update -= TickWatched;
+        }
+
+        // --- 持久化 ---
+
+        private static void EnsureLoaded()
+        {
+            if (_loaded)
+                return;
+            _loaded = true;
+            if (!File.Exists(CachePath))
+                return;
+
+            try
+            {
+                using (var reader = new BinaryReader(File.OpenRead(CachePath)))
+                {
+                    if (reader.ReadInt32() != FormatVersion)
+                        return;
+                    if (reader.ReadBoolean())
+                        _installed = ReadSnapshot(reader);
+                    int count = reader.ReadInt32();
+                    for (int i = 0; i < count; i++)
+                    {
+                        var snapshot = ReadSnapshot(reader);
+                        _searches[snapshot.Key] = snapshot;
+                    }
+                }
+            }
+            catch (Exception ex)
+            {
+                McpLogger.LogWarning($"[PackageCatalogCache] Failed to load cache: {ex.Message}");
+                _installed = null;
+                _searches.Clear();
+            }
+        }
+
+        private static void Save()
+        {
+            if (!_loaded || !_dirty)
+                return;
+
+            try
+            {
+                Directory.CreateDirectory(Path.GetDirectoryName(CachePath));
+                string tempPath = CachePath + ".tmp";
+                using (var writer = new BinaryWriter(File.Create(tempPath)))
+                {
+                    writer.Write(FormatVersion);
+                    writer.Write(_installed != null);
+                    if (_installed != null)
+                        WriteSnapshot(writer, _installed);
+                    writer.Write(_searches.Count);
+                    foreach (var snapshot in _searches.Values)
+                        WriteSnapshot(writer, snapshot);
+                }
+                if (File.Exists(CachePath))
+                    File.Delete(CachePath);
+                File.Move(tempPath, CachePath);
+                _dirty = false;
+            }
+            catch (Exception ex)
+            {
+                McpLogger.LogWarning($"[PackageCatalogCache] Failed to save cache: {ex.Message}");
+            }
+        }
+
+        private static Snapshot ReadSnapshot(BinaryReader reader)
+        {
+            var snapshot = new Snapshot
+            {
+                Key = reader.ReadString(),
+                CapturedUtc = new DateTime(reader.ReadInt64(), DateTimeKind.Utc),
+                Packages = new List<Entry>()
+            };
+            int count = reader.ReadInt32();
+            for (int i = 0; i < count; i++)
+            {
+                snapshot.Packages.Add(new Entry
+                {
+                    Name = reader.ReadString(),
+                    DisplayName = reader.ReadString(),
+                    Version = reader.ReadString(),
+                    Description = reader.ReadString(),
+                    Source = reader.ReadString(),
+                    PackageId = reader.ReadString(),
+                    ResolvedPath = reader.ReadString(),
+                    IsDirect = reader.ReadBoolean()
+                });
+            }
+            return snapshot;
+        }
+
+        private static void WriteSnapshot(BinaryWriter writer, Snapshot snapshot)
+        {
+            writer.Write(snapshot.Key);
+            writer.Write(snapshot.CapturedUtc.Ticks);
+            writer.Write(snapshot.Packages.Count);
+            foreach (var entry in snapshot.Packages)
+            {
+                writer.Write(entry.Name ?? string.Empty);
+                writer.Write(entry.DisplayName ?? string.Empty);
+                writer.Write(entry.Version ?? string.Empty);
+                writer.Write(entry.Description ?? string.Empty);
+                writer.Write(entry.Source ?? string.Empty);
+                writer.Write(entry.PackageId ?? string.Empty);
+                writer.Write(entry.ResolvedPath ?? string.Empty);
+                writer.Write(entry.IsDirect);
+            }
+        }
+    }
+}
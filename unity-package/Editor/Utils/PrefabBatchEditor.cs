@@ -0,0 +1,529 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using UnityEditor;
+using UnityEngine;
+using UniMcp.Models;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 批量预制体编辑。每个预制体只通过 PrefabUtility.LoadPrefabContents 打开一次，依次执行操作列表后保存并卸载；
+    /// 所有保存（以及实例的 Apply）都在同一个 StartAssetEditing/StopAssetEditing 范围内，
+    /// 导入和嵌套预制体的传播在范围结束时统一进行一次。返回每个预制体的耗时和操作结果；
+    /// 部分操作失败时仍保存成功的修改，状态为 partial 并附带失败原因。
+    /// 嵌套预制体：资源编辑范围内保存的预制体要到范围结束才导入，外层预制体打开时看不到内层本批次的修改，
+    /// 因此嵌套了本批次其他预制体的外层预制体放到后面的导入轮次处理（通常只需一轮）。
+    /// 操作格式：{"op": "set_property", "target": "Body/Mesh", "component": "MeshRenderer", "property": "enabled", "value": false}，
+    /// target 为相对预制体根节点的子路径（省略或为空表示根节点）。
+    /// </summary>
+    public static class PrefabBatchEditor
+    {
+        /// <summary>
+        /// 支持的操作
+        /// </summary>
+        public static readonly string[] Operations =
+        {
+            "set_property", "add_component", "remove_component", "set_active", "rename", "set_transform", "add_child", "destroy"
+        };
+
+        /// <summary>
+        /// 单个预制体的编辑：路径和操作列表
+        /// </summary>
+        public struct Edit
+        {
+            public string Path;
+            public JsonArray Operations;
+        }
+
+        /// <summary>
+        /// 打开、修改并保存一组预制体
+        /// </summary>
+        public static object Run(IList<Edit> edits, string operation)
+        {
+            var results = new JsonArray();
+            int saved = 0, partial = 0, unchanged = 0, failed = 0, processed = 0;
+            var total = Stopwatch.StartNew();
+            double importMs = 0;
+
+            List<List<Edit>> passes = GroupByNesting(edits);
+            foreach (List<Edit> pass in passes)
+            {
+                AssetDatabase.StartAssetEditing();
+                try
+                {
+                    foreach (Edit edit in pass)
+                    {
+                        if (processed++ % 20 == 0)
+                            McpProgress.Report(processed - 1, edits.Count, $"{operation}: {edit.Path}");
+
+                        var status = EditPrefab(edit);
+                        results.Add(status);
+                        switch (status["status"].Value)
+                        {
+                            case "saved": saved++; break;
+                            case "partial": partial++; break;
+                            case "unchanged": unchanged++; break;
+                            default: failed++; break;
+                        }
+                    }
+                }
+                finally
+                {
+                    var import = Stopwatch.StartNew();
+                    AssetDatabase.StopAssetEditing();
+                    importMs += import.Elapsed.TotalMilliseconds;
+                }
+            }
+
+            McpLogger.Log($"[PrefabBatchEditor] {operation}: {edits.Count} prefab(s), {saved} saved, {partial} partial, {unchanged} unchanged, {failed} failed in {total.ElapsedMilliseconds}ms (import {importMs:F0}ms, {passes.Count} pass(es))");
+
+            var data = new JsonClass
+            {
+                ["operation"] = operation,
+                ["prefabs"] = edits.Count,
+                ["saved"] = saved,
+                ["partial"] = partial,
+                ["unchanged"] = unchanged,
+                ["failed"] = failed,
+                ["total_ms"] = total.ElapsedMilliseconds,
+                ["import_ms"] = Math.Round(importMs, 1),
+                ["import_passes"] = passes.Count,
+                ["results"] = results
+            };
+            return Response.Success($"{operation}: saved {saved + partial} of {edits.Count} prefab(s) in {passes.Count} asset-editing batch(es) ({partial} with failed operations, {unchanged} unchanged, {failed} failed).", data);
+        }
+
+        /// <summary>
+        /// 在同一个资源编辑范围内把多个预制体实例的修改应用到各自的预制体资源
+        /// </summary>
+        public static object ApplyInstances(IList<GameObject> instances, string operation)
+        {
+            var total = Stopwatch.StartNew();
+            JsonArray results;
+            int applied, failed;
+            double importMs;
+
+            AssetDatabase.StartAssetEditing();
+            try
+            {
+                ProcessInstances(instances, root => PrefabUtility.ApplyPrefabInstance(root, InteractionMode.AutomatedAction), "applied", out results, out applied, out failed);
+            }
+            finally
+            {
+                var import = Stopwatch.StartNew();
+                AssetDatabase.StopAssetEditing();
+                importMs = import.Elapsed.TotalMilliseconds;
+            }
+
+            McpLogger.Log($"[PrefabBatchEditor] {operation}: applied {applied} of {instances.Count} instance(s) in {total.ElapsedMilliseconds}ms (import {importMs:F0}ms)");
+
+            var data = new JsonClass
+            {
+                ["operation"] = operation,
+                ["instances"] = instances.Count,
+                ["applied"] = applied,
+                ["failed"] = failed,
+                ["total_ms"] = total.ElapsedMilliseconds,
+                ["import_ms"] = Math.Round(importMs, 1),
+                ["results"] = results
+            };
+            return Response.Success($"{operation}: applied {applied} of {instances.Count} prefab instance(s) in one asset-editing batch.", data);
+        }
+
+        /// <summary>
+        /// 还原多个预制体实例的覆盖（只修改场景，不涉及资源导入）
+        /// </summary>
+        public static object RevertInstances(IList<GameObject> instances, string operation)
+        {
+            var total = Stopwatch.StartNew();
+            ProcessInstances(instances, root => PrefabUtility.RevertPrefabInstance(root, InteractionMode.AutomatedAction), "reverted", out JsonArray results, out int reverted, out int failed);
+
+            McpLogger.Log($"[PrefabBatchEditor] {operation}: reverted {reverted} of {instances.Count} instance(s) in {total.ElapsedMilliseconds}ms");
+
+            var data = new JsonClass
+            {
+                ["operation"] = operation,
+                ["instances"] = instances.Count,
+                ["reverted"] = reverted,
+                ["failed"] = failed,
+                ["total_ms"] = total.ElapsedMilliseconds,
+                ["results"] = results
+            };
+            return Response.Success($"{operation}: reverted {reverted} of {instances.Count} prefab instance(s).", data);
+        }
+
+        /// <summary>
+        /// 对每个实例所属的最外层预制体实例根执行一次操作，同一个根只处理一次
+        /// </summary>
+        private static void ProcessInstances(IList<GameObject> instances, Action<GameObject> action, string doneStatus, out JsonArray results, out int done, out int failed)
+        {
+            results = new JsonArray();
+            done = 0;
+            failed = 0;
+            var processedRoots = new HashSet<GameObject>();
+
+            foreach (GameObject instance in instances)
+            {
+                var status = new JsonClass { ["target"] = instance != null ? instance.name : "<null>" };
+                results.Add(status);
+                var stopwatch = Stopwatch.StartNew();
+                try
+                {
+                    GameObject root = instance != null ? PrefabUtility.GetOutermostPrefabInstanceRoot(instance) : null;
+                    if (root == null)
+                        throw new InvalidOperationException("GameObject is not a prefab instance.");
+
+                    status["prefab"] = PrefabUtility.GetPrefabAssetPathOfNearestInstanceRoot(root);
+                    if (!processedRoots.Add(root))
+                    {
+                        status["status"] = "duplicate";
+                        continue;
+                    }
+                    action(root);
+                    status["status"] = doneStatus;
+                    done++;
+                }
+                catch (Exception ex)
+                {
+                    status["status"] = "failed";
+                    status["error"] = ex.Message;
+                    failed++;
+                }
+                status["ms"] = Math.Round(stopwatch.Elapsed.TotalMilliseconds, 1);
+            }
+        }
+
+        /// <summary>
+        /// 解析批量编辑参数：edits 数组（[{path, operations}]），或 glob/asset_query 选出的预制体共用 operations；
+        /// 同一路径出现多次时按出现顺序合并为一个编辑，预制体只打开和保存一次
+        /// </summary>
+        public static bool TryParseEdits(JsonClass args, out List<Edit> edits, out string error)
+        {
+            edits = new List<Edit>();
+            error = null;
+            var indexByPath = new Dictionary<string, int>(StringComparer.OrdinalIgnoreCase);
+            JsonArray shared = args["operations"] as JsonArray;
+
+            if (args["edits"] is JsonArray editArray)
+            {
+                foreach (JsonNode item in editArray.Childs)
+                {
+                    string path = item["path"]?.Value;
+                    JsonArray operations = item["operations"] as JsonArray ?? shared;
+                    if (string.IsNullOrEmpty(path) || operations == null)
+                    {
+                        error = "Each entry in 'edits' needs 'path' and 'operations'.";
+                        return false;
+                    }
+                    AddEdit(edits, indexByPath, path, operations);
+                }
+            }
+            else if (ImportSettingsBatch.IsBulk(args))
+            {
+                if (shared == null)
+                {
+                    error = "'operations' is required with 'glob' or 'asset_query'.";
+                    return false;
+                }
+                foreach (string path in ImportSettingsBatch.ResolvePaths(args["glob"]?.Value, args["asset_query"]?.Value, "t:Prefab"))
+                    AddEdit(edits, indexByPath, path, shared);
+            }
+            else if (!string.IsNullOrEmpty(args["path"]?.Value) && shared != null)
+            {
+                edits.Add(new Edit { Path = args["path"].Value, Operations = shared });
+            }
+
+            if (edits.Count == 0)
+            {
+                error = "No prefabs to edit: provide 'edits', 'glob'/'asset_query' with 'operations', or 'path' with 'operations'.";
+                return false;
+            }
+            return true;
+        }
+
+        private static void AddEdit(List<Edit> edits, Dictionary<string, int> indexByPath, string path, JsonArray operations)
+        {
+            path = path.Replace('\\', '/');
+            if (!indexByPath.TryGetValue(path, out int index))
+            {
+                indexByPath[path] = edits.Count;
+                edits.Add(new Edit { Path = path, Operations = operations });
+                return;
+            }
+
+            // 合并到新数组，不修改调用方传入（可能被多个编辑共用）的操作列表
+            var merged = new JsonArray();
+            foreach (JsonNode op in edits[index].Operations.Childs)
+                merged.Add(op);
+            foreach (JsonNode op in operations.Childs)
+                merged.Add(op);
+            edits[index] = new Edit { Path = edits[index].Path, Operations = merged };
+        }
+
+        /// <summary>
+        /// 按嵌套关系分轮：嵌套了本批次其他预制体的预制体排在被嵌套者之后的轮次，每轮结束时导入一次
+        /// </summary>
+        private static List<List<Edit>> GroupByNesting(IList<Edit> edits)
+        {
+            var indexByPath = new Dictionary<string, int>(StringComparer.OrdinalIgnoreCase);
+            for (int i = 0; i < edits.Count; i++)
+                indexByPath[edits[i].Path] = i;
+
+            var levels = new int[edits.Count];
+            int maxLevel = 0;
+            if (edits.Count > 1)
+            {
+                var batchDependencies = new List<int>[edits.Count];
+                for (int i = 0; i < edits.Count; i++)
+                {
+                    batchDependencies[i] = new List<int>();
+                    foreach (string dependency in AssetDatabase.GetDependencies(edits[i].Path, true))
+                    {
+                        if (indexByPath.TryGetValue(dependency, out int index) && index != i)
+                            batchDependencies[i].Add(index);
+                    }
+                }
+
+                // 预制体嵌套不会成环，按依赖深度计算轮次；visiting 只用于防御异常数据
+                var resolved = new bool[edits.Count];
+                var visiting = new bool[edits.Count];
+                for (int i = 0; i < edits.Count; i++)
+                    maxLevel = Math.Max(maxLevel, ResolveLevel(i, batchDependencies, levels, resolved, visiting));
+            }
+
+            var passes = new List<List<Edit>>();
+            for (int level = 0; level <= maxLevel; level++)
+                passes.Add(new List<Edit>());
+            for (int i = 0; i < edits.Count; i++)
+                passes[levels[i]].Add(edits[i]);
+            return passes;
+        }
+
+        private static int ResolveLevel(int index, List<int>[] dependencies, int[] levels, bool[] resolved, bool[] visiting)
+        {
+            if (resolved[index] || visiting[index])
+                return levels[index];
+            visiting[index] = true;
+            int level = 0;
+            foreach (int dependency in dependencies[index])
+                level = Math.Max(level, ResolveLevel(dependency, dependencies, levels, resolved, visiting) + 1);
+            visiting[index] = false;
+            resolved[index] = true;
+            levels[index] = level;
+            return level;
+        }
+
+        // --- 单个预制体 ---
+
+        private static JsonClass EditPrefab(Edit edit)
+        {
+            var status = new JsonClass { ["path"] = edit.Path };
+            var stopwatch = Stopwatch.StartNew();
+            GameObject root = null;
+            try
+            {
+                root = PrefabUtility.LoadPrefabContents(edit.Path);
+                int applied = 0;
+                var errors = new JsonArray();
+                foreach (JsonNode op in edit.Operations.Childs)
+                {
+                    if (ApplyOperation(root, op as JsonClass, out string error))
+                        applied++;
+                    else
+                        errors.Add($"{op["op"]?.Value}: {error}");
+                }
+
+                status["applied"] = applied;
+                if (applied == 0)
+                {
+                    status["status"] = errors.Count > 0 ? "failed" : "unchanged";
+                }
+                else
+                {
+                    // 只有部分操作成功时仍保存成功的部分，但不报告为 saved
+                    PrefabUtility.SaveAsPrefabAsset(root, edit.Path, out bool success);
+                    if (!success)
+                    {
+                        errors.Add("SaveAsPrefabAsset failed.");
+                        status["status"] = "failed";
+                    }
+                    else
+                    {
+                        status["status"] = errors.Count > 0 ? "partial" : "saved";
+                    }
+                }
+                if (errors.Count > 0)
+                    status["errors"] = errors;
+            }
+            catch (Exception ex)
+            {
+                status["status"] = "failed";
+                status["error"] = ex.Message;
+            }
+            finally
+            {
+                if (root != null)
+                    PrefabUtility.UnloadPrefabContents(root);
+            }
+            status["ms"] = Math.Round(stopwatch.Elapsed.TotalMilliseconds, 1);
+            return status;
+        }
+
+        private static bool ApplyOperation(GameObject root, JsonClass op, out string error)
+        {
+            error = null;
+            if (op == null)
+            {
+                error = "Operation must be an object.";
+                return false;
+            }
+
+            string targetPath = op["target"]?.Value;
+            Transform target = string.IsNullOrEmpty(targetPath) || targetPath == root.name ? root.transform : root.transform.Find(targetPath);
+            if (target == null)
+            {
+                error = $"Child '{targetPath}' not found under '{root.name}'.";
+                return false;
+            }
+            GameObject go = target.gameObject;
+
+            switch (op["op"]?.Value)
+            {
+                case "set_property":
+                    return SetProperty(go, op, out error);
+
+                case "add_component":
+                {
+                    if (!TypeIndex.TryResolve(op["component"]?.Value, typeof(Component), out Type type, out error))
+                        return false;
+                    Component component = go.AddComponent(type);
+                    if (component == null)
+                    {
+                        error = $"Failed to add component '{type.Name}'.";
+                        return false;
+                    }
+                    if (op["properties"] is JsonClass properties)
+                    {
+                        foreach (var property in properties.Properties())
+                        {
+                            if (!SetMember(component, property.Key, property.Value, out error))
+                            {
+                                // 属性设置失败时移除刚添加的组件，不保存只初始化了一半的组件
+                                UnityEngine.Object.DestroyImmediate(component, true);
+                                return false;
+                            }
+                        }
+                    }
+                    return true;
+                }
+
+                case "remove_component":
+                {
+                    if (!TypeIndex.TryResolve(op["component"]?.Value, typeof(Component), out Type type, out error))
+                        return false;
+                    Component component = go.GetComponent(type);
+                    if (component == null)
+                    {
+                        error = $"Component '{type.Name}' not found on '{go.name}'.";
+                        return false;
+                    }
+                    UnityEngine.Object.DestroyImmediate(component, true);
+                    return true;
+                }
+
+                case "set_active":
+                    go.SetActive(op["value"].AsBoolDefault(true));
+                    return true;
+
+                case "rename":
+                {
+                    string name = op["value"]?.Value;
+                    if (string.IsNullOrEmpty(name))
+                    {
+                        error = "'value' is required for rename.";
+                        return false;
+                    }
+                    go.name = name;
+                    return true;
+                }
+
+                case "set_transform":
+                {
+                    bool changed = false;
+                    float[] position = op["position"].IsNull() ? null : JsonValueConverter.ReadFloats(op["position"], 3);
+                    float[] rotation = op["rotation"].IsNull() ? null : JsonValueConverter.ReadFloats(op["rotation"], 3);
+                    float[] scale = op["scale"].IsNull() ? null : JsonValueConverter.ReadFloats(op["scale"], 3);
+                    if (position != null) { target.localPosition = new Vector3(position[0], position[1], position[2]); changed = true; }
+                    if (rotation != null) { target.localEulerAngles = new Vector3(rotation[0], rotation[1], rotation[2]); changed = true; }
+                    if (scale != null) { target.localScale = new Vector3(scale[0], scale[1], scale[2]); changed = true; }
+                    if (!changed)
+                        error = "'position', 'rotation' or 'scale' is required for set_transform.";
+                    return changed;
+                }
+
+                case "add_child":
+                {
+                    string name = op["name"]?.Value;
+                    if (string.IsNullOrEmpty(name))
+                    {
+                        error = "'name' is required for add_child.";
+                        return false;
+                    }
+                    var child = new GameObject(name);
+                    child.transform.SetParent(target, false);
+                    return true;
+                }
+
+                case "destroy":
+                    if (target == root.transform)
+                    {
+                        error = "Cannot destroy the prefab root.";
+                        return false;
+                    }
+                    UnityEngine.Object.DestroyImmediate(go, true);
+                    return true;
+
+                default:
+                    error = $"Unknown operation '{op["op"]?.Value}'. Supported: {string.Join(", ", Operations)}";
+                    return false;
+            }
+        }
+
+        private static bool SetProperty(GameObject go, JsonClass op, out string error)
+        {
+            string property = op["property"]?.Value;
+            if (string.IsNullOrEmpty(property))
+            {
+                error = "'property' is required for set_property.";
+                return false;
+            }
+
+            string componentName = op["component"]?.Value;
+            UnityEngine.Object target = go;
+            if (!string.IsNullOrEmpty(componentName))
+            {
+                if (!TypeIndex.TryResolve(componentName, typeof(Component), out Type type, out error))
+                    return false;
+                target = go.GetComponent(type);
+                if (target == null)
+                {
+                    error = $"Component '{type.Name}' not found on '{go.name}'.";
+                    return false;
+                }
+            }
+            return SetMember(target, property, op["value"], out error);
+        }
+
+        /// <summary>
+        /// 通过缓存的成员访问器写入属性，无法访问时退回 SerializedProperty
+        /// </summary>
+        private static bool SetMember(UnityEngine.Object target, string path, JsonNode value, out string error)
+        {
+            MemberPath member = MemberAccessorCache.Get(target.GetType(), path);
+            if (member.IsValid)
+                return member.TrySetValue(target, value, out error);
+            return MemberAccessorCache.TrySetSerialized(target, path, value, out error);
+        }
+    }
+}
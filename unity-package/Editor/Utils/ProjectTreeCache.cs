@@ -0,0 +1,317 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using UnityEditor;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// Assets 文件夹树的内存快照。首次访问时从 AssetDatabase.GetAllAssetPaths 构建，
+    /// 之后由 AssetPostprocessor 的导入、删除、移动事件增量更新；
+    /// 每个文件夹记录直接文件数/大小，以及向上累加的子树文件数、大小和文件夹数（沿父链增量更新，O(深度)）。
+    /// 子文件夹和文件按名称排序保存，可按位置分页读取。脚本重载后在首次访问时重新构建。仅在主线程访问。
+    /// </summary>
+    public static class ProjectTreeCache
+    {
+        public const string RootPath = "Assets";
+
+        /// <summary>
+        /// 文件夹节点（只读视图）
+        /// </summary>
+        public sealed class Folder
+        {
+            internal readonly SortedList<string, Folder> _folders = new SortedList<string, Folder>(StringComparer.OrdinalIgnoreCase);
+            internal readonly SortedList<string, long> _files = new SortedList<string, long>(StringComparer.OrdinalIgnoreCase);
+
+            public string Name { get; internal set; }
+            public string Path { get; internal set; }
+            public Folder Parent { get; internal set; }
+
+            /// <summary>直接包含的文件总大小（字节）</summary>
+            public long Size { get; internal set; }
+            /// <summary>子树（含自身）的文件数</summary>
+            public int TotalFiles { get; internal set; }
+            /// <summary>子树（含自身）的文件总大小（字节）</summary>
+            public long TotalSize { get; internal set; }
+            /// <summary>子树中的文件夹数（不含自身）</summary>
+            public int TotalFolders { get; internal set; }
+
+            /// <summary>按名称排序的子文件夹</summary>
+            public IList<Folder> SubFolders => _folders.Values;
+            /// <summary>按名称排序的直接文件名</summary>
+            public IList<string> FileNames => _files.Keys;
+            /// <summary>与 FileNames 对应的文件大小</summary>
+            public IList<long> FileSizes => _files.Values;
+        }
+
+        private static readonly Dictionary<string, Folder> _folders = new Dictionary<string, Folder>(StringComparer.Ordinal);
+        private static Folder _root;
+        private static DateTime _builtUtc;
+        private static DateTime _updatedUtc;
+
+        /// <summary>
+        /// 快照构建时间（UTC），未构建时为 default
+        /// </summary>
+        public static DateTime BuiltUtc => _builtUtc;
+
+        /// <summary>
+        /// 最近一次增量更新时间（UTC）
+        /// </summary>
+        public static DateTime UpdatedUtc => _updatedUtc;
+
+        /// <summary>
+        /// 获取文件夹节点，不存在时返回 null
+        /// </summary>
+        public static Folder GetFolder(string path)
+        {
+            EnsureBuilt();
+            if (string.IsNullOrEmpty(path))
+                return _root;
+            _folders.TryGetValue(path.Replace('\\', '/').TrimEnd('/'), out var folder);
+            return folder;
+        }
+
+        /// <summary>
+        /// 丢弃快照，下次访问时重新构建
+        /// </summary>
+        public static void Invalidate()
+        {
+            _root = null;
+            _folders.Clear();
+        }
+
+        private static void EnsureBuilt()
+        {
+            if (_root != null)
+                return;
+
+            _root = new Folder { Name = RootPath, Path = RootPath };
+            _folders[RootPath] = _root;
+            // 预先排序，使插入有序列表时基本为追加
+            string[] paths = AssetDatabase.GetAllAssetPaths();
+            Array.Sort(paths, StringComparer.OrdinalIgnoreCase);
+            foreach (string path in paths)
+            {
+                if (!IsTracked(path))
+                    continue;
+                if (AssetDatabase.IsValidFolder(path))
+                    EnsureFolder(path);
+                else
+                    SetFile(path);
+            }
+            _builtUtc = DateTime.UtcNow;
+            _updatedUtc = _builtUtc;
+        }
+
+        private static bool IsTracked(string path)
+        {
+            return path != null && path.StartsWith(RootPath + "/", StringComparison.Ordinal);
+        }
+
+        // --- 增量更新 ---
+
+        internal static void OnAssetsChanged(string[] importedAssets, string[] deletedAssets, string[] movedAssets, string[] movedFromAssetPaths)
+        {
+            if (_root == null)
+                return;
+
+            foreach (string path in deletedAssets)
+            {
+                if (!IsTracked(path))
+                    continue;
+                if (_folders.TryGetValue(path, out var folder))
+                    RemoveFolder(folder);
+                else
+                    RemoveFile(path);
+            }
+
+            // 先移动较浅的文件夹（整棵子树一起移动），其内容的移动事件随后只需确认
+            var moves = new List<int>();
+            for (int i = 0; i < movedAssets.Length; i++)
+                moves.Add(i);
+            moves.Sort((a, b) => movedFromAssetPaths[a].Length.CompareTo(movedFromAssetPaths[b].Length));
+            foreach (int i in moves)
+            {
+                string from = movedFromAssetPaths[i];
+                string to = movedAssets[i];
+                if (_folders.TryGetValue(from, out var folder))
+                {
+                    RemoveFolder(folder);
+                    if (IsTracked(to))
+                        AttachFolder(folder, to);
+                }
+                else
+                {
+                    if (IsTracked(from))
+                        RemoveFile(from);
+                    if (IsTracked(to))
+                    {
+                        if (AssetDatabase.IsValidFolder(to))
+                            EnsureFolder(to);
+                        else
+                            SetFile(to);
+                    }
+                }
+            }
+
+            foreach (string path in importedAssets)
+            {
+                if (!IsTracked(path))
+                    continue;
+                if (AssetDatabase.IsValidFolder(path))
+                    EnsureFolder(path);
+                else
+                    SetFile(path);
+            }
+            _updatedUtc = DateTime.UtcNow;
+        }
+
+        private static Folder EnsureFolder(string path)
+        {
+            if (_folders.TryGetValue(path, out var folder))
+                return folder;
+
+            int slash = path.LastIndexOf('/');
+            Folder parent = EnsureFolder(path.Substring(0, slash));
+            folder = new Folder { Name = path.Substring(slash + 1), Path = path, Parent = parent };
+            parent._folders[folder.Name] = folder;
+            _folders[path] = folder;
+            ApplyDelta(parent, 0, 0, 1);
+            return folder;
+        }
+
+        /// <summary>
+        /// 添加或更新文件大小
+        /// </summary>
+        private static void SetFile(string path)
+        {
+            int slash = path.LastIndexOf('/');
+            Folder parent = EnsureFolder(path.Substring(0, slash));
+            string name = path.Substring(slash + 1);
+
+            long size = 0;
+            try
+            {
+                var info = new FileInfo(path);
+                if (info.Exists)
+                    size = info.Length;
+            }
+            catch
+            {
+                // 忽略文件信息获取错误
+            }
+
+            if (parent._files.TryGetValue(name, out long previous))
+            {
+                if (previous == size)
+                    return;
+                parent._files[name] = size;
+                parent.Size += size - previous;
+                ApplyDelta(parent, 0, size - previous, 0);
+            }
+            else
+            {
+                parent._files.Add(name, size);
+                parent.Size += size;
+                ApplyDelta(parent, 1, size, 0);
+            }
+        }
+
+        private static void RemoveFile(string path)
+        {
+            int slash = path.LastIndexOf('/');
+            if (!_folders.TryGetValue(path.Substring(0, slash), out var parent))
+                return;
+            string name = path.Substring(slash + 1);
+            if (!parent._files.TryGetValue(name, out long size))
+                return;
+
+            parent._files.Remove(name);
+            parent.Size -= size;
+            ApplyDelta(parent, -1, -size, 0);
+        }
+
+        /// <summary>
+        /// 将子树从父文件夹和路径表中摘除（节点本身保留，可重新挂接）
+        /// </summary>
+        private static void RemoveFolder(Folder folder)
+        {
+            if (folder.Parent == null)
+                return;
+
+            folder.Parent._folders.Remove(folder.Name);
+            ApplyDelta(folder.Parent, -folder.TotalFiles, -folder.TotalSize, -(folder.TotalFolders + 1));
+            folder.Parent = null;
+            ForEachFolder(folder, f => _folders.Remove(f.Path));
+        }
+
+        /// <summary>
+        /// 将摘除的子树挂接到新路径，目标已存在时合并为新路径下的重新构建
+        /// </summary>
+        private static void AttachFolder(Folder folder, string path)
+        {
+            if (_folders.ContainsKey(path))
+            {
+                // 目标已被子项事件创建：按新路径重新登记子树中的文件
+                ForEachFolder(folder, f =>
+                {
+                    string newPath = path + f.Path.Substring(folder.Path.Length);
+                    foreach (string name in f._files.Keys)
+                        SetFile(newPath + "/" + name);
+                    EnsureFolder(newPath);
+                });
+                return;
+            }
+
+            int slash = path.LastIndexOf('/');
+            Folder parent = EnsureFolder(path.Substring(0, slash));
+            string oldPath = folder.Path;
+            ForEachFolder(folder, f =>
+            {
+                f.Path = path + f.Path.Substring(oldPath.Length);
+                _folders[f.Path] = f;
+            });
+            folder.Name = path.Substring(slash + 1);
+            folder.Parent = parent;
+            parent._folders[folder.Name] = folder;
+            ApplyDelta(parent, folder.TotalFiles, folder.TotalSize, folder.TotalFolders + 1);
+        }
+
+        private static void ForEachFolder(Folder folder, Action<Folder> action)
+        {
+            var stack = new Stack<Folder>();
+            stack.Push(folder);
+            while (stack.Count > 0)
+            {
+                Folder current = stack.Pop();
+                action(current);
+                foreach (Folder child in current._folders.Values)
+                    stack.Push(child);
+            }
+        }
+
+        /// <summary>
+        /// 从 folder 起沿父链累加子树统计
+        /// </summary>
+        private static void ApplyDelta(Folder folder, int files, long size, int folders)
+        {
+            for (Folder current = folder; current != null; current = current.Parent)
+            {
+                current.TotalFiles += files;
+                current.TotalSize += size;
+                current.TotalFolders += folders;
+            }
+        }
+    }
+
+    /// <summary>
+    /// 资源导入、删除、移动后增量更新文件夹树快照
+    /// </summary>
+    internal class ProjectTreeCachePostprocessor : AssetPostprocessor
+    {
+        private static void OnPostprocessAllAssets(string[] importedAssets, string[] deletedAssets, string[] movedAssets, string[] movedFromAssetPaths)
+        {
+            ProjectTreeCache.OnAssetsChanged(importedAssets, deletedAssets, movedAssets, movedFromAssetPaths);
+        }
+    }
+}
@@ -0,0 +1,166 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using UnityEditor;
+using UnityEditor.U2D;
+using UnityEngine;
+using UnityEngine.U2D;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 图集打包状态（脏标记）。对每个图集计算内容哈希：打包/纹理设置、当前平台设置、
+    /// 可打包对象列表，以及所有成员纹理（含文件夹内的纹理）的依赖哈希；
+    /// 打包成功后按 图集GUID + 构建目标 记录哈希，哈希不变的图集无需重新打包。
+    /// 状态保存在 Library/UniMcp/SpriteAtlasPackState.bin。仅在主线程访问。
+    /// </summary>
+    public static class SpriteAtlasPackState
+    {
+        private const int FormatVersion = 1;
+        private const string CachePath = "Library/UniMcp/SpriteAtlasPackState.bin";
+
+        private static readonly Dictionary<string, string> _packedHashes = new Dictionary<string, string>(StringComparer.Ordinal);
+        private static bool _loaded;
+
+        /// <summary>
+        /// 计算图集的内容哈希
+        /// </summary>
+        /// <param name="memberCount">参与哈希的成员纹理数</param>
+        public static string ComputeHash(SpriteAtlas atlas, BuildTarget target, out int memberCount)
+        {
+            var builder = new StringBuilder();
+            builder.Append(target).Append('\n');
+
+            var packing = atlas.GetPackingSettings();
+            builder.Append(packing.enableRotation).Append(',').Append(packing.enableTightPacking).Append(',')
+                .Append(packing.padding).Append(',').Append(packing.blockOffset).Append('\n');
+
+            var texture = atlas.GetTextureSettings();
+            builder.Append(texture.filterMode).Append(',').Append(texture.anisoLevel).Append(',').Append(texture.generateMipMaps).Append(',')
+                .Append(texture.readable).Append(',').Append(texture.sRGB).Append('\n');
+
+            AppendPlatformSettings(builder, atlas.GetPlatformSettings("DefaultTexturePlatform"));
+            AppendPlatformSettings(builder, atlas.GetPlatformSettings(BuildPipeline.GetBuildTargetGroup(target).ToString()));
+            builder.Append(atlas.isVariant).Append(',').Append(SpriteAtlasExtensions.IsIncludeInBuild(atlas)).Append('\n');
+
+            var members = new SortedSet<string>(StringComparer.Ordinal);
+            UnityEngine.Object[] packables = atlas.GetPackables();
+            if (packables != null)
+            {
+                foreach (var packable in packables)
+                {
+                    string path = packable != null ? AssetDatabase.GetAssetPath(packable) : null;
+                    if (string.IsNullOrEmpty(path))
+                        continue;
+                    builder.Append("packable:").Append(path).Append('\n');
+                    if (AssetDatabase.IsValidFolder(path))
+                    {
+                        foreach (string guid in AssetDatabase.FindAssets("t:Texture2D", new[] { path }))
+                            members.Add(AssetDatabase.GUIDToAssetPath(guid));
+                    }
+                    else
+                    {
+                        members.Add(path);
+                    }
+                }
+            }
+
+            foreach (string member in members)
+                builder.Append(member).Append(':').Append(AssetDatabase.GetAssetDependencyHash(member)).Append('\n');
+
+            memberCount = members.Count;
+            return Hash128.Compute(builder.ToString()).ToString();
+        }
+
+        /// <summary>
+        /// 图集在指定构建目标下是否需要重新打包
+        /// </summary>
+        public static bool IsDirty(string atlasPath, string hash, BuildTarget target)
+        {
+            EnsureLoaded();
+            return !_packedHashes.TryGetValue(Key(atlasPath, target), out string packed) || packed != hash;
+        }
+
+        /// <summary>
+        /// 记录打包成功后的哈希，调用 Save 后写入磁盘
+        /// </summary>
+        public static void MarkPacked(string atlasPath, string hash, BuildTarget target)
+        {
+            EnsureLoaded();
+            _packedHashes[Key(atlasPath, target)] = hash;
+        }
+
+        private static string Key(string atlasPath, BuildTarget target)
+        {
+            return AssetDatabase.AssetPathToGUID(atlasPath) + "|" + target;
+        }
+
+        private static void AppendPlatformSettings(StringBuilder builder, TextureImporterPlatformSettings settings)
+        {
+            if (settings == null)
+                return;
+            builder.Append(settings.name).Append(',').Append(settings.overridden).Append(',').Append(settings.maxTextureSize).Append(',')
+                .Append(settings.format).Append(',').Append(settings.textureCompression).Append(',').Append(settings.compressionQuality).Append(',')
+                .Append(settings.crunchedCompression).Append('\n');
+        }
+
+        // --- 持久化 ---
+
+        private static void EnsureLoaded()
+        {
+            if (_loaded)
+                return;
+            _loaded = true;
+            if (!File.Exists(CachePath))
+                return;
+
+            try
+            {
+                using (var reader = new BinaryReader(File.OpenRead(CachePath)))
+                {
+                    if (reader.ReadInt32() != FormatVersion)
+                        return;
+                    int count = reader.ReadInt32();
+                    for (int i = 0; i < count; i++)
+                        _packedHashes[reader.ReadString()] = reader.ReadString();
+                }
+            }
+            catch (Exception ex)
+            {
+                McpLogger.LogWarning($"[SpriteAtlasPackState] Failed to load pack state, all atlases are dirty: {ex.Message}");
+                _packedHashes.Clear();
+            }
+        }
+
+        /// <summary>
+        /// 写入打包状态
+        /// </summary>
+        public static void Save()
+        {
+            EnsureLoaded();
+            try
+            {
+                Directory.CreateDirectory(Path.GetDirectoryName(CachePath));
+                string tempPath = CachePath + ".tmp";
+                using (var writer = new BinaryWriter(File.Create(tempPath)))
+                {
+                    writer.Write(FormatVersion);
+                    writer.Write(_packedHashes.Count);
+                    foreach (var pair in _packedHashes)
+                    {
+                        writer.Write(pair.Key);
+                        writer.Write(pair.Value);
+                    }
+                }
+                if (File.Exists(CachePath))
+                    File.Delete(CachePath);
+                File.Move(tempPath, CachePath);
+            }
+            catch (Exception ex)
+            {
+                McpLogger.LogWarning($"[SpriteAtlasPackState] Failed to save pack state: {ex.Message}");
+            }
+        }
+    }
+}
@@ -0,0 +1,207 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Reflection;
+using UnityEditor;
+using UnityEditor.Compilation;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 全局类型名索引，首次使用时构建；编译完成和域重载后丢弃，下次使用时重新构建。
+    /// UnityEngine.Object 派生类型直接取自 TypeCache；其他类型在第一次需要时扫描所有已加载程序集。
+    /// 按全名和短名建立索引，解析顺序：
+    /// 1. 程序集限定名（含 ","）交给 Type.GetType
+    /// 2. 全名精确匹配
+    /// 3. 常用命名空间（UnityEngine、UnityEngine.UI、UnityEditor）下的同名类型
+    /// 4. 短名精确匹配
+    /// 5. 忽略大小写的全名、短名匹配
+    /// 同一步骤命中多个类型时视为有歧义，不做任意选择，由 TryResolve 返回候选列表。
+    /// </summary>
+    public static class TypeIndex
+    {
+        private static readonly string[] PreferredNamespaces = { "UnityEngine.", "UnityEngine.UI.", "UnityEditor." };
+
+        private sealed class TypeTable
+        {
+            public readonly Type[] Types;
+            public readonly Dictionary<string, List<Type>> ByFullName = new Dictionary<string, List<Type>>(StringComparer.Ordinal);
+            public readonly Dictionary<string, List<Type>> ByShortName = new Dictionary<string, List<Type>>(StringComparer.Ordinal);
+            public readonly Dictionary<string, List<Type>> ByFullNameIgnoreCase = new Dictionary<string, List<Type>>(StringComparer.OrdinalIgnoreCase);
+            public readonly Dictionary<string, List<Type>> ByShortNameIgnoreCase = new Dictionary<string, List<Type>>(StringComparer.OrdinalIgnoreCase);
+
+            public TypeTable(IEnumerable<Type> types)
+            {
+                Types = types.Where(t => t != null && t.FullName != null).Distinct().ToArray();
+                foreach (var type in Types)
+                {
+                    Add(ByFullName, type.FullName, type);
+                    Add(ByShortName, type.Name, type);
+                    Add(ByFullNameIgnoreCase, type.FullName, type);
+                    Add(ByShortNameIgnoreCase, type.Name, type);
+                }
+            }
+
+            private static void Add(Dictionary<string, List<Type>> map, string key, Type type)
+            {
+                if (!map.TryGetValue(key, out var list))
+                {
+                    list = new List<Type>(1);
+                    map[key] = list;
+                }
+                list.Add(type);
+            }
+        }
+
+        private static TypeTable _unityObjects;
+        private static TypeTable _allTypes;
+
+        static TypeIndex()
+        {
+            CompilationPipeline.compilationFinished += context => Clear();
+            AssemblyReloadEvents.afterAssemblyReload += Clear;
+        }
+
+        private static TypeTable UnityObjects => _unityObjects ?? (_unityObjects =
+            new TypeTable(TypeCache.GetTypesDerivedFrom<UnityEngine.Object>().Append(typeof(UnityEngine.Object))));
+
+        private static TypeTable AllTypeTable => _allTypes ?? (_allTypes =
+            new TypeTable(AppDomain.CurrentDomain.GetAssemblies().Where(a => !a.IsDynamic).SelectMany(GetLoadableTypes)));
+
+        /// <summary>
+        /// 所有已加载程序集中的类型（不含动态程序集）
+        /// </summary>
+        public static IReadOnlyList<Type> AllTypes => AllTypeTable.Types;
+
+        /// <summary>
+        /// 丢弃已构建的索引（程序集变化后调用），下次使用时重新构建
+        /// </summary>
+        public static void Clear()
+        {
+            _unityObjects = null;
+            _allTypes = null;
+        }
+
+        /// <summary>
+        /// 获取派生自 baseType 的所有类型（基于 TypeCache）
+        /// </summary>
+        public static IList<Type> GetTypesDerivedFrom(Type baseType)
+        {
+            return TypeCache.GetTypesDerivedFrom(baseType);
+        }
+
+        /// <summary>
+        /// 按名称解析类型，未找到或名称有歧义时返回 null；需要向调用方报告候选时使用 TryResolve
+        /// </summary>
+        /// <param name="typeName">全名、短名或程序集限定名</param>
+        /// <param name="baseType">可选的基类型约束，只返回可赋值给它的类型</param>
+        public static Type Find(string typeName, Type baseType = null)
+        {
+            return TryResolve(typeName, baseType, out var type, out _) ? type : null;
+        }
+
+        /// <summary>
+        /// 按名称解析类型
+        /// </summary>
+        /// <param name="typeName">全名、短名或程序集限定名</param>
+        /// <param name="baseType">可选的基类型约束，只返回可赋值给它的类型</param>
+        /// <param name="type">解析结果</param>
+        /// <param name="error">失败原因；名称有歧义时列出全部候选</param>
+        public static bool TryResolve(string typeName, Type baseType, out Type type, out string error)
+        {
+            type = null;
+            error = null;
+            if (string.IsNullOrWhiteSpace(typeName))
+            {
+                error = "Type name is empty.";
+                return false;
+            }
+
+            typeName = typeName.Trim();
+            if (typeName.Contains(','))
+            {
+                type = Type.GetType(typeName, false);
+                if (type != null && (baseType == null || baseType.IsAssignableFrom(type)))
+                    return true;
+                type = null;
+                error = $"Type '{typeName}' not found.";
+                return false;
+            }
+
+            var table = baseType != null && typeof(UnityEngine.Object).IsAssignableFrom(baseType)
+                ? UnityObjects
+                : AllTypeTable;
+
+            List<Type> candidates = Match(table.ByFullName, typeName, baseType);
+            if (candidates.Count == 0)
+            {
+                foreach (var ns in PreferredNamespaces)
+                {
+                    candidates = Match(table.ByFullName, ns + typeName, baseType);
+                    if (candidates.Count > 0)
+                        break;
+                }
+            }
+            if (candidates.Count == 0)
+                candidates = Match(table.ByShortName, typeName, baseType);
+            if (candidates.Count == 0)
+                candidates = Match(table.ByFullNameIgnoreCase, typeName, baseType);
+            if (candidates.Count == 0)
+                candidates = Match(table.ByShortNameIgnoreCase, typeName, baseType);
+
+            if (candidates.Count == 1)
+            {
+                type = candidates[0];
+                return true;
+            }
+
+            error = candidates.Count == 0
+                ? $"Type '{typeName}' not found."
+                : $"Type name '{typeName}' is ambiguous, use one of the full names: {string.Join(", ", candidates.Select(t => $"{t.FullName} ({t.Assembly.GetName().Name})"))}";
+            return false;
+        }
+
+        /// <summary>
+        /// 返回短名（或全名）对应的全部类型，用于列出候选
+        /// </summary>
+        public static IReadOnlyList<Type> FindAll(string typeName, Type baseType = null, bool ignoreCase = false)
+        {
+            if (string.IsNullOrWhiteSpace(typeName))
+                return Array.Empty<Type>();
+
+            var table = baseType != null && typeof(UnityEngine.Object).IsAssignableFrom(baseType)
+                ? UnityObjects
+                : AllTypeTable;
+            typeName = typeName.Trim();
+            var byFullName = Match(ignoreCase ? table.ByFullNameIgnoreCase : table.ByFullName, typeName, baseType);
+            var byShortName = Match(ignoreCase ? table.ByShortNameIgnoreCase : table.ByShortName, typeName, baseType);
+            return byFullName.Concat(byShortName).Distinct().ToList();
+        }
+
+        private static List<Type> Match(Dictionary<string, List<Type>> map, string key, Type baseType)
+        {
+            if (!map.TryGetValue(key, out var types))
+                return new List<Type>();
+            if (baseType == null)
+                return types;
+            return types.Where(baseType.IsAssignableFrom).ToList();
+        }
+
+        private static IEnumerable<Type> GetLoadableTypes(Assembly assembly)
+        {
+            try
+            {
+                return assembly.GetTypes();
+            }
+            catch (ReflectionTypeLoadException ex)
+            {
+                // 部分类型无法加载时保留可加载的部分
+                return ex.Types.Where(t => t != null);
+            }
+            catch (Exception)
+            {
+                return Array.Empty<Type>();
+            }
+        }
+    }
+}
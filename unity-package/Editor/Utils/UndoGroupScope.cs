@@ -0,0 +1,30 @@
+using System;
+using UnityEditor;
+
+namespace UniMcp
+{
+    /// <summary>
+    /// 批量编辑的 Undo 分组。
+    /// 创建时开启一个新的 Undo 组，释放时把组内的所有记录合并为一步，批量操作只需一次撤销。
+    /// </summary>
+    public sealed class UndoGroupScope : IDisposable
+    {
+        private readonly int _group;
+        private bool _disposed;
+
+        /// <param name="name">Undo 菜单中显示的名称</param>
+        public UndoGroupScope(string name)
+        {
+            Undo.IncrementCurrentGroup();
+            Undo.SetCurrentGroupName(name);
+            _group = Undo.GetCurrentGroup();
+        }
+
+        public void Dispose()
+        {
+            if (_disposed) return;
+            _disposed = true;
+            Undo.CollapseUndoOperations(_group);
+        }
+    }
+}
@@ -2,6 +2,7 @@
 using System;
 using System.Collections;
 using System.Collections.Generic;
+using System.Globalization;
 using System.Linq;
 
 namespace UniMcp.Runtime
@@ -716,6 +717,36 @@ namespace UniMcp.Runtime
         }
 
         public static JsonNode Parse(string aJSON)
+        {
+            if (string.IsNullOrEmpty(aJSON))
+                return new JsonClass();
+
+            // 标准 JSON 走单遍快速解析，其余输入交给宽松解析器
+            if (JsonFastParser.TryParse(aJSON.AsSpan(), out JsonNode node))
+                return node;
+            return ParseLegacy(aJSON);
+        }
+
+        /// <summary>
+        /// 解析 UTF-8 编码的 JSON，标准 JSON 不会生成中间字符串
+        /// </summary>
+        public static JsonNode Parse(ReadOnlySpan<byte> aUtf8Json)
+        {
+            // 跳过 UTF-8 BOM
+            if (aUtf8Json.Length >= 3 && aUtf8Json[0] == 0xEF && aUtf8Json[1] == 0xBB && aUtf8Json[2] == 0xBF)
+                aUtf8Json = aUtf8Json.Slice(3);
+            if (aUtf8Json.IsEmpty)
+                return new JsonClass();
+
+            if (JsonFastParser.TryParse(aUtf8Json, out JsonNode node))
+                return node;
+            return ParseLegacy(System.Text.Encoding.UTF8.GetString(aUtf8Json));
+        }
+
+        /// <summary>
+        /// 宽松解析器：兼容被转义或包裹成字符串的 JSON、尾随逗号、未加引号的键等非标准输入
+        /// </summary>
+        internal static JsonNode ParseLegacy(string aJSON)
         {
             if (string.IsNullOrEmpty(aJSON))
                 return new JsonClass();
@@ -1089,7 +1120,20 @@ return LoadFromCompressedStream(stream);
 
     public class JsonArray : JsonNode, IEnumerable
     {
-        private List<JsonNode> m_List = new List<JsonNode>();
+        private List<JsonNode> m_List;
+
+        public JsonArray()
+        {
+            m_List = new List<JsonNode>();
+        }
+
+        /// <summary>
+        /// 按已知元素数量预分配容量（解析器使用）
+        /// </summary>
+        internal JsonArray(int aCapacity)
+        {
+            m_List = new List<JsonNode>(aCapacity);
+        }
 
         public override string Value
         {
@@ -1318,7 +1362,20 @@ return LoadFromCompressedStream(stream);
 
     public class JsonClass : JsonNode, IEnumerable
     {
-        private Dictionary<string, JsonNode> m_Dict = new Dictionary<string, JsonNode>();
+        private Dictionary<string, JsonNode> m_Dict;
+
+        public JsonClass()
+        {
+            m_Dict = new Dictionary<string, JsonNode>();
+        }
+
+        /// <summary>
+        /// 按已知成员数量预分配容量（解析器使用）
+        /// </summary>
+        internal JsonClass(int aCapacity)
+        {
+            m_Dict = new Dictionary<string, JsonNode>(aCapacity);
+        }
 
         public override string Value
         {
@@ -1626,16 +1683,35 @@ return LoadFromCompressedStream(stream);
 
     public class JsonData : JsonNode
     {
-        private string m_Data;
-        private JsonNodeType? m_CachedType = null;
+        /// <summary>
+        /// 值的实际存储类型：数值与布尔值按原始类型保存，只在需要文本时格式化
+        /// </summary>
+        private enum DataKind : byte
+        {
+            String,
+            Integer,
+            Single,
+            Double,
+            Boolean,
+        }
+
+        private DataKind m_Kind;
+        private string m_Data; // String 类型的值；其他类型为格式化结果的缓存
+        private long m_Bits;   // Integer/Boolean 的值，Single/Double 的位模式；String 类型时缓存推断出的节点类型
 
         public override string Value
         {
-            get { return m_Data; }
+            get
+            {
+                if (m_Data == null && m_Kind != DataKind.String)
+                    m_Data = FormatValue();
+                return m_Data;
+            }
             set
             {
                 m_Data = value;
-                m_CachedType = null; // 值变化时清除缓存的类型
+                m_Kind = DataKind.String;
+                m_Bits = 0; // 值变化时清除缓存的类型
             }
         }
         public JsonData(string aData)
@@ -1660,7 +1736,7 @@ return LoadFromCompressedStream(stream);
         }
         public JsonData(long aData)
         {
-            m_Data = aData.ToString();
+            SetInteger(aData);
         }
         public JsonData(decimal aData)
         {
@@ -1668,7 +1744,7 @@ return LoadFromCompressedStream(stream);
         }
         public JsonData(uint aData)
         {
-            m_Data = aData.ToString();
+            SetInteger(aData);
         }
         public JsonData(short aData)
         {
@@ -1676,7 +1752,7 @@ return LoadFromCompressedStream(stream);
         }
         public JsonData(ushort aData)
         {
-            m_Data = aData.ToString();
+            SetInteger(aData);
         }
         public JsonData(byte aData)
         {
@@ -1691,48 +1767,167 @@ return LoadFromCompressedStream(stream);
             m_Data = aData.ToString();
         }
 
-        public override string ToString()
+        /// <summary>
+        /// 是否以数值形式存储（而非字符串）
+        /// </summary>
+        public bool IsNumber
         {
-            // 处理 null 值
-            if (m_Data == null || m_Data == "null")
+            get { return m_Kind == DataKind.Integer || m_Kind == DataKind.Single || m_Kind == DataKind.Double; }
+        }
+
+        private double NumberValue
+        {
+            get { return m_Kind == DataKind.Integer ? m_Bits : BitConverter.Int64BitsToDouble(m_Bits); }
+        }
+
+        private void SetInteger(long aValue)
+        {
+            m_Kind = DataKind.Integer;
+            m_Bits = aValue;
+            m_Data = null;
+        }
+
+        private void SetNumber(DataKind aKind, double aValue)
+        {
+            m_Kind = aKind;
+            m_Bits = BitConverter.DoubleToInt64Bits(aValue);
+            m_Data = null;
+        }
+
+        private string FormatValue()
+        {
+            switch (m_Kind)
             {
-                return "null";
+                case DataKind.Integer:
+                    return m_Bits.ToString(CultureInfo.InvariantCulture);
+                case DataKind.Single:
+                    return ((float)NumberValue).ToString("R", CultureInfo.InvariantCulture);
+                case DataKind.Double:
+                    return NumberValue.ToString("R", CultureInfo.InvariantCulture);
+                case DataKind.Boolean:
+                    return m_Bits != 0 ? "true" : "false";
+                default:
+                    return m_Data;
             }
-            
-            JsonNodeType nodeType = GetCachedNodeType();
-            if (nodeType == JsonNodeType.Boolean)
+        }
+
+        /// <summary>
+        /// 数值的节点类型：与按文本判断时一致，能表示为 int 的整数值视为 Integer，其余视为 Float
+        /// </summary>
+        private JsonNodeType GetNumberNodeType()
+        {
+            double d = NumberValue;
+            return d >= int.MinValue && d <= int.MaxValue && Math.Floor(d) == d ? JsonNodeType.Integer : JsonNodeType.Float;
+        }
+
+        public override int AsInt
+        {
+            get
             {
-                return m_Data.ToLower(); // 布尔值不需要引号
+                switch (m_Kind)
+                {
+                    case DataKind.Integer:
+                    case DataKind.Single:
+                    case DataKind.Double:
+                        return GetNumberNodeType() == JsonNodeType.Integer ? (int)NumberValue : 0;
+                    case DataKind.Boolean:
+                        return 0;
+                    default:
+                        return base.AsInt;
+                }
             }
-            else if (nodeType == JsonNodeType.Integer || nodeType == JsonNodeType.Float)
+            set
             {
-                return m_Data; // 数字不需要引号
+                SetInteger(value);
             }
-            return "\"" + Escape(m_Data) + "\"";
         }
-
-        public override string ToString(string aPrefix)
+        public override float AsFloat
         {
-            // 处理 null 值
-            if (m_Data == null || m_Data == "null")
+            get
             {
-                return "null";
+                switch (m_Kind)
+                {
+                    case DataKind.Integer:
+                    case DataKind.Single:
+                    case DataKind.Double:
+                        return (float)NumberValue;
+                    case DataKind.Boolean:
+                        return 0.0f;
+                    default:
+                        return base.AsFloat;
+                }
             }
-            
-            JsonNodeType nodeType = GetCachedNodeType();
-            if (nodeType == JsonNodeType.Boolean)
+            set
             {
-                return m_Data.ToLower(); // 布尔值不需要引号
+                SetNumber(DataKind.Single, value);
             }
-            else if (nodeType == JsonNodeType.Integer || nodeType == JsonNodeType.Float)
+        }
+        public override double AsDouble
+        {
+            get
             {
-                return m_Data; // 数字不需要引号
+                switch (m_Kind)
+                {
+                    case DataKind.Integer:
+                    case DataKind.Double:
+                        return NumberValue;
+                    case DataKind.Boolean:
+                        return 0.0;
+                    default:
+                        // float 按其文本精度转换（0.1f -> 0.1），与字符串存储时一致
+                        return base.AsDouble;
+                }
+            }
+            set
+            {
+                SetNumber(DataKind.Double, value);
+            }
+        }
+        public override bool AsBool
+        {
+            get
+            {
+                switch (m_Kind)
+                {
+                    case DataKind.Boolean:
+                        return m_Bits != 0;
+                    case DataKind.Integer:
+                    case DataKind.Single:
+                    case DataKind.Double:
+                        return true; // 非空且不是布尔文本
+                    default:
+                        return base.AsBool;
+                }
+            }
+            set
+            {
+                m_Kind = DataKind.Boolean;
+                m_Bits = value ? 1 : 0;
+                m_Data = null;
             }
-            return "\"" + Escape(m_Data) + "\"";
         }
 
-        public override string ToPrettyStringInternal(int level, string indent)
+        public override bool IsNull()
         {
+            if (m_Kind != DataKind.String)
+                return false;
+            return base.IsNull();
+        }
+
+        public override JsonNodeType GetJSONNodeType()
+        {
+            if (m_Kind == DataKind.Boolean)
+                return JsonNodeType.Boolean;
+            if (m_Kind != DataKind.String)
+                return GetNumberNodeType();
+            return base.GetJSONNodeType();
+        }
+
+        public override string ToString()
+        {
+            if (m_Kind != DataKind.String)
+                return TypedToString();
+
             // 处理 null 值
             if (m_Data == null || m_Data == "null")
             {
@@ -1751,8 +1946,35 @@ return LoadFromCompressedStream(stream);
             return "\"" + Escape(m_Data) + "\"";
         }
 
+        /// <summary>
+        /// 数值与布尔值的输出：小数沿用按文本推断的规则（整数值的小数如 2f 推断为整数），推断为字符串时加引号输出
+        /// </summary>
+        private string TypedToString()
+        {
+            string text = Value;
+            if (m_Kind == DataKind.Integer || m_Kind == DataKind.Boolean)
+                return text;
+            JsonNodeType inferred = InferNodeType(text);
+            if (inferred == JsonNodeType.Integer || inferred == JsonNodeType.Float)
+                return text;
+            return "\"" + Escape(text) + "\"";
+        }
+
+        public override string ToString(string aPrefix)
+        {
+            return ToString();
+        }
+
+        public override string ToPrettyStringInternal(int level, string indent)
+        {
+            return ToString();
+        }
+
         public override string ToYamlStringInternal(int level, string indent, bool isArrayItem)
         {
+            if (m_Kind != DataKind.String)
+                return TypedToString();
+
             JsonNodeType nodeType = GetCachedNodeType();
 
             // null 值
@@ -1823,43 +2045,85 @@ return LoadFromCompressedStream(stream);
 
         private JsonNodeType GetCachedNodeType()
         {
-            if (m_CachedType.HasValue)
-                return m_CachedType.Value;
+            // 0 表示尚未推断，否则为 (节点类型 + 1)
+            if (m_Bits != 0)
+                return (JsonNodeType)(m_Bits - 1);
 
-            if (string.IsNullOrEmpty(m_Data) || m_Data == "null")
-                m_CachedType = JsonNodeType.Null;
-            else if (bool.TryParse(m_Data, out _))
-                m_CachedType = JsonNodeType.Boolean;
-            else if (int.TryParse(m_Data, out _))
-                m_CachedType = JsonNodeType.Integer;
-            else if (double.TryParse(m_Data, out _) && m_Data.Contains(".") && !m_Data.EndsWith("0") && m_Data.StartsWith("0") == false)
-                m_CachedType = JsonNodeType.Float;
+            JsonNodeType nodeType = InferNodeType(m_Data);
+            m_Bits = (long)nodeType + 1;
+            return nodeType;
+        }
+
+        /// <summary>
+        /// 按文本推断字符串值的节点类型
+        /// </summary>
+        private static JsonNodeType InferNodeType(string text)
+        {
+            JsonNodeType nodeType;
+            if (string.IsNullOrEmpty(text) || text == "null")
+                nodeType = JsonNodeType.Null;
+            else if (bool.TryParse(text, out _))
+                nodeType = JsonNodeType.Boolean;
+            else if (int.TryParse(text, out _))
+                nodeType = JsonNodeType.Integer;
+            else if (double.TryParse(text, out _) && text.Contains(".") && !text.EndsWith("0") && text.StartsWith("0") == false)
+                nodeType = JsonNodeType.Float;
             else
-                m_CachedType = JsonNodeType.String;
+                nodeType = JsonNodeType.String;
 
-            return m_CachedType.Value;
+            return nodeType;
         }
 
         public override void Serialize(System.IO.BinaryWriter aWriter)
         {
+            switch (m_Kind)
+            {
+                case DataKind.Integer:
+                case DataKind.Double:
+                    if (GetNumberNodeType() == JsonNodeType.Integer)
+                    {
+                        aWriter.Write((byte)JsonBinaryTag.IntValue);
+                        aWriter.Write((int)NumberValue);
+                    }
+                    else if (m_Kind == DataKind.Double && (double)(float)NumberValue == NumberValue)
+                    {
+                        aWriter.Write((byte)JsonBinaryTag.FloatValue);
+                        aWriter.Write((float)NumberValue);
+                    }
+                    else
+                    {
+                        aWriter.Write((byte)JsonBinaryTag.DoubleValue);
+                        aWriter.Write(NumberValue);
+                    }
+                    return;
+                case DataKind.Single:
+                    aWriter.Write((byte)JsonBinaryTag.FloatValue);
+                    aWriter.Write((float)NumberValue);
+                    return;
+                case DataKind.Boolean:
+                    aWriter.Write((byte)JsonBinaryTag.BoolValue);
+                    aWriter.Write(m_Bits != 0);
+                    return;
+            }
+
             var tmp = new JsonData("");
 
             tmp.AsInt = AsInt;
-            if (tmp.m_Data == this.m_Data)
+            if (tmp.Value == this.m_Data)
             {
                 aWriter.Write((byte)JsonBinaryTag.IntValue);
                 aWriter.Write(AsInt);
                 return;
             }
             tmp.AsFloat = AsFloat;
-            if (tmp.m_Data == this.m_Data)
+            if (tmp.Value == this.m_Data)
             {
                 aWriter.Write((byte)JsonBinaryTag.FloatValue);
                 aWriter.Write(AsFloat);
                 return;
             }
             tmp.AsDouble = AsDouble;
-            if (tmp.m_Data == this.m_Data)
+            if (tmp.Value == this.m_Data)
             {
                 aWriter.Write((byte)JsonBinaryTag.DoubleValue);
                 aWriter.Write(AsDouble);
@@ -1867,7 +2131,7 @@ return LoadFromCompressedStream(stream);
             }
 
             tmp.AsBool = AsBool;
-            if (tmp.m_Data == this.m_Data)
+            if (tmp.Value == this.m_Data)
             {
                 aWriter.Write((byte)JsonBinaryTag.BoolValue);
                 aWriter.Write(AsBool);
@@ -2074,8 +2338,17 @@ return LoadFromCompressedStream(stream);
             return JsonNode.Parse(aJSON);
         }
 
+        /// <summary>
+        /// 解析 UTF-8 编码的 JSON
+        /// </summary>
+        public static JsonNode Parse(ReadOnlySpan<byte> aUtf8Json)
+        {
+            return JsonNode.Parse(aUtf8Json);
+        }
+
         /// <summary>
         /// 从对象创建 JSONNode（类似 Json.FromObject）
+        /// 每种类型的转换方式只解析一次并缓存，对象的字段和属性通过编译后的取值委托读取
         /// </summary>
         public static JsonNode FromObject(object obj)
         {
@@ -2088,152 +2361,324 @@ return LoadFromCompressedStream(stream);
             if (obj is string str)
                 return new JsonData(str);
 
-            if (obj is int intVal)
-                return new JsonData(intVal);
-            if (obj is long longVal)
-                return new JsonData(longVal);
-            if (obj is short shortVal)
-                return new JsonData(shortVal);
-            if (obj is byte byteVal)
-                return new JsonData(byteVal);
-            if (obj is uint uintVal)
-                return new JsonData(uintVal);
-            if (obj is ushort ushortVal)
-                return new JsonData(ushortVal);
-            if (obj is sbyte sbyteVal)
-                return new JsonData(sbyteVal);
-            if (obj is char charVal)
-                return new JsonData(charVal);
-
-            if (obj is float floatVal)
-                return new JsonData(floatVal);
-            if (obj is double doubleVal)
-                return new JsonData(doubleVal);
-            if (obj is decimal decimalVal)
-                return new JsonData(decimalVal);
-
-            if (obj is bool b)
-                return new JsonData(b ? "true" : "false");
+            return GetConverter(obj.GetType())(obj);
+        }
+
+        private static readonly Dictionary<Type, Func<object, JsonNode>> s_Converters = new Dictionary<Type, Func<object, JsonNode>>();
+        private static readonly object s_ConvertersLock = new object();
+
+        /// <summary>
+        /// 可读成员的名称与取值委托
+        /// </summary>
+        private sealed class MemberAccessor
+        {
+            public string Name;
+            public Func<object, object> Getter;
+            public bool IsField;
+        }
+
+        private static Func<object, JsonNode> GetConverter(Type type)
+        {
+            Func<object, JsonNode> converter;
+            lock (s_ConvertersLock)
+            {
+                if (s_Converters.TryGetValue(type, out converter))
+                    return converter;
+            }
+
+            // 在锁外构建，避免编译表达式时阻塞其他线程；并发构建时保留先写入的结果
+            converter = CreateConverter(type);
+            lock (s_ConvertersLock)
+            {
+                if (s_Converters.TryGetValue(type, out var existing))
+                    return existing;
+                s_Converters[type] = converter;
+            }
+            return converter;
+        }
+
+        private static Func<object, JsonNode> CreateConverter(Type type)
+        {
+            if (type == typeof(int))
+                return obj => new JsonData((int)obj);
+            if (type == typeof(long))
+                return obj => new JsonData((long)obj);
+            if (type == typeof(short))
+                return obj => new JsonData((short)obj);
+            if (type == typeof(byte))
+                return obj => new JsonData((byte)obj);
+            if (type == typeof(uint))
+                return obj => new JsonData((uint)obj);
+            if (type == typeof(ushort))
+                return obj => new JsonData((ushort)obj);
+            if (type == typeof(sbyte))
+                return obj => new JsonData((sbyte)obj);
+            if (type == typeof(char))
+                return obj => new JsonData((char)obj);
+
+            if (type == typeof(float))
+                return obj => new JsonData((float)obj);
+            if (type == typeof(double))
+                return obj => new JsonData((double)obj);
+            if (type == typeof(decimal))
+                return obj => new JsonData((decimal)obj);
+
+            if (type == typeof(bool))
+                return obj => new JsonData((bool)obj);
 
 #if UNITY_EDITOR || UNITY_STANDALONE
-            if (obj is UnityEngine.Vector2 v2)
+            if (type == typeof(UnityEngine.Vector2))
             {
-                var arr = new JsonArray();
-                arr.Add(new JsonData(v2.x.ToString()));
-                arr.Add(new JsonData(v2.y.ToString()));
-                return arr;
+                return obj =>
+                {
+                    var v2 = (UnityEngine.Vector2)obj;
+                    var arr = new JsonArray(2);
+                    arr.Add(new JsonData(v2.x));
+                    arr.Add(new JsonData(v2.y));
+                    return arr;
+                };
             }
 
-            if (obj is UnityEngine.Vector3 v3)
+            if (type == typeof(UnityEngine.Vector3))
             {
-                var arr = new JsonArray();
-                arr.Add(new JsonData(v3.x.ToString()));
-                arr.Add(new JsonData(v3.y.ToString()));
-                arr.Add(new JsonData(v3.z.ToString()));
-                return arr;
+                return obj =>
+                {
+                    var v3 = (UnityEngine.Vector3)obj;
+                    var arr = new JsonArray(3);
+                    arr.Add(new JsonData(v3.x));
+                    arr.Add(new JsonData(v3.y));
+                    arr.Add(new JsonData(v3.z));
+                    return arr;
+                };
             }
 
-            if (obj is UnityEngine.Vector4 v4)
+            if (type == typeof(UnityEngine.Vector4))
             {
-                var arr = new JsonArray();
-                arr.Add(new JsonData(v4.x.ToString()));
-                arr.Add(new JsonData(v4.y.ToString()));
-                arr.Add(new JsonData(v4.z.ToString()));
-                arr.Add(new JsonData(v4.w.ToString()));
-                return arr;
+                return obj =>
+                {
+                    var v4 = (UnityEngine.Vector4)obj;
+                    var arr = new JsonArray(4);
+                    arr.Add(new JsonData(v4.x));
+                    arr.Add(new JsonData(v4.y));
+                    arr.Add(new JsonData(v4.z));
+                    arr.Add(new JsonData(v4.w));
+                    return arr;
+                };
             }
 
-            if (obj is UnityEngine.Quaternion q)
+            if (type == typeof(UnityEngine.Quaternion))
             {
-                var arr = new JsonArray();
-                arr.Add(new JsonData(q.x.ToString()));
-                arr.Add(new JsonData(q.y.ToString()));
-                arr.Add(new JsonData(q.z.ToString()));
-                arr.Add(new JsonData(q.w.ToString()));
-                return arr;
+                return obj =>
+                {
+                    var q = (UnityEngine.Quaternion)obj;
+                    var arr = new JsonArray(4);
+                    arr.Add(new JsonData(q.x));
+                    arr.Add(new JsonData(q.y));
+                    arr.Add(new JsonData(q.z));
+                    arr.Add(new JsonData(q.w));
+                    return arr;
+                };
             }
 
-            if (obj is UnityEngine.Color c)
+            if (type == typeof(UnityEngine.Color))
             {
-                var colorObj = new JsonClass();
-                colorObj.Add("r", new JsonData(c.r.ToString()));
-                colorObj.Add("g", new JsonData(c.g.ToString()));
-                colorObj.Add("b", new JsonData(c.b.ToString()));
-                colorObj.Add("a", new JsonData(c.a.ToString()));
-                return colorObj;
+                return obj =>
+                {
+                    var c = (UnityEngine.Color)obj;
+                    var colorObj = new JsonClass(4);
+                    colorObj.Add("r", new JsonData(c.r));
+                    colorObj.Add("g", new JsonData(c.g));
+                    colorObj.Add("b", new JsonData(c.b));
+                    colorObj.Add("a", new JsonData(c.a));
+                    return colorObj;
+                };
             }
 #endif
 
+            if (type.IsGenericType)
+            {
+                var definition = type.GetGenericTypeDefinition();
+                var arguments = type.GetGenericArguments();
+                if (definition == typeof(Dictionary<,>) && arguments[0] == typeof(string))
+                    return CreateGenericConverter(nameof(ConvertStringDictionary), type, arguments[1], ConvertDictionary);
+                if (definition == typeof(List<>))
+                    return CreateGenericConverter(nameof(ConvertList), type, arguments[0], ConvertEnumerable);
+            }
+
             // 先检查 IDictionary，因为 Dictionary 同时实现了 IDictionary 和 IEnumerable
-            if (obj is System.Collections.IDictionary dict)
+            if (typeof(IDictionary).IsAssignableFrom(type))
+                return ConvertDictionary;
+
+            if (type.IsArray)
+                return ConvertArray;
+
+            if (typeof(IEnumerable).IsAssignableFrom(type))
+                return ConvertEnumerable;
+
+            // 特殊处理匿名类型和具有属性的对象
+            if (type.IsClass)
             {
-                var jsonObj = new JsonClass();
-                foreach (System.Collections.DictionaryEntry entry in dict)
-                {
-                    jsonObj.Add(entry.Key.ToString(), FromObject(entry.Value));
-                }
-                return jsonObj;
+                var members = CreateMemberAccessors(type);
+                if (members.Length > 0)
+                    return obj => ConvertMembers(obj, members);
+            }
+
+            // 默认转换为字符串
+            return obj => new JsonData(obj.ToString());
+        }
+
+        /// <summary>
+        /// 为泛型集合创建强类型转换器；IL2CPP/AOT 下泛型实例可能没有生成代码，
+        /// 创建或试调用失败时使用非泛型的 fallback
+        /// </summary>
+        private static Func<object, JsonNode> CreateGenericConverter(string methodName, Type type, Type argument, Func<object, JsonNode> fallback)
+        {
+            try
+            {
+                var method = typeof(Json).GetMethod(methodName, System.Reflection.BindingFlags.NonPublic | System.Reflection.BindingFlags.Static)
+                    .MakeGenericMethod(argument);
+                var converter = (Func<object, JsonNode>)Delegate.CreateDelegate(typeof(Func<object, JsonNode>), method);
+                // 用空集合试调用一次，AOT 缺少泛型代码时在这里失败而不是在转换时
+                converter(Activator.CreateInstance(type));
+                return converter;
+            }
+            catch (Exception)
+            {
+                return fallback;
             }
+        }
 
-            if (obj is System.Collections.IEnumerable enumerable && !(obj is string))
+        private static JsonNode ConvertStringDictionary<T>(object obj)
+        {
+            var dict = (Dictionary<string, T>)obj;
+            var jsonObj = new JsonClass(dict.Count);
+            foreach (var pair in dict)
             {
-                var arr = new JsonArray();
-                foreach (var item in enumerable)
+                jsonObj.Add(pair.Key, FromObject(pair.Value));
+            }
+            return jsonObj;
+        }
+
+        private static JsonNode ConvertList<T>(object obj)
+        {
+            var list = (List<T>)obj;
+            var arr = new JsonArray(list.Count);
+            for (int i = 0; i < list.Count; i++)
+            {
+                arr.Add(FromObject(list[i]));
+            }
+            return arr;
+        }
+
+        private static JsonNode ConvertDictionary(object obj)
+        {
+            var dict = (IDictionary)obj;
+            var jsonObj = new JsonClass(dict.Count);
+            foreach (DictionaryEntry entry in dict)
+            {
+                jsonObj.Add(entry.Key.ToString(), FromObject(entry.Value));
+            }
+            return jsonObj;
+        }
+
+        private static JsonNode ConvertArray(object obj)
+        {
+            var array = (Array)obj;
+            var arr = new JsonArray(array.Length);
+            foreach (var item in array)
+            {
+                arr.Add(FromObject(item));
+            }
+            return arr;
+        }
+
+        private static JsonNode ConvertEnumerable(object obj)
+        {
+            var arr = new JsonArray();
+            foreach (var item in (IEnumerable)obj)
+            {
+                arr.Add(FromObject(item));
+            }
+            return arr;
+        }
+
+        private static JsonNode ConvertMembers(object obj, MemberAccessor[] members)
+        {
+            var jsonObj = new JsonClass(members.Length);
+            foreach (var member in members)
+            {
+                try
+                {
+                    jsonObj.Add(member.Name, FromObject(member.Getter(obj)));
+                }
+                catch (Exception ex)
                 {
-                    arr.Add(FromObject(item));
+                    UnityEngine.Debug.LogWarning($"Json.FromObject: 无法访问{(member.IsField ? "字段" : "属性")} {member.Name}: {ex.Message}");
+                    jsonObj.Add(member.Name, new JsonData("null"));
                 }
-                return arr;
             }
+            return jsonObj;
+        }
 
-            // 特殊处理匿名类型和具有属性的对象
-            if (obj.GetType().IsClass && !(obj is string))
+        /// <summary>
+        /// 收集类型的公共字段和可读属性（字段在前），并为每个成员构建取值委托
+        /// </summary>
+        private static MemberAccessor[] CreateMemberAccessors(Type type)
+        {
+            var members = new List<MemberAccessor>();
+
+            foreach (var field in type.GetFields())
             {
-                var type = obj.GetType();
+                members.Add(new MemberAccessor { Name = field.Name, Getter = CreateFieldGetter(type, field), IsField = true });
+            }
+
+            foreach (var prop in type.GetProperties())
+            {
+                // 只处理可读且不是索引器的属性
+                if (!prop.CanRead || prop.GetIndexParameters().Length > 0) continue;
+                members.Add(new MemberAccessor { Name = prop.Name, Getter = CreatePropertyGetter(type, prop) });
+            }
 
-                var jsonObj = new JsonClass();
+            return members.ToArray();
+        }
 
-                // 处理字段
-                var fields = type.GetFields();
-                foreach (var field in fields)
+        private static Func<object, object> CreateFieldGetter(Type type, System.Reflection.FieldInfo field)
+        {
+            if (!field.IsLiteral)
+            {
+                try
                 {
-                    try
-                    {
-                        var value = field.GetValue(obj);
-                        jsonObj.Add(field.Name, FromObject(value));
-                    }
-                    catch (Exception ex)
-                    {
-                        UnityEngine.Debug.LogWarning($"Json.FromObject: 无法访问字段 {field.Name}: {ex.Message}");
-                        jsonObj.Add(field.Name, new JsonData("null"));
-                    }
+                    var instance = System.Linq.Expressions.Expression.Parameter(typeof(object), "obj");
+                    var target = field.IsStatic ? null : System.Linq.Expressions.Expression.Convert(instance, type);
+                    var body = System.Linq.Expressions.Expression.Convert(System.Linq.Expressions.Expression.Field(target, field), typeof(object));
+                    return System.Linq.Expressions.Expression.Lambda<Func<object, object>>(body, instance).Compile();
                 }
-
-                // 处理属性
-                var properties = type.GetProperties();
-                foreach (var prop in properties)
+                catch (Exception)
                 {
-                    // 只处理可读且不是索引器的属性
-                    if (!prop.CanRead || prop.GetIndexParameters().Length > 0) continue;
-                    try
-                    {
-                        var value = prop.GetValue(obj, null);
-                        jsonObj.Add(prop.Name, FromObject(value));
-                    }
-                    catch (Exception ex)
-                    {
-                        UnityEngine.Debug.LogWarning($"Json.FromObject: 无法访问属性 {prop.Name}: {ex.Message}");
-                        jsonObj.Add(prop.Name, new JsonData("null"));
-                    }
+                    // 不支持动态编译的平台（如 IL2CPP）退回到反射
                 }
+            }
+            return field.GetValue;
+        }
 
-                if (jsonObj.Count > 0)
+        private static Func<object, object> CreatePropertyGetter(Type type, System.Reflection.PropertyInfo prop)
+        {
+            var getter = prop.GetGetMethod(true);
+            if (getter != null && !prop.PropertyType.IsByRef)
+            {
+                try
+                {
+                    var instance = System.Linq.Expressions.Expression.Parameter(typeof(object), "obj");
+                    var target = getter.IsStatic ? null : System.Linq.Expressions.Expression.Convert(instance, type);
+                    var body = System.Linq.Expressions.Expression.Convert(System.Linq.Expressions.Expression.Property(target, prop), typeof(object));
+                    return System.Linq.Expressions.Expression.Lambda<Func<object, object>>(body, instance).Compile();
+                }
+                catch (Exception)
                 {
-                    return jsonObj;
+                    // 不支持动态编译的平台（如 IL2CPP）退回到反射
                 }
             }
-
-            // 默认转换为字符串
-            return new JsonData(obj.ToString());
+            return obj => prop.GetValue(obj, null);
         }
     }
-}
\ No newline at end of file
+}